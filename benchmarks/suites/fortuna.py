@@ -7,6 +7,7 @@ rename while Fortuna 6 settles its public contract.
 from __future__ import annotations
 
 import importlib
+from array import array
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
@@ -105,10 +106,13 @@ def _workload_description(
     workload: _NumericWorkload,
     *,
     count: int | None = None,
+    as_buffer: bool = False,
 ) -> str:
     identity = f"owner={owner}; method={workload.method}; arguments={workload.arguments!r}; seed=0"
     if count is not None:
         identity += f"; count={count}"
+    if as_buffer:
+        identity += "; as_buffer=True"
     return identity
 
 
@@ -117,11 +121,15 @@ def _workload_metadata(
     workload: _NumericWorkload,
     *,
     count: int | None = None,
+    as_buffer: bool = False,
     input_data: Any = None,
 ) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {} if count is None else {"count": count}
+    if as_buffer:
+        kwargs["as_buffer"] = True
     return {
         "args": workload.arguments,
-        "kwargs": {} if count is None else {"count": count},
+        "kwargs": kwargs,
         "seed": 0,
         "input": input_data,
         "setup_variant": f"{owner}.{workload.method}-seed-0-per-sample",
@@ -307,6 +315,59 @@ def shuffle_algorithm_cases() -> list[BenchmarkCase]:
                     workload=metadata,
                 )
             )
+    cases.extend(_buffer_shuffle_strategy_cases(fortuna, error))
+    return cases
+
+
+def _buffer_shuffle_strategy_cases(
+    fortuna: Any | None, import_error: str | None
+) -> list[BenchmarkCase]:
+    """Compare the public Knuth-B and blocked strategies on int64 buffers."""
+
+    function, reason = _resolve(fortuna, "shuffle", import_error)
+    cases: list[BenchmarkCase] = []
+    for size in (100_000, 1_000_000, 10_000_000):
+        for label, strategy in (("knuth-b", "knuth_b"), ("blocked", "blocked")):
+            metadata = {
+                "args": [],
+                "kwargs": {"strategy": strategy},
+                "seed": 0,
+                "input": {
+                    "container": "array.array('q')",
+                    "contents": f"range({size})",
+                    "size": size,
+                },
+                "setup_variant": f"module-seed-0-{strategy}-fresh-buffer-per-sample",
+            }
+            if function is None:
+                cases.append(
+                    BenchmarkCase(
+                        "shuffle-algorithms",
+                        f"buffer-{label}-{size}",
+                        skip_reason=reason,
+                        workload=metadata,
+                    )
+                )
+                continue
+
+            def setup(
+                size: int = size,
+                strategy: str = strategy,
+                function: Callable[..., Any] = function,
+            ):
+                assert fortuna is not None
+                fortuna.seed(0)
+                values = array("q", range(size))
+                return lambda: function(values, strategy=strategy)
+
+            cases.append(
+                BenchmarkCase(
+                    "shuffle-algorithms",
+                    f"buffer-{label}-{size}",
+                    setup=setup,
+                    workload=metadata,
+                )
+            )
     return cases
 
 
@@ -351,11 +412,14 @@ def _generator_bulk_case(
     module: Any | None,
     import_error: str | None,
     workload: _NumericWorkload,
+    *,
+    as_buffer: bool = False,
 ) -> BenchmarkCase:
     generator_type = getattr(module, "Generator", None) if module is not None else None
-    description = _workload_description("Generator", workload, count=workload.bulk_count)
-    metadata = _workload_metadata("generator", workload, count=workload.bulk_count)
-    case_name = f"generator-{workload.name}-{workload.bulk_count}"
+    count = workload.bulk_count
+    description = _workload_description("Generator", workload, count=count, as_buffer=as_buffer)
+    metadata = _workload_metadata("generator", workload, count=count, as_buffer=as_buffer)
+    case_name = f"generator-{workload.name}-{count}" + ("-buffer" if as_buffer else "")
     if not callable(generator_type):
         return BenchmarkCase(
             "fortuna-bulk",
@@ -381,7 +445,93 @@ def _generator_bulk_case(
     def setup():
         generator = generator_type(0)
         bound = getattr(generator, workload.method)
-        return lambda: bound(*workload.arguments, count=workload.bulk_count)
+        if as_buffer:
+            return lambda: bound(*workload.arguments, count=count, as_buffer=True)
+        return lambda: bound(*workload.arguments, count=count)
+
+    return BenchmarkCase(
+        "fortuna-bulk",
+        case_name,
+        setup=setup,
+        unit="value",
+        values_per_call=workload.bulk_count,
+        description=description,
+        workload=metadata,
+    )
+
+
+_RAW_BYTE_COUNT = 1 << 20
+_PACKED_BIT_WORKLOADS = (
+    _NumericWorkload("random_bits", "random_bits", (1 << 20,), 1 << 20),
+    _NumericWorkload("bernoulli_bits", "bernoulli_bits", (0.3, 1 << 20), 1 << 20),
+)
+
+
+def _generator_raw_bytes_case(module: Any | None, import_error: str | None) -> BenchmarkCase:
+    generator_type = getattr(module, "Generator", None) if module is not None else None
+    case_name = f"generator-fill_bytes-{_RAW_BYTE_COUNT}"
+    description = f"owner=Generator; method=fill_bytes; bytes={_RAW_BYTE_COUNT}; seed=0"
+    metadata = {
+        "args": (),
+        "kwargs": {},
+        "seed": 0,
+        "input": {"bytearray": _RAW_BYTE_COUNT},
+        "setup_variant": "generator.fill_bytes-seed-0-per-sample",
+    }
+    method = getattr(generator_type, "fill_bytes", None) if callable(generator_type) else None
+    if not callable(method):
+        return BenchmarkCase(
+            "fortuna-bulk",
+            case_name,
+            unit="value",
+            values_per_call=_RAW_BYTE_COUNT,
+            description=description,
+            skip_reason=import_error or "Fortuna.Generator.fill_bytes is unavailable",
+            workload=metadata,
+        )
+
+    def setup():
+        # The destination is reused across calls, so only engine output and the
+        # byte copy are timed.
+        fill = generator_type(0).fill_bytes
+        storage = bytearray(_RAW_BYTE_COUNT)
+        return lambda: fill(storage)
+
+    return BenchmarkCase(
+        "fortuna-bulk",
+        case_name,
+        setup=setup,
+        unit="value",
+        values_per_call=_RAW_BYTE_COUNT,
+        description=description,
+        workload=metadata,
+    )
+
+
+def _generator_packed_bits_case(
+    module: Any | None,
+    import_error: str | None,
+    workload: _NumericWorkload,
+) -> BenchmarkCase:
+    generator_type = getattr(module, "Generator", None) if module is not None else None
+    description = _workload_description("Generator", workload)
+    metadata = _workload_metadata("generator", workload)
+    case_name = f"generator-{workload.name}-{workload.bulk_count}"
+    method = getattr(generator_type, workload.method, None) if callable(generator_type) else None
+    if not callable(method):
+        return BenchmarkCase(
+            "fortuna-bulk",
+            case_name,
+            unit="value",
+            values_per_call=workload.bulk_count,
+            description=description,
+            skip_reason=import_error or f"Fortuna.Generator.{workload.method} is unavailable",
+            workload=metadata,
+        )
+
+    def setup():
+        bound = getattr(generator_type(0), workload.method)
+        return lambda: bound(*workload.arguments)
 
     return BenchmarkCase(
         "fortuna-bulk",
@@ -398,7 +548,8 @@ def fortuna_bulk_cases() -> list[BenchmarkCase]:
     """Tentative Fortuna 6 cases; missing APIs appear as explicit skips.
 
     Bulk generation uses the same public name and arguments as scalar generation,
-    plus the keyword-only ``count`` contract.
+    plus the keyword-only ``count`` contract. Generator cases are repeated with
+    ``as_buffer=True`` to compare typed-array output against list output.
     """
 
     fortuna, error = _load_fortuna()
@@ -406,4 +557,8 @@ def fortuna_bulk_cases() -> list[BenchmarkCase]:
     for workload in _CORE_WORKLOADS:
         cases.append(_module_bulk_case(fortuna, error, workload))
         cases.append(_generator_bulk_case(fortuna, error, workload))
+        cases.append(_generator_bulk_case(fortuna, error, workload, as_buffer=True))
+    cases.append(_generator_raw_bytes_case(fortuna, error))
+    for workload in _PACKED_BIT_WORKLOADS:
+        cases.append(_generator_packed_bits_case(fortuna, error, workload))
     return cases
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import importlib
 import random
+from array import array
 from collections.abc import Callable
 from typing import Any
 
@@ -15,6 +16,7 @@ VALUES_100 = tuple(range(100))
 SAMPLE_REGIMES = ((100, 10), (1_000, 10), (1_000, 500))
 WEIGHT_SIZES = (4, 100, 1_000)
 SHUFFLE_SIZES = (0, 1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+BUFFER_SHUFFLE_SIZES = (100, 10_000, 1_000_000)
 RANDOM_VALUE_METHODS = (
     "uniform",
     "cycle",
@@ -188,6 +190,12 @@ def _weighted_call_setup(fortuna: Any, *, size: int) -> Callable[[], Any]:
     return fortuna.WeightedChoice(_weighted_data(size))
 
 
+def _weighted_take_setup(fortuna: Any, *, size: int, count: int) -> Callable[[], Any]:
+    fortuna.seed(SEED)
+    selector = fortuna.WeightedChoice(_weighted_data(size))
+    return lambda: selector.take(count)
+
+
 def _weighted_construction_setup(fortuna: Any, *, size: int) -> Callable[[], Any]:
     fortuna.seed(SEED)
     data = _weighted_data(size)
@@ -238,6 +246,12 @@ def _shuffle_setup(fortuna: Any, *, size: int, generator_method: bool) -> Callab
     return lambda: fortuna.shuffle(values)
 
 
+def _buffer_shuffle_setup(fortuna: Any, *, size: int) -> Callable[[], Any]:
+    values = array("q", range(size))
+    fortuna.seed(SEED)
+    return lambda: fortuna.shuffle(values)
+
+
 def selector_cases() -> list[BenchmarkCase]:
     fortuna, error = _load_fortuna()
     cases: list[BenchmarkCase] = []
@@ -407,6 +421,25 @@ def selector_cases() -> list[BenchmarkCase]:
                     },
                     setup_variant="reused WeightedChoice",
                 ),
+                _case(
+                    f"weighted-choice-take-{size}",
+                    fortuna,
+                    error,
+                    lambda module, size=size: _weighted_take_setup(
+                        module,
+                        size=size,
+                        count=1_000,
+                    ),
+                    unit="value",
+                    values_per_call=1_000,
+                    workload_args=(1_000,),
+                    workload_input={
+                        "callable": "WeightedChoice.take",
+                        "constructor": {"weighted_table": _fixture_reference(fixture["id"])},
+                        "fixtures": [fixture],
+                    },
+                    setup_variant="reused WeightedChoice",
+                ),
                 _case(
                     f"weighted-choice-construction-{size}",
                     fortuna,
@@ -576,4 +609,29 @@ def selector_cases() -> list[BenchmarkCase]:
                 setup_variant="Generator.shuffle",
             )
         )
+
+    for size in BUFFER_SHUFFLE_SIZES:
+        values_id = f"int64-buffer-{size}"
+        cases.append(
+            _case(
+                f"shuffle-buffer-{size}",
+                fortuna,
+                error,
+                lambda module, size=size: _buffer_shuffle_setup(module, size=size),
+                workload_args=(_fixture_reference(values_id),),
+                workload_input={
+                    "callable": "Fortuna.shuffle",
+                    "mutation": "in place across timed loop iterations",
+                    "fixtures": [
+                        {
+                            "id": values_id,
+                            "type": "array.array",
+                            "recipe": f'array("q", range({size}))',
+                            "size": size,
+                        }
+                    ],
+                },
+                setup_variant="native buffer shuffle",
+            )
+        )
     return cases
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 from benchmarks.suites import all_cases, suite_names
-from benchmarks.suites.selectors import RANDOM_VALUE_METHODS, SHUFFLE_SIZES, selector_cases
+from benchmarks.suites.selectors import (
+    BUFFER_SHUFFLE_SIZES,
+    RANDOM_VALUE_METHODS,
+    SHUFFLE_SIZES,
+    selector_cases,
+)
 
 
 def _cases_by_name():
@@ -29,7 +34,7 @@ def test_selector_suite_names_are_unique_and_cover_each_api_family():
     assert all(case.suite == "selectors" for case in cases)
     assert all(case.workload_payload["declared"] for case in cases)
     assert all(case.workload_payload["input"] is not None for case in cases)
-    assert len(cases) == 68
+    assert len(cases) == 74
     for prefix in (
         "random-value-",
         "truffle-",
@@ -140,6 +145,19 @@ def test_weighted_choice_workloads_preserve_relative_weight_scaling():
         assert fixture["weight_model"] == "relative"
 
 
+def test_weighted_choice_take_workloads_count_values():
+    cases = _cases_by_name()
+
+    for size in (4, 100, 1_000):
+        case = cases[f"weighted-choice-take-{size}"]
+        workload = case.workload_payload
+
+        assert case.values_per_call == 1_000
+        assert workload["args"] == [1_000]
+        assert workload["input"]["callable"] == "WeightedChoice.take"
+        assert workload["input"]["fixtures"][0]["id"] == f"weighted-relative-{size}"
+
+
 def test_weighted_choice_cumulative_workloads_are_explicit():
     cases = _cases_by_name()
 
@@ -195,6 +213,16 @@ def test_shuffle_covers_public_rng_owners_across_the_size_matrix():
             assert workload["input"]["mutation"] == "in place across timed loop iterations"
 
 
+def test_buffer_shuffle_cases_use_int64_arrays():
+    cases = _cases_by_name()
+
+    for size in BUFFER_SHUFFLE_SIZES:
+        workload = cases[f"shuffle-buffer-{size}"].workload_payload
+
+        assert workload["input"]["callable"] == "Fortuna.shuffle"
+        assert workload["input"]["fixtures"][0]["recipe"] == f'array("q", range({size}))'
+
+
 def test_sample_custom_generator_fallback_has_exact_workload_metadata():
     workload = _cases_by_name()["sample-custom-generator-100-10"].workload_payload
 
@@ -4,6 +4,7 @@ from ._core import (
     Generator,
     ability_dice,
     back_triangular,
+    bernoulli_bits,
     bernoulli_variate,
     beta_variate,
     binomial_variate,
@@ -15,8 +16,10 @@ from ._core import (
     dice,
     exponential_variate,
     extreme_value_variate,
+    fill_bytes,
     fisher_f_variate,
     for_stream,
+    for_streams,
     from_entropy,
     front_triangular,
     gamma_variate,
@@ -31,6 +34,8 @@ from ._core import (
     plus_or_minus_triangular,
     poisson_variate,
     random_below,
+    random_bits,
+    random_bytes,
     random_float,
     random_index,
     random_int,
@@ -42,7 +47,19 @@ from ._core import (
     vonmises_variate,
     weibull_variate,
 )
-from ._selectors import RandomValue, TruffleShuffle, WeightedChoice, random_value, sample, shuffle
+from ._selectors import (
+    MutableWeightedChoice,
+    RandomPermutation,
+    RandomValue,
+    TruffleShuffle,
+    WeightedChoice,
+    random_value,
+    reservoir_sample,
+    sample,
+    shuffle,
+    weighted_reservoir_sample,
+    weighted_sample,
+)
 
 __version__ = "6.1.1"
 
@@ -53,6 +70,7 @@ __all__ = (
     "seed",
     "from_entropy",
     "for_stream",
+    "for_streams",
     "percent_true",
     "bernoulli_variate",
     "random_below",
@@ -88,10 +106,19 @@ __all__ = (
     "front_triangular",
     "center_triangular",
     "back_triangular",
+    "random_bytes",
+    "fill_bytes",
+    "random_bits",
+    "bernoulli_bits",
     "random_value",
     "shuffle",
     "sample",
+    "weighted_sample",
+    "reservoir_sample",
+    "weighted_reservoir_sample",
     "RandomValue",
     "TruffleShuffle",
     "WeightedChoice",
+    "MutableWeightedChoice",
+    "RandomPermutation",
 )
@@ -1,528 +1,3547 @@
-from collections.abc import Callable, Iterable, MutableSequence
-from typing import Self, TypeVar, overload
+from array import array
+from collections.abc import Buffer, Callable, Iterable, Iterator, MutableSequence, Sequence
+from typing import Generic, Literal, Self, TypeVar, overload
 
 _T = TypeVar("_T")
+_OutT = TypeVar("_OutT", bound=Buffer)
 _StreamId = int | str | bytes
+_Engine = Literal["mt19937_64", "pcg64_dxsm", "xoshiro256++", "sfc64", "philox4x64"]
+_FloatVector = Sequence[float] | Buffer
+_IntVector = Sequence[int] | Buffer
+_FloatAlgorithm = Literal["standard", "ziggurat"]
+_ShuffleStrategy = Literal["knuth_b", "blocked"]
+_BoolMethod = Literal["percent_true", "bernoulli_variate"]
+_IntMethod = Literal[
+    "random_below",
+    "random_index",
+    "random_int",
+    "random_range",
+    "d",
+    "dice",
+    "ability_dice",
+    "plus_or_minus",
+    "plus_or_minus_triangular",
+    "plus_or_minus_normal",
+    "binomial_variate",
+    "negative_binomial_variate",
+    "geometric_variate",
+    "poisson_variate",
+    "front_triangular",
+    "center_triangular",
+    "back_triangular",
+]
+_FloatMethod = Literal[
+    "canonical",
+    "random_float",
+    "triangular",
+    "beta_variate",
+    "pareto_variate",
+    "vonmises_variate",
+    "exponential_variate",
+    "gamma_variate",
+    "weibull_variate",
+    "normal_variate",
+    "log_normal_variate",
+    "extreme_value_variate",
+    "chi_squared_variate",
+    "cauchy_variate",
+    "fisher_f_variate",
+    "student_t_variate",
+]
 
 class Generator:
     @overload
-    def percent_true(self, percent: float = 50.0, *, count: None = None) -> bool: ...
+    def percent_true(
+        self,
+        percent: float = 50.0,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> bool: ...
+    @overload
+    def percent_true(
+        self,
+        percent: float | _FloatVector = 50.0,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[bool]: ...
+    @overload
+    def percent_true(
+        self,
+        percent: float | _FloatVector = 50.0,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[int]: ...
+    @overload
+    def percent_true(
+        self,
+        percent: float = 50.0,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> bool | list[bool]: ...
     @overload
-    def percent_true(self, percent: float = 50.0, *, count: int) -> list[bool]: ...
+    def percent_true(
+        self,
+        percent: float | _FloatVector = 50.0,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def percent_true(
+        self,
+        percent: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[bool]: ...
     @overload
-    def percent_true(self, percent: float = 50.0, *, count: int | None) -> bool | list[bool]: ...
+    def bernoulli_variate(
+        self,
+        probability: float = 0.5,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> bool: ...
     @overload
-    def bernoulli_variate(self, probability: float = 0.5, *, count: None = None) -> bool: ...
+    def bernoulli_variate(
+        self,
+        probability: float | _FloatVector = 0.5,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[bool]: ...
     @overload
-    def bernoulli_variate(self, probability: float = 0.5, *, count: int) -> list[bool]: ...
+    def bernoulli_variate(
+        self,
+        probability: float | _FloatVector = 0.5,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[int]: ...
     @overload
     def bernoulli_variate(
-        self, probability: float = 0.5, *, count: int | None
+        self,
+        probability: float = 0.5,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> bool | list[bool]: ...
     @overload
-    def random_below(self, limit: int, *, count: None = None) -> int: ...
+    def bernoulli_variate(
+        self,
+        probability: float | _FloatVector = 0.5,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def bernoulli_variate(
+        self,
+        probability: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[bool]: ...
+    @overload
+    def random_below(
+        self, limit: int, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+    ) -> int: ...
     @overload
-    def random_below(self, limit: int, *, count: int) -> list[int]: ...
+    def random_below(
+        self, limit: int, *, count: int, as_buffer: Literal[False] = False, out: None = None
+    ) -> list[int]: ...
     @overload
-    def random_below(self, limit: int, *, count: int | None) -> int | list[int]: ...
+    def random_below(
+        self, limit: int, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[int]: ...
     @overload
-    def random_index(self, size: int, *, count: None = None) -> int: ...
+    def random_below(
+        self, limit: int, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+    ) -> int | list[int]: ...
     @overload
-    def random_index(self, size: int, *, count: int) -> list[int]: ...
+    def random_below(
+        self, limit: int, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+    ) -> _OutT: ...
     @overload
-    def random_index(self, size: int, *, count: int | None) -> int | list[int]: ...
+    def random_index(
+        self, size: int, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+    ) -> int: ...
     @overload
-    def random_int(self, low: int, high: int, *, count: None = None) -> int: ...
+    def random_index(
+        self, size: int, *, count: int, as_buffer: Literal[False] = False, out: None = None
+    ) -> list[int]: ...
     @overload
-    def random_int(self, low: int, high: int, *, count: int) -> list[int]: ...
+    def random_index(
+        self, size: int, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[int]: ...
     @overload
-    def random_int(self, low: int, high: int, *, count: int | None) -> int | list[int]: ...
+    def random_index(
+        self, size: int, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+    ) -> int | list[int]: ...
+    @overload
+    def random_index(
+        self, size: int, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+    ) -> _OutT: ...
+    @overload
+    def random_int(
+        self,
+        low: int,
+        high: int,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int: ...
+    @overload
+    def random_int(
+        self,
+        low: int,
+        high: int,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[int]: ...
+    @overload
+    def random_int(
+        self, low: int, high: int, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[int]: ...
+    @overload
+    def random_int(
+        self,
+        low: int,
+        high: int,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int | list[int]: ...
+    @overload
+    def random_int(
+        self,
+        low: int,
+        high: int,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
     @overload
     def random_range(
-        self, start: int, stop: int | None = None, step: int = 1, *, count: None = None
+        self,
+        start: int,
+        stop: int | None = None,
+        step: int = 1,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> int: ...
     @overload
     def random_range(
-        self, start: int, stop: int | None = None, step: int = 1, *, count: int
+        self,
+        start: int,
+        stop: int | None = None,
+        step: int = 1,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> list[int]: ...
     @overload
     def random_range(
-        self, start: int, stop: int | None = None, step: int = 1, *, count: int | None
+        self,
+        start: int,
+        stop: int | None = None,
+        step: int = 1,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[int]: ...
+    @overload
+    def random_range(
+        self,
+        start: int,
+        stop: int | None = None,
+        step: int = 1,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> int | list[int]: ...
     @overload
-    def d(self, sides: int = 20, *, count: None = None) -> int: ...
+    def random_range(
+        self,
+        start: int,
+        stop: int | None = None,
+        step: int = 1,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def d(
+        self,
+        sides: int = 20,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int: ...
     @overload
-    def d(self, sides: int = 20, *, count: int) -> list[int]: ...
+    def d(
+        self, sides: int = 20, *, count: int, as_buffer: Literal[False] = False, out: None = None
+    ) -> list[int]: ...
     @overload
-    def d(self, sides: int = 20, *, count: int | None) -> int | list[int]: ...
+    def d(
+        self, sides: int = 20, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[int]: ...
+    @overload
+    def d(
+        self,
+        sides: int = 20,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int | list[int]: ...
     @overload
-    def dice(self, rolls: int = 1, sides: int = 20, *, count: None = None) -> int: ...
+    def d(
+        self,
+        sides: int = 20,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def dice(
+        self,
+        rolls: int = 1,
+        sides: int = 20,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int: ...
     @overload
-    def dice(self, rolls: int = 1, sides: int = 20, *, count: int) -> list[int]: ...
+    def dice(
+        self,
+        rolls: int = 1,
+        sides: int = 20,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[int]: ...
     @overload
-    def dice(self, rolls: int = 1, sides: int = 20, *, count: int | None) -> int | list[int]: ...
+    def dice(
+        self,
+        rolls: int = 1,
+        sides: int = 20,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[int]: ...
+    @overload
+    def dice(
+        self,
+        rolls: int = 1,
+        sides: int = 20,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int | list[int]: ...
     @overload
-    def ability_dice(self, rolls: int = 4, *, count: None = None) -> int: ...
+    def dice(
+        self,
+        rolls: int = 1,
+        sides: int = 20,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def ability_dice(
+        self,
+        rolls: int = 4,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int: ...
     @overload
-    def ability_dice(self, rolls: int = 4, *, count: int) -> list[int]: ...
+    def ability_dice(
+        self, rolls: int = 4, *, count: int, as_buffer: Literal[False] = False, out: None = None
+    ) -> list[int]: ...
     @overload
-    def ability_dice(self, rolls: int = 4, *, count: int | None) -> int | list[int]: ...
+    def ability_dice(
+        self, rolls: int = 4, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[int]: ...
+    @overload
+    def ability_dice(
+        self,
+        rolls: int = 4,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int | list[int]: ...
     @overload
-    def plus_or_minus(self, radius: int = 1, *, count: None = None) -> int: ...
+    def ability_dice(
+        self,
+        rolls: int = 4,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def plus_or_minus(
+        self,
+        radius: int = 1,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int: ...
     @overload
-    def plus_or_minus(self, radius: int = 1, *, count: int) -> list[int]: ...
+    def plus_or_minus(
+        self, radius: int = 1, *, count: int, as_buffer: Literal[False] = False, out: None = None
+    ) -> list[int]: ...
+    @overload
+    def plus_or_minus(
+        self, radius: int = 1, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[int]: ...
+    @overload
+    def plus_or_minus(
+        self,
+        radius: int = 1,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int | list[int]: ...
+    @overload
+    def plus_or_minus(
+        self,
+        radius: int = 1,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def plus_or_minus_triangular(
+        self,
+        radius: int = 1,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int: ...
     @overload
-    def plus_or_minus(self, radius: int = 1, *, count: int | None) -> int | list[int]: ...
+    def plus_or_minus_triangular(
+        self, radius: int = 1, *, count: int, as_buffer: Literal[False] = False, out: None = None
+    ) -> list[int]: ...
     @overload
-    def plus_or_minus_triangular(self, radius: int = 1, *, count: None = None) -> int: ...
+    def plus_or_minus_triangular(
+        self, radius: int = 1, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[int]: ...
     @overload
-    def plus_or_minus_triangular(self, radius: int = 1, *, count: int) -> list[int]: ...
+    def plus_or_minus_triangular(
+        self,
+        radius: int = 1,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int | list[int]: ...
     @overload
     def plus_or_minus_triangular(
-        self, radius: int = 1, *, count: int | None
+        self,
+        radius: int = 1,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def plus_or_minus_normal(
+        self,
+        radius: int = 1,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int: ...
+    @overload
+    def plus_or_minus_normal(
+        self, radius: int = 1, *, count: int, as_buffer: Literal[False] = False, out: None = None
+    ) -> list[int]: ...
+    @overload
+    def plus_or_minus_normal(
+        self, radius: int = 1, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[int]: ...
+    @overload
+    def plus_or_minus_normal(
+        self,
+        radius: int = 1,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> int | list[int]: ...
     @overload
-    def plus_or_minus_normal(self, radius: int = 1, *, count: None = None) -> int: ...
+    def plus_or_minus_normal(
+        self,
+        radius: int = 1,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def canonical(
+        self, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+    ) -> float: ...
     @overload
-    def plus_or_minus_normal(self, radius: int = 1, *, count: int) -> list[int]: ...
+    def canonical(
+        self, *, count: int, as_buffer: Literal[False] = False, out: None = None
+    ) -> list[float]: ...
     @overload
-    def plus_or_minus_normal(self, radius: int = 1, *, count: int | None) -> int | list[int]: ...
+    def canonical(
+        self, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[float]: ...
     @overload
-    def canonical(self, *, count: None = None) -> float: ...
+    def canonical(
+        self, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+    ) -> float | list[float]: ...
     @overload
-    def canonical(self, *, count: int) -> list[float]: ...
+    def canonical(
+        self, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+    ) -> _OutT: ...
     @overload
-    def canonical(self, *, count: int | None) -> float | list[float]: ...
+    def random_float(
+        self,
+        low: float = 0.0,
+        high: float = 1.0,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float: ...
     @overload
-    def random_float(self, low: float = 0.0, high: float = 1.0, *, count: None = None) -> float: ...
+    def random_float(
+        self,
+        low: float | _FloatVector = 0.0,
+        high: float | _FloatVector = 1.0,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
     @overload
-    def random_float(self, low: float = 0.0, high: float = 1.0, *, count: int) -> list[float]: ...
+    def random_float(
+        self,
+        low: float | _FloatVector = 0.0,
+        high: float | _FloatVector = 1.0,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
     @overload
     def random_float(
-        self, low: float = 0.0, high: float = 1.0, *, count: int | None
+        self,
+        low: float = 0.0,
+        high: float = 1.0,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
-    def triangular(self, low: float, high: float, mode: float, *, count: None = None) -> float: ...
+    def random_float(
+        self,
+        low: float | _FloatVector = 0.0,
+        high: float | _FloatVector = 1.0,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def random_float(
+        self,
+        low: _FloatVector,
+        high: float | _FloatVector = 1.0,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def random_float(
+        self,
+        low: float,
+        high: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
     @overload
-    def triangular(self, low: float, high: float, mode: float, *, count: int) -> list[float]: ...
+    def triangular(
+        self,
+        low: float,
+        high: float,
+        mode: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float: ...
     @overload
     def triangular(
-        self, low: float, high: float, mode: float, *, count: int | None
+        self,
+        low: float | _FloatVector,
+        high: float | _FloatVector,
+        mode: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def triangular(
+        self,
+        low: float | _FloatVector,
+        high: float | _FloatVector,
+        mode: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
+    @overload
+    def triangular(
+        self,
+        low: float,
+        high: float,
+        mode: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
-    def beta_variate(self, alpha: float, beta: float, *, count: None = None) -> float: ...
+    def triangular(
+        self,
+        low: float | _FloatVector,
+        high: float | _FloatVector,
+        mode: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
     @overload
-    def beta_variate(self, alpha: float, beta: float, *, count: int) -> list[float]: ...
+    def triangular(
+        self,
+        low: _FloatVector,
+        high: float | _FloatVector,
+        mode: float | _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def triangular(
+        self,
+        low: float,
+        high: _FloatVector,
+        mode: float | _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def triangular(
+        self,
+        low: float,
+        high: float,
+        mode: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
     @overload
     def beta_variate(
-        self, alpha: float, beta: float, *, count: int | None
+        self,
+        alpha: float,
+        beta: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float: ...
+    @overload
+    def beta_variate(
+        self,
+        alpha: float | _FloatVector,
+        beta: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def beta_variate(
+        self,
+        alpha: float | _FloatVector,
+        beta: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
+    @overload
+    def beta_variate(
+        self,
+        alpha: float,
+        beta: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
-    def pareto_variate(self, alpha: float, *, count: None = None) -> float: ...
+    def beta_variate(
+        self,
+        alpha: float | _FloatVector,
+        beta: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def beta_variate(
+        self,
+        alpha: _FloatVector,
+        beta: float | _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def beta_variate(
+        self,
+        alpha: float,
+        beta: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
     @overload
-    def pareto_variate(self, alpha: float, *, count: int) -> list[float]: ...
+    def pareto_variate(
+        self,
+        alpha: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float: ...
     @overload
-    def pareto_variate(self, alpha: float, *, count: int | None) -> float | list[float]: ...
+    def pareto_variate(
+        self,
+        alpha: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
     @overload
-    def vonmises_variate(self, mu: float, kappa: float, *, count: None = None) -> float: ...
+    def pareto_variate(
+        self, alpha: float | _FloatVector, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[float]: ...
+    @overload
+    def pareto_variate(
+        self,
+        alpha: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float | list[float]: ...
+    @overload
+    def pareto_variate(
+        self,
+        alpha: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def pareto_variate(
+        self,
+        alpha: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def vonmises_variate(
+        self,
+        mu: float,
+        kappa: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float: ...
+    @overload
+    def vonmises_variate(
+        self,
+        mu: float | _FloatVector,
+        kappa: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
     @overload
-    def vonmises_variate(self, mu: float, kappa: float, *, count: int) -> list[float]: ...
+    def vonmises_variate(
+        self,
+        mu: float | _FloatVector,
+        kappa: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
     @overload
     def vonmises_variate(
-        self, mu: float, kappa: float, *, count: int | None
+        self,
+        mu: float,
+        kappa: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
-    def binomial_variate(self, trials: int, probability: float, *, count: None = None) -> int: ...
+    def vonmises_variate(
+        self,
+        mu: float | _FloatVector,
+        kappa: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def vonmises_variate(
+        self,
+        mu: _FloatVector,
+        kappa: float | _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def vonmises_variate(
+        self,
+        mu: float,
+        kappa: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def binomial_variate(
+        self,
+        trials: int,
+        probability: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int: ...
     @overload
-    def binomial_variate(self, trials: int, probability: float, *, count: int) -> list[int]: ...
+    def binomial_variate(
+        self,
+        trials: int | _IntVector,
+        probability: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[int]: ...
     @overload
     def binomial_variate(
-        self, trials: int, probability: float, *, count: int | None
+        self,
+        trials: int | _IntVector,
+        probability: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[int]: ...
+    @overload
+    def binomial_variate(
+        self,
+        trials: int,
+        probability: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> int | list[int]: ...
     @overload
+    def binomial_variate(
+        self,
+        trials: int | _IntVector,
+        probability: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def binomial_variate(
+        self,
+        trials: _IntVector,
+        probability: float | _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[int]: ...
+    @overload
+    def binomial_variate(
+        self,
+        trials: int,
+        probability: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[int]: ...
+    @overload
     def negative_binomial_variate(
-        self, successes: int, probability: float, *, count: None = None
+        self,
+        successes: int,
+        probability: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> int: ...
     @overload
     def negative_binomial_variate(
-        self, successes: int, probability: float, *, count: int
+        self,
+        successes: int | _IntVector,
+        probability: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> list[int]: ...
     @overload
     def negative_binomial_variate(
-        self, successes: int, probability: float, *, count: int | None
+        self,
+        successes: int | _IntVector,
+        probability: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[int]: ...
+    @overload
+    def negative_binomial_variate(
+        self,
+        successes: int,
+        probability: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> int | list[int]: ...
     @overload
-    def geometric_variate(self, probability: float, *, count: None = None) -> int: ...
+    def negative_binomial_variate(
+        self,
+        successes: int | _IntVector,
+        probability: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
     @overload
-    def geometric_variate(self, probability: float, *, count: int) -> list[int]: ...
+    def negative_binomial_variate(
+        self,
+        successes: _IntVector,
+        probability: float | _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[int]: ...
+    @overload
+    def negative_binomial_variate(
+        self,
+        successes: int,
+        probability: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[int]: ...
+    @overload
+    def geometric_variate(
+        self,
+        probability: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int: ...
+    @overload
+    def geometric_variate(
+        self,
+        probability: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[int]: ...
+    @overload
+    def geometric_variate(
+        self,
+        probability: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[int]: ...
+    @overload
+    def geometric_variate(
+        self,
+        probability: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int | list[int]: ...
+    @overload
+    def geometric_variate(
+        self,
+        probability: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def geometric_variate(
+        self,
+        probability: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[int]: ...
+    @overload
+    def poisson_variate(
+        self,
+        mean: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> int: ...
     @overload
-    def geometric_variate(self, probability: float, *, count: int | None) -> int | list[int]: ...
+    def poisson_variate(
+        self,
+        mean: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[int]: ...
     @overload
-    def poisson_variate(self, mean: float, *, count: None = None) -> int: ...
+    def poisson_variate(
+        self, mean: float | _FloatVector, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[int]: ...
     @overload
-    def poisson_variate(self, mean: float, *, count: int) -> list[int]: ...
+    def poisson_variate(
+        self, mean: float, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+    ) -> int | list[int]: ...
     @overload
-    def poisson_variate(self, mean: float, *, count: int | None) -> int | list[int]: ...
+    def poisson_variate(
+        self,
+        mean: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def poisson_variate(
+        self,
+        mean: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[int]: ...
     @overload
-    def exponential_variate(self, rate: float, *, count: None = None) -> float: ...
+    def exponential_variate(
+        self,
+        rate: float,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float: ...
     @overload
-    def exponential_variate(self, rate: float, *, count: int) -> list[float]: ...
+    def exponential_variate(
+        self,
+        rate: float | _FloatVector,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
     @overload
-    def exponential_variate(self, rate: float, *, count: int | None) -> float | list[float]: ...
+    def exponential_variate(
+        self,
+        rate: float | _FloatVector,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
+    @overload
+    def exponential_variate(
+        self,
+        rate: float,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float | list[float]: ...
     @overload
-    def gamma_variate(self, shape: float, scale: float, *, count: None = None) -> float: ...
+    def exponential_variate(
+        self,
+        rate: float | _FloatVector,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def exponential_variate(
+        self,
+        rate: _FloatVector,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def gamma_variate(
+        self,
+        shape: float,
+        scale: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float: ...
+    @overload
+    def gamma_variate(
+        self,
+        shape: float | _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
     @overload
-    def gamma_variate(self, shape: float, scale: float, *, count: int) -> list[float]: ...
+    def gamma_variate(
+        self,
+        shape: float | _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
     @overload
     def gamma_variate(
-        self, shape: float, scale: float, *, count: int | None
+        self,
+        shape: float,
+        scale: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
-    def weibull_variate(self, shape: float, scale: float, *, count: None = None) -> float: ...
+    def gamma_variate(
+        self,
+        shape: float | _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def gamma_variate(
+        self,
+        shape: _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def gamma_variate(
+        self,
+        shape: float,
+        scale: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
     @overload
-    def weibull_variate(self, shape: float, scale: float, *, count: int) -> list[float]: ...
+    def weibull_variate(
+        self,
+        shape: float,
+        scale: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float: ...
+    @overload
+    def weibull_variate(
+        self,
+        shape: float | _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
     @overload
     def weibull_variate(
-        self, shape: float, scale: float, *, count: int | None
+        self,
+        shape: float | _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
+    @overload
+    def weibull_variate(
+        self,
+        shape: float,
+        scale: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
-    def normal_variate(self, mean: float, std_dev: float, *, count: None = None) -> float: ...
+    def weibull_variate(
+        self,
+        shape: float | _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
     @overload
-    def normal_variate(self, mean: float, std_dev: float, *, count: int) -> list[float]: ...
+    def weibull_variate(
+        self,
+        shape: _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def weibull_variate(
+        self,
+        shape: float,
+        scale: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def normal_variate(
+        self,
+        mean: float,
+        std_dev: float,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float: ...
     @overload
     def normal_variate(
-        self, mean: float, std_dev: float, *, count: int | None
+        self,
+        mean: float | _FloatVector,
+        std_dev: float | _FloatVector,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def normal_variate(
+        self,
+        mean: float | _FloatVector,
+        std_dev: float | _FloatVector,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
+    @overload
+    def normal_variate(
+        self,
+        mean: float,
+        std_dev: float,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
+    def normal_variate(
+        self,
+        mean: float | _FloatVector,
+        std_dev: float | _FloatVector,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def normal_variate(
+        self,
+        mean: _FloatVector,
+        std_dev: float | _FloatVector,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def normal_variate(
+        self,
+        mean: float,
+        std_dev: _FloatVector,
+        *,
+        algorithm: _FloatAlgorithm = "standard",
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
     def log_normal_variate(
-        self, log_mean: float, log_deviation: float, *, count: None = None
+        self,
+        log_mean: float,
+        log_deviation: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float: ...
     @overload
     def log_normal_variate(
-        self, log_mean: float, log_deviation: float, *, count: int
+        self,
+        log_mean: float | _FloatVector,
+        log_deviation: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> list[float]: ...
     @overload
     def log_normal_variate(
-        self, log_mean: float, log_deviation: float, *, count: int | None
+        self,
+        log_mean: float | _FloatVector,
+        log_deviation: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
+    @overload
+    def log_normal_variate(
+        self,
+        log_mean: float,
+        log_deviation: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
+    def log_normal_variate(
+        self,
+        log_mean: float | _FloatVector,
+        log_deviation: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def log_normal_variate(
+        self,
+        log_mean: _FloatVector,
+        log_deviation: float | _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def log_normal_variate(
+        self,
+        log_mean: float,
+        log_deviation: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
     def extreme_value_variate(
-        self, location: float, scale: float, *, count: None = None
+        self,
+        location: float,
+        scale: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float: ...
     @overload
     def extreme_value_variate(
-        self, location: float, scale: float, *, count: int
+        self,
+        location: float | _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> list[float]: ...
     @overload
     def extreme_value_variate(
-        self, location: float, scale: float, *, count: int | None
+        self,
+        location: float | _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
+    @overload
+    def extreme_value_variate(
+        self,
+        location: float,
+        scale: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
-    def chi_squared_variate(self, degrees_of_freedom: float, *, count: None = None) -> float: ...
+    def extreme_value_variate(
+        self,
+        location: float | _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
     @overload
-    def chi_squared_variate(self, degrees_of_freedom: float, *, count: int) -> list[float]: ...
+    def extreme_value_variate(
+        self,
+        location: _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def extreme_value_variate(
+        self,
+        location: float,
+        scale: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def chi_squared_variate(
+        self,
+        degrees_of_freedom: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float: ...
+    @overload
+    def chi_squared_variate(
+        self,
+        degrees_of_freedom: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def chi_squared_variate(
+        self,
+        degrees_of_freedom: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
     @overload
     def chi_squared_variate(
-        self, degrees_of_freedom: float, *, count: int | None
+        self,
+        degrees_of_freedom: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
-    def cauchy_variate(self, location: float, scale: float, *, count: None = None) -> float: ...
+    def chi_squared_variate(
+        self,
+        degrees_of_freedom: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
     @overload
-    def cauchy_variate(self, location: float, scale: float, *, count: int) -> list[float]: ...
+    def chi_squared_variate(
+        self,
+        degrees_of_freedom: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
     @overload
     def cauchy_variate(
-        self, location: float, scale: float, *, count: int | None
+        self,
+        location: float,
+        scale: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float: ...
+    @overload
+    def cauchy_variate(
+        self,
+        location: float | _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def cauchy_variate(
+        self,
+        location: float | _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
+    @overload
+    def cauchy_variate(
+        self,
+        location: float,
+        scale: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
+    def cauchy_variate(
+        self,
+        location: float | _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def cauchy_variate(
+        self,
+        location: _FloatVector,
+        scale: float | _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def cauchy_variate(
+        self,
+        location: float,
+        scale: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
     def fisher_f_variate(
-        self, degrees_1: float, degrees_2: float, *, count: None = None
+        self,
+        degrees_1: float,
+        degrees_2: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float: ...
     @overload
     def fisher_f_variate(
-        self, degrees_1: float, degrees_2: float, *, count: int
+        self,
+        degrees_1: float | _FloatVector,
+        degrees_2: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> list[float]: ...
     @overload
     def fisher_f_variate(
-        self, degrees_1: float, degrees_2: float, *, count: int | None
+        self,
+        degrees_1: float | _FloatVector,
+        degrees_2: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
+    @overload
+    def fisher_f_variate(
+        self,
+        degrees_1: float,
+        degrees_2: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
-    def student_t_variate(self, degrees_of_freedom: float, *, count: None = None) -> float: ...
+    def fisher_f_variate(
+        self,
+        degrees_1: float | _FloatVector,
+        degrees_2: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def fisher_f_variate(
+        self,
+        degrees_1: _FloatVector,
+        degrees_2: float | _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def fisher_f_variate(
+        self,
+        degrees_1: float,
+        degrees_2: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def student_t_variate(
+        self,
+        degrees_of_freedom: float,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> float: ...
     @overload
-    def student_t_variate(self, degrees_of_freedom: float, *, count: int) -> list[float]: ...
+    def student_t_variate(
+        self,
+        degrees_of_freedom: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
     @overload
     def student_t_variate(
-        self, degrees_of_freedom: float, *, count: int | None
+        self,
+        degrees_of_freedom: float | _FloatVector,
+        *,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+    ) -> array[float]: ...
+    @overload
+    def student_t_variate(
+        self,
+        degrees_of_freedom: float,
+        *,
+        count: int | None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
     ) -> float | list[float]: ...
     @overload
-    def front_triangular(self, size: int, *, count: None = None) -> int: ...
+    def student_t_variate(
+        self,
+        degrees_of_freedom: float | _FloatVector,
+        *,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+    ) -> _OutT: ...
+    @overload
+    def student_t_variate(
+        self,
+        degrees_of_freedom: _FloatVector,
+        *,
+        count: None = None,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+    ) -> list[float]: ...
+    @overload
+    def front_triangular(
+        self, size: int, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+    ) -> int: ...
+    @overload
+    def front_triangular(
+        self, size: int, *, count: int, as_buffer: Literal[False] = False, out: None = None
+    ) -> list[int]: ...
+    @overload
+    def front_triangular(
+        self, size: int, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[int]: ...
+    @overload
+    def front_triangular(
+        self, size: int, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+    ) -> int | list[int]: ...
+    @overload
+    def front_triangular(
+        self, size: int, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+    ) -> _OutT: ...
+    @overload
+    def center_triangular(
+        self, size: int, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+    ) -> int: ...
     @overload
-    def front_triangular(self, size: int, *, count: int) -> list[int]: ...
+    def center_triangular(
+        self, size: int, *, count: int, as_buffer: Literal[False] = False, out: None = None
+    ) -> list[int]: ...
     @overload
-    def front_triangular(self, size: int, *, count: int | None) -> int | list[int]: ...
+    def center_triangular(
+        self, size: int, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[int]: ...
     @overload
-    def center_triangular(self, size: int, *, count: None = None) -> int: ...
+    def center_triangular(
+        self, size: int, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+    ) -> int | list[int]: ...
     @overload
-    def center_triangular(self, size: int, *, count: int) -> list[int]: ...
+    def center_triangular(
+        self, size: int, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+    ) -> _OutT: ...
     @overload
-    def center_triangular(self, size: int, *, count: int | None) -> int | list[int]: ...
+    def back_triangular(
+        self, size: int, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+    ) -> int: ...
     @overload
-    def back_triangular(self, size: int, *, count: None = None) -> int: ...
+    def back_triangular(
+        self, size: int, *, count: int, as_buffer: Literal[False] = False, out: None = None
+    ) -> list[int]: ...
     @overload
-    def back_triangular(self, size: int, *, count: int) -> list[int]: ...
+    def back_triangular(
+        self, size: int, *, count: int, as_buffer: Literal[True], out: None = None
+    ) -> array[int]: ...
     @overload
-    def back_triangular(self, size: int, *, count: int | None) -> int | list[int]: ...
+    def back_triangular(
+        self, size: int, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+    ) -> int | list[int]: ...
+    @overload
+    def back_triangular(
+        self, size: int, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+    ) -> _OutT: ...
+    def random_bytes(self, size: int) -> bytes: ...
+    def fill_bytes(self, buffer: Buffer) -> None: ...
+    def random_bits(self, size: int) -> bytes: ...
+    def bernoulli_bits(self, probability: float, size: int) -> bytes: ...
+    @overload
+    def prepare(
+        self, method: _BoolMethod, *args: float, **kwargs: float | str
+    ) -> Sampler[bool]: ...
+    @overload
+    def prepare(self, method: _IntMethod, *args: float, **kwargs: float | str) -> Sampler[int]: ...
+    @overload
+    def prepare(
+        self, method: _FloatMethod, *args: float, **kwargs: float | str
+    ) -> Sampler[float]: ...
+    @overload
+    def stream(
+        self, method: _BoolMethod, *args: float, chunk: int = 1024, **kwargs: float | str
+    ) -> Iterator[bool]: ...
+    @overload
+    def stream(
+        self, method: _IntMethod, *args: float, chunk: int = 1024, **kwargs: float | str
+    ) -> Iterator[int]: ...
+    @overload
+    def stream(
+        self, method: _FloatMethod, *args: float, chunk: int = 1024, **kwargs: float | str
+    ) -> Iterator[float]: ...
+    @overload
+    def parallel(
+        self,
+        method: _BoolMethod,
+        *args: float,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+        chunk: int = 65536,
+        threads: int | None = None,
+        **kwargs: float | str,
+    ) -> list[bool]: ...
+    @overload
+    def parallel(
+        self,
+        method: _IntMethod,
+        *args: float,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+        chunk: int = 65536,
+        threads: int | None = None,
+        **kwargs: float | str,
+    ) -> list[int]: ...
+    @overload
+    def parallel(
+        self,
+        method: _FloatMethod,
+        *args: float,
+        count: int,
+        as_buffer: Literal[False] = False,
+        out: None = None,
+        chunk: int = 65536,
+        threads: int | None = None,
+        **kwargs: float | str,
+    ) -> list[float]: ...
+    @overload
+    def parallel(
+        self,
+        method: _BoolMethod | _IntMethod,
+        *args: float,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+        chunk: int = 65536,
+        threads: int | None = None,
+        **kwargs: float | str,
+    ) -> array[int]: ...
+    @overload
+    def parallel(
+        self,
+        method: _FloatMethod,
+        *args: float,
+        count: int,
+        as_buffer: Literal[True],
+        out: None = None,
+        chunk: int = 65536,
+        threads: int | None = None,
+        **kwargs: float | str,
+    ) -> array[float]: ...
+    @overload
+    def parallel(
+        self,
+        method: _BoolMethod | _IntMethod | _FloatMethod,
+        *args: float,
+        count: int | None = None,
+        as_buffer: Literal[False] = False,
+        out: _OutT,
+        chunk: int = 65536,
+        threads: int | None = None,
+        **kwargs: float | str,
+    ) -> _OutT: ...
     def _front_poisson(self, size: int) -> int: ...
-    def __init__(self, seed: int = 0) -> None: ...
+    def __init__(self, seed: int = 0, *, engine: _Engine = "mt19937_64") -> None: ...
+    @classmethod
+    def from_entropy(cls, *, engine: _Engine = "mt19937_64") -> Self: ...
     @classmethod
-    def from_entropy(cls) -> Self: ...
+    def for_stream(
+        cls, root_seed: int, stream_id: _StreamId, *, engine: _Engine = "mt19937_64"
+    ) -> Self: ...
     @classmethod
-    def for_stream(cls, root_seed: int, stream_id: _StreamId) -> Self: ...
+    def for_streams(
+        cls, root_seed: int, stream_ids: Iterable[_StreamId], *, engine: _Engine = "mt19937_64"
+    ) -> list[Self]: ...
+    def spawn(self, n: int) -> list[Self]: ...
+    @property
+    def engine(self) -> _Engine: ...
+    @property
+    def position(self) -> int: ...
+    def at(self, offset: int) -> Self: ...
+    def advance(self, steps: int) -> Self: ...
+    def jump(self) -> Self: ...
+    @overload
+    def getstate(self, *, out: None = None) -> bytes: ...
+    @overload
+    def getstate(self, *, out: _OutT) -> _OutT: ...
+    def setstate(self, state: Buffer) -> None: ...
     def seed(self, value: int = 0) -> None: ...
     def reseed_from_entropy(self) -> None: ...
     def random_value(self, data: Iterable[_T]) -> _T: ...
-    def shuffle(self, data: MutableSequence[_T]) -> None: ...
+    def shuffle(
+        self,
+        data: MutableSequence[_T] | Buffer,
+        *,
+        item_size: int | None = None,
+        strategy: _ShuffleStrategy = "knuth_b",
+        threads: int = 1,
+    ) -> None: ...
     def sample(self, population: Iterable[_T], k: int) -> list[_T]: ...
     def _sample_materialized(self, working: list[_T], checked_k: int) -> list[_T]: ...
+    def _sample_range(self, population: range, checked_k: int) -> list[int]: ...
+
+class Sampler(Generic[_T]):
+    def __call__(self) -> _T: ...
+    @overload
+    def take(self, count: int, *, as_buffer: Literal[False] = False) -> list[_T]: ...
+    @overload
+    def take(self: Sampler[float], count: int, *, as_buffer: Literal[True]) -> array[float]: ...
+    @overload
+    def take(
+        self: Sampler[int] | Sampler[bool], count: int, *, as_buffer: Literal[True]
+    ) -> array[int]: ...
+    def fill(self, out: _OutT) -> _OutT: ...
 
 def storm_version() -> str: ...
 def seed(value: int = 0) -> None: ...
-def from_entropy() -> Generator: ...
-def for_stream(root_seed: int, stream_id: _StreamId) -> Generator: ...
-def shuffle(data: MutableSequence[_T]) -> None: ...
+def from_entropy(*, engine: _Engine = "mt19937_64") -> Generator: ...
+def for_stream(
+    root_seed: int, stream_id: _StreamId, *, engine: _Engine = "mt19937_64"
+) -> Generator: ...
+def for_streams(
+    root_seed: int, stream_ids: Iterable[_StreamId], *, engine: _Engine = "mt19937_64"
+) -> list[Generator]: ...
+def shuffle(
+    data: MutableSequence[_T] | Buffer,
+    *,
+    item_size: int | None = None,
+    strategy: _ShuffleStrategy = "knuth_b",
+    threads: int = 1,
+) -> None: ...
 def _benchmark_shuffle_knuth_b(data: MutableSequence[_T]) -> None: ...
 def _benchmark_shuffle_fisher_yates(data: MutableSequence[_T]) -> None: ...
 def _sample_materialized(working: list[_T], checked_k: int) -> list[_T]: ...
+def _sample_range(population: range, checked_k: int) -> list[int]: ...
+def _weighted_sample(
+    values: tuple[_T, ...],
+    boundaries: Iterable[float],
+    count: int,
+    generator: Generator | None = None,
+) -> list[_T]: ...
 def _random_value_materialized(data: tuple[_T, ...] | list[_T]) -> _T: ...
 def _wide_index_selector(size: int, generator: Generator | None = None) -> Callable[[], int]: ...
 def _prepared_cumulative_weighted_index(
     boundaries: Iterable[float], generator: Generator | None = None
 ) -> Callable[[], int]: ...
+def _prepared_alias_weighted_index(
+    boundaries: Iterable[float], generator: Generator | None = None
+) -> Callable[[], int]: ...
+def _reservoir_draws(size: int, generator: Generator | None = None) -> object: ...
+def _fenwick_weighted_index(
+    weights: Iterable[float], generator: Generator | None = None
+) -> Callable[[], int]: ...
+def _feistel_permutation(size: int, keys: Iterable[int]) -> object: ...
+@overload
+def percent_true(
+    percent: float = 50.0,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> bool: ...
+@overload
+def percent_true(
+    percent: float | _FloatVector = 50.0,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[bool]: ...
+@overload
+def percent_true(
+    percent: float | _FloatVector = 50.0, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
+@overload
+def percent_true(
+    percent: float = 50.0, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> bool | list[bool]: ...
+@overload
+def percent_true(
+    percent: float | _FloatVector = 50.0,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def percent_true(
+    percent: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[bool]: ...
+@overload
+def bernoulli_variate(
+    probability: float = 0.5,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> bool: ...
+@overload
+def bernoulli_variate(
+    probability: float | _FloatVector = 0.5,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[bool]: ...
+@overload
+def bernoulli_variate(
+    probability: float | _FloatVector = 0.5,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[int]: ...
+@overload
+def bernoulli_variate(
+    probability: float = 0.5,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> bool | list[bool]: ...
+@overload
+def bernoulli_variate(
+    probability: float | _FloatVector = 0.5,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def bernoulli_variate(
+    probability: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[bool]: ...
+@overload
+def random_below(
+    limit: int, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
 @overload
-def percent_true(percent: float = 50.0, *, count: None = None) -> bool: ...
-@overload
-def percent_true(percent: float = 50.0, *, count: int) -> list[bool]: ...
+def random_below(
+    limit: int, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
 @overload
-def percent_true(percent: float = 50.0, *, count: int | None) -> bool | list[bool]: ...
+def random_below(
+    limit: int, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
 @overload
-def bernoulli_variate(probability: float = 0.5, *, count: None = None) -> bool: ...
+def random_below(
+    limit: int, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
 @overload
-def bernoulli_variate(probability: float = 0.5, *, count: int) -> list[bool]: ...
+def random_below(
+    limit: int, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+) -> _OutT: ...
 @overload
-def bernoulli_variate(probability: float = 0.5, *, count: int | None) -> bool | list[bool]: ...
+def random_index(
+    size: int, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
 @overload
-def random_below(limit: int, *, count: None = None) -> int: ...
+def random_index(
+    size: int, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
 @overload
-def random_below(limit: int, *, count: int) -> list[int]: ...
+def random_index(
+    size: int, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
 @overload
-def random_below(limit: int, *, count: int | None) -> int | list[int]: ...
+def random_index(
+    size: int, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
 @overload
-def random_index(size: int, *, count: None = None) -> int: ...
+def random_index(
+    size: int, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+) -> _OutT: ...
 @overload
-def random_index(size: int, *, count: int) -> list[int]: ...
+def random_int(
+    low: int, high: int, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
 @overload
-def random_index(size: int, *, count: int | None) -> int | list[int]: ...
+def random_int(
+    low: int, high: int, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
 @overload
-def random_int(low: int, high: int, *, count: None = None) -> int: ...
+def random_int(
+    low: int, high: int, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
 @overload
-def random_int(low: int, high: int, *, count: int) -> list[int]: ...
+def random_int(
+    low: int, high: int, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
 @overload
-def random_int(low: int, high: int, *, count: int | None) -> int | list[int]: ...
+def random_int(
+    low: int, high: int, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+) -> _OutT: ...
 @overload
 def random_range(
-    start: int, stop: int | None = None, step: int = 1, *, count: None = None
+    start: int,
+    stop: int | None = None,
+    step: int = 1,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
 ) -> int: ...
 @overload
 def random_range(
-    start: int, stop: int | None = None, step: int = 1, *, count: int
+    start: int,
+    stop: int | None = None,
+    step: int = 1,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
 ) -> list[int]: ...
 @overload
 def random_range(
-    start: int, stop: int | None = None, step: int = 1, *, count: int | None
+    start: int,
+    stop: int | None = None,
+    step: int = 1,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[int]: ...
+@overload
+def random_range(
+    start: int,
+    stop: int | None = None,
+    step: int = 1,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
 ) -> int | list[int]: ...
 @overload
-def d(sides: int = 20, *, count: None = None) -> int: ...
+def random_range(
+    start: int,
+    stop: int | None = None,
+    step: int = 1,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def d(
+    sides: int = 20, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
 @overload
-def d(sides: int = 20, *, count: int) -> list[int]: ...
+def d(
+    sides: int = 20, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
 @overload
-def d(sides: int = 20, *, count: int | None) -> int | list[int]: ...
+def d(sides: int = 20, *, count: int, as_buffer: Literal[True], out: None = None) -> array[int]: ...
 @overload
-def dice(rolls: int = 1, sides: int = 20, *, count: None = None) -> int: ...
+def d(
+    sides: int = 20, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
 @overload
-def dice(rolls: int = 1, sides: int = 20, *, count: int) -> list[int]: ...
+def d(
+    sides: int = 20, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+) -> _OutT: ...
+@overload
+def dice(
+    rolls: int = 1,
+    sides: int = 20,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> int: ...
 @overload
-def dice(rolls: int = 1, sides: int = 20, *, count: int | None) -> int | list[int]: ...
+def dice(
+    rolls: int = 1,
+    sides: int = 20,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[int]: ...
 @overload
-def ability_dice(rolls: int = 4, *, count: None = None) -> int: ...
+def dice(
+    rolls: int = 1, sides: int = 20, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
+@overload
+def dice(
+    rolls: int = 1,
+    sides: int = 20,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> int | list[int]: ...
 @overload
-def ability_dice(rolls: int = 4, *, count: int) -> list[int]: ...
+def dice(
+    rolls: int = 1,
+    sides: int = 20,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def ability_dice(
+    rolls: int = 4, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
 @overload
-def ability_dice(rolls: int = 4, *, count: int | None) -> int | list[int]: ...
+def ability_dice(
+    rolls: int = 4, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
 @overload
-def plus_or_minus(radius: int = 1, *, count: None = None) -> int: ...
+def ability_dice(
+    rolls: int = 4, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
 @overload
-def plus_or_minus(radius: int = 1, *, count: int) -> list[int]: ...
+def ability_dice(
+    rolls: int = 4, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
 @overload
-def plus_or_minus(radius: int = 1, *, count: int | None) -> int | list[int]: ...
+def ability_dice(
+    rolls: int = 4, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+) -> _OutT: ...
 @overload
-def plus_or_minus_triangular(radius: int = 1, *, count: None = None) -> int: ...
+def plus_or_minus(
+    radius: int = 1, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
 @overload
-def plus_or_minus_triangular(radius: int = 1, *, count: int) -> list[int]: ...
+def plus_or_minus(
+    radius: int = 1, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
 @overload
-def plus_or_minus_triangular(radius: int = 1, *, count: int | None) -> int | list[int]: ...
+def plus_or_minus(
+    radius: int = 1, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
 @overload
-def plus_or_minus_normal(radius: int = 1, *, count: None = None) -> int: ...
+def plus_or_minus(
+    radius: int = 1, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
 @overload
-def plus_or_minus_normal(radius: int = 1, *, count: int) -> list[int]: ...
+def plus_or_minus(
+    radius: int = 1, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+) -> _OutT: ...
 @overload
-def plus_or_minus_normal(radius: int = 1, *, count: int | None) -> int | list[int]: ...
+def plus_or_minus_triangular(
+    radius: int = 1, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
 @overload
-def canonical(*, count: None = None) -> float: ...
+def plus_or_minus_triangular(
+    radius: int = 1, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
 @overload
-def canonical(*, count: int) -> list[float]: ...
+def plus_or_minus_triangular(
+    radius: int = 1, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
 @overload
-def canonical(*, count: int | None) -> float | list[float]: ...
+def plus_or_minus_triangular(
+    radius: int = 1, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
 @overload
-def random_float(low: float = 0.0, high: float = 1.0, *, count: None = None) -> float: ...
+def plus_or_minus_triangular(
+    radius: int = 1, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+) -> _OutT: ...
 @overload
-def random_float(low: float = 0.0, high: float = 1.0, *, count: int) -> list[float]: ...
+def plus_or_minus_normal(
+    radius: int = 1, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
+@overload
+def plus_or_minus_normal(
+    radius: int = 1, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
+@overload
+def plus_or_minus_normal(
+    radius: int = 1, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
+@overload
+def plus_or_minus_normal(
+    radius: int = 1, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
+@overload
+def plus_or_minus_normal(
+    radius: int = 1, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+) -> _OutT: ...
+@overload
+def canonical(
+    *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> float: ...
+@overload
+def canonical(
+    *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[float]: ...
+@overload
+def canonical(*, count: int, as_buffer: Literal[True], out: None = None) -> array[float]: ...
+@overload
+def canonical(
+    *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> float | list[float]: ...
+@overload
+def canonical(
+    *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+) -> _OutT: ...
 @overload
 def random_float(
-    low: float = 0.0, high: float = 1.0, *, count: int | None
+    low: float = 0.0,
+    high: float = 1.0,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
+@overload
+def random_float(
+    low: float | _FloatVector = 0.0,
+    high: float | _FloatVector = 1.0,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def random_float(
+    low: float | _FloatVector = 0.0,
+    high: float | _FloatVector = 1.0,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
+@overload
+def random_float(
+    low: float = 0.0,
+    high: float = 1.0,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
 ) -> float | list[float]: ...
 @overload
-def triangular(low: float, high: float, mode: float, *, count: None = None) -> float: ...
+def random_float(
+    low: float | _FloatVector = 0.0,
+    high: float | _FloatVector = 1.0,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
 @overload
-def triangular(low: float, high: float, mode: float, *, count: int) -> list[float]: ...
+def random_float(
+    low: _FloatVector,
+    high: float | _FloatVector = 1.0,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def random_float(
+    low: float,
+    high: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def triangular(
+    low: float,
+    high: float,
+    mode: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
+@overload
+def triangular(
+    low: float | _FloatVector,
+    high: float | _FloatVector,
+    mode: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
 @overload
 def triangular(
-    low: float, high: float, mode: float, *, count: int | None
+    low: float | _FloatVector,
+    high: float | _FloatVector,
+    mode: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
+@overload
+def triangular(
+    low: float,
+    high: float,
+    mode: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
 ) -> float | list[float]: ...
 @overload
-def beta_variate(alpha: float, beta: float, *, count: None = None) -> float: ...
+def triangular(
+    low: float | _FloatVector,
+    high: float | _FloatVector,
+    mode: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
 @overload
-def beta_variate(alpha: float, beta: float, *, count: int) -> list[float]: ...
+def triangular(
+    low: _FloatVector,
+    high: float | _FloatVector,
+    mode: float | _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
 @overload
-def beta_variate(alpha: float, beta: float, *, count: int | None) -> float | list[float]: ...
+def triangular(
+    low: float,
+    high: _FloatVector,
+    mode: float | _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
 @overload
-def pareto_variate(alpha: float, *, count: None = None) -> float: ...
+def triangular(
+    low: float,
+    high: float,
+    mode: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def beta_variate(
+    alpha: float,
+    beta: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
+@overload
+def beta_variate(
+    alpha: float | _FloatVector,
+    beta: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def beta_variate(
+    alpha: float | _FloatVector,
+    beta: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
+@overload
+def beta_variate(
+    alpha: float,
+    beta: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float | list[float]: ...
 @overload
-def pareto_variate(alpha: float, *, count: int) -> list[float]: ...
+def beta_variate(
+    alpha: float | _FloatVector,
+    beta: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def beta_variate(
+    alpha: _FloatVector,
+    beta: float | _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def beta_variate(
+    alpha: float,
+    beta: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def pareto_variate(
+    alpha: float, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> float: ...
+@overload
+def pareto_variate(
+    alpha: float | _FloatVector, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[float]: ...
+@overload
+def pareto_variate(
+    alpha: float | _FloatVector, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[float]: ...
+@overload
+def pareto_variate(
+    alpha: float, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> float | list[float]: ...
 @overload
-def pareto_variate(alpha: float, *, count: int | None) -> float | list[float]: ...
+def pareto_variate(
+    alpha: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def pareto_variate(
+    alpha: _FloatVector, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> list[float]: ...
+@overload
+def vonmises_variate(
+    mu: float,
+    kappa: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
+@overload
+def vonmises_variate(
+    mu: float | _FloatVector,
+    kappa: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def vonmises_variate(
+    mu: float | _FloatVector,
+    kappa: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
+@overload
+def vonmises_variate(
+    mu: float,
+    kappa: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float | list[float]: ...
 @overload
-def vonmises_variate(mu: float, kappa: float, *, count: None = None) -> float: ...
+def vonmises_variate(
+    mu: float | _FloatVector,
+    kappa: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def vonmises_variate(
+    mu: _FloatVector,
+    kappa: float | _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def vonmises_variate(
+    mu: float,
+    kappa: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def binomial_variate(
+    trials: int,
+    probability: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> int: ...
 @overload
-def vonmises_variate(mu: float, kappa: float, *, count: int) -> list[float]: ...
+def binomial_variate(
+    trials: int | _IntVector,
+    probability: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[int]: ...
 @overload
-def vonmises_variate(mu: float, kappa: float, *, count: int | None) -> float | list[float]: ...
+def binomial_variate(
+    trials: int | _IntVector,
+    probability: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[int]: ...
+@overload
+def binomial_variate(
+    trials: int,
+    probability: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> int | list[int]: ...
 @overload
-def binomial_variate(trials: int, probability: float, *, count: None = None) -> int: ...
+def binomial_variate(
+    trials: int | _IntVector,
+    probability: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def binomial_variate(
+    trials: _IntVector,
+    probability: float | _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[int]: ...
 @overload
-def binomial_variate(trials: int, probability: float, *, count: int) -> list[int]: ...
+def binomial_variate(
+    trials: int,
+    probability: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[int]: ...
 @overload
-def binomial_variate(trials: int, probability: float, *, count: int | None) -> int | list[int]: ...
+def negative_binomial_variate(
+    successes: int,
+    probability: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> int: ...
 @overload
-def negative_binomial_variate(successes: int, probability: float, *, count: None = None) -> int: ...
+def negative_binomial_variate(
+    successes: int | _IntVector,
+    probability: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[int]: ...
 @overload
-def negative_binomial_variate(successes: int, probability: float, *, count: int) -> list[int]: ...
+def negative_binomial_variate(
+    successes: int | _IntVector,
+    probability: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[int]: ...
 @overload
 def negative_binomial_variate(
-    successes: int, probability: float, *, count: int | None
+    successes: int,
+    probability: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
 ) -> int | list[int]: ...
 @overload
-def geometric_variate(probability: float, *, count: None = None) -> int: ...
+def negative_binomial_variate(
+    successes: int | _IntVector,
+    probability: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
 @overload
-def geometric_variate(probability: float, *, count: int) -> list[int]: ...
+def negative_binomial_variate(
+    successes: _IntVector,
+    probability: float | _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[int]: ...
 @overload
-def geometric_variate(probability: float, *, count: int | None) -> int | list[int]: ...
+def negative_binomial_variate(
+    successes: int,
+    probability: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[int]: ...
 @overload
-def poisson_variate(mean: float, *, count: None = None) -> int: ...
+def geometric_variate(
+    probability: float, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
 @overload
-def poisson_variate(mean: float, *, count: int) -> list[int]: ...
+def geometric_variate(
+    probability: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[int]: ...
 @overload
-def poisson_variate(mean: float, *, count: int | None) -> int | list[int]: ...
+def geometric_variate(
+    probability: float | _FloatVector, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
 @overload
-def exponential_variate(rate: float, *, count: None = None) -> float: ...
+def geometric_variate(
+    probability: float, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
 @overload
-def exponential_variate(rate: float, *, count: int) -> list[float]: ...
+def geometric_variate(
+    probability: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def geometric_variate(
+    probability: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[int]: ...
 @overload
-def exponential_variate(rate: float, *, count: int | None) -> float | list[float]: ...
+def poisson_variate(
+    mean: float, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
 @overload
-def gamma_variate(shape: float, scale: float, *, count: None = None) -> float: ...
+def poisson_variate(
+    mean: float | _FloatVector, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
+@overload
+def poisson_variate(
+    mean: float | _FloatVector, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
+@overload
+def poisson_variate(
+    mean: float, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
 @overload
-def gamma_variate(shape: float, scale: float, *, count: int) -> list[float]: ...
+def poisson_variate(
+    mean: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def poisson_variate(
+    mean: _FloatVector, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
+@overload
+def exponential_variate(
+    rate: float,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
+@overload
+def exponential_variate(
+    rate: float | _FloatVector,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def exponential_variate(
+    rate: float | _FloatVector,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
+@overload
+def exponential_variate(
+    rate: float,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float | list[float]: ...
+@overload
+def exponential_variate(
+    rate: float | _FloatVector,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def exponential_variate(
+    rate: _FloatVector,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def gamma_variate(
+    shape: float,
+    scale: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
+@overload
+def gamma_variate(
+    shape: float | _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def gamma_variate(
+    shape: float | _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
+@overload
+def gamma_variate(
+    shape: float,
+    scale: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float | list[float]: ...
 @overload
-def gamma_variate(shape: float, scale: float, *, count: int | None) -> float | list[float]: ...
+def gamma_variate(
+    shape: float | _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def gamma_variate(
+    shape: _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def gamma_variate(
+    shape: float,
+    scale: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def weibull_variate(
+    shape: float,
+    scale: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
+@overload
+def weibull_variate(
+    shape: float | _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def weibull_variate(
+    shape: float | _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
+@overload
+def weibull_variate(
+    shape: float,
+    scale: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float | list[float]: ...
 @overload
-def weibull_variate(shape: float, scale: float, *, count: None = None) -> float: ...
+def weibull_variate(
+    shape: float | _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def weibull_variate(
+    shape: _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def weibull_variate(
+    shape: float,
+    scale: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def normal_variate(
+    mean: float,
+    std_dev: float,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
+@overload
+def normal_variate(
+    mean: float | _FloatVector,
+    std_dev: float | _FloatVector,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def normal_variate(
+    mean: float | _FloatVector,
+    std_dev: float | _FloatVector,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
+@overload
+def normal_variate(
+    mean: float,
+    std_dev: float,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float | list[float]: ...
 @overload
-def weibull_variate(shape: float, scale: float, *, count: int) -> list[float]: ...
+def normal_variate(
+    mean: float | _FloatVector,
+    std_dev: float | _FloatVector,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def normal_variate(
+    mean: _FloatVector,
+    std_dev: float | _FloatVector,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def normal_variate(
+    mean: float,
+    std_dev: _FloatVector,
+    *,
+    algorithm: _FloatAlgorithm = "standard",
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
 @overload
-def weibull_variate(shape: float, scale: float, *, count: int | None) -> float | list[float]: ...
+def log_normal_variate(
+    log_mean: float,
+    log_deviation: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
 @overload
-def normal_variate(mean: float, std_dev: float, *, count: None = None) -> float: ...
+def log_normal_variate(
+    log_mean: float | _FloatVector,
+    log_deviation: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
 @overload
-def normal_variate(mean: float, std_dev: float, *, count: int) -> list[float]: ...
+def log_normal_variate(
+    log_mean: float | _FloatVector,
+    log_deviation: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
 @overload
-def normal_variate(mean: float, std_dev: float, *, count: int | None) -> float | list[float]: ...
+def log_normal_variate(
+    log_mean: float,
+    log_deviation: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float | list[float]: ...
 @overload
-def log_normal_variate(log_mean: float, log_deviation: float, *, count: None = None) -> float: ...
+def log_normal_variate(
+    log_mean: float | _FloatVector,
+    log_deviation: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
 @overload
-def log_normal_variate(log_mean: float, log_deviation: float, *, count: int) -> list[float]: ...
+def log_normal_variate(
+    log_mean: _FloatVector,
+    log_deviation: float | _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
 @overload
 def log_normal_variate(
-    log_mean: float, log_deviation: float, *, count: int | None
+    log_mean: float,
+    log_deviation: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def extreme_value_variate(
+    location: float,
+    scale: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
+@overload
+def extreme_value_variate(
+    location: float | _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def extreme_value_variate(
+    location: float | _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
+@overload
+def extreme_value_variate(
+    location: float,
+    scale: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
 ) -> float | list[float]: ...
 @overload
-def extreme_value_variate(location: float, scale: float, *, count: None = None) -> float: ...
+def extreme_value_variate(
+    location: float | _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
 @overload
-def extreme_value_variate(location: float, scale: float, *, count: int) -> list[float]: ...
+def extreme_value_variate(
+    location: _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
 @overload
 def extreme_value_variate(
-    location: float, scale: float, *, count: int | None
+    location: float,
+    scale: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def chi_squared_variate(
+    degrees_of_freedom: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
+@overload
+def chi_squared_variate(
+    degrees_of_freedom: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def chi_squared_variate(
+    degrees_of_freedom: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
+@overload
+def chi_squared_variate(
+    degrees_of_freedom: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
 ) -> float | list[float]: ...
 @overload
-def chi_squared_variate(degrees_of_freedom: float, *, count: None = None) -> float: ...
+def chi_squared_variate(
+    degrees_of_freedom: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def chi_squared_variate(
+    degrees_of_freedom: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def cauchy_variate(
+    location: float,
+    scale: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
+@overload
+def cauchy_variate(
+    location: float | _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def cauchy_variate(
+    location: float | _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
+@overload
+def cauchy_variate(
+    location: float,
+    scale: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float | list[float]: ...
 @overload
-def chi_squared_variate(degrees_of_freedom: float, *, count: int) -> list[float]: ...
+def cauchy_variate(
+    location: float | _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def cauchy_variate(
+    location: _FloatVector,
+    scale: float | _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def cauchy_variate(
+    location: float,
+    scale: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
 @overload
-def chi_squared_variate(degrees_of_freedom: float, *, count: int | None) -> float | list[float]: ...
+def fisher_f_variate(
+    degrees_1: float,
+    degrees_2: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
 @overload
-def cauchy_variate(location: float, scale: float, *, count: None = None) -> float: ...
+def fisher_f_variate(
+    degrees_1: float | _FloatVector,
+    degrees_2: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
 @overload
-def cauchy_variate(location: float, scale: float, *, count: int) -> list[float]: ...
+def fisher_f_variate(
+    degrees_1: float | _FloatVector,
+    degrees_2: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
 @overload
-def cauchy_variate(location: float, scale: float, *, count: int | None) -> float | list[float]: ...
+def fisher_f_variate(
+    degrees_1: float,
+    degrees_2: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float | list[float]: ...
 @overload
-def fisher_f_variate(degrees_1: float, degrees_2: float, *, count: None = None) -> float: ...
+def fisher_f_variate(
+    degrees_1: float | _FloatVector,
+    degrees_2: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
 @overload
-def fisher_f_variate(degrees_1: float, degrees_2: float, *, count: int) -> list[float]: ...
+def fisher_f_variate(
+    degrees_1: _FloatVector,
+    degrees_2: float | _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
 @overload
 def fisher_f_variate(
-    degrees_1: float, degrees_2: float, *, count: int | None
+    degrees_1: float,
+    degrees_2: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def student_t_variate(
+    degrees_of_freedom: float,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> float: ...
+@overload
+def student_t_variate(
+    degrees_of_freedom: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def student_t_variate(
+    degrees_of_freedom: float | _FloatVector,
+    *,
+    count: int,
+    as_buffer: Literal[True],
+    out: None = None,
+) -> array[float]: ...
+@overload
+def student_t_variate(
+    degrees_of_freedom: float,
+    *,
+    count: int | None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
 ) -> float | list[float]: ...
 @overload
-def student_t_variate(degrees_of_freedom: float, *, count: None = None) -> float: ...
+def student_t_variate(
+    degrees_of_freedom: float | _FloatVector,
+    *,
+    count: int | None = None,
+    as_buffer: Literal[False] = False,
+    out: _OutT,
+) -> _OutT: ...
+@overload
+def student_t_variate(
+    degrees_of_freedom: _FloatVector,
+    *,
+    count: None = None,
+    as_buffer: Literal[False] = False,
+    out: None = None,
+) -> list[float]: ...
+@overload
+def front_triangular(
+    size: int, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
 @overload
-def student_t_variate(degrees_of_freedom: float, *, count: int) -> list[float]: ...
+def front_triangular(
+    size: int, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
 @overload
-def student_t_variate(degrees_of_freedom: float, *, count: int | None) -> float | list[float]: ...
+def front_triangular(
+    size: int, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
 @overload
-def front_triangular(size: int, *, count: None = None) -> int: ...
+def front_triangular(
+    size: int, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
 @overload
-def front_triangular(size: int, *, count: int) -> list[int]: ...
+def front_triangular(
+    size: int, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+) -> _OutT: ...
 @overload
-def front_triangular(size: int, *, count: int | None) -> int | list[int]: ...
+def center_triangular(
+    size: int, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
 @overload
-def center_triangular(size: int, *, count: None = None) -> int: ...
+def center_triangular(
+    size: int, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
 @overload
-def center_triangular(size: int, *, count: int) -> list[int]: ...
+def center_triangular(
+    size: int, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
 @overload
-def center_triangular(size: int, *, count: int | None) -> int | list[int]: ...
+def center_triangular(
+    size: int, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
 @overload
-def back_triangular(size: int, *, count: None = None) -> int: ...
+def center_triangular(
+    size: int, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+) -> _OutT: ...
 @overload
-def back_triangular(size: int, *, count: int) -> list[int]: ...
+def back_triangular(
+    size: int, *, count: None = None, as_buffer: Literal[False] = False, out: None = None
+) -> int: ...
+@overload
+def back_triangular(
+    size: int, *, count: int, as_buffer: Literal[False] = False, out: None = None
+) -> list[int]: ...
+@overload
+def back_triangular(
+    size: int, *, count: int, as_buffer: Literal[True], out: None = None
+) -> array[int]: ...
+@overload
+def back_triangular(
+    size: int, *, count: int | None, as_buffer: Literal[False] = False, out: None = None
+) -> int | list[int]: ...
 @overload
-def back_triangular(size: int, *, count: int | None) -> int | list[int]: ...
+def back_triangular(
+    size: int, *, count: int | None = None, as_buffer: Literal[False] = False, out: _OutT
+) -> _OutT: ...
+def random_bytes(size: int) -> bytes: ...
+def fill_bytes(buffer: Buffer) -> None: ...
+def random_bits(size: int) -> bytes: ...
+def bernoulli_bits(probability: float, size: int) -> bytes: ...
 def _front_poisson(size: int) -> int: ...
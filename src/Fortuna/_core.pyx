@@ -1,16 +1,30 @@
 # distutils: language = c++
 # cython: language_level=3, embedsignature=True
 
-from hashlib import sha256
 from collections.abc import MutableSequence
 from numbers import Real
+import array
+import inspect
 import operator
 import os
+import sys
 
 from libc.stddef cimport size_t
 from libc.stdint cimport int64_t, uint64_t, uint8_t
+from libc.string cimport memcpy
+from cpython cimport array
+from cpython.buffer cimport (
+    PyBUF_RECORDS_RO,
+    PyBuffer_IsContiguous,
+    PyObject_CheckBuffer,
+    PyBuffer_Release,
+    PyObject_GetBuffer,
+)
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize, PyBytes_GET_SIZE
+from cpython.long cimport PyLong_AsLongLongAndOverflow
 from cpython.list cimport PyList_New
 from cpython.object cimport PyObject
+from cpython.unicode cimport PyUnicode_AsUTF8AndSize
 from libcpp.vector cimport vector
 
 
@@ -20,6 +34,8 @@ DEF SMALL_EXACT_LIST_SHUFFLE_LIMIT = 256
 cdef extern from "Python.h":
     PyObject* raw_float_from_double "PyFloat_FromDouble"(double) except NULL
     void raw_list_set_item "PyList_SET_ITEM"(PyObject*, Py_ssize_t, PyObject*)
+    PyObject* raw_fast_get_item "PySequence_Fast_GET_ITEM"(PyObject*, Py_ssize_t)
+    void raw_incref "Py_INCREF"(PyObject*)
     long long raw_long_as_long_long_and_overflow "PyLong_AsLongLongAndOverflow"(
         PyObject*, int*
     )
@@ -33,10 +49,11 @@ cdef extern from "Python.h":
 
 cdef extern from "src/Fortuna/cpp/fortuna_core.hpp" namespace "FortunaCore":
     cdef cppclass GeneratorCore:
-        GeneratorCore(uint64_t) except +
+        GeneratorCore(uint64_t, bint, int) except +
         void seed(uint64_t) except + nogil
         void reseed_from_entropy() except + nogil
         void lock() except + nogil
+        bint try_lock() noexcept nogil
         void unlock() noexcept nogil
         void prepare() except + nogil
 
@@ -46,10 +63,69 @@ cdef extern from "src/Fortuna/cpp/fortuna_core.hpp" namespace "FortunaCore":
         uint64_t draw_module() except +
         uint64_t draw(GeneratorCore&) except +
 
+    cdef cppclass UnsignedSetup:
+        pass
+
+    enum:
+        _GENERATOR_STATE_CAPACITY "FortunaCore::generator_state_capacity"
+
+    cdef struct EnginePosition:
+        uint64_t block_high
+        uint64_t block_low
+        unsigned int lane
+
+    cdef cppclass PreparedAliasWeightedIndexCore:
+        PreparedAliasWeightedIndexCore(const vector[double]&) except +
+        uint64_t draw_module() except +
+        uint64_t draw(GeneratorCore&) except +
+        void fill_module(uint64_t*, size_t) except + nogil
+        void fill(GeneratorCore&, uint64_t*, size_t) except + nogil
+
+    cdef cppclass FenwickWeightedIndexCore:
+        FenwickWeightedIndexCore() except +
+        size_t size() noexcept
+        size_t positive() noexcept
+        double weight(size_t) except +
+        double total() noexcept
+        void set(size_t, double) except +
+        void push_back(double) except +
+        void swap_remove(size_t) except +
+        uint64_t locate(double) except +
+        uint64_t draw_module() except +
+        uint64_t draw(GeneratorCore&) except +
+        void fill_module(uint64_t*, size_t) except + nogil
+        void fill(GeneratorCore&, uint64_t*, size_t) except + nogil
+
+    cdef cppclass ReservoirDrawsCore:
+        ReservoirDrawsCore(uint64_t) except +
+        void start(GeneratorCore&) except + nogil
+        uint64_t skip(GeneratorCore&) except + nogil
+        uint64_t replace(GeneratorCore&) except + nogil
+        void fill(GeneratorCore&, uint64_t, uint64_t*) except + nogil
+
+    double core_reservoir_key "FortunaCore::ReservoirDrawsCore::key"(
+        GeneratorCore&, double
+    ) except + nogil
+    double core_reservoir_jump "FortunaCore::ReservoirDrawsCore::jump"(
+        GeneratorCore&, double
+    ) except + nogil
+    double core_reservoir_bounded_key "FortunaCore::ReservoirDrawsCore::bounded_key"(
+        GeneratorCore&, double, double
+    ) except + nogil
+
+    cdef cppclass FeistelPermutationCore:
+        FeistelPermutationCore(uint64_t, const vector[uint64_t]&) except +
+        uint64_t size()
+        uint64_t forward(uint64_t) except + nogil
+        uint64_t inverse(uint64_t) except + nogil
+        void fill(uint64_t, uint64_t*, size_t) except + nogil
+
     cdef cppclass PreparedCumulativeWeightedIndexCore:
         PreparedCumulativeWeightedIndexCore(const vector[double]&) except +
         uint64_t draw_module() except +
         uint64_t draw(GeneratorCore&) except +
+        void fill_module(uint64_t*, size_t) except + nogil
+        void fill(GeneratorCore&, uint64_t*, size_t) except + nogil
 
     const char* core_storm_version "FortunaCore::storm_version"() noexcept nogil
     GeneratorCore* core_module_generator "FortunaCore::module_generator"() except + nogil
@@ -63,12 +139,59 @@ cdef extern from "src/Fortuna/cpp/fortuna_core.hpp" namespace "FortunaCore":
     uint64_t core_unsigned "FortunaCore::sample_unsigned_unchecked"(
         GeneratorCore&, int, uint64_t, uint64_t, double
     ) except + nogil
+    void core_shuffle_items "FortunaCore::shuffle_items"(
+        GeneratorCore&, unsigned char*, size_t, size_t
+    ) except + nogil
+    void core_blocked_shuffle_items "FortunaCore::blocked_shuffle_items"(
+        GeneratorCore&, unsigned char*, size_t, size_t, size_t
+    ) except + nogil
+    UnsignedSetup core_prepare_unsigned "FortunaCore::prepare_unsigned"(
+        int, uint64_t, uint64_t, double
+    ) except + nogil
+    uint64_t core_unsigned_prepared "FortunaCore::sample_unsigned_prepared"(
+        GeneratorCore&, const UnsignedSetup&
+    ) except + nogil
     double core_float "FortunaCore::sample_float_unchecked"(
         GeneratorCore&, int, double, double, double
     ) except + nogil
     bint core_bool "FortunaCore::sample_bool_unchecked"(
         GeneratorCore&, int, double
     ) except + nogil
+    int core_generator_engine "FortunaCore::generator_engine"(GeneratorCore&) noexcept nogil
+    uint64_t core_stream_seed "FortunaCore::stream_seed"(
+        uint64_t, unsigned char, unsigned char, const unsigned char*, size_t
+    ) noexcept nogil
+    uint64_t core_stream_seed_integer "FortunaCore::stream_seed_integer"(
+        uint64_t, int64_t
+    ) noexcept nogil
+    void core_generator_seek "FortunaCore::generator_seek"(
+        GeneratorCore&, EnginePosition
+    ) except + nogil
+    void core_generator_advance "FortunaCore::generator_advance"(
+        GeneratorCore&, uint64_t
+    ) except + nogil
+    void core_generator_jump "FortunaCore::generator_jump"(GeneratorCore&) except + nogil
+    EnginePosition core_generator_position "FortunaCore::generator_position"(
+        GeneratorCore&
+    ) except + nogil
+    size_t core_generator_write_state "FortunaCore::generator_write_state"(
+        GeneratorCore&, unsigned char*, size_t
+    ) except + nogil
+    void core_generator_restore_state "FortunaCore::generator_restore_state"(
+        GeneratorCore&, const unsigned char*, size_t
+    ) except + nogil
+    void core_parallel_signed "FortunaCore::parallel_fill_signed"(
+        const uint64_t*, int64_t*, size_t, size_t, size_t, int, int, int64_t, int64_t, int64_t
+    ) except + nogil
+    void core_parallel_unsigned "FortunaCore::parallel_fill_unsigned"(
+        const uint64_t*, uint64_t*, size_t, size_t, size_t, int, const UnsignedSetup&
+    ) except + nogil
+    void core_parallel_float "FortunaCore::parallel_fill_float"(
+        const uint64_t*, double*, size_t, size_t, size_t, int, int, double, double, double
+    ) except + nogil
+    void core_parallel_bool "FortunaCore::parallel_fill_bool"(
+        const uint64_t*, uint8_t*, size_t, size_t, size_t, int, int, double
+    ) except + nogil
     bint core_module_needs_prepare "FortunaCore::module_needs_prepare"() noexcept nogil
     void core_module_prepare "FortunaCore::module_prepare"() except + nogil
     double core_module_canonical_prepared "FortunaCore::module_canonical_prepared"() noexcept nogil
@@ -81,6 +204,24 @@ cdef extern from "src/Fortuna/cpp/fortuna_core.hpp" namespace "FortunaCore":
     void core_generator_canonical_fill "FortunaCore::generator_canonical_fill"(
         GeneratorCore&, double*, size_t
     ) except + nogil
+    void core_module_fill_bytes "FortunaCore::module_fill_bytes"(
+        unsigned char*, size_t
+    ) except + nogil
+    void core_generator_fill_bytes "FortunaCore::generator_fill_bytes"(
+        GeneratorCore&, unsigned char*, size_t
+    ) except + nogil
+    void core_module_fill_bits "FortunaCore::module_fill_bits"(
+        unsigned char*, size_t
+    ) except + nogil
+    void core_generator_fill_bits "FortunaCore::generator_fill_bits"(
+        GeneratorCore&, unsigned char*, size_t
+    ) except + nogil
+    void core_module_fill_bernoulli_bits "FortunaCore::module_fill_bernoulli_bits"(
+        double, unsigned char*, size_t
+    ) except + nogil
+    void core_generator_fill_bernoulli_bits "FortunaCore::generator_fill_bernoulli_bits"(
+        GeneratorCore&, double, unsigned char*, size_t
+    ) except + nogil
     uint64_t core_module_random_below "FortunaCore::module_random_below_prepared"(
         uint64_t
     ) except + nogil
@@ -99,6 +240,15 @@ cdef extern from "src/Fortuna/cpp/fortuna_core.hpp" namespace "FortunaCore":
     void core_generator_sample_offsets "FortunaCore::generator_sample_offsets"(
         GeneratorCore&, size_t, size_t, size_t*
     ) except + nogil
+    void core_sparse_sample_indices "FortunaCore::sparse_sample_indices"(
+        const size_t*, size_t, uint64_t*
+    ) noexcept nogil
+    void core_module_weighted_sample "FortunaCore::module_weighted_sample"(
+        const double*, size_t, size_t, uint64_t*
+    ) except + nogil
+    void core_generator_weighted_sample "FortunaCore::generator_weighted_sample"(
+        GeneratorCore&, const double*, size_t, size_t, uint64_t*
+    ) except + nogil
     int64_t core_module_random_int "FortunaCore::module_random_int_prepared"(
         int64_t, int64_t
     ) except + nogil
@@ -351,7 +501,8 @@ cdef object _reflected_below_result(object result, int direction):
         for index in range(len(values)):
             values[index] = -values[index]
         return values
-    return -result
+    # Native storage was already reflected in place by _unsigned_result.
+    return result
 
 
 cdef object _continued_index_result(
@@ -370,32 +521,47 @@ cdef object _continued_index_result(
         for index in range(len(values)):
             values[index] = values[index] - offset
         return values
-    return result - offset
+    # Native storage was already continued in place by _unsigned_result.
+    return result
+
 
+# Fortuna-owned ziggurat replacements for standard-library float operations.
+_ZIGGURAT_OPERATIONS = {6: 17, 9: 16}
 
-cdef Py_ssize_t _as_count(object value) except *:
+
+cdef int _float_algorithm(object algorithm, int operation) except -1:
+    if not isinstance(algorithm, str):
+        raise TypeError("algorithm must be a str")
+    if algorithm == "standard":
+        return operation
+    if algorithm == "ziggurat":
+        return _ZIGGURAT_OPERATIONS[operation]
+    raise ValueError("algorithm must be 'standard' or 'ziggurat'")
+
+
+cdef Py_ssize_t _as_count(object value, str name="count") except *:
     cdef object integer
     cdef Py_ssize_t result
     if isinstance(value, bool):
-        raise TypeError("count must be an integer, not bool")
+        raise TypeError(f"{name} must be an integer, not bool")
     if type(value) is int:
         if value < 0:
-            raise ValueError("count must be nonnegative")
+            raise ValueError(f"{name} must be nonnegative")
         result = raw_long_as_ssize_t(<PyObject*>value)
         if result == -1 and raw_error_occurred() != NULL:
             raw_error_clear()
-            raise OverflowError("count exceeds the platform size limit") from None
+            raise OverflowError(f"{name} exceeds the platform size limit") from None
         return result
     try:
         integer = operator.index(value)
     except TypeError as error:
-        raise TypeError("count must be an integer") from error
+        raise TypeError(f"{name} must be an integer") from error
     if integer < 0:
-        raise ValueError("count must be nonnegative")
+        raise ValueError(f"{name} must be nonnegative")
     result = raw_long_as_ssize_t(<PyObject*>integer)
     if result == -1 and raw_error_occurred() != NULL:
         raw_error_clear()
-        raise OverflowError("count exceeds the platform size limit") from None
+        raise OverflowError(f"{name} exceeds the platform size limit") from None
     return result
 
 
@@ -438,6 +604,136 @@ cdef inline void _prepare_module_scalar() except *:
             core_module_prepare()
 
 
+# Buffer results share array.array's native-width storage so NumPy, memoryview,
+# and Arrow consumers can read bulk draws without one Python object per value.
+cdef enum:
+    _SIGNED_STORAGE = 0
+    _UNSIGNED_STORAGE = 1
+    _FLOAT_STORAGE = 2
+    _BOOL_STORAGE = 3
+
+# Negative random_below limits reflect magnitudes; negative random_index sizes
+# continue below zero. Native storage applies either mapping in place.
+cdef enum:
+    _UNMAPPED = 0
+    _REFLECTED = 1
+    _CONTINUED = 2
+
+_BUFFER_TEMPLATES = (array.array("q"), array.array("Q"), array.array("d"), array.array("B"))
+_STORAGE_NAMES = ("int64", "uint64", "float64", "bool")
+_STORAGE_FORMATS = (("q", "l"), ("Q", "L"), ("d",), ("?", "B", "b"))
+_BYTE_FORMATS = ("B", "b", "c")
+_NATIVE_ORDER = "<" if sys.byteorder == "little" else ">"
+cdef uint64_t _SIGNED_STORAGE_MAGNITUDE = <uint64_t>1 << 63
+
+
+cdef inline bint _is_bulk(object count, object as_buffer, object out):
+    return count is not None or as_buffer is not False or out is not None
+
+
+cdef bint _buffer_requested(object as_buffer, object count) except -1:
+    if as_buffer is False:
+        return False
+    if as_buffer is not True:
+        raise TypeError("as_buffer must be a bool")
+    if count is None:
+        raise TypeError("as_buffer requires count")
+    return True
+
+
+cdef int _acquire_writable(Py_buffer* view, object target, str name) except -1:
+    try:
+        PyObject_GetBuffer(target, view, PyBUF_RECORDS_RO)
+    except TypeError:
+        raise TypeError(f"{name} must be a writable buffer") from None
+    if view.readonly:
+        PyBuffer_Release(view)
+        raise TypeError(f"{name} must be a writable buffer")
+    if not PyBuffer_IsContiguous(view, b"C"):
+        PyBuffer_Release(view)
+        raise ValueError(f"{name} must be C-contiguous")
+    return 0
+
+
+cdef Py_ssize_t _acquire_out(
+    Py_buffer* view,
+    object out,
+    object count,
+    int storage,
+) except -1:
+    # Every check runs before sampling so a rejected buffer never advances
+    # the engine. Byte buffers are accepted as raw native-order storage.
+    cdef Py_ssize_t requested = -1 if count is None else _as_count(count)
+    cdef Py_ssize_t itemsize = 1 if storage == _BOOL_STORAGE else 8
+    cdef Py_ssize_t size
+    cdef str layout
+    _acquire_writable(view, out, "out")
+    try:
+        layout = "B" if view.format == NULL else view.format.decode("ascii")
+        if layout[:1] in ("@", "=", _NATIVE_ORDER):
+            layout = layout[1:]
+        if view.itemsize == 1 and layout in _BYTE_FORMATS:
+            if view.len % itemsize:
+                raise ValueError(f"out byte length must be a multiple of {itemsize}")
+        elif view.itemsize != itemsize or layout not in _STORAGE_FORMATS[storage]:
+            raise TypeError(
+                f"out must hold {_STORAGE_NAMES[storage]} values, not format {layout!r}"
+            )
+        # An empty export may carry an unaligned placeholder pointer.
+        if view.len and <size_t>view.buf % <size_t>itemsize:
+            raise ValueError(f"out must be aligned to {itemsize} bytes")
+        size = view.len // itemsize
+        if requested >= 0 and requested != size:
+            raise ValueError("count must equal the length of out")
+    except BaseException:
+        PyBuffer_Release(view)
+        raise
+    return size
+
+
+cdef object _bulk_storage(
+    Py_buffer* view,
+    object count,
+    object as_buffer,
+    object out,
+    int storage,
+    void** data,
+    Py_ssize_t* size,
+):
+    # Returns the object handed back for native storage, or None when the
+    # dispatcher should build a list. ``view`` is held only for ``out``.
+    cdef array.array buffer
+    if out is not None:
+        if as_buffer is not False:
+            raise TypeError("out cannot be combined with as_buffer")
+        size[0] = _acquire_out(view, out, count, storage)
+        data[0] = view.buf
+        return out
+    if _buffer_requested(as_buffer, count):
+        size[0] = _as_count(count)
+        buffer = array.clone(_BUFFER_TEMPLATES[storage], size[0], False)
+        data[0] = buffer.data.as_voidptr
+        return buffer
+    size[0] = _as_count(count)
+    return None
+
+
+cdef void _map_signed_storage(
+    uint64_t* values,
+    Py_ssize_t size,
+    int mapping,
+    uint64_t magnitude,
+) noexcept nogil:
+    # Two's-complement wraparound maps magnitudes up to 2**63 onto int64 exactly.
+    cdef Py_ssize_t index
+    if mapping == _REFLECTED:
+        for index in range(size):
+            values[index] = <uint64_t>0 - values[index]
+    elif mapping == _CONTINUED:
+        for index in range(size):
+            values[index] = values[index] - magnitude
+
+
 cdef object _signed_dispatch(
     GeneratorCore* generator,
     int operation,
@@ -446,9 +742,11 @@ cdef object _signed_dispatch(
     int64_t c,
     bint bulk,
     Py_ssize_t size,
+    int64_t* output,
 ):
     cdef int64_t scalar
     cdef vector[int64_t] values
+    cdef bint owned = output == NULL
     cdef Py_ssize_t index
     with nogil:
         core_validate_signed(operation, a, b, c)
@@ -456,11 +754,15 @@ cdef object _signed_dispatch(
         with nogil:
             scalar = core_signed(generator[0], operation, a, b, c)
         return scalar
-    values.resize(size)
+    if owned:
+        values.resize(size)
+        output = values.data()
     with nogil:
         for index in range(size):
-            values[index] = core_signed(generator[0], operation, a, b, c)
-    return list(values)
+            output[index] = core_signed(generator[0], operation, a, b, c)
+    if owned:
+        return list(values)
+    return None
 
 
 cdef object _signed_result(
@@ -470,10 +772,34 @@ cdef object _signed_result(
     int64_t b,
     int64_t c,
     object count,
+    object as_buffer,
+    object out,
+    bint locked=False,
 ):
-    if count is None:
-        return _signed_dispatch(generator, operation, a, b, c, False, 0)
-    return _signed_dispatch(generator, operation, a, b, c, True, _as_count(count))
+    cdef Py_buffer view
+    cdef void* data = NULL
+    cdef Py_ssize_t size = 0
+    cdef bint bulk = _is_bulk(count, as_buffer, out)
+    cdef object storage = None
+    cdef object result
+    if bulk:
+        storage = _bulk_storage(&view, count, as_buffer, out, _SIGNED_STORAGE, &data, &size)
+    try:
+        if locked:
+            with nogil:
+                generator.lock()
+        try:
+            result = _signed_dispatch(
+                generator, operation, a, b, c, bulk, size, <int64_t*>data
+            )
+        finally:
+            if locked:
+                with nogil:
+                    generator.unlock()
+    finally:
+        if out is not None:
+            PyBuffer_Release(&view)
+    return result if storage is None else storage
 
 
 cdef object _signed_generator_result(
@@ -483,16 +809,10 @@ cdef object _signed_generator_result(
     int64_t b,
     int64_t c,
     object count,
+    object as_buffer,
+    object out,
 ):
-    cdef bint bulk = count is not None
-    cdef Py_ssize_t size = _as_count(count) if bulk else 0
-    with nogil:
-        generator.lock()
-    try:
-        return _signed_dispatch(generator, operation, a, b, c, bulk, size)
-    finally:
-        with nogil:
-            generator.unlock()
+    return _signed_result(generator, operation, a, b, c, count, as_buffer, out, True)
 
 
 cdef object _unsigned_dispatch(
@@ -503,9 +823,12 @@ cdef object _unsigned_dispatch(
     double parameter,
     bint bulk,
     Py_ssize_t size,
+    uint64_t* output,
 ):
     cdef uint64_t scalar
     cdef vector[uint64_t] values
+    cdef UnsignedSetup setup
+    cdef bint owned = output == NULL
     cdef Py_ssize_t index
     with nogil:
         core_validate_unsigned(operation, a, b, parameter)
@@ -513,11 +836,16 @@ cdef object _unsigned_dispatch(
         with nogil:
             scalar = core_unsigned(generator[0], operation, a, b, parameter)
         return scalar
-    values.resize(size)
+    if owned:
+        values.resize(size)
+        output = values.data()
     with nogil:
+        setup = core_prepare_unsigned(operation, a, b, parameter)
         for index in range(size):
-            values[index] = core_unsigned(generator[0], operation, a, b, parameter)
-    return list(values)
+            output[index] = core_unsigned_prepared(generator[0], setup)
+    if owned:
+        return list(values)
+    return None
 
 
 cdef object _unsigned_result(
@@ -527,12 +855,42 @@ cdef object _unsigned_result(
     uint64_t b,
     double parameter,
     object count,
+    object as_buffer,
+    object out,
+    bint locked=False,
+    int mapping=_UNMAPPED,
+    uint64_t magnitude=0,
 ):
-    if count is None:
-        return _unsigned_dispatch(generator, operation, a, b, parameter, False, 0)
-    return _unsigned_dispatch(
-        generator, operation, a, b, parameter, True, _as_count(count)
-    )
+    cdef Py_buffer view
+    cdef void* data = NULL
+    cdef Py_ssize_t size = 0
+    cdef bint bulk = _is_bulk(count, as_buffer, out)
+    cdef int storage_type = _UNSIGNED_STORAGE if mapping == _UNMAPPED else _SIGNED_STORAGE
+    cdef object storage = None
+    cdef object result
+    if bulk:
+        storage = _bulk_storage(&view, count, as_buffer, out, storage_type, &data, &size)
+    try:
+        if storage is not None and mapping != _UNMAPPED and magnitude > _SIGNED_STORAGE_MAGNITUDE:
+            raise OverflowError("negative buffer results must fit the signed 64-bit range")
+        if locked:
+            with nogil:
+                generator.lock()
+        try:
+            result = _unsigned_dispatch(
+                generator, operation, a, b, parameter, bulk, size, <uint64_t*>data
+            )
+        finally:
+            if locked:
+                with nogil:
+                    generator.unlock()
+        if storage is not None:
+            with nogil:
+                _map_signed_storage(<uint64_t*>data, size, mapping, magnitude)
+    finally:
+        if out is not None:
+            PyBuffer_Release(&view)
+    return result if storage is None else storage
 
 
 cdef object _unsigned_generator_result(
@@ -542,16 +900,14 @@ cdef object _unsigned_generator_result(
     uint64_t b,
     double parameter,
     object count,
+    object as_buffer,
+    object out,
+    int mapping=_UNMAPPED,
+    uint64_t magnitude=0,
 ):
-    cdef bint bulk = count is not None
-    cdef Py_ssize_t size = _as_count(count) if bulk else 0
-    with nogil:
-        generator.lock()
-    try:
-        return _unsigned_dispatch(generator, operation, a, b, parameter, bulk, size)
-    finally:
-        with nogil:
-            generator.unlock()
+    return _unsigned_result(
+        generator, operation, a, b, parameter, count, as_buffer, out, True, mapping, magnitude
+    )
 
 
 cdef object _float_dispatch(
@@ -562,9 +918,11 @@ cdef object _float_dispatch(
     double c,
     bint bulk,
     Py_ssize_t size,
+    double* output,
 ):
     cdef double scalar
     cdef vector[double] values
+    cdef bint owned = output == NULL
     cdef Py_ssize_t index
     with nogil:
         core_validate_float(operation, a, b, c)
@@ -572,11 +930,15 @@ cdef object _float_dispatch(
         with nogil:
             scalar = core_float(generator[0], operation, a, b, c)
         return scalar
-    values.resize(size)
+    if owned:
+        values.resize(size)
+        output = values.data()
     with nogil:
         for index in range(size):
-            values[index] = core_float(generator[0], operation, a, b, c)
-    return list(values)
+            output[index] = core_float(generator[0], operation, a, b, c)
+    if owned:
+        return list(values)
+    return None
 
 
 cdef object _float_result(
@@ -586,10 +948,32 @@ cdef object _float_result(
     double b,
     double c,
     object count,
+    object as_buffer,
+    object out,
+    bint locked=False,
 ):
-    if count is None:
-        return _float_dispatch(generator, operation, a, b, c, False, 0)
-    return _float_dispatch(generator, operation, a, b, c, True, _as_count(count))
+    cdef Py_buffer view
+    cdef void* data = NULL
+    cdef Py_ssize_t size = 0
+    cdef bint bulk = _is_bulk(count, as_buffer, out)
+    cdef object storage = None
+    cdef object result
+    if bulk:
+        storage = _bulk_storage(&view, count, as_buffer, out, _FLOAT_STORAGE, &data, &size)
+    try:
+        if locked:
+            with nogil:
+                generator.lock()
+        try:
+            result = _float_dispatch(generator, operation, a, b, c, bulk, size, <double*>data)
+        finally:
+            if locked:
+                with nogil:
+                    generator.unlock()
+    finally:
+        if out is not None:
+            PyBuffer_Release(&view)
+    return result if storage is None else storage
 
 
 cdef object _float_generator_result(
@@ -599,16 +983,10 @@ cdef object _float_generator_result(
     double b,
     double c,
     object count,
+    object as_buffer,
+    object out,
 ):
-    cdef bint bulk = count is not None
-    cdef Py_ssize_t size = _as_count(count) if bulk else 0
-    with nogil:
-        generator.lock()
-    try:
-        return _float_dispatch(generator, operation, a, b, c, bulk, size)
-    finally:
-        with nogil:
-            generator.unlock()
+    return _float_result(generator, operation, a, b, c, count, as_buffer, out, True)
 
 
 cdef list _canonical_list(vector[double]& values):
@@ -622,24 +1000,109 @@ cdef list _canonical_list(vector[double]& values):
     return result
 
 
-cdef list _module_canonical_bulk(object count):
+cdef object _canonical_bulk(
+    GeneratorCore* generator,
+    object count,
+    object as_buffer,
+    object out,
+):
+    # A NULL generator selects the calling thread's module default.
+    cdef Py_buffer view
+    cdef void* data = NULL
+    cdef Py_ssize_t size = 0
     cdef vector[double] values
-    cdef Py_ssize_t size = _as_count(count)
-    values.resize(size)
-    if size:
+    cdef object storage = _bulk_storage(
+        &view, count, as_buffer, out, _FLOAT_STORAGE, &data, &size
+    )
+    if storage is None:
+        values.resize(size)
+        data = values.data()
+    try:
+        if size:
+            with nogil:
+                if generator == NULL:
+                    core_module_canonical_fill(<double*>data, <size_t>size)
+                else:
+                    core_generator_canonical_fill(generator[0], <double*>data, <size_t>size)
+    finally:
+        if out is not None:
+            PyBuffer_Release(&view)
+    if storage is None:
+        return _canonical_list(values)
+    return storage
+
+
+cdef object _module_canonical_bulk(object count, object as_buffer, object out):
+    return _canonical_bulk(NULL, count, as_buffer, out)
+
+
+cdef object _generator_canonical_bulk(
+    GeneratorCore* generator, object count, object as_buffer, object out
+):
+    return _canonical_bulk(generator, count, as_buffer, out)
+
+
+cdef bytes _random_bytes(GeneratorCore* generator, object size):
+    # A NULL generator selects the calling thread's module default.
+    cdef Py_ssize_t checked = _as_count(size, "size")
+    cdef bytes result = PyBytes_FromStringAndSize(NULL, checked)
+    cdef unsigned char* data = <unsigned char*>PyBytes_AS_STRING(result)
+    if checked:
         with nogil:
-            core_module_canonical_fill(&values[0], <size_t>size)
-    return _canonical_list(values)
+            if generator == NULL:
+                core_module_fill_bytes(data, <size_t>checked)
+            else:
+                core_generator_fill_bytes(generator[0], data, <size_t>checked)
+    return result
 
 
-cdef list _generator_canonical_bulk(GeneratorCore* generator, object count):
-    cdef vector[double] values
-    cdef Py_ssize_t size = _as_count(count)
-    values.resize(size)
-    if size:
+cdef bytes _random_bits(GeneratorCore* generator, object size):
+    # Bits are packed least-significant bit first within each byte.
+    cdef Py_ssize_t checked = _as_count(size, "size")
+    cdef bytes result = PyBytes_FromStringAndSize(NULL, (checked + 7) // 8)
+    cdef unsigned char* data = <unsigned char*>PyBytes_AS_STRING(result)
+    if checked:
+        with nogil:
+            if generator == NULL:
+                core_module_fill_bits(data, <size_t>checked)
+            else:
+                core_generator_fill_bits(generator[0], data, <size_t>checked)
+    return result
+
+
+cdef bytes _bernoulli_bits(GeneratorCore* generator, double probability, object size):
+    cdef Py_ssize_t checked = _as_count(size, "size")
+    cdef bytes result
+    cdef unsigned char* data
+    with nogil:
+        core_validate_bool(1, probability)
+    result = PyBytes_FromStringAndSize(NULL, (checked + 7) // 8)
+    data = <unsigned char*>PyBytes_AS_STRING(result)
+    if checked:
         with nogil:
-            core_generator_canonical_fill(generator[0], &values[0], <size_t>size)
-    return _canonical_list(values)
+            if generator == NULL:
+                core_module_fill_bernoulli_bits(probability, data, <size_t>checked)
+            else:
+                core_generator_fill_bernoulli_bits(
+                    generator[0], probability, data, <size_t>checked
+                )
+    return result
+
+
+cdef void _fill_bytes(GeneratorCore* generator, object buffer) except *:
+    cdef Py_buffer view
+    _acquire_writable(&view, buffer, "buffer")
+    try:
+        if view.len:
+            with nogil:
+                if generator == NULL:
+                    core_module_fill_bytes(<unsigned char*>view.buf, <size_t>view.len)
+                else:
+                    core_generator_fill_bytes(
+                        generator[0], <unsigned char*>view.buf, <size_t>view.len
+                    )
+    finally:
+        PyBuffer_Release(&view)
 
 
 cdef object _bool_dispatch(
@@ -648,9 +1111,11 @@ cdef object _bool_dispatch(
     double parameter,
     bint bulk,
     Py_ssize_t size,
+    uint8_t* output,
 ):
     cdef bint scalar
     cdef vector[uint8_t] values
+    cdef bint owned = output == NULL
     cdef Py_ssize_t index
     with nogil:
         core_validate_bool(operation, parameter)
@@ -658,11 +1123,15 @@ cdef object _bool_dispatch(
         with nogil:
             scalar = core_bool(generator[0], operation, parameter)
         return bool(scalar)
-    values.resize(size)
+    if owned:
+        values.resize(size)
+        output = values.data()
     with nogil:
         for index in range(size):
-            values[index] = <uint8_t>core_bool(generator[0], operation, parameter)
-    return [bool(values[index]) for index in range(size)]
+            output[index] = <uint8_t>core_bool(generator[0], operation, parameter)
+    if owned:
+        return [bool(values[index]) for index in range(size)]
+    return None
 
 
 cdef object _bool_result(
@@ -670,10 +1139,32 @@ cdef object _bool_result(
     int operation,
     double parameter,
     object count,
+    object as_buffer,
+    object out,
+    bint locked=False,
 ):
-    if count is None:
-        return _bool_dispatch(generator, operation, parameter, False, 0)
-    return _bool_dispatch(generator, operation, parameter, True, _as_count(count))
+    cdef Py_buffer view
+    cdef void* data = NULL
+    cdef Py_ssize_t size = 0
+    cdef bint bulk = _is_bulk(count, as_buffer, out)
+    cdef object storage = None
+    cdef object result
+    if bulk:
+        storage = _bulk_storage(&view, count, as_buffer, out, _BOOL_STORAGE, &data, &size)
+    try:
+        if locked:
+            with nogil:
+                generator.lock()
+        try:
+            result = _bool_dispatch(generator, operation, parameter, bulk, size, <uint8_t*>data)
+        finally:
+            if locked:
+                with nogil:
+                    generator.unlock()
+    finally:
+        if out is not None:
+            PyBuffer_Release(&view)
+    return result if storage is None else storage
 
 
 cdef object _bool_generator_result(
@@ -681,16 +1172,283 @@ cdef object _bool_generator_result(
     int operation,
     double parameter,
     object count,
+    object as_buffer,
+    object out,
 ):
-    cdef bint bulk = count is not None
-    cdef Py_ssize_t size = _as_count(count) if bulk else 0
-    with nogil:
-        generator.lock()
+    return _bool_result(generator, operation, parameter, count, as_buffer, out, True)
+
+
+# Per-element parameters: a list, tuple, or one-dimensional buffer supplies one
+# parameter per draw. Scalars in the same call are broadcast. Every element is
+# coerced and validated before the engine advances, then one nogil loop draws
+# in order, matching repeated scalar calls with the same parameters.
+cdef inline bint _is_parameter_vector(object value):
+    if type(value) is float or type(value) is int:
+        return False
+    if type(value) is list or type(value) is tuple:
+        return True
+    return PyObject_CheckBuffer(value) and not isinstance(value, Real)
+
+
+cdef object _parameter_items(object value, str name):
+    cdef object view
+    if type(value) is list or type(value) is tuple:
+        return value
+    view = memoryview(value)
+    if view.ndim != 1:
+        raise ValueError(f"{name} must be one-dimensional")
+    return view
+
+
+cdef Py_ssize_t _double_column(
+    object value,
+    str name,
+    vector[double]& column,
+) except -2:
+    # Returns the vector length, or -1 after storing one broadcast scalar.
+    cdef Py_buffer view
+    cdef object item
+    if not _is_parameter_vector(value):
+        column.push_back(_as_double(value, name))
+        return -1
+    if type(value) is not list and type(value) is not tuple:
+        PyObject_GetBuffer(value, &view, PyBUF_RECORDS_RO)
+        try:
+            if (
+                view.ndim == 1
+                and view.itemsize == 8
+                and view.format != NULL
+                and view.format.decode("ascii").lstrip("@=" + _NATIVE_ORDER) == "d"
+                and PyBuffer_IsContiguous(&view, b"C")
+            ):
+                column.resize(view.len // 8)
+                if view.len:
+                    memcpy(column.data(), view.buf, <size_t>view.len)
+                return <Py_ssize_t>column.size()
+        finally:
+            PyBuffer_Release(&view)
+    for item in _parameter_items(value, name):
+        column.push_back(_as_double(item, name))
+    return <Py_ssize_t>column.size()
+
+
+cdef Py_ssize_t _uint64_column(
+    object value,
+    str name,
+    vector[uint64_t]& column,
+) except -2:
+    cdef object item
+    if not _is_parameter_vector(value):
+        column.push_back(_as_uint64(value, name))
+        return -1
+    for item in _parameter_items(value, name):
+        column.push_back(_as_uint64(item, name))
+    return <Py_ssize_t>column.size()
+
+
+cdef int _broadcast_double(vector[double]& column, Py_ssize_t size) except -1:
+    cdef double value
+    if column.size() == 1 and size != 1:
+        value = column[0]
+        column.assign(size, value)
+    return 0
+
+
+cdef int _broadcast_uint64(vector[uint64_t]& column, Py_ssize_t size) except -1:
+    cdef uint64_t value
+    if column.size() == 1 and size != 1:
+        value = column[0]
+        column.assign(size, value)
+    return 0
+
+
+cdef Py_ssize_t _vector_size(
+    Py_ssize_t requested,
+    Py_ssize_t first,
+    Py_ssize_t second,
+    Py_ssize_t third,
+) except -1:
+    cdef Py_ssize_t size = -1
+    cdef Py_ssize_t length
+    for length in (first, second, third):
+        if length < 0:
+            continue
+        if size >= 0 and length != size:
+            raise ValueError("parameter vectors must have equal lengths")
+        size = length
+    if requested >= 0 and requested != size:
+        raise ValueError("count must equal the parameter vector length")
+    return size
+
+
+cdef object _float_vector_result(
+    GeneratorCore* generator,
+    int operation,
+    object a,
+    object b,
+    object c,
+    tuple names,
+    object count,
+    object as_buffer,
+    object out,
+    bint locked=False,
+):
+    cdef vector[double] first
+    cdef vector[double] second
+    cdef vector[double] third
+    cdef vector[double] values
+    cdef Py_ssize_t first_size = _double_column(a, names[0], first)
+    cdef Py_ssize_t second_size = _double_column(b, names[1], second)
+    cdef Py_ssize_t third_size = _double_column(c, names[2], third)
+    cdef Py_ssize_t size = _vector_size(
+        -1 if count is None else _as_count(count), first_size, second_size, third_size
+    )
+    cdef Py_buffer view
+    cdef void* data = NULL
+    cdef double* output
+    cdef Py_ssize_t index
+    cdef object storage
+    _broadcast_double(first, size)
+    _broadcast_double(second, size)
+    _broadcast_double(third, size)
+    storage = _bulk_storage(&view, size, as_buffer, out, _FLOAT_STORAGE, &data, &size)
     try:
-        return _bool_dispatch(generator, operation, parameter, bulk, size)
+        with nogil:
+            for index in range(size):
+                core_validate_float(operation, first[index], second[index], third[index])
+        if storage is None:
+            values.resize(size)
+            data = values.data()
+        output = <double*>data
+        if locked:
+            with nogil:
+                generator.lock()
+        try:
+            with nogil:
+                for index in range(size):
+                    output[index] = core_float(
+                        generator[0], operation, first[index], second[index], third[index]
+                    )
+        finally:
+            if locked:
+                with nogil:
+                    generator.unlock()
     finally:
+        if out is not None:
+            PyBuffer_Release(&view)
+    if storage is None:
+        return list(values)
+    return storage
+
+
+cdef object _unsigned_vector_result(
+    GeneratorCore* generator,
+    int operation,
+    object a,
+    object b,
+    object parameter,
+    tuple names,
+    object count,
+    object as_buffer,
+    object out,
+    bint locked=False,
+):
+    cdef vector[uint64_t] first
+    cdef vector[uint64_t] second
+    cdef vector[double] third
+    cdef vector[uint64_t] values
+    cdef Py_ssize_t first_size = _uint64_column(a, names[0], first)
+    cdef Py_ssize_t second_size = _uint64_column(b, names[1], second)
+    cdef Py_ssize_t third_size = _double_column(parameter, names[2], third)
+    cdef Py_ssize_t size = _vector_size(
+        -1 if count is None else _as_count(count), first_size, second_size, third_size
+    )
+    cdef Py_buffer view
+    cdef void* data = NULL
+    cdef uint64_t* output
+    cdef Py_ssize_t index
+    cdef object storage
+    _broadcast_uint64(first, size)
+    _broadcast_uint64(second, size)
+    _broadcast_double(third, size)
+    storage = _bulk_storage(&view, size, as_buffer, out, _UNSIGNED_STORAGE, &data, &size)
+    try:
         with nogil:
-            generator.unlock()
+            for index in range(size):
+                core_validate_unsigned(operation, first[index], second[index], third[index])
+        if storage is None:
+            values.resize(size)
+            data = values.data()
+        output = <uint64_t*>data
+        if locked:
+            with nogil:
+                generator.lock()
+        try:
+            with nogil:
+                for index in range(size):
+                    output[index] = core_unsigned(
+                        generator[0], operation, first[index], second[index], third[index]
+                    )
+        finally:
+            if locked:
+                with nogil:
+                    generator.unlock()
+    finally:
+        if out is not None:
+            PyBuffer_Release(&view)
+    if storage is None:
+        return list(values)
+    return storage
+
+
+cdef object _bool_vector_result(
+    GeneratorCore* generator,
+    int operation,
+    object parameter,
+    str name,
+    object count,
+    object as_buffer,
+    object out,
+    bint locked=False,
+):
+    cdef vector[double] column
+    cdef vector[uint8_t] values
+    cdef Py_ssize_t column_size = _double_column(parameter, name, column)
+    cdef Py_ssize_t size = _vector_size(
+        -1 if count is None else _as_count(count), column_size, -1, -1
+    )
+    cdef Py_buffer view
+    cdef void* data = NULL
+    cdef uint8_t* output
+    cdef Py_ssize_t index
+    cdef object storage
+    _broadcast_double(column, size)
+    storage = _bulk_storage(&view, size, as_buffer, out, _BOOL_STORAGE, &data, &size)
+    try:
+        with nogil:
+            for index in range(size):
+                core_validate_bool(operation, column[index])
+        if storage is None:
+            values.resize(size)
+            data = values.data()
+        output = <uint8_t*>data
+        if locked:
+            with nogil:
+                generator.lock()
+        try:
+            with nogil:
+                for index in range(size):
+                    output[index] = <uint8_t>core_bool(generator[0], operation, column[index])
+        finally:
+            if locked:
+                with nogil:
+                    generator.unlock()
+    finally:
+        if out is not None:
+            PyBuffer_Release(&view)
+    if storage is None:
+        return [bool(values[index]) for index in range(size)]
+    return storage
 
 
 cdef void _shuffle_small_exact_list(
@@ -730,11 +1488,89 @@ cdef void _shuffle_small_exact_list(
         data[position], data[other] = data[other], data[position]
 
 
-cdef void _shuffle_knuth_b(GeneratorCore* generator, object data, bint synchronize) except *:
+cdef bint _blocked_strategy(object strategy) except -1:
+    if not isinstance(strategy, str):
+        raise TypeError("strategy must be a str")
+    if strategy == "knuth_b":
+        return False
+    if strategy == "blocked":
+        return True
+    raise ValueError("strategy must be 'knuth_b' or 'blocked'")
+
+
+cdef Py_ssize_t _shuffle_threads(object threads, bint blocked) except -1:
+    cdef Py_ssize_t workers = _as_count(threads, "threads")
+    if workers == 0:
+        raise ValueError("threads must be positive")
+    if workers != 1 and not blocked:
+        raise ValueError("threads requires strategy='blocked'")
+    return workers
+
+
+cdef void _shuffle_buffer(
+    GeneratorCore* generator,
+    object data,
+    object item_size,
+    bint blocked,
+    Py_ssize_t threads,
+) except *:
+    # Buffer items cannot run callbacks, so the whole shuffle runs under the
+    # generator lock without the GIL. Holding the export also prevents a
+    # bytearray or array.array from resizing during the shuffle.
+    cdef Py_buffer view
+    cdef Py_ssize_t unit
+    _acquire_writable(&view, data, "data")
+    try:
+        if item_size is not None:
+            unit = _as_count(item_size, "item_size")
+            if unit == 0:
+                raise ValueError("item_size must be positive")
+        elif view.ndim > 1 and view.shape[0] > 0:
+            unit = view.len // view.shape[0]
+        else:
+            unit = view.itemsize
+        if view.len == 0 or unit == 0:
+            # Zero-width rows leave nothing to move.
+            return
+        if view.len % unit:
+            raise ValueError("item_size must divide the buffer length")
+        if blocked:
+            with nogil:
+                core_blocked_shuffle_items(
+                    generator[0],
+                    <unsigned char*>view.buf,
+                    <size_t>(view.len // unit),
+                    <size_t>unit,
+                    <size_t>threads,
+                )
+        else:
+            with nogil:
+                core_shuffle_items(
+                    generator[0], <unsigned char*>view.buf, <size_t>(view.len // unit), <size_t>unit
+                )
+    finally:
+        PyBuffer_Release(&view)
+
+
+cdef void _shuffle_knuth_b(
+    GeneratorCore* generator,
+    object data,
+    bint synchronize,
+    object item_size=None,
+    object strategy="knuth_b",
+    object threads=1,
+) except *:
     cdef Py_ssize_t last
     cdef Py_ssize_t position
     cdef Py_ssize_t other
     cdef vector[size_t] others
+    cdef bint blocked = _blocked_strategy(strategy)
+    cdef Py_ssize_t workers = _shuffle_threads(threads, blocked)
+    if blocked or item_size is not None or (
+        type(data) is not list and PyObject_CheckBuffer(data)
+    ):
+        _shuffle_buffer(generator, data, item_size, blocked, workers)
+        return
     if type(data) is not list and not isinstance(data, MutableSequence):
         raise TypeError("data must be a mutable sequence")
     last = len(data) - 1
@@ -856,53 +1692,235 @@ cdef list _sample_generator_materialized(
     return working
 
 
-cdef bytes _stream_payload(object stream_id):
-    cdef bytes magnitude
+cdef list _sample_range_native(
+    GeneratorCore* generator, object population, Py_ssize_t count
+):
+    # Passing NULL draws from the module engine.
+    cdef vector[size_t] offsets
+    cdef vector[uint64_t] indices
+    cdef size_t population_size = <size_t>len(population)
+    cdef Py_ssize_t position
+    if count < 0:
+        raise ValueError("sample size must be nonnegative")
+    if count > len(population):
+        raise ValueError("sample size exceeds population")
+    if count == 0:
+        return []
+    offsets.resize(count)
+    indices.resize(count)
+    if generator == NULL:
+        _prepare_module_scalar()
+        with nogil:
+            core_module_sample_offsets(population_size, <size_t>count, &offsets[0])
+            core_sparse_sample_indices(&offsets[0], <size_t>count, &indices[0])
+    else:
+        with nogil:
+            core_generator_sample_offsets(
+                generator[0], population_size, <size_t>count, &offsets[0]
+            )
+            core_sparse_sample_indices(&offsets[0], <size_t>count, &indices[0])
+    return [population[indices[position]] for position in range(count)]
+
+
+cdef uint64_t _stream_id_seed(uint64_t root, object stream_id) except *:
+    cdef int overflow = 0
+    cdef long long small
     cdef bytes encoded
-    cdef bytes sign
+    cdef const char* text
+    cdef Py_ssize_t length
     if isinstance(stream_id, bool):
         raise TypeError("stream_id must be int, str, or bytes, not bool")
     if isinstance(stream_id, int):
-        sign = b"-" if stream_id < 0 else b"+"
-        magnitude = abs(stream_id).to_bytes(
-            max(1, (abs(stream_id).bit_length() + 7) // 8), "big"
+        small = PyLong_AsLongLongAndOverflow(stream_id, &overflow)
+        if overflow == 0:
+            return core_stream_seed_integer(root, small)
+        encoded = abs(stream_id).to_bytes((abs(stream_id).bit_length() + 7) // 8, "big")
+        return core_stream_seed(
+            root,
+            c"i",
+            c"-" if stream_id < 0 else c"+",
+            <const unsigned char*>PyBytes_AS_STRING(encoded),
+            PyBytes_GET_SIZE(encoded),
         )
-        return b"i" + sign + len(magnitude).to_bytes(8, "big") + magnitude
     if isinstance(stream_id, str):
-        encoded = stream_id.encode("utf-8")
-        return b"s" + len(encoded).to_bytes(8, "big") + encoded
+        text = PyUnicode_AsUTF8AndSize(stream_id, &length)
+        return core_stream_seed(root, c"s", 0, <const unsigned char*>text, length)
     if isinstance(stream_id, bytes):
-        return b"b" + len(stream_id).to_bytes(8, "big") + stream_id
+        return core_stream_seed(
+            root,
+            c"b",
+            0,
+            <const unsigned char*>PyBytes_AS_STRING(stream_id),
+            PyBytes_GET_SIZE(stream_id),
+        )
     raise TypeError("stream_id must be int, str, or bytes")
 
 
-cdef uint64_t _stream_seed(object root_seed, object stream_id) except *:
-    cdef uint64_t checked_root = _as_uint64(root_seed, "root_seed")
-    cdef bytes payload = (
-        b"Fortuna\x006.0\x00for_stream\x00"
-        + int(checked_root).to_bytes(8, "big")
-        + _stream_payload(stream_id)
-    )
-    return int.from_bytes(sha256(payload).digest()[:8], "big")
+_ENGINES = ("mt19937_64", "pcg64_dxsm", "xoshiro256++", "sfc64", "philox4x64")
 
 
-cdef class Generator:
-    """Generator(seed=0)\n--\n\nOwned random engine with deterministic and entropy construction modes."""
+cdef int _engine_index(object engine) except -1:
+    if not isinstance(engine, str):
+        raise TypeError("engine must be a str")
+    if engine not in _ENGINES:
+        raise ValueError(
+            "engine must be 'mt19937_64', 'pcg64_dxsm', 'xoshiro256++', 'sfc64', "
+            "or 'philox4x64'"
+        )
+    return _ENGINES.index(engine)
 
-    cdef GeneratorCore* _generator
 
-    def __cinit__(self, seed=0):
-        self._generator = NULL
-        self._generator = new GeneratorCore(_as_uint64(seed, "seed"))
+cdef EnginePosition _as_engine_position(object offset) except *:
+    # A counter-based engine addresses 2**128 blocks of four words.
+    cdef EnginePosition position
+    cdef object block
+    if isinstance(offset, bool):
+        raise TypeError("offset must be an integer, not bool")
+    try:
+        offset = operator.index(offset)
+    except TypeError as error:
+        raise TypeError("offset must be an integer") from error
+    if offset < 0:
+        raise ValueError("offset must be nonnegative")
+    if offset >> 130:
+        raise OverflowError("offset must be below 2**130")
+    block = offset >> 2
+    position.block_high = block >> 64
+    position.block_low = block & 0xFFFF_FFFF_FFFF_FFFF
+    position.lane = offset & 3
+    return position
+
+
+cdef object _engine_constructor(type cls, object seed, object engine):
+    # The default engine is not passed on, so subclass constructors that take
+    # only a seed keep working.
+    if _engine_index(engine) == 0:
+        return cls(seed)
+    return cls(seed, engine=engine)
 
-    def __dealloc__(self):
-        if self._generator != NULL:
-            del self._generator
 
-    @classmethod
-    def from_entropy(cls):
-        cdef object constructed = cls(0)
-        cdef Generator result
+cdef uint64_t _stream_seed(object root_seed, object stream_id) except *:
+    return _stream_id_seed(_as_uint64(root_seed, "root_seed"), stream_id)
+
+
+cdef list _stream_generators(type cls, object root_seed, object stream_ids, object engine):
+    cdef uint64_t checked_root = _as_uint64(root_seed, "root_seed")
+    cdef vector[uint64_t] seeds
+    cdef list result = []
+    cdef object constructed
+    _engine_index(engine)
+    for stream_id in stream_ids:
+        seeds.push_back(_stream_id_seed(checked_root, stream_id))
+    for index in range(<Py_ssize_t>seeds.size()):
+        constructed = _engine_constructor(cls, seeds[index], engine)
+        if not isinstance(constructed, cls):
+            raise TypeError("Generator subclass constructor must return an instance of cls")
+        result.append(constructed)
+    return result
+
+
+_STREAM_CHUNK = 1024
+_PARALLEL_CHUNK = 65536
+_COUNT_METHODS = frozenset(
+    {
+        "percent_true",
+        "bernoulli_variate",
+        "random_below",
+        "random_index",
+        "random_int",
+        "random_range",
+        "d",
+        "dice",
+        "ability_dice",
+        "plus_or_minus",
+        "plus_or_minus_triangular",
+        "plus_or_minus_normal",
+        "canonical",
+        "random_float",
+        "triangular",
+        "beta_variate",
+        "pareto_variate",
+        "vonmises_variate",
+        "binomial_variate",
+        "negative_binomial_variate",
+        "geometric_variate",
+        "poisson_variate",
+        "exponential_variate",
+        "gamma_variate",
+        "weibull_variate",
+        "normal_variate",
+        "log_normal_variate",
+        "extreme_value_variate",
+        "chi_squared_variate",
+        "cauchy_variate",
+        "fisher_f_variate",
+        "student_t_variate",
+        "front_triangular",
+        "center_triangular",
+        "back_triangular",
+    }
+)
+# Prepared sampler dispatch: result storage, native operation code, and the
+# coercion applied to each positional parameter ("i" int64, "u" uint64,
+# "d" double). random_below, random_index, and random_range are bound specially.
+_PREPARED_OPERATIONS = {
+    "percent_true": (_BOOL_STORAGE, 0, "d"),
+    "bernoulli_variate": (_BOOL_STORAGE, 1, "d"),
+    "random_below": (_UNSIGNED_STORAGE, 0, ""),
+    "random_index": (_UNSIGNED_STORAGE, 1, ""),
+    "random_int": (_SIGNED_STORAGE, 0, "ii"),
+    "random_range": (_SIGNED_STORAGE, 1, "iii"),
+    "d": (_UNSIGNED_STORAGE, 2, "u"),
+    "dice": (_UNSIGNED_STORAGE, 3, "uu"),
+    "ability_dice": (_UNSIGNED_STORAGE, 4, "u"),
+    "plus_or_minus": (_SIGNED_STORAGE, 2, "i"),
+    "plus_or_minus_triangular": (_SIGNED_STORAGE, 3, "i"),
+    "plus_or_minus_normal": (_SIGNED_STORAGE, 4, "i"),
+    "canonical": (_FLOAT_STORAGE, 0, ""),
+    "random_float": (_FLOAT_STORAGE, 1, "dd"),
+    "triangular": (_FLOAT_STORAGE, 2, "ddd"),
+    "beta_variate": (_FLOAT_STORAGE, 3, "dd"),
+    "pareto_variate": (_FLOAT_STORAGE, 4, "d"),
+    "vonmises_variate": (_FLOAT_STORAGE, 5, "dd"),
+    "binomial_variate": (_UNSIGNED_STORAGE, 5, "ud"),
+    "negative_binomial_variate": (_UNSIGNED_STORAGE, 6, "ud"),
+    "geometric_variate": (_UNSIGNED_STORAGE, 7, "d"),
+    "poisson_variate": (_UNSIGNED_STORAGE, 8, "d"),
+    "exponential_variate": (_FLOAT_STORAGE, 6, "d"),
+    "gamma_variate": (_FLOAT_STORAGE, 7, "dd"),
+    "weibull_variate": (_FLOAT_STORAGE, 8, "dd"),
+    "normal_variate": (_FLOAT_STORAGE, 9, "dd"),
+    "log_normal_variate": (_FLOAT_STORAGE, 10, "dd"),
+    "extreme_value_variate": (_FLOAT_STORAGE, 11, "dd"),
+    "chi_squared_variate": (_FLOAT_STORAGE, 12, "d"),
+    "cauchy_variate": (_FLOAT_STORAGE, 13, "dd"),
+    "fisher_f_variate": (_FLOAT_STORAGE, 14, "dd"),
+    "student_t_variate": (_FLOAT_STORAGE, 15, "d"),
+    "front_triangular": (_UNSIGNED_STORAGE, 9, "u"),
+    "center_triangular": (_UNSIGNED_STORAGE, 10, "u"),
+    "back_triangular": (_UNSIGNED_STORAGE, 11, "u"),
+}
+_BULK_KEYWORDS = frozenset({"count", "as_buffer", "out"})
+
+
+cdef class Generator:
+    """Generator(seed=0, *, engine='mt19937_64')\n--\n\nOwned random engine with deterministic and entropy construction modes."""
+
+    cdef GeneratorCore* _generator
+
+    def __cinit__(self, seed=0, *, engine="mt19937_64"):
+        cdef uint64_t checked = _as_uint64(seed, "seed")
+        self._generator = NULL
+        self._generator = new GeneratorCore(checked, True, _engine_index(engine))
+
+    def __dealloc__(self):
+        if self._generator != NULL:
+            del self._generator
+
+    @classmethod
+    def from_entropy(cls, *, engine="mt19937_64"):
+        cdef object constructed = _engine_constructor(cls, 0, engine)
+        cdef Generator result
         if not isinstance(constructed, cls):
             raise TypeError("Generator subclass constructor must return an instance of cls")
         result = constructed
@@ -911,12 +1929,105 @@ cdef class Generator:
         return result
 
     @classmethod
-    def for_stream(cls, root_seed, stream_id):
-        result = cls(_stream_seed(root_seed, stream_id))
+    def for_stream(cls, root_seed, stream_id, *, engine="mt19937_64"):
+        _engine_index(engine)
+        result = _engine_constructor(cls, _stream_seed(root_seed, stream_id), engine)
         if not isinstance(result, cls):
             raise TypeError("Generator subclass constructor must return an instance of cls")
         return result
 
+    @classmethod
+    def for_streams(cls, root_seed, stream_ids, *, engine="mt19937_64"):
+        return _stream_generators(cls, root_seed, stream_ids, engine)
+
+    def spawn(self, n):
+        cdef Py_ssize_t count = _as_count(n, "n")
+        if count == 0:
+            return []
+        root = self.random_below(1 << 64)
+        return type(self).for_streams(root, range(count), engine=self.engine)
+
+    @property
+    def engine(self):
+        """Name of the bit generator behind this Generator."""
+        return _ENGINES[core_generator_engine(self._generator[0])]
+
+    @property
+    def position(self):
+        """Engine words drawn since seeding, for a counter-based engine."""
+        cdef EnginePosition position
+        with nogil:
+            position = core_generator_position(self._generator[0])
+        return (((<object>position.block_high) << 64) | position.block_low) * 4 + position.lane
+
+    def at(self, offset):
+        cdef EnginePosition checked = _as_engine_position(offset)
+        with nogil:
+            core_generator_seek(self._generator[0], checked)
+        return self
+
+    def advance(self, steps):
+        cdef uint64_t checked = _as_uint64(steps, "steps")
+        with nogil:
+            core_generator_advance(self._generator[0], checked)
+        return self
+
+    def jump(self):
+        with nogil:
+            core_generator_jump(self._generator[0])
+        return self
+
+    def getstate(self, *, out=None):
+        cdef unsigned char snapshot[_GENERATOR_STATE_CAPACITY]
+        cdef Py_buffer view
+        cdef Py_ssize_t capacity
+        cdef size_t size
+        if out is None:
+            with nogil:
+                size = core_generator_write_state(
+                    self._generator[0], snapshot, _GENERATOR_STATE_CAPACITY
+                )
+            return PyBytes_FromStringAndSize(<char*>snapshot, <Py_ssize_t>size)
+        # The snapshot is staged so a rejected out is left untouched.
+        _acquire_writable(&view, out, "out")
+        capacity = view.len
+        try:
+            with nogil:
+                size = core_generator_write_state(
+                    self._generator[0], snapshot, _GENERATOR_STATE_CAPACITY
+                )
+            if size != <size_t>capacity:
+                raise ValueError(f"out must hold exactly {size} bytes")
+            memcpy(view.buf, snapshot, size)
+        finally:
+            PyBuffer_Release(&view)
+        return out
+
+    def setstate(self, state):
+        cdef Py_buffer view
+        try:
+            PyObject_GetBuffer(state, &view, PyBUF_RECORDS_RO)
+        except TypeError:
+            raise TypeError("state must be a bytes-like object") from None
+        try:
+            if not PyBuffer_IsContiguous(&view, b"C"):
+                raise ValueError("state must be C-contiguous")
+            with nogil:
+                core_generator_restore_state(
+                    self._generator[0], <const unsigned char*>view.buf, <size_t>view.len
+                )
+        finally:
+            PyBuffer_Release(&view)
+
+    def __reduce__(self):
+        return type(self), (), (self.getstate(), getattr(self, "__dict__", None))
+
+    def __setstate__(self, state):
+        snapshot, attributes = state
+        self.setstate(snapshot)
+        if attributes:
+            self.__dict__.update(attributes)
+
     def seed(self, value=0):
         cdef uint64_t checked = _as_uint64(value, "seed")
         with nogil:
@@ -938,25 +2049,33 @@ cdef class Generator:
             with nogil:
                 self._generator.unlock()
 
-    def percent_true(self, percent=50.0, *, count=None):
+    def percent_true(self, percent=50.0, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(percent):
+            return _bool_vector_result(
+                self._generator, 0, percent, "percent", count, as_buffer, out, True
+            )
         cdef double checked = _as_double(percent, "percent")
         cdef bint scalar
-        if count is not None:
-            return _bool_generator_result(self._generator, 0, checked, count)
+        if _is_bulk(count, as_buffer, out):
+            return _bool_generator_result(self._generator, 0, checked, count, as_buffer, out)
         with nogil:
             scalar = core_generator_percent_true(self._generator[0], checked)
         return bool(scalar)
 
-    def bernoulli_variate(self, probability=0.5, *, count=None):
+    def bernoulli_variate(self, probability=0.5, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(probability):
+            return _bool_vector_result(
+                self._generator, 1, probability, "probability", count, as_buffer, out, True
+            )
         cdef double checked = _as_double(probability, "probability")
         cdef bint scalar
-        if count is not None:
-            return _bool_generator_result(self._generator, 1, checked, count)
+        if _is_bulk(count, as_buffer, out):
+            return _bool_generator_result(self._generator, 1, checked, count, as_buffer, out)
         with nogil:
             scalar = core_generator_bernoulli(self._generator[0], checked)
         return bool(scalar)
 
-    def random_below(self, limit, *, count=None):
+    def random_below(self, limit, *, count=None, as_buffer=False, out=None):
         cdef int direction
         cdef uint64_t high = _below_high(limit, &direction)
         cdef uint64_t scalar
@@ -965,9 +2084,18 @@ cdef class Generator:
             if count is not None:
                 _as_count(count)
             raise ValueError("limit must be nonzero")
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             result = _unsigned_generator_result(
-                self._generator, 0, 0, high, 0.0, count
+                self._generator,
+                0,
+                0,
+                high,
+                0.0,
+                count,
+                as_buffer,
+                out,
+                _REFLECTED if direction < 0 else _UNMAPPED,
+                high,
             )
             return _reflected_below_result(result, direction)
         with nogil:
@@ -976,14 +2104,23 @@ cdef class Generator:
             return scalar
         return -(<object>scalar)
 
-    def random_index(self, size, *, count=None):
+    def random_index(self, size, *, count=None, as_buffer=False, out=None):
         cdef int direction
         cdef uint64_t checked = _index_magnitude(size, &direction)
         cdef uint64_t scalar
         cdef object result
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             result = _unsigned_generator_result(
-                self._generator, 1, checked, 0, 0.0, count
+                self._generator,
+                1,
+                checked,
+                0,
+                0.0,
+                count,
+                as_buffer,
+                out,
+                _CONTINUED if direction < 0 else _UNMAPPED,
+                checked,
             )
             return _continued_index_result(result, direction, checked)
         with nogil:
@@ -992,19 +2129,19 @@ cdef class Generator:
             return scalar
         return (<object>scalar) - checked
 
-    def random_int(self, low, high, *, count=None):
+    def random_int(self, low, high, *, count=None, as_buffer=False, out=None):
         cdef int64_t checked_low = _as_int64(low, "low")
         cdef int64_t checked_high = _as_int64(high, "high")
         cdef int64_t scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _signed_generator_result(
-                self._generator, 0, checked_low, checked_high, 0, count
+                self._generator, 0, checked_low, checked_high, 0, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_random_int(self._generator[0], checked_low, checked_high)
         return scalar
 
-    def random_range(self, start, stop=None, step=1, *, count=None):
+    def random_range(self, start, stop=None, step=1, *, count=None, as_buffer=False, out=None):
         cdef int64_t checked_start
         cdef int64_t checked_stop
         cdef int64_t checked_step
@@ -1015,9 +2152,9 @@ cdef class Generator:
         checked_start = _as_int64(start, "start")
         checked_stop = _as_int64(stop, "stop")
         checked_step = _as_int64(step, "step")
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _signed_generator_result(
-                self._generator, 1, checked_start, checked_stop, checked_step, count
+                self._generator, 1, checked_start, checked_stop, checked_step, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_random_range(
@@ -1025,22 +2162,24 @@ cdef class Generator:
             )
         return scalar
 
-    def d(self, sides=20, *, count=None):
+    def d(self, sides=20, *, count=None, as_buffer=False, out=None):
         cdef uint64_t checked = _as_uint64(sides, "sides")
         cdef uint64_t scalar
-        if count is not None:
-            return _unsigned_generator_result(self._generator, 2, checked, 0, 0.0, count)
+        if _is_bulk(count, as_buffer, out):
+            return _unsigned_generator_result(
+                self._generator, 2, checked, 0, 0.0, count, as_buffer, out
+            )
         with nogil:
             scalar = core_generator_roll_die(self._generator[0], checked)
         return scalar
 
-    def dice(self, rolls=1, sides=20, *, count=None):
+    def dice(self, rolls=1, sides=20, *, count=None, as_buffer=False, out=None):
         cdef uint64_t checked_rolls = _as_uint64(rolls, "rolls")
         cdef uint64_t checked_sides = _as_uint64(sides, "sides")
         cdef uint64_t scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _unsigned_generator_result(
-                self._generator, 3, checked_rolls, checked_sides, 0.0, count
+                self._generator, 3, checked_rolls, checked_sides, 0.0, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_roll_dice(
@@ -1048,74 +2187,90 @@ cdef class Generator:
             )
         return scalar
 
-    def ability_dice(self, rolls=4, *, count=None):
+    def ability_dice(self, rolls=4, *, count=None, as_buffer=False, out=None):
         cdef uint64_t checked = _as_uint64(rolls, "rolls")
         cdef uint64_t scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _unsigned_generator_result(
-                self._generator, 4, checked, 0, 0.0, count
+                self._generator, 4, checked, 0, 0.0, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_ability_dice(self._generator[0], checked)
         return scalar
 
-    def plus_or_minus(self, radius=1, *, count=None):
+    def plus_or_minus(self, radius=1, *, count=None, as_buffer=False, out=None):
         cdef int64_t checked = _as_int64(radius, "radius")
         cdef int64_t scalar
-        if count is not None:
-            return _signed_generator_result(self._generator, 2, checked, 0, 0, count)
+        if _is_bulk(count, as_buffer, out):
+            return _signed_generator_result(
+                self._generator, 2, checked, 0, 0, count, as_buffer, out
+            )
         with nogil:
             scalar = core_generator_plus_or_minus(self._generator[0], checked)
         return scalar
 
-    def plus_or_minus_triangular(self, radius=1, *, count=None):
+    def plus_or_minus_triangular(self, radius=1, *, count=None, as_buffer=False, out=None):
         cdef int64_t checked = _as_int64(radius, "radius")
         cdef int64_t scalar
-        if count is not None:
-            return _signed_generator_result(self._generator, 3, checked, 0, 0, count)
+        if _is_bulk(count, as_buffer, out):
+            return _signed_generator_result(
+                self._generator, 3, checked, 0, 0, count, as_buffer, out
+            )
         with nogil:
             scalar = core_generator_plus_or_minus_triangular(
                 self._generator[0], checked
             )
         return scalar
 
-    def plus_or_minus_normal(self, radius=1, *, count=None):
+    def plus_or_minus_normal(self, radius=1, *, count=None, as_buffer=False, out=None):
         cdef int64_t checked = _as_int64(radius, "radius")
         cdef int64_t scalar
-        if count is not None:
-            return _signed_generator_result(self._generator, 4, checked, 0, 0, count)
+        if _is_bulk(count, as_buffer, out):
+            return _signed_generator_result(
+                self._generator, 4, checked, 0, 0, count, as_buffer, out
+            )
         with nogil:
             scalar = core_generator_plus_or_minus_normal(self._generator[0], checked)
         return scalar
 
-    def canonical(self, *, count=None):
+    def canonical(self, *, count=None, as_buffer=False, out=None):
         cdef double scalar
-        if count is not None:
-            return _generator_canonical_bulk(self._generator, count)
+        if _is_bulk(count, as_buffer, out):
+            return _generator_canonical_bulk(self._generator, count, as_buffer, out)
         with nogil:
             scalar = core_generator_canonical(self._generator[0])
         return scalar
 
-    def random_float(self, low=0.0, high=1.0, *, count=None):
+    def random_float(self, low=0.0, high=1.0, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(low) or _is_parameter_vector(high):
+            return _float_vector_result(
+                self._generator, 1, low, high, 0.0, ("low", "high", ""), count, as_buffer, out,
+                True
+            )
         cdef double checked_low = _as_double(low, "low")
         cdef double checked_high = _as_double(high, "high")
         cdef double scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _float_generator_result(
-                self._generator, 1, checked_low, checked_high, 0.0, count
+                self._generator, 1, checked_low, checked_high, 0.0, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_random_float(self._generator[0], checked_low, checked_high)
         return scalar
 
-    def triangular(self, low, high, mode, *, count=None):
+    def triangular(self, low, high, mode, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(low) or _is_parameter_vector(high) or _is_parameter_vector(mode):
+            return _float_vector_result(
+                self._generator, 2, low, high, mode, ("low", "high", "mode"), count, as_buffer, out,
+                True
+            )
         cdef double checked_low = _as_double(low, "low")
         cdef double checked_high = _as_double(high, "high")
         cdef double checked_mode = _as_double(mode, "mode")
         cdef double scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _float_generator_result(
-                self._generator, 2, checked_low, checked_high, checked_mode, count
+                self._generator, 2, checked_low, checked_high, checked_mode, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_triangular(
@@ -1123,13 +2278,18 @@ cdef class Generator:
             )
         return scalar
 
-    def beta_variate(self, alpha, beta, *, count=None):
+    def beta_variate(self, alpha, beta, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(alpha) or _is_parameter_vector(beta):
+            return _float_vector_result(
+                self._generator, 3, alpha, beta, 0.0, ("alpha", "beta", ""), count, as_buffer, out,
+                True
+            )
         cdef double checked_alpha = _as_double(alpha, "alpha")
         cdef double checked_beta = _as_double(beta, "beta")
         cdef double scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _float_generator_result(
-                self._generator, 3, checked_alpha, checked_beta, 0.0, count
+                self._generator, 3, checked_alpha, checked_beta, 0.0, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_float_scalar(
@@ -1137,22 +2297,33 @@ cdef class Generator:
             )
         return scalar
 
-    def pareto_variate(self, alpha, *, count=None):
+    def pareto_variate(self, alpha, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(alpha):
+            return _float_vector_result(
+                self._generator, 4, alpha, 0.0, 0.0, ("alpha", "", ""), count, as_buffer, out, True
+            )
         cdef double checked = _as_double(alpha, "alpha")
         cdef double scalar
-        if count is not None:
-            return _float_generator_result(self._generator, 4, checked, 0.0, 0.0, count)
+        if _is_bulk(count, as_buffer, out):
+            return _float_generator_result(
+                self._generator, 4, checked, 0.0, 0.0, count, as_buffer, out
+            )
         with nogil:
             scalar = core_generator_float_scalar(self._generator[0], 4, checked, 0.0, 0.0)
         return scalar
 
-    def vonmises_variate(self, mu, kappa, *, count=None):
+    def vonmises_variate(self, mu, kappa, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(mu) or _is_parameter_vector(kappa):
+            return _float_vector_result(
+                self._generator, 5, mu, kappa, 0.0, ("mu", "kappa", ""), count, as_buffer, out,
+                True
+            )
         cdef double checked_mu = _as_double(mu, "mu")
         cdef double checked_kappa = _as_double(kappa, "kappa")
         cdef double scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _float_generator_result(
-                self._generator, 5, checked_mu, checked_kappa, 0.0, count
+                self._generator, 5, checked_mu, checked_kappa, 0.0, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_float_scalar(
@@ -1160,13 +2331,18 @@ cdef class Generator:
             )
         return scalar
 
-    def binomial_variate(self, trials, probability, *, count=None):
+    def binomial_variate(self, trials, probability, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(trials) or _is_parameter_vector(probability):
+            return _unsigned_vector_result(
+                self._generator, 5, trials, 0, probability, ("trials", "", "probability"), count,
+                as_buffer, out, True
+            )
         cdef uint64_t checked_trials = _as_uint64(trials, "trials")
         cdef double checked_probability = _as_double(probability, "probability")
         cdef uint64_t scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _unsigned_generator_result(
-                self._generator, 5, checked_trials, 0, checked_probability, count
+                self._generator, 5, checked_trials, 0, checked_probability, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_unsigned_scalar(
@@ -1174,13 +2350,20 @@ cdef class Generator:
             )
         return scalar
 
-    def negative_binomial_variate(self, successes, probability, *, count=None):
+    def negative_binomial_variate(
+        self, successes, probability, *, count=None, as_buffer=False, out=None
+    ):
+        if _is_parameter_vector(successes) or _is_parameter_vector(probability):
+            return _unsigned_vector_result(
+                self._generator, 6, successes, 0, probability, ("successes", "", "probability"),
+                count, as_buffer, out, True
+            )
         cdef uint64_t checked_successes = _as_uint64(successes, "successes")
         cdef double checked_probability = _as_double(probability, "probability")
         cdef uint64_t scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _unsigned_generator_result(
-                self._generator, 6, checked_successes, 0, checked_probability, count
+                self._generator, 6, checked_successes, 0, checked_probability, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_unsigned_scalar(
@@ -1188,40 +2371,73 @@ cdef class Generator:
             )
         return scalar
 
-    def geometric_variate(self, probability, *, count=None):
+    def geometric_variate(self, probability, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(probability):
+            return _unsigned_vector_result(
+                self._generator, 7, 0, 0, probability, ("", "", "probability"), count, as_buffer,
+                out, True
+            )
         cdef double checked = _as_double(probability, "probability")
         cdef uint64_t scalar
-        if count is not None:
-            return _unsigned_generator_result(self._generator, 7, 0, 0, checked, count)
+        if _is_bulk(count, as_buffer, out):
+            return _unsigned_generator_result(
+                self._generator, 7, 0, 0, checked, count, as_buffer, out
+            )
         with nogil:
             scalar = core_generator_unsigned_scalar(self._generator[0], 7, 0, 0, checked)
         return scalar
 
-    def poisson_variate(self, mean, *, count=None):
+    def poisson_variate(self, mean, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(mean):
+            return _unsigned_vector_result(
+                self._generator, 8, 0, 0, mean, ("", "", "mean"), count, as_buffer, out, True
+            )
         cdef double checked = _as_double(mean, "mean")
         cdef uint64_t scalar
-        if count is not None:
-            return _unsigned_generator_result(self._generator, 8, 0, 0, checked, count)
+        if _is_bulk(count, as_buffer, out):
+            return _unsigned_generator_result(
+                self._generator, 8, 0, 0, checked, count, as_buffer, out
+            )
         with nogil:
             scalar = core_generator_unsigned_scalar(self._generator[0], 8, 0, 0, checked)
         return scalar
 
-    def exponential_variate(self, rate, *, count=None):
+    def exponential_variate(
+        self, rate, *, algorithm="standard", count=None, as_buffer=False, out=None
+    ):
+        cdef int operation = _float_algorithm(algorithm, 6)
+        if _is_parameter_vector(rate):
+            return _float_vector_result(
+                self._generator, operation, rate, 0.0, 0.0, ("rate", "", ""), count, as_buffer,
+                out, True
+            )
         cdef double checked = _as_double(rate, "rate")
         cdef double scalar
-        if count is not None:
-            return _float_generator_result(self._generator, 6, checked, 0.0, 0.0, count)
+        if _is_bulk(count, as_buffer, out):
+            return _float_generator_result(
+                self._generator, operation, checked, 0.0, 0.0, count, as_buffer, out
+            )
         with nogil:
-            scalar = core_generator_exponential(self._generator[0], checked)
+            if operation == 6:
+                scalar = core_generator_exponential(self._generator[0], checked)
+            else:
+                scalar = core_generator_float_scalar(
+                    self._generator[0], operation, checked, 0.0, 0.0
+                )
         return scalar
 
-    def gamma_variate(self, shape, scale, *, count=None):
+    def gamma_variate(self, shape, scale, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(shape) or _is_parameter_vector(scale):
+            return _float_vector_result(
+                self._generator, 7, shape, scale, 0.0, ("shape", "scale", ""), count, as_buffer,
+                out, True
+            )
         cdef double checked_shape = _as_double(shape, "shape")
         cdef double checked_scale = _as_double(scale, "scale")
         cdef double scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _float_generator_result(
-                self._generator, 7, checked_shape, checked_scale, 0.0, count
+                self._generator, 7, checked_shape, checked_scale, 0.0, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_float_scalar(
@@ -1229,13 +2445,18 @@ cdef class Generator:
             )
         return scalar
 
-    def weibull_variate(self, shape, scale, *, count=None):
+    def weibull_variate(self, shape, scale, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(shape) or _is_parameter_vector(scale):
+            return _float_vector_result(
+                self._generator, 8, shape, scale, 0.0, ("shape", "scale", ""), count, as_buffer,
+                out, True
+            )
         cdef double checked_shape = _as_double(shape, "shape")
         cdef double checked_scale = _as_double(scale, "scale")
         cdef double scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _float_generator_result(
-                self._generator, 8, checked_shape, checked_scale, 0.0, count
+                self._generator, 8, checked_shape, checked_scale, 0.0, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_float_scalar(
@@ -1243,27 +2464,46 @@ cdef class Generator:
             )
         return scalar
 
-    def normal_variate(self, mean, std_dev, *, count=None):
+    def normal_variate(
+        self, mean, std_dev, *, algorithm="standard", count=None, as_buffer=False, out=None
+    ):
+        cdef int operation = _float_algorithm(algorithm, 9)
+        if _is_parameter_vector(mean) or _is_parameter_vector(std_dev):
+            return _float_vector_result(
+                self._generator, operation, mean, std_dev, 0.0, ("mean", "std_dev", ""), count,
+                as_buffer, out, True
+            )
         cdef double checked_mean = _as_double(mean, "mean")
         cdef double checked_deviation = _as_double(std_dev, "std_dev")
         cdef double scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _float_generator_result(
-                self._generator, 9, checked_mean, checked_deviation, 0.0, count
+                self._generator, operation, checked_mean, checked_deviation, 0.0, count,
+                as_buffer, out
             )
         with nogil:
-            scalar = core_generator_normal(
-                self._generator[0], checked_mean, checked_deviation
-            )
+            if operation == 9:
+                scalar = core_generator_normal(
+                    self._generator[0], checked_mean, checked_deviation
+                )
+            else:
+                scalar = core_generator_float_scalar(
+                    self._generator[0], operation, checked_mean, checked_deviation, 0.0
+                )
         return scalar
 
-    def log_normal_variate(self, log_mean, log_deviation, *, count=None):
+    def log_normal_variate(self, log_mean, log_deviation, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(log_mean) or _is_parameter_vector(log_deviation):
+            return _float_vector_result(
+                self._generator, 10, log_mean, log_deviation, 0.0,
+                ("log_mean", "log_deviation", ""), count, as_buffer, out, True
+            )
         cdef double checked_mean = _as_double(log_mean, "log_mean")
         cdef double checked_deviation = _as_double(log_deviation, "log_deviation")
         cdef double scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _float_generator_result(
-                self._generator, 10, checked_mean, checked_deviation, 0.0, count
+                self._generator, 10, checked_mean, checked_deviation, 0.0, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_float_scalar(
@@ -1271,13 +2511,18 @@ cdef class Generator:
             )
         return scalar
 
-    def extreme_value_variate(self, location, scale, *, count=None):
+    def extreme_value_variate(self, location, scale, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(location) or _is_parameter_vector(scale):
+            return _float_vector_result(
+                self._generator, 11, location, scale, 0.0, ("location", "scale", ""), count,
+                as_buffer, out, True
+            )
         cdef double checked_location = _as_double(location, "location")
         cdef double checked_scale = _as_double(scale, "scale")
         cdef double scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _float_generator_result(
-                self._generator, 11, checked_location, checked_scale, 0.0, count
+                self._generator, 11, checked_location, checked_scale, 0.0, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_float_scalar(
@@ -1285,22 +2530,34 @@ cdef class Generator:
             )
         return scalar
 
-    def chi_squared_variate(self, degrees_of_freedom, *, count=None):
+    def chi_squared_variate(self, degrees_of_freedom, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(degrees_of_freedom):
+            return _float_vector_result(
+                self._generator, 12, degrees_of_freedom, 0.0, 0.0, ("degrees_of_freedom", "", ""),
+                count, as_buffer, out, True
+            )
         cdef double checked = _as_double(degrees_of_freedom, "degrees_of_freedom")
         cdef double scalar
-        if count is not None:
-            return _float_generator_result(self._generator, 12, checked, 0.0, 0.0, count)
+        if _is_bulk(count, as_buffer, out):
+            return _float_generator_result(
+                self._generator, 12, checked, 0.0, 0.0, count, as_buffer, out
+            )
         with nogil:
             scalar = core_generator_float_scalar(self._generator[0], 12, checked, 0.0, 0.0)
         return scalar
 
-    def cauchy_variate(self, location, scale, *, count=None):
+    def cauchy_variate(self, location, scale, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(location) or _is_parameter_vector(scale):
+            return _float_vector_result(
+                self._generator, 13, location, scale, 0.0, ("location", "scale", ""), count,
+                as_buffer, out, True
+            )
         cdef double checked_location = _as_double(location, "location")
         cdef double checked_scale = _as_double(scale, "scale")
         cdef double scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _float_generator_result(
-                self._generator, 13, checked_location, checked_scale, 0.0, count
+                self._generator, 13, checked_location, checked_scale, 0.0, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_float_scalar(
@@ -1308,13 +2565,18 @@ cdef class Generator:
             )
         return scalar
 
-    def fisher_f_variate(self, degrees_1, degrees_2, *, count=None):
+    def fisher_f_variate(self, degrees_1, degrees_2, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(degrees_1) or _is_parameter_vector(degrees_2):
+            return _float_vector_result(
+                self._generator, 14, degrees_1, degrees_2, 0.0, ("degrees_1", "degrees_2", ""),
+                count, as_buffer, out, True
+            )
         cdef double checked_first = _as_double(degrees_1, "degrees_1")
         cdef double checked_second = _as_double(degrees_2, "degrees_2")
         cdef double scalar
-        if count is not None:
+        if _is_bulk(count, as_buffer, out):
             return _float_generator_result(
-                self._generator, 14, checked_first, checked_second, 0.0, count
+                self._generator, 14, checked_first, checked_second, 0.0, count, as_buffer, out
             )
         with nogil:
             scalar = core_generator_float_scalar(
@@ -1322,42 +2584,108 @@ cdef class Generator:
             )
         return scalar
 
-    def student_t_variate(self, degrees_of_freedom, *, count=None):
+    def student_t_variate(self, degrees_of_freedom, *, count=None, as_buffer=False, out=None):
+        if _is_parameter_vector(degrees_of_freedom):
+            return _float_vector_result(
+                self._generator, 15, degrees_of_freedom, 0.0, 0.0, ("degrees_of_freedom", "", ""),
+                count, as_buffer, out, True
+            )
         cdef double checked = _as_double(degrees_of_freedom, "degrees_of_freedom")
         cdef double scalar
-        if count is not None:
-            return _float_generator_result(self._generator, 15, checked, 0.0, 0.0, count)
+        if _is_bulk(count, as_buffer, out):
+            return _float_generator_result(
+                self._generator, 15, checked, 0.0, 0.0, count, as_buffer, out
+            )
         with nogil:
             scalar = core_generator_float_scalar(self._generator[0], 15, checked, 0.0, 0.0)
         return scalar
 
-    def front_triangular(self, size, *, count=None):
+    def front_triangular(self, size, *, count=None, as_buffer=False, out=None):
         cdef uint64_t checked = _as_uint64(size, "size")
         cdef uint64_t scalar
-        if count is not None:
-            return _unsigned_generator_result(self._generator, 9, checked, 0, 0.0, count)
+        if _is_bulk(count, as_buffer, out):
+            return _unsigned_generator_result(
+                self._generator, 9, checked, 0, 0.0, count, as_buffer, out
+            )
         with nogil:
             scalar = core_generator_front_triangular(self._generator[0], checked)
         return scalar
 
-    def center_triangular(self, size, *, count=None):
+    def center_triangular(self, size, *, count=None, as_buffer=False, out=None):
         cdef uint64_t checked = _as_uint64(size, "size")
         cdef uint64_t scalar
-        if count is not None:
-            return _unsigned_generator_result(self._generator, 10, checked, 0, 0.0, count)
+        if _is_bulk(count, as_buffer, out):
+            return _unsigned_generator_result(
+                self._generator, 10, checked, 0, 0.0, count, as_buffer, out
+            )
         with nogil:
             scalar = core_generator_center_triangular(self._generator[0], checked)
         return scalar
 
-    def back_triangular(self, size, *, count=None):
+    def back_triangular(self, size, *, count=None, as_buffer=False, out=None):
         cdef uint64_t checked = _as_uint64(size, "size")
         cdef uint64_t scalar
-        if count is not None:
-            return _unsigned_generator_result(self._generator, 11, checked, 0, 0.0, count)
+        if _is_bulk(count, as_buffer, out):
+            return _unsigned_generator_result(
+                self._generator, 11, checked, 0, 0.0, count, as_buffer, out
+            )
         with nogil:
             scalar = core_generator_back_triangular(self._generator[0], checked)
         return scalar
 
+    def random_bytes(self, size):
+        return _random_bytes(self._generator, size)
+
+    def fill_bytes(self, buffer):
+        _fill_bytes(self._generator, buffer)
+
+    def random_bits(self, size):
+        return _random_bits(self._generator, size)
+
+    def bernoulli_bits(self, probability, size):
+        cdef double checked = _as_double(probability, "probability")
+        return _bernoulli_bits(self._generator, checked, size)
+
+    def prepare(self, method, *args, **kwargs):
+        """Bind one count-aware method to fixed arguments, validated once.
+
+        Calling the returned Sampler draws one value; ``take(count)`` and
+        ``fill(out)`` draw in bulk. Every form matches the equivalent call on
+        this generator and shares its engine.
+        """
+        return Sampler(self, method, args, kwargs)
+
+    def stream(self, method, *args, chunk=_STREAM_CHUNK, **kwargs):
+        """Iterate endlessly over draws from one count-aware method.
+
+        Draws are produced ``chunk`` at a time into native storage and yielded
+        in the same order as repeated scalar calls. Arguments are validated
+        before the first draw; the engine advances only as chunks are consumed.
+        """
+        return _GeneratorStream(self, method, args, kwargs, chunk)
+
+    def parallel(
+        self,
+        method,
+        *args,
+        count=None,
+        as_buffer=False,
+        out=None,
+        chunk=_PARALLEL_CHUNK,
+        threads=None,
+        **kwargs,
+    ):
+        """Draw in bulk from one count-aware method on several threads.
+
+        One ``random_below(2**64)`` draw from this generator becomes a root
+        seed, and the result is split into chunks of ``chunk`` values. Chunk
+        ``i`` holds what ``for_stream(root, i)`` draws for it, so the values
+        depend on this generator's state and ``chunk`` but not on ``threads``,
+        which defaults to the usable CPU count.
+        """
+        cdef Sampler sampler = Sampler(self, method, args, kwargs)
+        return sampler._parallel(count, as_buffer, out, chunk, threads)
+
     def _front_poisson(self, size):
         cdef uint64_t checked = _as_uint64(size, "size")
         cdef uint64_t scalar
@@ -1380,20 +2708,42 @@ cdef class Generator:
         index = self.random_index(size)
         return data[_validated_generated_index(index, size)]
 
-    def shuffle(self, data):
+    def shuffle(self, data, *, item_size=None, strategy="knuth_b", threads=1):
         """Shuffle in place after atomically consuming the complete index schedule.
 
         Mutable-sequence callbacks run without the generator lock. If one
         raises, the sequence may be partially shuffled and the full schedule's
-        entropy has still been consumed.
+        entropy has still been consumed. Writable C-contiguous buffers are
+        shuffled natively in units of ``item_size`` bytes, which defaults to
+        one element, or one row of a multidimensional buffer.
+        ``strategy="blocked"`` shuffles a buffer with sequential bucket passes
+        on up to ``threads`` threads, under its own seeded schedule.
         """
-        _shuffle_knuth_b(self._generator, data, True)
+        _shuffle_knuth_b(self._generator, data, True, item_size, strategy, threads)
 
     def sample(self, population, k):
         cdef Py_ssize_t checked_k = _as_count(k)
-        cdef list working = list(population)
+        cdef list working
+        cdef dict displaced
+        cdef Py_ssize_t size
         cdef Py_ssize_t position
         cdef Py_ssize_t other
+        if type(population) is range:
+            if type(self) is Generator:
+                return _sample_range_native(self._generator, population, checked_k)
+            size = len(population)
+            if checked_k > size:
+                raise ValueError("sample size exceeds population")
+            displaced = {}
+            working = []
+            for position in range(checked_k):
+                other = position + _validated_generated_index(
+                    self.random_index(size - position), size - position
+                )
+                working.append(population[displaced.get(other, other)])
+                displaced[other] = displaced.get(position, position)
+            return working
+        working = list(population)
         if checked_k > len(working):
             raise ValueError("sample size exceeds population")
         if type(self) is Generator:
@@ -1409,6 +2759,390 @@ cdef class Generator:
     def _sample_materialized(self, list working, Py_ssize_t checked_k):
         return _sample_generator_materialized(self._generator, working, checked_k)
 
+    def _sample_range(self, population, Py_ssize_t checked_k):
+        return _sample_range_native(self._generator, population, checked_k)
+
+
+cdef class _GeneratorStream:
+    # Exact generators refill one native array with ``out=`` and index it in
+    # C. Subclasses call their bound method once per draw so overrides keep
+    # observing every request, as in random_value and sample.
+    cdef object _method
+    cdef tuple _args
+    cdef dict _kwargs
+    cdef array.array _storage
+    cdef int _kind
+    cdef Py_ssize_t _size
+    cdef Py_ssize_t _position
+
+    def __cinit__(self, Generator generator, method, tuple args, dict kwargs, chunk):
+        cdef Py_ssize_t checked_chunk = _as_count(chunk, "chunk")
+        cdef array.array template
+        self._method = _count_method(generator, method)
+        if checked_chunk == 0:
+            raise ValueError("chunk must be positive")
+        self._args = args
+        self._kwargs = kwargs
+        self._size = 0
+        self._position = 0
+        self._kind = -1
+        if type(generator) is Generator:
+            template = self._method(*args, count=0, as_buffer=True, **kwargs)
+            self._kind = "qQdB".index(template.typecode)
+            self._storage = array.clone(template, checked_chunk, zero=False)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef Py_ssize_t index
+        if self._kind < 0:
+            return self._method(*self._args, **self._kwargs)
+        if self._position == self._size:
+            self._method(*self._args, out=self._storage, **self._kwargs)
+            self._size = len(self._storage)
+            self._position = 0
+        index = self._position
+        self._position += 1
+        if self._kind == _FLOAT_STORAGE:
+            return self._storage.data.as_doubles[index]
+        if self._kind == _UNSIGNED_STORAGE:
+            return (<uint64_t*>self._storage.data.as_voidptr)[index]
+        if self._kind == _SIGNED_STORAGE:
+            return (<int64_t*>self._storage.data.as_voidptr)[index]
+        return self._storage.data.as_uchars[index] != 0
+
+
+cdef object _count_method(Generator generator, object method):
+    if not isinstance(method, str):
+        raise TypeError("method must be a str")
+    if method not in _COUNT_METHODS:
+        raise ValueError(f"{method!r} is not a count-aware Generator method")
+    return getattr(generator, method)
+
+
+cdef class Sampler:
+    """Prepared draws from one Generator method with fixed, validated arguments."""
+
+    cdef Generator _owner
+    cdef object _method
+    cdef tuple _args
+    cdef dict _kwargs
+    cdef int _storage
+    cdef int _operation
+    cdef int _mapping
+    cdef int64_t _signed[3]
+    cdef uint64_t _unsigned[2]
+    cdef double _real[3]
+    cdef uint64_t _magnitude
+    cdef UnsignedSetup _setup
+
+    def __cinit__(self, Generator generator, method, tuple args, dict kwargs):
+        cdef object bound
+        cdef list names
+        cdef list values
+        cdef str kinds
+        cdef int direction
+        cdef Py_ssize_t position
+        cdef Py_ssize_t signed_slot = 0
+        cdef Py_ssize_t unsigned_slot = 0
+        cdef Py_ssize_t real_slot = 0
+        self._owner = generator
+        self._method = _count_method(generator, method)
+        bound = inspect.signature(self._method).bind(*args, **kwargs)
+        if _BULK_KEYWORDS.intersection(bound.arguments):
+            raise TypeError("prepare() arguments cannot include count, as_buffer, or out")
+        self._args = bound.args
+        self._kwargs = bound.kwargs
+        self._storage = -1
+        self._mapping = _UNMAPPED
+        self._magnitude = 0
+        self._signed = [0, 0, 0]
+        self._unsigned = [0, 0]
+        self._real = [0.0, 0.0, 0.0]
+        if type(generator) is not Generator:
+            return
+        self._method(*self._args, count=0, **self._kwargs)
+        bound.apply_defaults()
+        names = [
+            name
+            for name, parameter in bound.signature.parameters.items()
+            if parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+        ]
+        values = [bound.arguments[name] for name in names]
+        self._storage, self._operation, kinds = _PREPARED_OPERATIONS[method]
+        if "algorithm" in bound.arguments:
+            self._operation = _float_algorithm(bound.arguments["algorithm"], self._operation)
+        if method == "random_below":
+            self._unsigned[1] = _below_high(values[0], &direction)
+            self._mapping = _REFLECTED if direction < 0 else _UNMAPPED
+            self._magnitude = self._unsigned[1]
+        elif method == "random_index":
+            self._unsigned[0] = _index_magnitude(values[0], &direction)
+            self._mapping = _CONTINUED if direction < 0 else _UNMAPPED
+            self._magnitude = self._unsigned[0]
+        else:
+            if method == "random_range" and values[1] is None:
+                values[0:2] = [0, values[0]]
+            for position in range(len(kinds)):
+                if kinds[position] == "i":
+                    self._signed[signed_slot] = _as_int64(values[position], names[position])
+                    signed_slot += 1
+                elif kinds[position] == "u":
+                    self._unsigned[unsigned_slot] = _as_uint64(values[position], names[position])
+                    unsigned_slot += 1
+                else:
+                    self._real[real_slot] = _as_double(values[position], names[position])
+                    real_slot += 1
+        # Binomial and Poisson constants are computed here once, not per draw.
+        if self._storage == _UNSIGNED_STORAGE:
+            self._setup = core_prepare_unsigned(
+                self._operation, self._unsigned[0], self._unsigned[1], self._real[0]
+            )
+
+    def __call__(self):
+        cdef GeneratorCore* generator = self._owner._generator
+        if self._storage < 0:
+            return self._method(*self._args, **self._kwargs)
+        # An uncontended draw is shorter than a GIL round trip, so hold the GIL
+        # and take the generator lock directly; wait for it only without the GIL.
+        if generator.try_lock():
+            try:
+                return self._draw(generator)
+            finally:
+                generator.unlock()
+        with nogil:
+            generator.lock()
+        try:
+            return self._draw(generator)
+        finally:
+            generator.unlock()
+
+    cdef object _draw(self, GeneratorCore* generator):
+        cdef uint64_t unsigned_scalar
+        if self._storage == _FLOAT_STORAGE:
+            return core_float(
+                generator[0], self._operation, self._real[0], self._real[1], self._real[2]
+            )
+        if self._storage == _UNSIGNED_STORAGE:
+            unsigned_scalar = core_unsigned_prepared(generator[0], self._setup)
+            if self._mapping == _REFLECTED:
+                return -(<object>unsigned_scalar)
+            if self._mapping == _CONTINUED:
+                return (<object>unsigned_scalar) - self._magnitude
+            return unsigned_scalar
+        if self._storage == _SIGNED_STORAGE:
+            return core_signed(
+                generator[0], self._operation, self._signed[0], self._signed[1], self._signed[2]
+            )
+        return bool(core_bool(generator[0], self._operation, self._real[0]))
+
+    def take(self, count, *, as_buffer=False):
+        return self._bulk(count, as_buffer, None)
+
+    def fill(self, out):
+        return self._bulk(None, False, out)
+
+    cdef object _bulk(self, object count, object as_buffer, object out):
+        cdef GeneratorCore* generator = self._owner._generator
+        cdef object result
+        if self._storage == _FLOAT_STORAGE:
+            if self._operation == 0:
+                return _generator_canonical_bulk(generator, count, as_buffer, out)
+            return _float_generator_result(
+                generator,
+                self._operation,
+                self._real[0],
+                self._real[1],
+                self._real[2],
+                count,
+                as_buffer,
+                out,
+            )
+        if self._storage == _UNSIGNED_STORAGE:
+            result = _unsigned_generator_result(
+                generator,
+                self._operation,
+                self._unsigned[0],
+                self._unsigned[1],
+                self._real[0],
+                count,
+                as_buffer,
+                out,
+                self._mapping,
+                self._magnitude,
+            )
+            if self._mapping == _REFLECTED:
+                return _reflected_below_result(result, -1)
+            if self._mapping == _CONTINUED:
+                return _continued_index_result(result, -1, self._magnitude)
+            return result
+        if self._storage == _SIGNED_STORAGE:
+            return _signed_generator_result(
+                generator,
+                self._operation,
+                self._signed[0],
+                self._signed[1],
+                self._signed[2],
+                count,
+                as_buffer,
+                out,
+            )
+        if self._storage == _BOOL_STORAGE:
+            return _bool_generator_result(
+                generator, self._operation, self._real[0], count, as_buffer, out
+            )
+        return self._method(*self._args, count=count, as_buffer=as_buffer, out=out, **self._kwargs)
+
+    cdef object _parallel(
+        self, object count, object as_buffer, object out, object chunk, object threads
+    ):
+        cdef Py_ssize_t checked_chunk = _as_count(chunk, "chunk")
+        cdef Py_ssize_t workers
+        cdef Py_buffer view
+        cdef void* data = NULL
+        cdef Py_ssize_t size = 0
+        cdef Py_ssize_t index
+        cdef int storage_type = self._storage
+        cdef object storage
+        cdef array.array values = None
+        cdef vector[uint64_t] seeds
+        cdef int engine = core_generator_engine(self._owner._generator[0])
+        cdef uint64_t root
+        if checked_chunk == 0:
+            raise ValueError("chunk must be positive")
+        if threads is None:
+            workers = os.process_cpu_count() or 1
+        else:
+            workers = _as_count(threads, "threads")
+            if workers == 0:
+                raise ValueError("threads must be positive")
+        if count is None and out is None:
+            raise TypeError("parallel() requires count or out")
+        if self._storage < 0:
+            return self._parallel_streams(count, as_buffer, out, checked_chunk)
+        if self._mapping != _UNMAPPED:
+            storage_type = _SIGNED_STORAGE
+        storage = _bulk_storage(&view, count, as_buffer, out, storage_type, &data, &size)
+        try:
+            if storage is None:
+                values = array.clone(_BUFFER_TEMPLATES[self._storage], size, False)
+                data = values.data.as_voidptr
+            elif self._mapping != _UNMAPPED and self._magnitude > _SIGNED_STORAGE_MAGNITUDE:
+                raise OverflowError("negative buffer results must fit the signed 64-bit range")
+            root = self._owner.random_below(1 << 64)
+            seeds.resize((size + checked_chunk - 1) // checked_chunk)
+            for index in range(<Py_ssize_t>seeds.size()):
+                seeds[index] = core_stream_seed_integer(root, index)
+            with nogil:
+                if self._storage == _FLOAT_STORAGE:
+                    core_parallel_float(
+                        seeds.data(),
+                        <double*>data,
+                        size,
+                        checked_chunk,
+                        workers,
+                        engine,
+                        self._operation,
+                        self._real[0],
+                        self._real[1],
+                        self._real[2],
+                    )
+                elif self._storage == _UNSIGNED_STORAGE:
+                    core_parallel_unsigned(
+                        seeds.data(),
+                        <uint64_t*>data,
+                        size,
+                        checked_chunk,
+                        workers,
+                        engine,
+                        self._setup,
+                    )
+                    if values is None:
+                        _map_signed_storage(<uint64_t*>data, size, self._mapping, self._magnitude)
+                elif self._storage == _SIGNED_STORAGE:
+                    core_parallel_signed(
+                        seeds.data(),
+                        <int64_t*>data,
+                        size,
+                        checked_chunk,
+                        workers,
+                        engine,
+                        self._operation,
+                        self._signed[0],
+                        self._signed[1],
+                        self._signed[2],
+                    )
+                else:
+                    core_parallel_bool(
+                        seeds.data(),
+                        <uint8_t*>data,
+                        size,
+                        checked_chunk,
+                        workers,
+                        engine,
+                        self._operation,
+                        self._real[0],
+                    )
+        finally:
+            if out is not None:
+                PyBuffer_Release(&view)
+        if storage is not None:
+            return storage
+        if self._storage == _BOOL_STORAGE:
+            return [value != 0 for value in values]
+        if self._mapping == _REFLECTED:
+            return _reflected_below_result(values.tolist(), -1)
+        if self._mapping == _CONTINUED:
+            return _continued_index_result(values.tolist(), -1, self._magnitude)
+        return values.tolist()
+
+    cdef object _parallel_streams(
+        self, object count, object as_buffer, object out, Py_ssize_t chunk
+    ):
+        # Subclasses draw each chunk through their own for_stream generator
+        # and method, so overrides observe every request.
+        cdef str name = self._method.__name__
+        cdef type owner_type = type(self._owner)
+        cdef str engine = self._owner.engine
+        cdef dict options = {} if engine == _ENGINES[0] else {"engine": engine}
+        cdef object target
+        cdef object raw
+        cdef object result
+        cdef object root
+        cdef Py_ssize_t size
+        cdef Py_ssize_t start
+        cdef Py_ssize_t stop
+        if out is not None:
+            if as_buffer is not False:
+                raise TypeError("out cannot be combined with as_buffer")
+            target = memoryview(out)
+            size = len(target)
+            if count is not None and _as_count(count) != size:
+                raise ValueError("count must equal the length of out")
+            raw = target.cast("B")
+            root = self._owner.random_below(1 << 64)
+            for start in range(0, size, chunk):
+                stop = min(size, start + chunk)
+                getattr(owner_type.for_stream(root, start // chunk, **options), name)(
+                    *self._args,
+                    out=raw[start * target.itemsize : stop * target.itemsize].cast(target.format),
+                    **self._kwargs,
+                )
+            return out
+        size = _as_count(count)
+        root = self._owner.random_below(1 << 64)
+        result = getattr(owner_type.for_stream(root, 0, **options), name)(
+            *self._args, count=0, as_buffer=as_buffer, **self._kwargs
+        )
+        for start in range(0, size, chunk):
+            result.extend(
+                getattr(owner_type.for_stream(root, start // chunk, **options), name)(
+                    *self._args, count=min(chunk, size - start), as_buffer=as_buffer, **self._kwargs
+                )
+            )
+        return result
+
 
 cdef class _WideIndexSelector:
     cdef WideIndexCore* _selector
@@ -1442,9 +3176,23 @@ cdef class _WideIndexSelector:
         return result
 
 
+cdef list _indexed_values(object values, vector[uint64_t]& indices):
+    # ``values`` is an exact list or tuple whose length covers every index.
+    cdef Py_ssize_t size = <Py_ssize_t>indices.size()
+    cdef Py_ssize_t position
+    cdef list result = PyList_New(size)
+    cdef PyObject* item
+    for position in range(size):
+        item = raw_fast_get_item(<PyObject*>values, <Py_ssize_t>indices[position])
+        raw_incref(item)
+        raw_list_set_item(<PyObject*>result, position, item)
+    return result
+
+
 cdef class _PreparedCumulativeWeightedIndex:
     cdef PreparedCumulativeWeightedIndexCore* _selector
     cdef object _owner
+    cdef Py_ssize_t _size
 
     def __cinit__(self, boundaries, generator=None):
         cdef vector[double] prepared
@@ -1452,6 +3200,7 @@ cdef class _PreparedCumulativeWeightedIndex:
         self._owner = generator
         for boundary in boundaries:
             prepared.push_back(_as_double(boundary, "cumulative boundary"))
+        self._size = <Py_ssize_t>prepared.size()
         if generator is None:
             self._selector = new PreparedCumulativeWeightedIndexCore(prepared)
         elif type(generator) is Generator:
@@ -1473,6 +3222,281 @@ cdef class _PreparedCumulativeWeightedIndex:
             result = self._selector.draw(exact_generator._generator[0])
         return result
 
+    def take(self, tuple values, Py_ssize_t count):
+        """Draw ``count`` indices under one lock and return their ``values``."""
+        cdef vector[uint64_t] indices
+        cdef Generator exact_generator
+        if len(values) != self._size:
+            raise ValueError("values must match the prepared boundaries")
+        if count < 0:
+            raise ValueError("count must be >= 0")
+        indices.resize(count)
+        if self._owner is None:
+            with nogil:
+                self._selector.fill_module(indices.data(), <size_t>count)
+        else:
+            exact_generator = self._owner
+            with nogil:
+                self._selector.fill(exact_generator._generator[0], indices.data(), <size_t>count)
+        return _indexed_values(values, indices)
+
+
+cdef class _PreparedAliasWeightedIndex:
+    cdef PreparedAliasWeightedIndexCore* _selector
+    cdef object _owner
+    cdef Py_ssize_t _size
+
+    def __cinit__(self, boundaries, generator=None):
+        cdef vector[double] prepared
+        self._selector = NULL
+        self._owner = generator
+        for boundary in boundaries:
+            prepared.push_back(_as_double(boundary, "cumulative boundary"))
+        self._size = <Py_ssize_t>prepared.size()
+        if generator is not None and type(generator) is not Generator:
+            raise TypeError("generator must be an exact Fortuna.Generator or None")
+        self._selector = new PreparedAliasWeightedIndexCore(prepared)
+
+    def __dealloc__(self):
+        if self._selector != NULL:
+            del self._selector
+
+    def __call__(self):
+        cdef uint64_t result
+        cdef Generator exact_generator
+        if self._owner is None:
+            result = self._selector.draw_module()
+        else:
+            exact_generator = self._owner
+            result = self._selector.draw(exact_generator._generator[0])
+        return result
+
+    def take(self, tuple values, Py_ssize_t count):
+        """Draw ``count`` indices under one lock and return their ``values``."""
+        cdef vector[uint64_t] indices
+        cdef Generator exact_generator
+        if len(values) != self._size:
+            raise ValueError("values must match the prepared boundaries")
+        if count < 0:
+            raise ValueError("count must be >= 0")
+        indices.resize(count)
+        if self._owner is None:
+            with nogil:
+                self._selector.fill_module(indices.data(), <size_t>count)
+        else:
+            exact_generator = self._owner
+            with nogil:
+                self._selector.fill(exact_generator._generator[0], indices.data(), <size_t>count)
+        return _indexed_values(values, indices)
+
+
+cdef class _FenwickWeightedIndex:
+    cdef FenwickWeightedIndexCore* _selector
+    cdef object _owner
+
+    def __cinit__(self, weights, generator=None):
+        self._selector = NULL
+        self._owner = generator
+        if generator is not None and type(generator) is not Generator:
+            raise TypeError("generator must be an exact Fortuna.Generator or None")
+        self._selector = new FenwickWeightedIndexCore()
+        for weight in weights:
+            self._selector.push_back(_as_double(weight, "weight"))
+
+    def __dealloc__(self):
+        if self._selector != NULL:
+            del self._selector
+
+    def __len__(self):
+        return self._selector.size()
+
+    def positive(self):
+        """Return how many entries have a positive weight."""
+        return self._selector.positive()
+
+    def weight(self, size_t index):
+        return self._selector.weight(index)
+
+    def total(self):
+        return self._selector.total()
+
+    def set(self, size_t index, weight):
+        self._selector.set(index, _as_double(weight, "weight"))
+
+    def append(self, weight):
+        self._selector.push_back(_as_double(weight, "weight"))
+
+    def swap_remove(self, size_t index):
+        """Remove ``index`` by moving the last entry into its position."""
+        self._selector.swap_remove(index)
+
+    def locate(self, double draw):
+        """Return the entry whose interval contains ``draw`` in ``[0, total)``."""
+        return self._selector.locate(draw)
+
+    def __call__(self):
+        cdef uint64_t result
+        cdef Generator exact_generator
+        if self._owner is None:
+            result = self._selector.draw_module()
+        else:
+            exact_generator = self._owner
+            result = self._selector.draw(exact_generator._generator[0])
+        return result
+
+    def take(self, list values, Py_ssize_t count):
+        """Draw ``count`` indices under one lock and return their ``values``."""
+        cdef vector[uint64_t] indices
+        cdef Generator exact_generator
+        if len(values) != <Py_ssize_t>self._selector.size():
+            raise ValueError("values must match the prepared weights")
+        if count < 0:
+            raise ValueError("count must be >= 0")
+        indices.resize(count)
+        if self._owner is None:
+            with nogil:
+                self._selector.fill_module(indices.data(), <size_t>count)
+        else:
+            exact_generator = self._owner
+            with nogil:
+                self._selector.fill(exact_generator._generator[0], indices.data(), <size_t>count)
+        return _indexed_values(values, indices)
+
+
+cdef class _ReservoirDraws:
+    cdef ReservoirDrawsCore* _draws
+    cdef object _owner
+    cdef uint64_t _size
+
+    def __cinit__(self, size, generator=None):
+        self._draws = NULL
+        self._owner = generator
+        if generator is not None and type(generator) is not Generator:
+            raise TypeError("generator must be an exact Fortuna.Generator or None")
+        self._size = _as_uint64(size, "size")
+        self._draws = new ReservoirDrawsCore(self._size)
+
+    def __dealloc__(self):
+        if self._draws != NULL:
+            del self._draws
+
+    cdef GeneratorCore* _core(self) except NULL:
+        cdef Generator exact_generator
+        if self._owner is None:
+            return _module()
+        exact_generator = self._owner
+        return exact_generator._generator
+
+    def start(self):
+        """Draw Algorithm L's first threshold once the reservoir is full."""
+        cdef GeneratorCore* core = self._core()
+        with nogil:
+            self._draws.start(core[0])
+
+    def skip(self):
+        """Return how many items to pass over before the next replacement."""
+        cdef GeneratorCore* core = self._core()
+        cdef uint64_t result
+        with nogil:
+            result = self._draws.skip(core[0])
+        return result
+
+    def replace(self):
+        """Return the reservoir slot for the next item and shrink the threshold."""
+        cdef GeneratorCore* core = self._core()
+        cdef uint64_t result
+        with nogil:
+            result = self._draws.replace(core[0])
+        return result
+
+    def sample(self, population):
+        """Run Algorithm L natively over a sized sequence of at least ``size`` items."""
+        cdef GeneratorCore* core = self._core()
+        cdef vector[uint64_t] indices
+        cdef uint64_t population_size = <uint64_t>len(population)
+        cdef Py_ssize_t position
+        if population_size < self._size:
+            raise ValueError("population must hold at least size items")
+        indices.resize(self._size)
+        with nogil:
+            self._draws.fill(core[0], population_size, indices.data())
+        if type(population) is list or type(population) is tuple:
+            return _indexed_values(population, indices)
+        return [population[indices[position]] for position in range(<Py_ssize_t>self._size)]
+
+    def key(self, double weight):
+        """Return a log key ``log(U) / weight``."""
+        cdef GeneratorCore* core = self._core()
+        cdef double result
+        with nogil:
+            result = core_reservoir_key(core[0], weight)
+        return result
+
+    def jump(self, double threshold):
+        """Return the weight to pass over before the smallest log key is beaten."""
+        cdef GeneratorCore* core = self._core()
+        cdef double result
+        with nogil:
+            result = core_reservoir_jump(core[0], threshold)
+        return result
+
+    def bounded_key(self, double weight, double threshold):
+        """Return a log key for ``weight`` conditioned to exceed ``threshold``."""
+        cdef GeneratorCore* core = self._core()
+        cdef double result
+        with nogil:
+            result = core_reservoir_bounded_key(core[0], weight, threshold)
+        return result
+
+
+cdef class _FeistelPermutation:
+    cdef FeistelPermutationCore* _permutation
+
+    def __cinit__(self, size, keys):
+        cdef vector[uint64_t] round_keys = [_as_uint64(key, "key") for key in keys]
+        self._permutation = NULL
+        self._permutation = new FeistelPermutationCore(_as_uint64(size, "size"), round_keys)
+
+    def __dealloc__(self):
+        if self._permutation != NULL:
+            del self._permutation
+
+    def __len__(self):
+        return <Py_ssize_t>self._permutation.size()
+
+    def forward(self, uint64_t index):
+        """Return the permuted value at ``index``."""
+        cdef uint64_t result
+        with nogil:
+            result = self._permutation.forward(index)
+        return result
+
+    def inverse(self, uint64_t value):
+        """Return the index whose permuted value is ``value``."""
+        cdef uint64_t result
+        with nogil:
+            result = self._permutation.inverse(value)
+        return result
+
+    def fill(self, uint64_t start, out):
+        """Write the permuted values from ``start`` into an int64 buffer."""
+        cdef Py_buffer view
+        cdef Py_ssize_t size = _acquire_out(&view, out, None, _SIGNED_STORAGE)
+        try:
+            with nogil:
+                self._permutation.fill(start, <uint64_t*>view.buf, <size_t>size)
+        finally:
+            PyBuffer_Release(&view)
+        return out
+
+    def chunk(self, uint64_t start, count):
+        """Return ``count`` permuted values from ``start`` as an int64 array."""
+        cdef Py_ssize_t size = _as_count(count)
+        cdef array.array buffer = array.clone(_BUFFER_TEMPLATES[_SIGNED_STORAGE], size, False)
+        with nogil:
+            self._permutation.fill(start, <uint64_t*>buffer.data.as_voidptr, <size_t>size)
+        return buffer
+
 
 def _wide_index_selector(size, generator=None):
     return _WideIndexSelector(size, generator)
@@ -1482,6 +3506,22 @@ def _prepared_cumulative_weighted_index(boundaries, generator=None):
     return _PreparedCumulativeWeightedIndex(boundaries, generator)
 
 
+def _prepared_alias_weighted_index(boundaries, generator=None):
+    return _PreparedAliasWeightedIndex(boundaries, generator)
+
+
+def _reservoir_draws(size, generator=None):
+    return _ReservoirDraws(size, generator)
+
+
+def _fenwick_weighted_index(weights, generator=None):
+    return _FenwickWeightedIndex(weights, generator)
+
+
+def _feistel_permutation(size, keys):
+    return _FeistelPermutation(size, keys)
+
+
 def storm_version():
     return core_storm_version().decode("ascii")
 
@@ -1492,17 +3532,21 @@ def seed(value=0):
         core_module_seed(checked)
 
 
-def from_entropy():
-    return Generator.from_entropy()
+def from_entropy(*, engine="mt19937_64"):
+    return Generator.from_entropy(engine=engine)
 
 
-def for_stream(root_seed, stream_id):
-    return Generator.for_stream(root_seed, stream_id)
+def for_stream(root_seed, stream_id, *, engine="mt19937_64"):
+    return Generator.for_stream(root_seed, stream_id, engine=engine)
 
 
-def shuffle(data):
+def for_streams(root_seed, stream_ids, *, engine="mt19937_64"):
+    return Generator.for_streams(root_seed, stream_ids, engine=engine)
+
+
+def shuffle(data, *, item_size=None, strategy="knuth_b", threads=1):
     """Shuffle in place after consuming the complete index schedule."""
-    _shuffle_knuth_b(_module(), data, False)
+    _shuffle_knuth_b(_module(), data, False, item_size, strategy, threads)
 
 
 def _benchmark_shuffle_knuth_b(data):
@@ -1519,6 +3563,42 @@ def _sample_materialized(list working, Py_ssize_t checked_k):
     return _sample_module_materialized(working, checked_k)
 
 
+def _weighted_sample(tuple values, boundaries, Py_ssize_t count, generator=None):
+    """Return ``count`` weighted ``values`` without replacement, in draw order."""
+    cdef vector[double] prepared
+    cdef vector[uint64_t] indices
+    cdef Generator exact_generator
+    for boundary in boundaries:
+        prepared.push_back(_as_double(boundary, "cumulative boundary"))
+    if <Py_ssize_t>prepared.size() != len(values):
+        raise ValueError("values must match the cumulative boundaries")
+    if count < 0:
+        raise ValueError("k must be >= 0")
+    if generator is not None and type(generator) is not Generator:
+        raise TypeError("generator must be an exact Fortuna.Generator or None")
+    indices.resize(count)
+    if generator is None:
+        with nogil:
+            core_module_weighted_sample(
+                prepared.data(), prepared.size(), <size_t>count, indices.data()
+            )
+    else:
+        exact_generator = generator
+        with nogil:
+            core_generator_weighted_sample(
+                exact_generator._generator[0],
+                prepared.data(),
+                prepared.size(),
+                <size_t>count,
+                indices.data(),
+            )
+    return _indexed_values(values, indices)
+
+
+def _sample_range(population, Py_ssize_t checked_k):
+    return _sample_range_native(NULL, population, checked_k)
+
+
 def _random_value_materialized(data):
     """Select from an exact nonempty tuple/list through the module engine."""
     cdef tuple tuple_data
@@ -1538,27 +3618,31 @@ def _random_value_materialized(data):
     return tuple_data[index]
 
 
-def percent_true(percent=50.0, *, count=None):
+def percent_true(percent=50.0, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(percent):
+        return _bool_vector_result(_module(), 0, percent, "percent", count, as_buffer, out)
     cdef double checked = _as_double(percent, "percent")
     cdef bint scalar
-    if count is not None:
-        return _bool_result(_module(), 0, checked, count)
+    if _is_bulk(count, as_buffer, out):
+        return _bool_result(_module(), 0, checked, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_percent_true(checked)
     return bool(scalar)
 
 
-def bernoulli_variate(probability=0.5, *, count=None):
+def bernoulli_variate(probability=0.5, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(probability):
+        return _bool_vector_result(_module(), 1, probability, "probability", count, as_buffer, out)
     cdef double checked = _as_double(probability, "probability")
     cdef bint scalar
-    if count is not None:
-        return _bool_result(_module(), 1, checked, count)
+    if _is_bulk(count, as_buffer, out):
+        return _bool_result(_module(), 1, checked, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_bernoulli(checked)
     return bool(scalar)
 
 
-def random_below(limit, *, count=None):
+def random_below(limit, *, count=None, as_buffer=False, out=None):
     cdef int direction
     cdef uint64_t high = _below_high(limit, &direction)
     cdef uint64_t scalar
@@ -1567,8 +3651,20 @@ def random_below(limit, *, count=None):
         if count is not None:
             _as_count(count)
         raise ValueError("limit must be nonzero")
-    if count is not None:
-        result = _unsigned_result(_module(), 0, 0, high, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        result = _unsigned_result(
+            _module(),
+            0,
+            0,
+            high,
+            0.0,
+            count,
+            as_buffer,
+            out,
+            False,
+            _REFLECTED if direction < 0 else _UNMAPPED,
+            high,
+        )
         return _reflected_below_result(result, direction)
     _prepare_module_scalar()
     scalar = core_module_random_below(high)
@@ -1577,13 +3673,25 @@ def random_below(limit, *, count=None):
     return -(<object>scalar)
 
 
-def random_index(size, *, count=None):
+def random_index(size, *, count=None, as_buffer=False, out=None):
     cdef int direction
     cdef uint64_t checked = _index_magnitude(size, &direction)
     cdef uint64_t scalar
     cdef object result
-    if count is not None:
-        result = _unsigned_result(_module(), 1, checked, 0, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        result = _unsigned_result(
+            _module(),
+            1,
+            checked,
+            0,
+            0.0,
+            count,
+            as_buffer,
+            out,
+            False,
+            _CONTINUED if direction < 0 else _UNMAPPED,
+            checked,
+        )
         return _continued_index_result(result, direction, checked)
     _prepare_module_scalar()
     scalar = core_module_random_index(checked)
@@ -1592,18 +3700,18 @@ def random_index(size, *, count=None):
     return (<object>scalar) - checked
 
 
-def random_int(low, high, *, count=None):
+def random_int(low, high, *, count=None, as_buffer=False, out=None):
     cdef int64_t checked_low = _as_int64(low, "low")
     cdef int64_t checked_high = _as_int64(high, "high")
     cdef int64_t scalar
-    if count is not None:
-        return _signed_result(_module(), 0, checked_low, checked_high, 0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _signed_result(_module(), 0, checked_low, checked_high, 0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_random_int(checked_low, checked_high)
     return scalar
 
 
-def random_range(start, stop=None, step=1, *, count=None):
+def random_range(start, stop=None, step=1, *, count=None, as_buffer=False, out=None):
     cdef int64_t checked_start
     cdef int64_t checked_stop
     cdef int64_t checked_step
@@ -1614,335 +3722,447 @@ def random_range(start, stop=None, step=1, *, count=None):
     checked_start = _as_int64(start, "start")
     checked_stop = _as_int64(stop, "stop")
     checked_step = _as_int64(step, "step")
-    if count is not None:
-        return _signed_result(_module(), 1, checked_start, checked_stop, checked_step, count)
+    if _is_bulk(count, as_buffer, out):
+        return _signed_result(
+            _module(), 1, checked_start, checked_stop, checked_step, count, as_buffer, out
+        )
     _prepare_module_scalar()
     scalar = core_module_random_range(checked_start, checked_stop, checked_step)
     return scalar
 
 
-def d(sides=20, *, count=None):
+def d(sides=20, *, count=None, as_buffer=False, out=None):
     cdef uint64_t checked = _as_uint64(sides, "sides")
     cdef uint64_t scalar
-    if count is not None:
-        return _unsigned_result(_module(), 2, checked, 0, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _unsigned_result(_module(), 2, checked, 0, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_roll_die(checked)
     return scalar
 
 
-def dice(rolls=1, sides=20, *, count=None):
+def dice(rolls=1, sides=20, *, count=None, as_buffer=False, out=None):
     cdef uint64_t checked_rolls = _as_uint64(rolls, "rolls")
     cdef uint64_t checked_sides = _as_uint64(sides, "sides")
     cdef uint64_t scalar
-    if count is not None:
+    if _is_bulk(count, as_buffer, out):
         return _unsigned_result(
-            _module(), 3, checked_rolls, checked_sides, 0.0, count
+            _module(), 3, checked_rolls, checked_sides, 0.0, count, as_buffer, out
         )
     _prepare_module_scalar()
     scalar = core_module_roll_dice(checked_rolls, checked_sides)
     return scalar
 
 
-def ability_dice(rolls=4, *, count=None):
+def ability_dice(rolls=4, *, count=None, as_buffer=False, out=None):
     cdef uint64_t checked = _as_uint64(rolls, "rolls")
     cdef uint64_t scalar
-    if count is not None:
-        return _unsigned_result(_module(), 4, checked, 0, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _unsigned_result(_module(), 4, checked, 0, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_ability_dice(checked)
     return scalar
 
 
-def plus_or_minus(radius=1, *, count=None):
+def plus_or_minus(radius=1, *, count=None, as_buffer=False, out=None):
     cdef int64_t checked = _as_int64(radius, "radius")
     cdef int64_t scalar
-    if count is not None:
-        return _signed_result(_module(), 2, checked, 0, 0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _signed_result(_module(), 2, checked, 0, 0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_plus_or_minus(checked)
     return scalar
 
 
-def plus_or_minus_triangular(radius=1, *, count=None):
+def plus_or_minus_triangular(radius=1, *, count=None, as_buffer=False, out=None):
     cdef int64_t checked = _as_int64(radius, "radius")
     cdef int64_t scalar
-    if count is not None:
-        return _signed_result(_module(), 3, checked, 0, 0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _signed_result(_module(), 3, checked, 0, 0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_plus_or_minus_triangular(checked)
     return scalar
 
 
-def plus_or_minus_normal(radius=1, *, count=None):
+def plus_or_minus_normal(radius=1, *, count=None, as_buffer=False, out=None):
     cdef int64_t checked = _as_int64(radius, "radius")
     cdef int64_t scalar
-    if count is not None:
-        return _signed_result(_module(), 4, checked, 0, 0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _signed_result(_module(), 4, checked, 0, 0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_plus_or_minus_normal(checked)
     return scalar
 
 
-def canonical(*, count=None):
-    if count is not None:
-        return _module_canonical_bulk(count)
+def canonical(*, count=None, as_buffer=False, out=None):
+    if _is_bulk(count, as_buffer, out):
+        return _module_canonical_bulk(count, as_buffer, out)
     if core_module_needs_prepare():
         with nogil:
             core_module_prepare()
     return core_module_canonical_prepared()
 
 
-def random_float(low=0.0, high=1.0, *, count=None):
+def random_float(low=0.0, high=1.0, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(low) or _is_parameter_vector(high):
+        return _float_vector_result(
+            _module(), 1, low, high, 0.0, ("low", "high", ""), count, as_buffer, out
+        )
     cdef double checked_low = _as_double(low, "low")
     cdef double checked_high = _as_double(high, "high")
     cdef double scalar
-    if count is not None:
-        return _float_result(_module(), 1, checked_low, checked_high, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _float_result(_module(), 1, checked_low, checked_high, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_random_float(checked_low, checked_high)
     return scalar
 
 
-def triangular(low, high, mode, *, count=None):
+def triangular(low, high, mode, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(low) or _is_parameter_vector(high) or _is_parameter_vector(mode):
+        return _float_vector_result(
+            _module(), 2, low, high, mode, ("low", "high", "mode"), count, as_buffer, out
+        )
     cdef double checked_low = _as_double(low, "low")
     cdef double checked_high = _as_double(high, "high")
     cdef double checked_mode = _as_double(mode, "mode")
     cdef double scalar
-    if count is not None:
+    if _is_bulk(count, as_buffer, out):
         return _float_result(
-            _module(), 2, checked_low, checked_high, checked_mode, count
+            _module(), 2, checked_low, checked_high, checked_mode, count, as_buffer, out
         )
     _prepare_module_scalar()
     scalar = core_module_triangular(checked_low, checked_high, checked_mode)
     return scalar
 
 
-def beta_variate(alpha, beta, *, count=None):
+def beta_variate(alpha, beta, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(alpha) or _is_parameter_vector(beta):
+        return _float_vector_result(
+            _module(), 3, alpha, beta, 0.0, ("alpha", "beta", ""), count, as_buffer, out
+        )
     cdef double checked_alpha = _as_double(alpha, "alpha")
     cdef double checked_beta = _as_double(beta, "beta")
     cdef double scalar
-    if count is not None:
-        return _float_result(_module(), 3, checked_alpha, checked_beta, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _float_result(_module(), 3, checked_alpha, checked_beta, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_float_scalar(3, checked_alpha, checked_beta, 0.0)
     return scalar
 
 
-def pareto_variate(alpha, *, count=None):
+def pareto_variate(alpha, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(alpha):
+        return _float_vector_result(
+            _module(), 4, alpha, 0.0, 0.0, ("alpha", "", ""), count, as_buffer, out
+        )
     cdef double checked = _as_double(alpha, "alpha")
     cdef double scalar
-    if count is not None:
-        return _float_result(_module(), 4, checked, 0.0, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _float_result(_module(), 4, checked, 0.0, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_float_scalar(4, checked, 0.0, 0.0)
     return scalar
 
 
-def vonmises_variate(mu, kappa, *, count=None):
+def vonmises_variate(mu, kappa, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(mu) or _is_parameter_vector(kappa):
+        return _float_vector_result(
+            _module(), 5, mu, kappa, 0.0, ("mu", "kappa", ""), count, as_buffer, out
+        )
     cdef double checked_mu = _as_double(mu, "mu")
     cdef double checked_kappa = _as_double(kappa, "kappa")
     cdef double scalar
-    if count is not None:
-        return _float_result(_module(), 5, checked_mu, checked_kappa, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _float_result(_module(), 5, checked_mu, checked_kappa, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_float_scalar(5, checked_mu, checked_kappa, 0.0)
     return scalar
 
 
-def binomial_variate(trials, probability, *, count=None):
+def binomial_variate(trials, probability, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(trials) or _is_parameter_vector(probability):
+        return _unsigned_vector_result(
+            _module(), 5, trials, 0, probability, ("trials", "", "probability"), count, as_buffer,
+            out
+        )
     cdef uint64_t checked_trials = _as_uint64(trials, "trials")
     cdef double checked_probability = _as_double(probability, "probability")
     cdef uint64_t scalar
-    if count is not None:
+    if _is_bulk(count, as_buffer, out):
         return _unsigned_result(
-            _module(), 5, checked_trials, 0, checked_probability, count
+            _module(), 5, checked_trials, 0, checked_probability, count, as_buffer, out
         )
     _prepare_module_scalar()
     scalar = core_module_unsigned_scalar(5, checked_trials, 0, checked_probability)
     return scalar
 
 
-def negative_binomial_variate(successes, probability, *, count=None):
+def negative_binomial_variate(successes, probability, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(successes) or _is_parameter_vector(probability):
+        return _unsigned_vector_result(
+            _module(), 6, successes, 0, probability, ("successes", "", "probability"), count,
+            as_buffer, out
+        )
     cdef uint64_t checked_successes = _as_uint64(successes, "successes")
     cdef double checked_probability = _as_double(probability, "probability")
     cdef uint64_t scalar
-    if count is not None:
+    if _is_bulk(count, as_buffer, out):
         return _unsigned_result(
-            _module(), 6, checked_successes, 0, checked_probability, count
+            _module(), 6, checked_successes, 0, checked_probability, count, as_buffer, out
         )
     _prepare_module_scalar()
     scalar = core_module_unsigned_scalar(6, checked_successes, 0, checked_probability)
     return scalar
 
 
-def geometric_variate(probability, *, count=None):
+def geometric_variate(probability, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(probability):
+        return _unsigned_vector_result(
+            _module(), 7, 0, 0, probability, ("", "", "probability"), count, as_buffer, out
+        )
     cdef double checked = _as_double(probability, "probability")
     cdef uint64_t scalar
-    if count is not None:
-        return _unsigned_result(_module(), 7, 0, 0, checked, count)
+    if _is_bulk(count, as_buffer, out):
+        return _unsigned_result(_module(), 7, 0, 0, checked, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_unsigned_scalar(7, 0, 0, checked)
     return scalar
 
 
-def poisson_variate(mean, *, count=None):
+def poisson_variate(mean, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(mean):
+        return _unsigned_vector_result(
+            _module(), 8, 0, 0, mean, ("", "", "mean"), count, as_buffer, out
+        )
     cdef double checked = _as_double(mean, "mean")
     cdef uint64_t scalar
-    if count is not None:
-        return _unsigned_result(_module(), 8, 0, 0, checked, count)
+    if _is_bulk(count, as_buffer, out):
+        return _unsigned_result(_module(), 8, 0, 0, checked, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_unsigned_scalar(8, 0, 0, checked)
     return scalar
 
 
-def exponential_variate(rate, *, count=None):
+def exponential_variate(rate, *, algorithm="standard", count=None, as_buffer=False, out=None):
+    cdef int operation = _float_algorithm(algorithm, 6)
+    if _is_parameter_vector(rate):
+        return _float_vector_result(
+            _module(), operation, rate, 0.0, 0.0, ("rate", "", ""), count, as_buffer, out
+        )
     cdef double checked = _as_double(rate, "rate")
     cdef double scalar
-    if count is not None:
-        return _float_result(_module(), 6, checked, 0.0, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _float_result(_module(), operation, checked, 0.0, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
-    scalar = core_module_exponential(checked)
+    if operation == 6:
+        scalar = core_module_exponential(checked)
+    else:
+        scalar = core_module_float_scalar(operation, checked, 0.0, 0.0)
     return scalar
 
 
-def gamma_variate(shape, scale, *, count=None):
+def gamma_variate(shape, scale, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(shape) or _is_parameter_vector(scale):
+        return _float_vector_result(
+            _module(), 7, shape, scale, 0.0, ("shape", "scale", ""), count, as_buffer, out
+        )
     cdef double checked_shape = _as_double(shape, "shape")
     cdef double checked_scale = _as_double(scale, "scale")
     cdef double scalar
-    if count is not None:
-        return _float_result(_module(), 7, checked_shape, checked_scale, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _float_result(_module(), 7, checked_shape, checked_scale, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_float_scalar(7, checked_shape, checked_scale, 0.0)
     return scalar
 
 
-def weibull_variate(shape, scale, *, count=None):
+def weibull_variate(shape, scale, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(shape) or _is_parameter_vector(scale):
+        return _float_vector_result(
+            _module(), 8, shape, scale, 0.0, ("shape", "scale", ""), count, as_buffer, out
+        )
     cdef double checked_shape = _as_double(shape, "shape")
     cdef double checked_scale = _as_double(scale, "scale")
     cdef double scalar
-    if count is not None:
-        return _float_result(_module(), 8, checked_shape, checked_scale, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _float_result(_module(), 8, checked_shape, checked_scale, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_float_scalar(8, checked_shape, checked_scale, 0.0)
     return scalar
 
 
-def normal_variate(mean, std_dev, *, count=None):
+def normal_variate(
+    mean, std_dev, *, algorithm="standard", count=None, as_buffer=False, out=None
+):
+    cdef int operation = _float_algorithm(algorithm, 9)
+    if _is_parameter_vector(mean) or _is_parameter_vector(std_dev):
+        return _float_vector_result(
+            _module(), operation, mean, std_dev, 0.0, ("mean", "std_dev", ""), count, as_buffer,
+            out
+        )
     cdef double checked_mean = _as_double(mean, "mean")
     cdef double checked_deviation = _as_double(std_dev, "std_dev")
     cdef double scalar
-    if count is not None:
+    if _is_bulk(count, as_buffer, out):
         return _float_result(
-            _module(), 9, checked_mean, checked_deviation, 0.0, count
+            _module(), operation, checked_mean, checked_deviation, 0.0, count, as_buffer, out
         )
     _prepare_module_scalar()
-    scalar = core_module_normal(checked_mean, checked_deviation)
+    if operation == 9:
+        scalar = core_module_normal(checked_mean, checked_deviation)
+    else:
+        scalar = core_module_float_scalar(operation, checked_mean, checked_deviation, 0.0)
     return scalar
 
 
-def log_normal_variate(log_mean, log_deviation, *, count=None):
+def log_normal_variate(log_mean, log_deviation, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(log_mean) or _is_parameter_vector(log_deviation):
+        return _float_vector_result(
+            _module(), 10, log_mean, log_deviation, 0.0, ("log_mean", "log_deviation", ""), count,
+            as_buffer, out
+        )
     cdef double checked_mean = _as_double(log_mean, "log_mean")
     cdef double checked_deviation = _as_double(log_deviation, "log_deviation")
     cdef double scalar
-    if count is not None:
+    if _is_bulk(count, as_buffer, out):
         return _float_result(
-            _module(), 10, checked_mean, checked_deviation, 0.0, count
+            _module(), 10, checked_mean, checked_deviation, 0.0, count, as_buffer, out
         )
     _prepare_module_scalar()
     scalar = core_module_float_scalar(10, checked_mean, checked_deviation, 0.0)
     return scalar
 
 
-def extreme_value_variate(location, scale, *, count=None):
+def extreme_value_variate(location, scale, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(location) or _is_parameter_vector(scale):
+        return _float_vector_result(
+            _module(), 11, location, scale, 0.0, ("location", "scale", ""), count, as_buffer, out
+        )
     cdef double checked_location = _as_double(location, "location")
     cdef double checked_scale = _as_double(scale, "scale")
     cdef double scalar
-    if count is not None:
+    if _is_bulk(count, as_buffer, out):
         return _float_result(
-            _module(), 11, checked_location, checked_scale, 0.0, count
+            _module(), 11, checked_location, checked_scale, 0.0, count, as_buffer, out
         )
     _prepare_module_scalar()
     scalar = core_module_float_scalar(11, checked_location, checked_scale, 0.0)
     return scalar
 
 
-def chi_squared_variate(degrees_of_freedom, *, count=None):
+def chi_squared_variate(degrees_of_freedom, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(degrees_of_freedom):
+        return _float_vector_result(
+            _module(), 12, degrees_of_freedom, 0.0, 0.0, ("degrees_of_freedom", "", ""), count,
+            as_buffer, out
+        )
     cdef double checked = _as_double(degrees_of_freedom, "degrees_of_freedom")
     cdef double scalar
-    if count is not None:
-        return _float_result(_module(), 12, checked, 0.0, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _float_result(_module(), 12, checked, 0.0, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_float_scalar(12, checked, 0.0, 0.0)
     return scalar
 
 
-def cauchy_variate(location, scale, *, count=None):
+def cauchy_variate(location, scale, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(location) or _is_parameter_vector(scale):
+        return _float_vector_result(
+            _module(), 13, location, scale, 0.0, ("location", "scale", ""), count, as_buffer, out
+        )
     cdef double checked_location = _as_double(location, "location")
     cdef double checked_scale = _as_double(scale, "scale")
     cdef double scalar
-    if count is not None:
+    if _is_bulk(count, as_buffer, out):
         return _float_result(
-            _module(), 13, checked_location, checked_scale, 0.0, count
+            _module(), 13, checked_location, checked_scale, 0.0, count, as_buffer, out
         )
     _prepare_module_scalar()
     scalar = core_module_float_scalar(13, checked_location, checked_scale, 0.0)
     return scalar
 
 
-def fisher_f_variate(degrees_1, degrees_2, *, count=None):
+def fisher_f_variate(degrees_1, degrees_2, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(degrees_1) or _is_parameter_vector(degrees_2):
+        return _float_vector_result(
+            _module(), 14, degrees_1, degrees_2, 0.0, ("degrees_1", "degrees_2", ""), count,
+            as_buffer, out
+        )
     cdef double checked_first = _as_double(degrees_1, "degrees_1")
     cdef double checked_second = _as_double(degrees_2, "degrees_2")
     cdef double scalar
-    if count is not None:
+    if _is_bulk(count, as_buffer, out):
         return _float_result(
-            _module(), 14, checked_first, checked_second, 0.0, count
+            _module(), 14, checked_first, checked_second, 0.0, count, as_buffer, out
         )
     _prepare_module_scalar()
     scalar = core_module_float_scalar(14, checked_first, checked_second, 0.0)
     return scalar
 
 
-def student_t_variate(degrees_of_freedom, *, count=None):
+def student_t_variate(degrees_of_freedom, *, count=None, as_buffer=False, out=None):
+    if _is_parameter_vector(degrees_of_freedom):
+        return _float_vector_result(
+            _module(), 15, degrees_of_freedom, 0.0, 0.0, ("degrees_of_freedom", "", ""), count,
+            as_buffer, out
+        )
     cdef double checked = _as_double(degrees_of_freedom, "degrees_of_freedom")
     cdef double scalar
-    if count is not None:
-        return _float_result(_module(), 15, checked, 0.0, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _float_result(_module(), 15, checked, 0.0, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_float_scalar(15, checked, 0.0, 0.0)
     return scalar
 
 
-def front_triangular(size, *, count=None):
+def front_triangular(size, *, count=None, as_buffer=False, out=None):
     cdef uint64_t checked = _as_uint64(size, "size")
     cdef uint64_t scalar
-    if count is not None:
-        return _unsigned_result(_module(), 9, checked, 0, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _unsigned_result(_module(), 9, checked, 0, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_front_triangular(checked)
     return scalar
 
 
-def center_triangular(size, *, count=None):
+def center_triangular(size, *, count=None, as_buffer=False, out=None):
     cdef uint64_t checked = _as_uint64(size, "size")
     cdef uint64_t scalar
-    if count is not None:
-        return _unsigned_result(_module(), 10, checked, 0, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _unsigned_result(_module(), 10, checked, 0, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_center_triangular(checked)
     return scalar
 
 
-def back_triangular(size, *, count=None):
+def back_triangular(size, *, count=None, as_buffer=False, out=None):
     cdef uint64_t checked = _as_uint64(size, "size")
     cdef uint64_t scalar
-    if count is not None:
-        return _unsigned_result(_module(), 11, checked, 0, 0.0, count)
+    if _is_bulk(count, as_buffer, out):
+        return _unsigned_result(_module(), 11, checked, 0, 0.0, count, as_buffer, out)
     _prepare_module_scalar()
     scalar = core_module_back_triangular(checked)
     return scalar
 
 
+def random_bytes(size):
+    return _random_bytes(NULL, size)
+
+
+def fill_bytes(buffer):
+    _fill_bytes(NULL, buffer)
+
+
+def random_bits(size):
+    return _random_bits(NULL, size)
+
+
+def bernoulli_bits(probability, size):
+    cdef double checked = _as_double(probability, "probability")
+    return _bernoulli_bits(NULL, checked, size)
+
+
 def _front_poisson(size):
     cdef uint64_t checked = _as_uint64(size, "size")
     cdef uint64_t scalar
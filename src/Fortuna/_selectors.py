@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import heapq
 import math
 import operator
+import sys
+from array import array
 from collections import deque
-from collections.abc import Callable, Iterable, MutableSequence
+from collections.abc import Buffer, Callable, Iterable, Iterator, MutableSequence
 from itertools import cycle as iter_cycle
+from itertools import islice, pairwise
 from numbers import Real
 from typing import (
     TYPE_CHECKING,
@@ -26,8 +30,11 @@ _DEFAULT_RESOLVE_DEPTH = 100
 _NORMAL_PROFILE_SPAN = 3.0
 
 _T = TypeVar("_T")
+_OutT = TypeVar("_OutT", bound=Buffer)
 _Weight = int | float
 _Resolvable: TypeAlias = _T | Callable[..., "_Resolvable[_T]"]
+_WeightedMethod = Literal["cumulative", "alias"]
+_ShuffleStrategy = Literal["knuth_b", "blocked"]
 
 
 def _front_normal_weights(size: int) -> tuple[float, ...]:
@@ -61,6 +68,55 @@ class _FloatGenerator(Protocol):
     def random_float(self, low: float = 0.0, high: float = 1.0) -> Any: ...
 
 
+class _PreparedWeightedIndex(Protocol):
+    def __call__(self) -> int: ...
+
+    def take(self, values: tuple[Any, ...], count: int) -> list[Any]: ...
+
+
+class _ReservoirDraws(Protocol):
+    def start(self) -> None: ...
+
+    def skip(self) -> int: ...
+
+    def replace(self) -> int: ...
+
+    def key(self, weight: float) -> float: ...
+
+    def jump(self, threshold: float) -> float: ...
+
+    def bounded_key(self, weight: float, threshold: float) -> float: ...
+
+
+class _NativeReservoirDraws(_ReservoirDraws, Protocol):
+    def sample(self, population: Any) -> list[Any]: ...
+
+
+class _ReservoirGenerator(_FloatGenerator, _IndexGenerator, Protocol): ...
+
+
+class _MutableWeightedIndex(Protocol):
+    def __call__(self) -> int: ...
+
+    def __len__(self) -> int: ...
+
+    def positive(self) -> int: ...
+
+    def weight(self, index: int) -> float: ...
+
+    def total(self) -> float: ...
+
+    def set(self, index: int, weight: float) -> None: ...
+
+    def append(self, weight: float) -> None: ...
+
+    def swap_remove(self, index: int) -> None: ...
+
+    def locate(self, draw: float) -> int: ...
+
+    def take(self, values: list[Any], count: int) -> list[Any]: ...
+
+
 def _integer(value: Any, *, name: str, minimum: int | None = None) -> int:
     if isinstance(value, bool):
         raise TypeError(f"{name} must be an integer, not bool")
@@ -147,25 +203,69 @@ def random_value(
     return values[index]
 
 
+def _buffer_items(data: Buffer, item_size: int | None) -> tuple[memoryview, int]:
+    view = memoryview(data)
+    if view.readonly:
+        raise TypeError("array must be a writable buffer")
+    if not view.c_contiguous:
+        raise ValueError("array must be C-contiguous")
+    if item_size is not None:
+        unit = _integer(item_size, name="item_size", minimum=1)
+    elif view.ndim > 1 and view.shape and view.shape[0]:
+        unit = view.nbytes // view.shape[0]
+    else:
+        unit = view.itemsize
+    if view.nbytes % unit:
+        raise ValueError("item_size must divide the buffer length")
+    return view.cast("B"), unit
+
+
 def shuffle(
-    array: MutableSequence[_T],
+    array: MutableSequence[_T] | Buffer,
     *,
+    item_size: int | None = None,
+    strategy: _ShuffleStrategy = "knuth_b",
+    threads: int = 1,
     generator: _core.Generator | _IndexGenerator | _ShuffleGenerator | None = None,
 ) -> None:
-    """Shuffle a mutable sequence in place using Fortuna's native Knuth-B loop."""
-    if not isinstance(array, MutableSequence):
-        raise TypeError("array must be a mutable sequence")
-    if generator is None:
-        _core.shuffle(array)
-        return
-    native_shuffle = getattr(generator, "shuffle", None)
+    """Shuffle a mutable sequence or writable buffer in place.
+
+    Fortuna generators run the Knuth-B loop natively. Buffers are shuffled in
+    units of ``item_size`` bytes, which defaults to one element, or one row of
+    a multidimensional buffer. ``strategy="blocked"`` shuffles a buffer with
+    sequential bucket passes on up to ``threads`` threads.
+    """
+    is_buffer = isinstance(array, Buffer)
+    if not is_buffer and not isinstance(array, MutableSequence):
+        raise TypeError("array must be a mutable sequence or writable buffer")
+    if item_size is not None and not is_buffer:
+        raise TypeError("item_size requires a buffer")
+    options: dict[str, Any] = {}
+    if item_size is not None:
+        options["item_size"] = item_size
+    if strategy != "knuth_b" or threads != 1:
+        options.update(strategy=strategy, threads=threads)
+    native_shuffle = _core.shuffle if generator is None else getattr(generator, "shuffle", None)
     if callable(native_shuffle):
-        native_shuffle(array)
+        native_shuffle(array, **options)
         return
+    if "strategy" in options:
+        raise TypeError("strategy and threads require a generator with a shuffle method")
     index_generator = cast(_IndexGenerator, generator)
-    for position in range(len(array) - 1, 0, -1):
-        other = _validated_index(index_generator.random_index(position + 1), position + 1)
-        array[position], array[other] = array[other], array[position]
+    if not is_buffer:
+        sequence = cast(MutableSequence[_T], array)
+        for position in range(len(sequence) - 1, 0, -1):
+            other = _validated_index(index_generator.random_index(position + 1), position + 1)
+            sequence[position], sequence[other] = sequence[other], sequence[position]
+        return
+    view, unit = _buffer_items(cast(Buffer, array), item_size)
+    with view:
+        for position in range(view.nbytes // unit - 1, 0, -1):
+            other = _validated_index(index_generator.random_index(position + 1), position + 1)
+            if other != position:
+                first = slice(position * unit, (position + 1) * unit)
+                second = slice(other * unit, (other + 1) * unit)
+                view[first], view[second] = bytes(view[second]), bytes(view[first])
 
 
 def sample(
@@ -174,8 +274,14 @@ def sample(
     *,
     generator: _core.Generator | _IndexGenerator | None = None,
 ) -> list[_T]:
-    """Return ``k`` uniformly selected values without replacement."""
+    """Return ``k`` uniformly selected values without replacement.
+
+    A ``range`` population is never materialized; its sample needs memory for
+    ``k`` values only and matches the materialized sample's order.
+    """
     checked_k = _integer(k, name="k", minimum=0)
+    if type(population) is range:
+        return cast(list[_T], _sample_range(population, checked_k, generator))
     data = list(population)
     size = len(data)
     if checked_k > size:
@@ -191,6 +297,163 @@ def sample(
     return data[:checked_k]
 
 
+def _sample_range(
+    population: range, k: int, generator: _core.Generator | _IndexGenerator | None
+) -> list[int]:
+    size = len(population)
+    if k > size:
+        raise ValueError("sample size k must not exceed the population size")
+    if generator is None:
+        return _core._sample_range(population, k)
+    if type(generator) is _core.Generator:
+        return generator._sample_range(population, k)
+    displaced: dict[int, int] = {}
+    result: list[int] = []
+    for position in range(k):
+        offset = _validated_index(generator.random_index(size - position), size - position)
+        other = position + offset
+        result.append(population[displaced.get(other, other)])
+        displaced[other] = displaced.get(position, position)
+    return result
+
+
+class _GeneratedReservoirDraws:
+    """Reservoir draws from a custom generator's validated ``random_float``."""
+
+    __slots__ = ("_generator", "_size", "_threshold")
+
+    def __init__(self, size: int, generator: _FloatGenerator | _IndexGenerator) -> None:
+        self._generator = generator
+        self._size = size
+        self._threshold = 1.0
+
+    def _open_unit(self) -> float:
+        source = cast(_FloatGenerator, self._generator)
+        return 1.0 - _validated_weighted_draw(source.random_float(0.0, 1.0), 1.0)
+
+    def _shrink(self) -> float:
+        return math.exp(math.log(self._open_unit()) / self._size)
+
+    def start(self) -> None:
+        self._threshold = self._shrink()
+
+    def skip(self) -> int:
+        numerator = math.log(self._open_unit())
+        if not self._threshold < 1.0:
+            return 0
+        count = math.floor(numerator / math.log1p(-self._threshold))
+        return min(count, sys.maxsize)
+
+    def replace(self) -> int:
+        source = cast(_IndexGenerator, self._generator)
+        slot = _validated_index(source.random_index(self._size), self._size)
+        self._threshold *= self._shrink()
+        return slot
+
+    def key(self, weight: float) -> float:
+        return math.log(self._open_unit()) / weight
+
+    def jump(self, threshold: float) -> float:
+        numerator = math.log(self._open_unit())
+        return numerator / threshold if threshold < 0.0 else math.inf
+
+    def bounded_key(self, weight: float, threshold: float) -> float:
+        lower = math.exp(weight * threshold)
+        draw = lower + (1.0 - lower) * self._open_unit()
+        return math.log(draw) / weight if draw < 1.0 else 0.0
+
+
+def _reservoir_draws(
+    size: int, generator: _core.Generator | _FloatGenerator | _IndexGenerator | None
+) -> _ReservoirDraws:
+    if generator is None or type(generator) is _core.Generator:
+        return cast(_ReservoirDraws, _core._reservoir_draws(size, generator))
+    return _GeneratedReservoirDraws(size, generator)
+
+
+_MISSING = object()
+
+
+def reservoir_sample(
+    iterable: Iterable[_T],
+    k: int,
+    *,
+    generator: _core.Generator | _ReservoirGenerator | None = None,
+) -> list[_T]:
+    """Return ``k`` uniformly selected values from a stream of unknown length.
+
+    Li's Algorithm L keeps ``k`` values and skips geometric runs of the
+    stream, so memory is ``O(k)``. The values are in reservoir order; shuffle
+    them when their order matters.
+    """
+    checked_k = _integer(k, name="k", minimum=0)
+    if not checked_k:
+        return []
+    draws = _reservoir_draws(checked_k, generator)
+    data_type = type(iterable)
+    if not isinstance(draws, _GeneratedReservoirDraws) and (
+        data_type is list or data_type is tuple or data_type is range or isinstance(iterable, array)
+    ):
+        if len(cast(Any, iterable)) < checked_k:
+            raise ValueError("sample size k must not exceed the population size")
+        return cast(_NativeReservoirDraws, draws).sample(iterable)
+    iterator = iter(iterable)
+    reservoir = list(islice(iterator, checked_k))
+    if len(reservoir) < checked_k:
+        raise ValueError("sample size k must not exceed the population size")
+    draws.start()
+    while (item := next(islice(iterator, draws.skip(), None), _MISSING)) is not _MISSING:
+        reservoir[draws.replace()] = cast(_T, item)
+    return reservoir
+
+
+def weighted_reservoir_sample(
+    weighted_iterable: Iterable[tuple[_Weight, _T]],
+    k: int,
+    *,
+    generator: _core.Generator | _FloatGenerator | None = None,
+) -> list[_T]:
+    """Return ``k`` distinct weighted values from a stream of ``(weight, value)`` pairs.
+
+    Efraimidis and Spirakis's exponential jumps keep the ``k`` largest keys,
+    so memory is ``O(k)``. Values are in the order repeated weighted draws
+    without replacement would select them.
+    """
+    checked_k = _integer(k, name="k", minimum=0)
+    if not checked_k:
+        return []
+    draws = _reservoir_draws(checked_k, generator)
+    try:
+        iterator = iter(weighted_iterable)
+    except TypeError as error:
+        raise TypeError("weighted_iterable must be an iterable of (weight, value) pairs") from error
+    heap: list[tuple[float, int, Any]] = []
+    remaining = math.inf
+    for position, pair in enumerate(iterator):
+        weight, value = _weighted_item(
+            pair, position, table_name="weighted_iterable", number_name="weight"
+        )
+        if weight < 0.0:
+            raise ValueError("weights must be nonnegative")
+        if weight == 0.0:
+            continue
+        if len(heap) < checked_k:
+            heapq.heappush(heap, (draws.key(weight), position, value))
+            if len(heap) == checked_k:
+                remaining = draws.jump(heap[0][0])
+            continue
+        remaining -= weight
+        if remaining > 0.0:
+            continue
+        key = draws.bounded_key(weight, heap[0][0])
+        heapq.heapreplace(heap, (key, position, value))
+        remaining = draws.jump(heap[0][0])
+    if len(heap) < checked_k:
+        raise ValueError("k must not exceed the number of positive weights")
+    heap.sort(key=lambda entry: (-entry[0], entry[1]))
+    return [value for _, _, value in heap]
+
+
 class _ValueEngine(Generic[_T]):
     __slots__ = ("_generator", "resolve_callables")
 
@@ -487,41 +750,94 @@ class RandomValue(_ValueEngine[_T]):
         return selector(*args, **kwargs)
 
 
+def _weighted_item(
+    pair: Any, position: int, *, table_name: str, number_name: str
+) -> tuple[float, Any]:
+    try:
+        number, value = pair
+    except (TypeError, ValueError) as error:
+        raise TypeError(
+            f"{table_name} item {position} must be a ({number_name}, value) pair"
+        ) from error
+    if isinstance(number, bool) or not isinstance(number, Real):
+        raise TypeError(f"{number_name} at position {position} must be a real number")
+    try:
+        numeric = float(number)
+    except (TypeError, ValueError, OverflowError) as error:
+        raise ValueError(
+            f"{number_name} at position {position} must be representable as a float"
+        ) from error
+    if not math.isfinite(numeric):
+        raise ValueError(f"{number_name} at position {position} must be finite")
+    return numeric, value
+
+
 def _weighted_pairs(
     weighted_table: Iterable[tuple[_Weight, _T]],
     *,
     table_name: str,
     number_name: str,
+    allow_empty: bool = False,
 ) -> list[tuple[float, _T]]:
-    result: list[tuple[float, _T]] = []
     try:
         iterator = iter(weighted_table)
     except TypeError as error:
         message = f"{table_name} must be an iterable of ({number_name}, value) pairs"
         raise TypeError(message) from error
-    for position, pair in enumerate(iterator):
-        try:
-            number, value = pair
-        except (TypeError, ValueError) as error:
-            raise TypeError(
-                f"{table_name} item {position} must be a ({number_name}, value) pair"
-            ) from error
-        if isinstance(number, bool) or not isinstance(number, Real):
-            raise TypeError(f"{number_name} at position {position} must be a real number")
-        try:
-            numeric = float(number)
-        except (TypeError, ValueError, OverflowError) as error:
-            raise ValueError(
-                f"{number_name} at position {position} must be representable as a float"
-            ) from error
-        if not math.isfinite(numeric):
-            raise ValueError(f"{number_name} at position {position} must be finite")
-        result.append((numeric, value))
-    if not result:
+    result = [
+        _weighted_item(pair, position, table_name=table_name, number_name=number_name)
+        for position, pair in enumerate(iterator)
+    ]
+    if not result and not allow_empty:
         raise ValueError(f"{table_name} must not be empty")
     return result
 
 
+def _weighted_source(
+    weighted_table: Iterable[tuple[_Weight, Any]] | None,
+    relative: Iterable[tuple[_Weight, Any]] | None,
+    cumulative: Iterable[tuple[_Weight, Any]] | None,
+    *,
+    owner: str,
+) -> tuple[Iterable[tuple[_Weight, Any]], str, bool]:
+    supplied = sum(source is not None for source in (weighted_table, relative, cumulative))
+    if supplied != 1:
+        raise TypeError(f"{owner} requires exactly one of weighted_table, relative, or cumulative")
+    if cumulative is not None:
+        return cumulative, "cumulative", True
+    if relative is not None:
+        return relative, "relative", False
+    return cast(Iterable[tuple[_Weight, Any]], weighted_table), "weighted_table", False
+
+
+def _cumulative_pairs(
+    table: Iterable[tuple[_Weight, _T]], *, table_name: str, cumulative_input: bool
+) -> list[tuple[float, _T]]:
+    """Validate one weighted table and return its ``(boundary, value)`` pairs."""
+    number_name = "cumulative boundary" if cumulative_input else "weight"
+    data: list[tuple[float, _T]] = []
+    total = 0.0
+    for number, value in _weighted_pairs(table, table_name=table_name, number_name=number_name):
+        if number < 0.0:
+            if cumulative_input:
+                raise ValueError("cumulative boundaries must be nonnegative")
+            raise ValueError("weights must be nonnegative")
+        if cumulative_input:
+            if data and number < total:
+                raise ValueError("cumulative boundaries must be nondecreasing")
+            total = number
+        else:
+            total += number
+            if not math.isfinite(total):
+                raise ValueError("weight total must be finite")
+        data.append((total, value))
+    if total <= 0.0:
+        if cumulative_input:
+            raise ValueError("final cumulative boundary must be positive")
+        raise ValueError("at least one weight must be positive")
+    return data
+
+
 def _validated_weighted_draw(value: Any, total: float) -> float:
     if isinstance(value, bool) or not isinstance(value, Real):
         raise TypeError("generated weighted draw must be a real number")
@@ -538,13 +854,100 @@ def _validated_weighted_draw(value: Any, total: float) -> float:
     return draw
 
 
+@overload
+def weighted_sample(
+    weighted_table: Iterable[tuple[_Weight, _T]],
+    k: int,
+    *,
+    generator: _core.Generator | _FloatGenerator | None = None,
+) -> list[_T]: ...
+
+
+@overload
+def weighted_sample(
+    *,
+    relative: Iterable[tuple[_Weight, _T]],
+    k: int,
+    generator: _core.Generator | _FloatGenerator | None = None,
+) -> list[_T]: ...
+
+
+@overload
+def weighted_sample(
+    *,
+    cumulative: Iterable[tuple[_Weight, _T]],
+    k: int,
+    generator: _core.Generator | _FloatGenerator | None = None,
+) -> list[_T]: ...
+
+
+def weighted_sample(
+    weighted_table: Iterable[tuple[_Weight, Any]] | None = None,
+    k: int | None = None,
+    *,
+    relative: Iterable[tuple[_Weight, Any]] | None = None,
+    cumulative: Iterable[tuple[_Weight, Any]] | None = None,
+    generator: _core.Generator | _FloatGenerator | None = None,
+) -> list[Any]:
+    """Return ``k`` weighted values without replacement, in selection order.
+
+    The table forms match ``WeightedChoice``. Zero-weight entries are never
+    selected, so ``k`` may not exceed the number of positive weights.
+    """
+    table, table_name, cumulative_input = _weighted_source(
+        weighted_table, relative, cumulative, owner="weighted_sample"
+    )
+    if k is None:
+        raise TypeError("weighted_sample requires k")
+    checked_k = _integer(k, name="k", minimum=0)
+    data = _cumulative_pairs(table, table_name=table_name, cumulative_input=cumulative_input)
+    boundaries = [boundary for boundary, _ in data]
+    positive = sum(after > before for before, after in pairwise([0.0, *boundaries]))
+    if checked_k > positive:
+        raise ValueError("k must not exceed the number of positive weights")
+    if type(generator) is _core.Generator or (
+        generator is None and _core.random_float is _NATIVE_RANDOM_FLOAT
+    ):
+        return _core._weighted_sample(
+            tuple(value for _, value in data),
+            boundaries,
+            checked_k,
+            cast(_core.Generator | None, generator),
+        )
+    weights: list[float] = []
+    values: list[Any] = []
+    previous = 0.0
+    for boundary, value in data:
+        if boundary > previous:
+            weights.append(boundary - previous)
+            values.append(value)
+        previous = boundary
+    source = cast(_FloatGenerator, generator) if generator is not None else None
+    selected: list[Any] = []
+    for _ in range(checked_k):
+        total = math.fsum(weights)
+        draw_method = _core.random_float if source is None else source.random_float
+        draw = _validated_weighted_draw(draw_method(0.0, total), total)
+        position = len(weights) - 1
+        for index, weight in enumerate(weights):
+            draw -= weight
+            if draw < 0.0:
+                position = index
+                break
+        del weights[position]
+        selected.append(values.pop(position))
+    return selected
+
+
 class WeightedChoice(_ValueEngine[_T]):
     """Prepare selection from one relative-weight or cumulative-boundary table.
 
     A positional table is equivalent to the explicit ``relative=`` form.
+    ``method="alias"`` prepares a Walker alias table whose native draws take
+    constant time instead of a binary search over the boundaries.
     """
 
-    __slots__ = ("_selector", "data", "total")
+    __slots__ = ("_callables", "_selector", "_values", "data", "total")
 
     @overload
     def __init__(
@@ -553,6 +956,7 @@ class WeightedChoice(_ValueEngine[_T]):
         *,
         resolve_callables: Literal[False],
         generator: _core.Generator | _FloatGenerator | None = None,
+        method: _WeightedMethod = "cumulative",
     ) -> None: ...
 
     @overload
@@ -562,6 +966,7 @@ class WeightedChoice(_ValueEngine[_T]):
         *,
         resolve_callables: Literal[True] = True,
         generator: _core.Generator | _FloatGenerator | None = None,
+        method: _WeightedMethod = "cumulative",
     ) -> None: ...
 
     @overload
@@ -571,6 +976,7 @@ class WeightedChoice(_ValueEngine[_T]):
         relative: Iterable[tuple[_Weight, _T]],
         resolve_callables: Literal[False],
         generator: _core.Generator | _FloatGenerator | None = None,
+        method: _WeightedMethod = "cumulative",
     ) -> None: ...
 
     @overload
@@ -580,6 +986,7 @@ class WeightedChoice(_ValueEngine[_T]):
         relative: Iterable[tuple[_Weight, _Resolvable[_T]]],
         resolve_callables: Literal[True] = True,
         generator: _core.Generator | _FloatGenerator | None = None,
+        method: _WeightedMethod = "cumulative",
     ) -> None: ...
 
     @overload
@@ -589,6 +996,7 @@ class WeightedChoice(_ValueEngine[_T]):
         cumulative: Iterable[tuple[_Weight, _T]],
         resolve_callables: Literal[False],
         generator: _core.Generator | _FloatGenerator | None = None,
+        method: _WeightedMethod = "cumulative",
     ) -> None: ...
 
     @overload
@@ -598,6 +1006,7 @@ class WeightedChoice(_ValueEngine[_T]):
         cumulative: Iterable[tuple[_Weight, _Resolvable[_T]]],
         resolve_callables: Literal[True] = True,
         generator: _core.Generator | _FloatGenerator | None = None,
+        method: _WeightedMethod = "cumulative",
     ) -> None: ...
 
     def __init__(
@@ -608,57 +1017,35 @@ class WeightedChoice(_ValueEngine[_T]):
         cumulative: Iterable[tuple[_Weight, Any]] | None = None,
         resolve_callables: bool = True,
         generator: _core.Generator | _FloatGenerator | None = None,
+        method: _WeightedMethod = "cumulative",
     ) -> None:
         super().__init__(resolve_callables=resolve_callables, generator=generator)
-        supplied = sum(source is not None for source in (weighted_table, relative, cumulative))
-        if supplied != 1:
-            raise TypeError(
-                "WeightedChoice requires exactly one of weighted_table, relative, or cumulative"
-            )
+        table, table_name, cumulative_input = _weighted_source(
+            weighted_table, relative, cumulative, owner="WeightedChoice"
+        )
 
-        cumulative_input = cumulative is not None
-        if cumulative_input:
-            table = cast(Iterable[tuple[_Weight, Any]], cumulative)
-            table_name = "cumulative"
-            number_name = "cumulative boundary"
-        else:
-            table = cast(
-                Iterable[tuple[_Weight, Any]],
-                relative if relative is not None else weighted_table,
-            )
-            table_name = "relative" if relative is not None else "weighted_table"
-            number_name = "weight"
+        if not isinstance(method, str):
+            raise TypeError("method must be a str")
+        if method not in ("cumulative", "alias"):
+            raise ValueError("method must be 'cumulative' or 'alias'")
 
-        data: list[tuple[float, _T]] = []
-        boundaries: list[float] = []
-        total = 0.0
-        for number, value in _weighted_pairs(table, table_name=table_name, number_name=number_name):
-            if number < 0.0:
-                if cumulative_input:
-                    raise ValueError("cumulative boundaries must be nonnegative")
-                raise ValueError("weights must be nonnegative")
-            if cumulative_input:
-                if boundaries and number < total:
-                    raise ValueError("cumulative boundaries must be nondecreasing")
-                total = number
-            else:
-                total += number
-                if not math.isfinite(total):
-                    raise ValueError("weight total must be finite")
-            boundaries.append(total)
-            data.append((total, value))
-        if total <= 0.0:
-            if cumulative_input:
-                raise ValueError("final cumulative boundary must be positive")
-            raise ValueError("at least one weight must be positive")
+        data = _cumulative_pairs(table, table_name=table_name, cumulative_input=cumulative_input)
+        boundaries = [boundary for boundary, _ in data]
         self.data = tuple(data)
-        self.total = total
+        self.total = boundaries[-1]
+        self._values = tuple(value for _, value in data)
+        self._callables = any(callable(value) for value in self._values)
         native_source = type(generator) is _core.Generator or (
             generator is None and _core.random_float is _NATIVE_RANDOM_FLOAT
         )
         native_generator = cast(_core.Generator | None, generator)
+        prepare = (
+            _core._prepared_alias_weighted_index
+            if method == "alias"
+            else _core._prepared_cumulative_weighted_index
+        )
         self._selector = (
-            _core._prepared_cumulative_weighted_index(boundaries, native_generator)
+            cast(_PreparedWeightedIndex, prepare(boundaries, native_generator))
             if native_source
             else None
         )
@@ -669,7 +1056,11 @@ class WeightedChoice(_ValueEngine[_T]):
         if selector is not None and (
             source is not None or _core.random_float is _NATIVE_RANDOM_FLOAT
         ):
-            selected = self.data[selector()][1]
+            # The prepared native draw returns straight from here when no
+            # value can need resolving.
+            selected = self._values[selector()]
+            if not self._callables:
+                return selected
         else:
             if source is None:
                 draw_method = _core.random_float
@@ -689,3 +1080,286 @@ class WeightedChoice(_ValueEngine[_T]):
         if self.resolve_callables and callable(selected):
             return cast(_T, _resolve_callable(selected, *args, **kwargs))
         return selected
+
+    def take(self, count: int, *args: Any, **kwargs: Any) -> list[_T]:
+        """Return ``count`` selections, drawn in one native loop when possible.
+
+        Native sources fill every index under one generator lock before any
+        selected callable is resolved, in selection order.
+        """
+        selector = self._selector
+        if selector is None or (
+            self._generator is None and _core.random_float is not _NATIVE_RANDOM_FLOAT
+        ):
+            return super().take(count, *args, **kwargs)
+        checked_count = _integer(count, name="count", minimum=0)
+        selected = selector.take(self._values, checked_count)
+        if not (self.resolve_callables and self._callables):
+            return selected
+        return [
+            cast(_T, _resolve_callable(value, *args, **kwargs)) if callable(value) else value
+            for value in selected
+        ]
+
+
+def _checked_weight(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, Real):
+        raise TypeError("weight must be a real number")
+    try:
+        weight = float(value)
+    except (TypeError, ValueError, OverflowError) as error:
+        raise ValueError("weight must be representable as a float") from error
+    if not math.isfinite(weight):
+        raise ValueError("weight must be finite")
+    if weight < 0.0:
+        raise ValueError("weights must be nonnegative")
+    return weight
+
+
+class MutableWeightedChoice(_ValueEngine[_T]):
+    """Weighted selection from a relative-weight table that changes in place.
+
+    Weights live in a native Fenwick tree, so ``set_weight``, ``add``,
+    ``remove``, and each native draw take logarithmic time. ``remove`` moves
+    the last entry into the removed position.
+    """
+
+    __slots__ = ("_index", "_native", "_values")
+
+    @overload
+    def __init__(
+        self,
+        weighted_table: Iterable[tuple[_Weight, _T]] = (),
+        *,
+        resolve_callables: Literal[False],
+        generator: _core.Generator | _FloatGenerator | None = None,
+    ) -> None: ...
+
+    @overload
+    def __init__(
+        self,
+        weighted_table: Iterable[tuple[_Weight, _Resolvable[_T]]] = (),
+        *,
+        resolve_callables: Literal[True] = True,
+        generator: _core.Generator | _FloatGenerator | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        weighted_table: Iterable[tuple[_Weight, Any]] = (),
+        *,
+        resolve_callables: bool = True,
+        generator: _core.Generator | _FloatGenerator | None = None,
+    ) -> None:
+        super().__init__(resolve_callables=resolve_callables, generator=generator)
+        pairs = _weighted_pairs(
+            weighted_table,
+            table_name="weighted_table",
+            number_name="weight",
+            allow_empty=True,
+        )
+        total = 0.0
+        for weight, _ in pairs:
+            if weight < 0.0:
+                raise ValueError("weights must be nonnegative")
+            total += weight
+            if not math.isfinite(total):
+                raise ValueError("weight total must be finite")
+        self._values = [value for _, value in pairs]
+        self._native = type(generator) is _core.Generator
+        native_generator = generator if self._native else None
+        self._index = cast(
+            _MutableWeightedIndex,
+            _core._fenwick_weighted_index(
+                [weight for weight, _ in pairs],
+                cast(_core.Generator | None, native_generator),
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> tuple[float, _Resolvable[_T]]:
+        """Return the ``(weight, value)`` pair at ``index``."""
+        position = self._position(index)
+        return self._index.weight(position), self._values[position]
+
+    @property
+    def total(self) -> float:
+        """Return the current sum of all weights."""
+        return self._index.total()
+
+    def _position(self, index: Any) -> int:
+        position = _integer(index, name="index")
+        if not 0 <= position < len(self._values):
+            raise IndexError("index out of range")
+        return position
+
+    def _checked_total(self, weight: float, replaced: float = 0.0) -> None:
+        if not math.isfinite(self._index.total() - replaced + weight):
+            raise ValueError("weight total must be finite")
+
+    def set_weight(self, index: int, weight: _Weight) -> None:
+        """Replace the weight at ``index``."""
+        position = self._position(index)
+        checked = _checked_weight(weight)
+        self._checked_total(checked, self._index.weight(position))
+        self._index.set(position, checked)
+
+    def add(self, value: _Resolvable[_T], weight: _Weight) -> int:
+        """Append ``value`` with ``weight`` and return its index."""
+        checked = _checked_weight(weight)
+        self._checked_total(checked)
+        self._index.append(checked)
+        self._values.append(value)
+        return len(self._values) - 1
+
+    def remove(self, index: int) -> _Resolvable[_T]:
+        """Remove and return the value at ``index``.
+
+        The last entry moves into ``index``; no other index changes.
+        """
+        position = self._position(index)
+        self._index.swap_remove(position)
+        removed = self._values[position]
+        last = self._values.pop()
+        if position < len(self._values):
+            self._values[position] = last
+        return removed
+
+    def _require_positive(self) -> None:
+        if not self._index.positive():
+            raise ValueError("at least one weight must be positive")
+
+    def _select(self) -> Any:
+        source = self._generator
+        if self._native or (source is None and _core.random_float is _NATIVE_RANDOM_FLOAT):
+            return self._values[self._index()]
+        total = self._index.total()
+        if source is None:
+            draw = _validated_weighted_draw(_core.random_float(0.0, total), total)
+        else:
+            draw = _validated_weighted_draw(source.random_float(0.0, total), total)
+        return self._values[self._index.locate(draw)]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> _T:
+        self._require_positive()
+        selected = self._select()
+        if self.resolve_callables and callable(selected):
+            return cast(_T, _resolve_callable(selected, *args, **kwargs))
+        return selected
+
+    def take(self, count: int, *args: Any, **kwargs: Any) -> list[_T]:
+        """Return ``count`` selections, drawn in one native loop when possible."""
+        if not self._native and (
+            self._generator is not None or _core.random_float is not _NATIVE_RANDOM_FLOAT
+        ):
+            return super().take(count, *args, **kwargs)
+        checked_count = _integer(count, name="count", minimum=0)
+        if not checked_count:
+            return []
+        self._require_positive()
+        selected = self._index.take(self._values, checked_count)
+        if not self.resolve_callables:
+            return selected
+        return [
+            cast(_T, _resolve_callable(value, *args, **kwargs)) if callable(value) else value
+            for value in selected
+        ]
+
+
+class _FeistelPermutation(Protocol):
+    def __len__(self) -> int: ...
+
+    def forward(self, index: int) -> int: ...
+
+    def inverse(self, value: int) -> int: ...
+
+    def fill(self, start: int, out: _OutT) -> _OutT: ...
+
+    def chunk(self, start: int, count: int) -> array[int]: ...
+
+
+_PERMUTATION_ROUNDS = 8
+_PERMUTATION_KEY_SPAN = 2**32
+_PERMUTATION_CHUNK = 1024
+
+
+class RandomPermutation:
+    """Seeded random order of ``range(size)`` computed on demand.
+
+    A keyed Feistel network with cycle walking maps each position to its
+    value and back in constant time and memory, so the order is never
+    materialized. Construction draws all of the keys; later lookups do not
+    advance the generator.
+    """
+
+    __slots__ = ("_permutation", "_size")
+
+    def __init__(
+        self, size: int, *, generator: _core.Generator | _IndexGenerator | None = None
+    ) -> None:
+        checked_size = _integer(size, name="size", minimum=0)
+        if checked_size > sys.maxsize:
+            raise OverflowError(f"size must be <= {sys.maxsize}")
+        source = _core.random_index if generator is None else generator.random_index
+        keys = [
+            _validated_index(source(_PERMUTATION_KEY_SPAN), _PERMUTATION_KEY_SPAN)
+            for _ in range(_PERMUTATION_ROUNDS)
+        ]
+        self._size = checked_size
+        self._permutation = cast(
+            _FeistelPermutation, _core._feistel_permutation(checked_size, keys)
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[int]: ...
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        if isinstance(index, slice):
+            positions = range(self._size)[index]
+            if positions.step == 1:
+                return self._permutation.chunk(positions.start, len(positions)).tolist()
+            return [self._permutation.forward(position) for position in positions]
+        position = _integer(index, name="index")
+        if position < 0:
+            position += self._size
+        if not 0 <= position < self._size:
+            raise IndexError("permutation index out of range")
+        return self._permutation.forward(position)
+
+    def __iter__(self) -> Iterator[int]:
+        for start in range(0, self._size, _PERMUTATION_CHUNK):
+            yield from self._permutation.chunk(start, min(_PERMUTATION_CHUNK, self._size - start))
+
+    def __contains__(self, value: object) -> bool:
+        if isinstance(value, bool):
+            return False
+        try:
+            return 0 <= operator.index(cast(Any, value)) < self._size
+        except TypeError:
+            return False
+
+    def index_of(self, value: int) -> int:
+        """Return the position at which ``value`` appears."""
+        checked = _integer(value, name="value")
+        if not 0 <= checked < self._size:
+            raise ValueError(f"{checked} is not in the permutation")
+        return self._permutation.inverse(checked)
+
+    def fill(self, out: _OutT, start: int = 0) -> _OutT:
+        """Write the values from position ``start`` into an int64 buffer.
+
+        The buffer's length sets how many values are written. Raises
+        ``IndexError`` if they would run past the end of the permutation.
+        """
+        checked_start = _integer(start, name="start", minimum=0)
+        if checked_start > self._size:
+            raise IndexError("permutation slice out of range")
+        return self._permutation.fill(checked_start, out)
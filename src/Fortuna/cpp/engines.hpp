@@ -0,0 +1,937 @@
+// SPDX-License-Identifier: MIT
+#pragma once
+
+#include <Storm/Storm.hpp>
+
+#include <algorithm>
+#include <array>
+#include <bit>
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <memory>
+#include <numeric>
+#include <random>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+namespace FortunaCore {
+
+// Engines behind one Generator. MT19937-64 is Storm's engine and the default;
+// the others are seeded from four SplitMix64 words.
+enum class EngineKind : int {
+    mt19937_64 = 0,
+    pcg64_dxsm = 1,
+    xoshiro256pp = 2,
+    sfc64 = 3,
+    philox4x64 = 4,
+};
+
+inline constexpr int engine_kind_count = 5;
+
+inline auto engine_kind(const int value) -> EngineKind {
+    if (value < 0 || value >= engine_kind_count) {
+        throw std::invalid_argument{"unknown engine"};
+    }
+    return static_cast<EngineKind>(value);
+}
+
+using EngineWords = std::array<std::uint64_t, 4>;
+
+inline auto splitmix64(std::uint64_t& state) noexcept -> std::uint64_t {
+    std::uint64_t mixed = (state += 0x9E3779B97F4A7C15ULL);
+    mixed = (mixed ^ (mixed >> 30U)) * 0xBF58476D1CE4E5B9ULL;
+    mixed = (mixed ^ (mixed >> 27U)) * 0x94D049BB133111EBULL;
+    return mixed ^ (mixed >> 31U);
+}
+
+inline auto multiply_high(const std::uint64_t left, const std::uint64_t right) noexcept
+    -> std::uint64_t {
+#ifdef __SIZEOF_INT128__
+    __extension__ using wide = unsigned __int128;
+    return static_cast<std::uint64_t>((static_cast<wide>(left) * right) >> 64U);
+#else
+    const std::uint64_t left_low = left & 0xFFFFFFFFULL;
+    const std::uint64_t left_high = left >> 32U;
+    const std::uint64_t right_low = right & 0xFFFFFFFFULL;
+    const std::uint64_t right_high = right >> 32U;
+    const std::uint64_t cross = (left_low * right_low >> 32U) + left_high * right_low;
+    const std::uint64_t middle = (cross & 0xFFFFFFFFULL) + left_low * right_high;
+    return left_high * right_high + (cross >> 32U) + (middle >> 32U);
+#endif
+}
+
+// PCG64 DXSM (O'Neill), the 128-bit LCG with the cheap multiplier and the
+// double-xorshift-multiply output of the state before each step. Words are
+// {state high, state low, increment high, increment low}.
+inline constexpr std::uint64_t pcg_cheap_multiplier = 0xDA942042E4DD58B5ULL;
+
+inline void pcg64_dxsm_step(EngineWords& state) noexcept {
+    const std::uint64_t high =
+        state[0] * pcg_cheap_multiplier + multiply_high(state[1], pcg_cheap_multiplier);
+    const std::uint64_t low = state[1] * pcg_cheap_multiplier;
+    state[1] = low + state[3];
+    state[0] = high + state[2] + (state[1] < low ? 1U : 0U);
+}
+
+inline auto pcg64_dxsm_next(EngineWords& state) noexcept -> std::uint64_t {
+    std::uint64_t high = state[0];
+    const std::uint64_t low = state[1] | 1U;
+    high ^= high >> 32U;
+    high *= pcg_cheap_multiplier;
+    high ^= high >> 48U;
+    high *= low;
+    pcg64_dxsm_step(state);
+    return high;
+}
+
+// PCG's srandom: words[0..1] are the initial state, words[2..3] the stream.
+inline void pcg64_dxsm_seed(EngineWords& state, const EngineWords& words) noexcept {
+    state = {0, 0, (words[2] << 1U) | (words[3] >> 63U), (words[3] << 1U) | 1U};
+    pcg64_dxsm_step(state);
+    state[1] += words[1];
+    state[0] += words[0] + (state[1] < words[1] ? 1U : 0U);
+    pcg64_dxsm_step(state);
+}
+
+// xoshiro256++ (Blackman and Vigna). The all-zero state is its only fixed
+// point and is replaced by a SplitMix64 expansion of zero.
+inline auto xoshiro256pp_next(EngineWords& state) noexcept -> std::uint64_t {
+    const std::uint64_t result = std::rotl(state[0] + state[3], 23) + state[0];
+    const std::uint64_t shifted = state[1] << 17U;
+    state[2] ^= state[0];
+    state[3] ^= state[1];
+    state[1] ^= state[2];
+    state[0] ^= state[3];
+    state[2] ^= shifted;
+    state[3] = std::rotl(state[3], 45);
+    return result;
+}
+
+inline void xoshiro256pp_seed(EngineWords& state, const EngineWords& words) noexcept {
+    state = words;
+    if ((state[0] | state[1] | state[2] | state[3]) == 0) {
+        std::uint64_t expansion = 0;
+        for (auto& word : state) {
+            word = splitmix64(expansion);
+        }
+    }
+}
+
+// SFC64 (Doty-Humphrey). Words are {a, b, c, counter}; seeding sets the
+// counter to one and discards twelve outputs, as the reference does.
+inline auto sfc64_next(EngineWords& state) noexcept -> std::uint64_t {
+    const std::uint64_t result = state[0] + state[1] + state[3]++;
+    state[0] = state[1] ^ (state[1] >> 11U);
+    state[1] = state[2] + (state[2] << 3U);
+    state[2] = std::rotl(state[2], 24) + result;
+    return result;
+}
+
+inline void sfc64_seed(EngineWords& state, const EngineWords& words) noexcept {
+    state = {words[0], words[1], words[2], 1};
+    for (int round = 0; round < 12; ++round) {
+        static_cast<void>(sfc64_next(state));
+    }
+}
+
+// Philox4x64-10 (Salmon et al.), a counter-based engine: output word n is lane
+// n % 4 of the keyed bijection of counter {n / 4, block high, stream words}, so
+// any position is reachable in constant time. Seeding uses words[0..1] as the
+// key and words[2..3] as the upper counter words, and starts at word zero.
+inline constexpr std::array<std::uint64_t, 2> philox_multipliers{
+    0xD2E7470EE14C6C93ULL, 0xCA5A826395121157ULL};
+inline constexpr std::array<std::uint64_t, 2> philox_weyl{
+    0x9E3779B97F4A7C15ULL, 0xBB67AE8584CAA73BULL};
+
+inline auto philox4x64_block(EngineWords counter, std::array<std::uint64_t, 2> key) noexcept
+    -> EngineWords {
+    for (int round = 0; round < 10; ++round) {
+        if (round != 0) {
+            key[0] += philox_weyl[0];
+            key[1] += philox_weyl[1];
+        }
+        const std::uint64_t high0 = multiply_high(philox_multipliers[0], counter[0]);
+        const std::uint64_t low0 = philox_multipliers[0] * counter[0];
+        const std::uint64_t high1 = multiply_high(philox_multipliers[1], counter[2]);
+        const std::uint64_t low1 = philox_multipliers[1] * counter[2];
+        counter = {high1 ^ counter[1] ^ key[0], low1, high0 ^ counter[3] ^ key[1], low0};
+    }
+    return counter;
+}
+
+// The next word is lane `lane` of block `counter`; `block` holds that block's
+// output once `buffered` is set.
+struct PhiloxState {
+    EngineWords counter{};
+    std::array<std::uint64_t, 2> key{};
+    EngineWords block{};
+    unsigned lane{0};
+    bool buffered{false};
+};
+
+// Word position of a counter-based engine: block * 4 + lane, where block is
+// the 128-bit {block_high, block_low}.
+struct EnginePosition {
+    std::uint64_t block_high;
+    std::uint64_t block_low;
+    unsigned lane;
+};
+
+inline auto philox4x64_next(PhiloxState& state) noexcept -> std::uint64_t {
+    if (!state.buffered) {
+        state.block = philox4x64_block(state.counter, state.key);
+        state.buffered = true;
+    }
+    const std::uint64_t result = state.block[state.lane];
+    if (++state.lane == 4) {
+        state.lane = 0;
+        state.buffered = false;
+        state.counter[1] += (++state.counter[0] == 0) ? 1U : 0U;
+    }
+    return result;
+}
+
+inline void philox4x64_seek(PhiloxState& state, const EnginePosition& position) noexcept {
+    state.counter[0] = position.block_low;
+    state.counter[1] = position.block_high;
+    state.lane = position.lane;
+    state.buffered = false;
+}
+
+inline void philox4x64_advance(PhiloxState& state, const std::uint64_t steps) noexcept {
+    const std::uint64_t lanes = state.lane + (steps & 3U);
+    const std::uint64_t blocks = (steps >> 2U) + (lanes >> 2U);
+    state.lane = static_cast<unsigned>(lanes & 3U);
+    if (blocks != 0) {
+        state.counter[0] += blocks;
+        state.counter[1] += (state.counter[0] < blocks) ? 1U : 0U;
+        state.buffered = false;
+    }
+}
+
+inline void philox4x64_seed(PhiloxState& state, const EngineWords& words) noexcept {
+    state = PhiloxState{};
+    state.key = {words[0], words[1]};
+    state.counter = {0, 0, words[2], words[3]};
+}
+
+// MT19937-64 (Matsumoto and Nishimura) exactly as std::mt19937_64 specifies
+// it, with the state exposed so it can jump ahead. `index` is the next word to
+// temper; the block is regenerated after all 312 words have been used.
+inline constexpr std::size_t mt_size = 312;
+inline constexpr std::size_t mt_shift = 156;
+inline constexpr std::uint64_t mt_matrix = 0xB5026F5AA96619E9ULL;
+inline constexpr std::uint64_t mt_upper = ~std::uint64_t{0} << 31U;
+inline constexpr std::uint64_t mt_lower = ~mt_upper;
+
+struct Mt19937State {
+    std::array<std::uint64_t, mt_size> words{};
+    std::size_t index{mt_size};
+};
+
+inline auto mt19937_64_mix(const std::uint64_t upper, const std::uint64_t lower,
+                           const std::uint64_t shifted) noexcept -> std::uint64_t {
+    const std::uint64_t combined = (upper & mt_upper) | (lower & mt_lower);
+    return shifted ^ (combined >> 1U) ^ ((combined & 1U) != 0 ? mt_matrix : 0U);
+}
+
+inline void mt19937_64_twist(Mt19937State& state) noexcept {
+    auto& words = state.words;
+    std::size_t index = 0;
+    for (; index < mt_size - mt_shift; ++index) {
+        words[index] = mt19937_64_mix(words[index], words[index + 1], words[index + mt_shift]);
+    }
+    for (; index < mt_size - 1; ++index) {
+        words[index] =
+            mt19937_64_mix(words[index], words[index + 1], words[index + mt_shift - mt_size]);
+    }
+    words[mt_size - 1] = mt19937_64_mix(words[mt_size - 1], words[0], words[mt_shift - 1]);
+    state.index = 0;
+}
+
+// The untempered sequence word. Tempering is linear, so jump-ahead works on
+// these words and leaves tempering to the draw.
+inline auto mt19937_64_raw(Mt19937State& state) noexcept -> std::uint64_t {
+    if (state.index >= mt_size) [[unlikely]] {
+        mt19937_64_twist(state);
+    }
+    return state.words[state.index++];
+}
+
+inline auto mt19937_64_next(Mt19937State& state) noexcept -> std::uint64_t {
+    std::uint64_t word = mt19937_64_raw(state);
+    word ^= (word >> 29U) & 0x5555555555555555ULL;
+    word ^= (word << 17U) & 0x71D67FFFEDA60000ULL;
+    word ^= (word << 37U) & 0xFFF7EEE000000000ULL;
+    return word ^ (word >> 43U);
+}
+
+inline void mt19937_64_seed(Mt19937State& state, const std::uint64_t seed_value) noexcept {
+    state.words[0] = seed_value;
+    for (std::size_t index = 1; index < mt_size; ++index) {
+        const std::uint64_t previous = state.words[index - 1];
+        state.words[index] = 6364136223846793005ULL * (previous ^ (previous >> 62U)) + index;
+    }
+    state.index = mt_size;
+}
+
+inline void mt19937_64_seed(Mt19937State& state, std::seed_seq& sequence) {
+    std::array<std::uint32_t, 2 * mt_size> halves{};
+    sequence.generate(halves.begin(), halves.end());
+    bool zero = true;
+    for (std::size_t index = 0; index < mt_size; ++index) {
+        state.words[index] = halves[2 * index] |
+                             (static_cast<std::uint64_t>(halves[2 * index + 1]) << 32U);
+        zero = zero && (state.words[index] & (index == 0 ? mt_upper : ~std::uint64_t{0})) == 0;
+    }
+    if (zero) {
+        state.words[0] = std::uint64_t{1} << 63U;
+    }
+    state.index = mt_size;
+}
+
+// Jump-ahead for MT19937-64 (Haramoto et al.). Polynomials over GF(2) keep
+// coefficient i in bit i % 64 of word i / 64. The characteristic polynomial P
+// of the recurrence has degree 19937, and x_{k + n} = sum of c_i * x_{k + i}
+// whenever x^n mod P = sum of c_i * x^i, for every word of the sequence.
+inline constexpr std::size_t mt_degree = 19937;
+inline constexpr std::size_t mt_polynomial_words = mt_degree / 64 + 1;
+
+using Gf2Polynomial = std::vector<std::uint64_t>;
+
+inline auto gf2_bit(const Gf2Polynomial& polynomial, const std::size_t bit) noexcept -> bool {
+    return ((polynomial[bit >> 6U] >> (bit & 63U)) & 1U) != 0;
+}
+
+// 64 bits of `bits` starting at bit `offset`; words past the end read as zero.
+inline auto gf2_window(const Gf2Polynomial& bits, const std::size_t offset) noexcept
+    -> std::uint64_t {
+    const std::size_t word = offset >> 6U;
+    const unsigned shift = offset & 63U;
+    const std::uint64_t low = word < bits.size() ? bits[word] : 0U;
+    if (shift == 0) {
+        return low;
+    }
+    const std::uint64_t high = word + 1 < bits.size() ? bits[word + 1] : 0U;
+    return (low >> shift) | (high << (64U - shift));
+}
+
+// Word `word` of `bits` multiplied by x^shift.
+inline auto gf2_shifted_word(const Gf2Polynomial& bits, const std::size_t word,
+                             const std::size_t shift) noexcept -> std::uint64_t {
+    const std::size_t words = shift >> 6U;
+    const unsigned remainder = shift & 63U;
+    if (word < words || word - words >= bits.size()) {
+        return 0;
+    }
+    const std::size_t source = word - words;
+    std::uint64_t result = bits[source] << remainder;
+    if (remainder != 0 && source != 0) {
+        result |= bits[source - 1] >> (64U - remainder);
+    }
+    return result;
+}
+
+// Interleaves zero bits, which squares a polynomial over GF(2).
+inline auto gf2_spread(std::uint64_t half) noexcept -> std::uint64_t {
+    half = (half | (half << 16U)) & 0x0000FFFF0000FFFFULL;
+    half = (half | (half << 8U)) & 0x00FF00FF00FF00FFULL;
+    half = (half | (half << 4U)) & 0x0F0F0F0F0F0F0F0FULL;
+    half = (half | (half << 2U)) & 0x3333333333333333ULL;
+    return (half | (half << 1U)) & 0x5555555555555555ULL;
+}
+
+class Mt19937Jump {
+public:
+    // Berlekamp-Massey over 2 * 19937 low bits of one stream. The recurrence
+    // is primitive, so the shortest generating polynomial of any nonzero bit
+    // stream is P itself.
+    Mt19937Jump() {
+        constexpr std::size_t length = 2 * mt_degree;
+        Mt19937State state{};
+        mt19937_64_seed(state, 0);
+        Gf2Polynomial reversed(length / 64 + 1, 0);
+        for (std::size_t index = 0; index < length; ++index) {
+            const std::size_t bit = length - 1 - index;
+            reversed[bit >> 6U] |= (mt19937_64_raw(state) & 1U) << (bit & 63U);
+        }
+
+        Gf2Polynomial connection(length / 64 + 2, 0);
+        Gf2Polynomial previous(connection.size(), 0);
+        connection[0] = previous[0] = 1;
+        std::size_t degree = 0;
+        std::size_t gap = 1;
+        for (std::size_t index = 0; index < length; ++index) {
+            const std::size_t used = std::min(connection.size(), index / 64 + 2);
+            std::uint64_t parity = 0;
+            for (std::size_t word = 0; word <= degree / 64; ++word) {
+                parity ^= connection[word] & gf2_window(reversed, length - 1 - index + 64 * word);
+            }
+            if ((std::popcount(parity) & 1) == 0) {
+                ++gap;
+                continue;
+            }
+            Gf2Polynomial saved;
+            const bool grows = 2 * degree <= index;
+            if (grows) {
+                saved = connection;
+            }
+            for (std::size_t word = used; word-- > gap / 64;) {
+                connection[word] ^= gf2_shifted_word(previous, word, gap);
+            }
+            if (grows) {
+                degree = index + 1 - degree;
+                previous = std::move(saved);
+                gap = 1;
+            } else {
+                ++gap;
+            }
+        }
+        if (degree != mt_degree) {
+            throw std::logic_error{"MT19937-64 characteristic polynomial has the wrong degree"};
+        }
+
+        Gf2Polynomial characteristic(mt_polynomial_words, 0);
+        for (std::size_t bit = 0; bit <= mt_degree; ++bit) {
+            if (gf2_bit(connection, mt_degree - bit)) {
+                characteristic[bit >> 6U] |= std::uint64_t{1} << (bit & 63U);
+            }
+        }
+        for (unsigned shift = 0; shift < 64; ++shift) {
+            auto& shifted = shifted_[shift];
+            shifted.assign(mt_polynomial_words + 1, 0);
+            for (std::size_t word = 0; word < shifted.size(); ++word) {
+                shifted[word] = gf2_shifted_word(characteristic, word, shift);
+            }
+        }
+    }
+
+    // x^(steps * 2^doublings) mod P.
+    [[nodiscard]] auto power(const std::uint64_t steps, const unsigned doublings) const
+        -> Gf2Polynomial {
+        Gf2Polynomial result(mt_polynomial_words, 0);
+        result[0] = 1;
+        for (int bit = 63 - std::countl_zero(steps); bit >= 0; --bit) {
+            square(result);
+            if (((steps >> bit) & 1U) != 0) {
+                times_x(result);
+            }
+        }
+        for (unsigned doubling = 0; doubling < doublings; ++doubling) {
+            square(result);
+        }
+        return result;
+    }
+
+    // Replaces the stream at x_k with the stream at x_{k + n}, where
+    // `polynomial` is x^n mod P.
+    static void apply(Mt19937State& state, const Gf2Polynomial& polynomial) {
+        Mt19937State source = state;
+        std::vector<std::uint64_t> sequence(mt_degree + mt_size - 1);
+        for (auto& word : sequence) {
+            word = mt19937_64_raw(source);
+        }
+        std::array<std::uint64_t, mt_size> jumped{};
+        for (std::size_t term = 0; term < mt_degree; ++term) {
+            if (gf2_bit(polynomial, term)) {
+                const std::uint64_t* window = sequence.data() + term;
+                for (std::size_t index = 0; index < mt_size; ++index) {
+                    jumped[index] ^= window[index];
+                }
+            }
+        }
+        state.words = jumped;
+        state.index = 0;
+    }
+
+private:
+    void reduce(Gf2Polynomial& wide) const noexcept {
+        for (std::size_t bit = 2 * mt_degree; bit-- > mt_degree;) {
+            if (gf2_bit(wide, bit)) {
+                const std::size_t offset = bit - mt_degree;
+                const auto& shifted = shifted_[offset & 63U];
+                std::uint64_t* target = wide.data() + (offset >> 6U);
+                for (std::size_t word = 0; word < shifted.size(); ++word) {
+                    target[word] ^= shifted[word];
+                }
+            }
+        }
+        wide.resize(mt_polynomial_words);
+    }
+
+    void square(Gf2Polynomial& polynomial) const {
+        Gf2Polynomial wide(2 * mt_polynomial_words + 2, 0);
+        for (std::size_t word = 0; word < mt_polynomial_words; ++word) {
+            wide[2 * word] = gf2_spread(polynomial[word] & 0xFFFFFFFFULL);
+            wide[2 * word + 1] = gf2_spread(polynomial[word] >> 32U);
+        }
+        reduce(wide);
+        polynomial = std::move(wide);
+    }
+
+    void times_x(Gf2Polynomial& polynomial) const noexcept {
+        for (std::size_t word = mt_polynomial_words; word-- > 1;) {
+            polynomial[word] = (polynomial[word] << 1U) | (polynomial[word - 1] >> 63U);
+        }
+        polynomial[0] <<= 1U;
+        if (gf2_bit(polynomial, mt_degree)) {
+            const auto& characteristic = shifted_[0];
+            for (std::size_t word = 0; word < mt_polynomial_words; ++word) {
+                polynomial[word] ^= characteristic[word];
+            }
+        }
+    }
+
+    std::array<Gf2Polynomial, 64> shifted_;
+};
+
+// Built on first use and shared by every thread.
+inline auto mt19937_64_jumps() -> const Mt19937Jump& {
+    static const Mt19937Jump jumps;
+    return jumps;
+}
+
+inline auto mt19937_64_jump_polynomial() -> const Gf2Polynomial& {
+    static const Gf2Polynomial jump = mt19937_64_jumps().power(1, 128);
+    return jump;
+}
+
+// Short skips draw and discard, which is cheaper than one polynomial.
+inline constexpr std::uint64_t mt_discard_limit = std::uint64_t{1} << 20U;
+
+inline void mt19937_64_advance(Mt19937State& state, const std::uint64_t steps) {
+    if (steps < mt_discard_limit) {
+        for (std::uint64_t step = 0; step < steps; ++step) {
+            static_cast<void>(mt19937_64_raw(state));
+        }
+        return;
+    }
+    Mt19937Jump::apply(state, mt19937_64_jumps().power(steps, 0));
+}
+
+inline void mt19937_64_jump(Mt19937State& state) {
+    Mt19937Jump::apply(state, mt19937_64_jump_polynomial());
+}
+
+// A uniform random bit generator over any EngineKind. MT19937-64's 2.5 KB
+// state and Philox4x64-10's counter, key, and buffered block live on the heap,
+// so the engines with four state words stay small.
+class Engine {
+public:
+    using result_type = std::uint64_t;
+
+    static constexpr auto min() noexcept -> result_type { return 0; }
+    static constexpr auto max() noexcept -> result_type {
+        return std::numeric_limits<result_type>::max();
+    }
+
+    explicit Engine(const std::uint64_t seed_value = 0,
+                    const EngineKind kind = EngineKind::mt19937_64)
+        : kind_{kind} {
+        if (kind_ == EngineKind::mt19937_64) {
+            mt_ = std::make_unique<Mt19937State>();
+        } else if (kind_ == EngineKind::philox4x64) {
+            philox_ = std::make_unique<PhiloxState>();
+        }
+        seed(seed_value);
+    }
+
+    Engine(const Engine& other)
+        : kind_{other.kind_},
+          words_{other.words_},
+          philox_{other.philox_ ? std::make_unique<PhiloxState>(*other.philox_) : nullptr},
+          mt_{other.mt_ ? std::make_unique<Mt19937State>(*other.mt_) : nullptr} {}
+
+    auto operator=(const Engine& other) -> Engine& {
+        if (this != &other) {
+            Engine copy{other};
+            *this = std::move(copy);
+        }
+        return *this;
+    }
+
+    Engine(Engine&&) noexcept = default;
+    auto operator=(Engine&&) noexcept -> Engine& = default;
+    ~Engine() = default;
+
+    auto operator()() -> result_type {
+        switch (kind_) {
+            case EngineKind::mt19937_64:
+                [[likely]] return mt19937_64_next(*mt_);
+            case EngineKind::pcg64_dxsm:
+                return pcg64_dxsm_next(words_);
+            case EngineKind::xoshiro256pp:
+                return xoshiro256pp_next(words_);
+            case EngineKind::philox4x64:
+                return philox4x64_next(*philox_);
+            default:
+                return sfc64_next(words_);
+        }
+    }
+
+    [[nodiscard]] auto kind() const noexcept -> EngineKind { return kind_; }
+
+    // Random access is only available on counter-based engines.
+    void seek(const EnginePosition& position) {
+        require_counter("at() requires a counter-based engine");
+        philox4x64_seek(*philox_, position);
+    }
+
+    // MT19937-64 jumps with a polynomial and Philox moves its counter.
+    void advance(const std::uint64_t steps) {
+        if (kind_ == EngineKind::mt19937_64) {
+            mt19937_64_advance(*mt_, steps);
+            return;
+        }
+        require_counter("advance() requires the mt19937_64 or philox4x64 engine");
+        philox4x64_advance(*philox_, steps);
+    }
+
+    // Advances by 2^128 words.
+    void jump() {
+        if (kind_ == EngineKind::mt19937_64) {
+            mt19937_64_jump(*mt_);
+            return;
+        }
+        require_counter("jump() requires the mt19937_64 or philox4x64 engine");
+        philox_->counter[1] += std::uint64_t{1} << 62U;
+        philox_->buffered = false;
+    }
+
+    [[nodiscard]] auto position() const -> EnginePosition {
+        require_counter("position requires a counter-based engine");
+        return {philox_->counter[1], philox_->counter[0], philox_->lane};
+    }
+
+    void seed(const std::uint64_t seed_value) {
+        if (kind_ == EngineKind::mt19937_64) {
+            mt19937_64_seed(*mt_, seed_value);
+            return;
+        }
+        EngineWords words{};
+        std::uint64_t expansion = seed_value;
+        for (auto& word : words) {
+            word = splitmix64(expansion);
+        }
+        seed_words(words);
+    }
+
+    void seed(std::seed_seq& sequence) {
+        if (kind_ == EngineKind::mt19937_64) {
+            mt19937_64_seed(*mt_, sequence);
+            return;
+        }
+        std::array<std::uint32_t, 8> halves{};
+        sequence.generate(halves.begin(), halves.end());
+        EngineWords words{};
+        for (std::size_t index = 0; index < words.size(); ++index) {
+            words[index] = (static_cast<std::uint64_t>(halves[2 * index]) << 32U) |
+                           halves[2 * index + 1];
+        }
+        seed_words(words);
+    }
+
+    // Saved state: MT19937-64's block and index, Philox's counter, key, and
+    // lane, or the four words of the other engines. Philox's buffered block
+    // is recomputed from its counter.
+    [[nodiscard]] auto state_words() const noexcept -> std::size_t {
+        switch (kind_) {
+            case EngineKind::mt19937_64:
+                return mt_size + 1;
+            case EngineKind::philox4x64:
+                return 7;
+            default:
+                return 4;
+        }
+    }
+
+    void save(std::uint64_t* output) const noexcept {
+        switch (kind_) {
+            case EngineKind::mt19937_64:
+                std::copy(mt_->words.begin(), mt_->words.end(), output);
+                output[mt_size] = mt_->index;
+                return;
+            case EngineKind::philox4x64:
+                std::copy(philox_->counter.begin(), philox_->counter.end(), output);
+                std::copy(philox_->key.begin(), philox_->key.end(), output + 4);
+                output[6] = philox_->lane;
+                return;
+            default:
+                std::copy(words_.begin(), words_.end(), output);
+                return;
+        }
+    }
+
+    // Rejects states the engine cannot reach before changing anything.
+    void load(const std::uint64_t* input) {
+        switch (kind_) {
+            case EngineKind::mt19937_64: {
+                const bool stuck = (input[0] & mt_upper) == 0 &&
+                                   std::all_of(input + 1, input + mt_size,
+                                               [](const std::uint64_t word) { return word == 0; });
+                if (input[mt_size] > mt_size || stuck) {
+                    throw std::invalid_argument{"state is not a valid mt19937_64 state"};
+                }
+                std::copy(input, input + mt_size, mt_->words.begin());
+                mt_->index = static_cast<std::size_t>(input[mt_size]);
+                return;
+            }
+            case EngineKind::pcg64_dxsm:
+                if ((input[3] & 1U) == 0) {
+                    throw std::invalid_argument{"state is not a valid pcg64_dxsm state"};
+                }
+                break;
+            case EngineKind::xoshiro256pp:
+                if ((input[0] | input[1] | input[2] | input[3]) == 0) {
+                    throw std::invalid_argument{"state is not a valid xoshiro256++ state"};
+                }
+                break;
+            case EngineKind::philox4x64:
+                if (input[6] > 3) {
+                    throw std::invalid_argument{"state is not a valid philox4x64 state"};
+                }
+                std::copy(input, input + 4, philox_->counter.begin());
+                std::copy(input + 4, input + 6, philox_->key.begin());
+                philox_->lane = static_cast<unsigned>(input[6]);
+                philox_->buffered = false;
+                return;
+            default:
+                break;
+        }
+        std::copy(input, input + 4, words_.begin());
+    }
+
+private:
+    void seed_words(const EngineWords& words) noexcept {
+        switch (kind_) {
+            case EngineKind::pcg64_dxsm:
+                pcg64_dxsm_seed(words_, words);
+                return;
+            case EngineKind::xoshiro256pp:
+                xoshiro256pp_seed(words_, words);
+                return;
+            case EngineKind::philox4x64:
+                philox4x64_seed(*philox_, words);
+                return;
+            default:
+                sfc64_seed(words_, words);
+                return;
+        }
+    }
+
+    void require_counter(const char* message) const {
+        if (kind_ != EngineKind::philox4x64) {
+            throw std::invalid_argument{message};
+        }
+    }
+
+    EngineKind kind_;
+    EngineWords words_{};
+    std::unique_ptr<PhiloxState> philox_;
+    std::unique_ptr<Mt19937State> mt_;
+};
+
+// Storm's uniform samplers, selectors, and dice, drawn from an Engine. Each
+// consumes engine words exactly as its Storm counterpart does, so an
+// MT19937-64 Engine reproduces Storm's sequences.
+namespace draws {
+
+inline auto bounded(Engine& engine, const std::uint64_t bound) -> std::uint64_t {
+    if (bound == 0) {
+        return engine();
+    }
+    const std::uint64_t threshold = (std::uint64_t{0} - bound) % bound;
+    for (;;) {
+        const std::uint64_t value = engine();
+        if (value >= threshold) {
+            return value % bound;
+        }
+    }
+}
+
+inline auto canonical(Engine& engine) -> double {
+    constexpr double scale = 0x1.0p-53;
+    return static_cast<double>(engine() >> 11U) * scale;
+}
+
+inline auto uniform_unsigned(Engine& engine, const std::uint64_t low, const std::uint64_t high)
+    -> std::uint64_t {
+    if (low > high) {
+        throw std::invalid_argument{"uniform_unsigned requires low <= high"};
+    }
+    return low + bounded(engine, high - low + std::uint64_t{1});
+}
+
+inline auto uniform_integer(Engine& engine, const std::int64_t low, const std::int64_t high)
+    -> std::int64_t {
+    if (low > high) {
+        throw std::invalid_argument{"uniform_integer requires low <= high"};
+    }
+    const std::uint64_t low_key = Storm::detail::signed_key(low);
+    const std::uint64_t span = Storm::detail::signed_key(high) - low_key;
+    return Storm::detail::signed_from_key(low_key + bounded(engine, span + std::uint64_t{1}));
+}
+
+inline auto uniform_index(Engine& engine, const std::size_t size) -> std::size_t {
+    if (size == 0) {
+        throw std::invalid_argument{"uniform_index requires a nonzero size"};
+    }
+    return static_cast<std::size_t>(bounded(engine, static_cast<std::uint64_t>(size)));
+}
+
+inline auto random_range(Engine& engine, const std::int64_t start, const std::int64_t stop,
+                         const std::int64_t step) -> std::int64_t {
+    if (step == 0) {
+        throw std::invalid_argument{"random_range step must not be zero"};
+    }
+    const std::uint64_t start_key = Storm::detail::signed_key(start);
+    if (step > 0) {
+        if (start >= stop) {
+            throw std::invalid_argument{"random_range is empty for this positive step"};
+        }
+        const auto stride = static_cast<std::uint64_t>(step);
+        const std::uint64_t span = Storm::detail::signed_key(stop) - start_key;
+        const std::uint64_t count = ((span - std::uint64_t{1}) / stride) + std::uint64_t{1};
+        return Storm::detail::signed_from_key(start_key + bounded(engine, count) * stride);
+    }
+    if (start <= stop) {
+        throw std::invalid_argument{"random_range is empty for this negative step"};
+    }
+    const std::uint64_t stride = std::uint64_t{0} - static_cast<std::uint64_t>(step);
+    const std::uint64_t span = start_key - Storm::detail::signed_key(stop);
+    const std::uint64_t count = ((span - std::uint64_t{1}) / stride) + std::uint64_t{1};
+    return Storm::detail::signed_from_key(start_key - bounded(engine, count) * stride);
+}
+
+inline auto roll_die(Engine& engine, const std::size_t sides) -> std::size_t {
+    if (sides == 0) {
+        throw std::invalid_argument{"roll_die requires at least one side"};
+    }
+    return static_cast<std::size_t>(bounded(engine, static_cast<std::uint64_t>(sides))) + 1U;
+}
+
+inline auto roll_dice(Engine& engine, const std::size_t rolls, const std::size_t sides)
+    -> std::uint64_t {
+    if (sides == 0) {
+        throw std::invalid_argument{"roll_dice requires at least one side"};
+    }
+    if (sides == 1) {
+        return static_cast<std::uint64_t>(rolls);
+    }
+    const auto roll_count = static_cast<std::uint64_t>(rolls);
+    const auto side_count = static_cast<std::uint64_t>(sides);
+    if (roll_count != 0 && side_count > std::numeric_limits<std::uint64_t>::max() / roll_count) {
+        throw std::overflow_error{"roll_dice result is not representable"};
+    }
+    std::uint64_t total = 0;
+    for (std::size_t index = 0; index < rolls; ++index) {
+        total += static_cast<std::uint64_t>(roll_die(engine, sides));
+    }
+    return total;
+}
+
+inline auto ability_dice(Engine& engine, const std::size_t dice_count) -> std::uint64_t {
+    if (dice_count < 3) {
+        throw std::invalid_argument{"ability_dice requires at least three dice"};
+    }
+    std::array<std::uint64_t, 3> best{};
+    for (std::size_t index = 0; index < dice_count; ++index) {
+        Storm::detail::insert_ability_roll(best, static_cast<std::uint64_t>(roll_die(engine, 6)));
+        if (best[0] == 6) {
+            break;
+        }
+    }
+    return best[0] + best[1] + best[2];
+}
+
+class wide_index_selector {
+public:
+    explicit wide_index_selector(Engine& engine, const std::size_t size)
+        : permutation_{make_permutation(engine, size)},
+          cursor_{permutation_.size() - 1},
+          rotation_width_{Storm::detail::integer_sqrt(size)},
+          distance_{static_cast<double>(rotation_width_) / 4.0} {}
+
+    [[nodiscard]] auto operator()(Engine& engine) -> std::size_t {
+        std::uint64_t sample = 0;
+        do {
+            sample = distance_(engine);
+        } while (sample >= static_cast<std::uint64_t>(rotation_width_));
+        cursor_ = Storm::detail::subtract_modulo(cursor_, static_cast<std::size_t>(sample) + 1,
+                                                 permutation_.size());
+        return permutation_[cursor_];
+    }
+
+private:
+    static auto make_permutation(Engine& engine, const std::size_t size)
+        -> std::vector<std::size_t> {
+        if (size == 0) {
+            throw std::invalid_argument{"wide_index_selector requires a nonzero size"};
+        }
+        std::vector<std::size_t> permutation(size);
+        std::iota(permutation.begin(), permutation.end(), std::size_t{0});
+        const std::size_t last = size - 1;
+        for (std::size_t position = last; position > 0;) {
+            --position;
+            const auto other = static_cast<std::size_t>(uniform_unsigned(
+                engine, static_cast<std::uint64_t>(position), static_cast<std::uint64_t>(last)));
+            std::swap(permutation[position], permutation[other]);
+        }
+        return permutation;
+    }
+
+    std::vector<std::size_t> permutation_;
+    std::size_t cursor_ = 0;
+    std::size_t rotation_width_;
+    std::poisson_distribution<std::uint64_t> distance_;
+};
+
+class PreparedCumulativeWeightedIndex {
+public:
+    explicit PreparedCumulativeWeightedIndex(const std::vector<double>& cumulative_boundaries) {
+        cumulative_.reserve(cumulative_boundaries.size());
+        for (const double boundary : cumulative_boundaries) {
+            if (!std::isfinite(boundary) || boundary < 0.0) {
+                throw std::invalid_argument{
+                    "PreparedCumulativeWeightedIndex requires finite, nonnegative "
+                    "boundaries"};
+            }
+            if (!cumulative_.empty() && boundary < total_) {
+                throw std::invalid_argument{
+                    "PreparedCumulativeWeightedIndex requires monotonically "
+                    "nondecreasing boundaries"};
+            }
+            cumulative_.push_back(boundary);
+            total_ = boundary;
+        }
+        if (cumulative_.empty()) {
+            throw std::invalid_argument{
+                "PreparedCumulativeWeightedIndex requires at least one boundary"};
+        }
+        if (total_ == 0.0) {
+            throw std::invalid_argument{
+                "PreparedCumulativeWeightedIndex requires a positive final boundary"};
+        }
+        maximum_draw_ = std::nextafter(total_, 0.0);
+    }
+
+    [[nodiscard]] auto operator()(Engine& engine) const -> std::size_t {
+        std::uniform_real_distribution<double> distribution{0.0, total_};
+        const double draw = distribution(engine);
+        const double effective_draw = draw < total_ ? draw : maximum_draw_;
+        const auto selected = std::ranges::upper_bound(cumulative_, effective_draw);
+        return static_cast<std::size_t>(selected - cumulative_.begin());
+    }
+
+private:
+    std::vector<double> cumulative_;
+    double total_{0.0};
+    double maximum_draw_{0.0};
+};
+
+}  // namespace draws
+
+}  // namespace FortunaCore
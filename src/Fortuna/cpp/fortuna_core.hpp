@@ -3,17 +3,27 @@
 
 #include <Storm/Storm.hpp>
 
+#include "engines.hpp"
+#include "streams.hpp"
+
 #include <algorithm>
 #include <array>
 #include <atomic>
+#include <bit>
 #include <cmath>
 #include <cstddef>
 #include <cstdint>
+#include <cstring>
+#include <exception>
 #include <limits>
 #include <mutex>
 #include <numbers>
 #include <random>
 #include <stdexcept>
+#include <system_error>
+#include <thread>
+#include <unordered_map>
+#include <utility>
 #include <vector>
 
 #ifdef _WIN32
@@ -34,7 +44,7 @@ inline auto current_process_id() noexcept -> std::uint64_t {
 
 inline std::atomic<std::uint64_t> entropy_nonce{0};
 
-inline void seed_from_entropy(Storm::Generator& generator) {
+inline void seed_from_entropy(Engine& engine) {
     std::random_device source;
     std::array<std::uint32_t, 20> words{};
     for (std::size_t index = 0; index < 16; ++index) {
@@ -47,13 +57,28 @@ inline void seed_from_entropy(Storm::Generator& generator) {
     words[18] = static_cast<std::uint32_t>(nonce);
     words[19] = static_cast<std::uint32_t>(nonce >> 32U);
     std::seed_seq sequence{words.begin(), words.end()};
-    generator.engine().seed(sequence);
+    engine.seed(sequence);
 }
 
+// Generator snapshots are little-endian: the magic "FRTN", the format version,
+// the engine kind, flags (bit 0 marks an entropy-managed generator), a zero
+// byte, and the engine's state words.
+inline constexpr std::array<unsigned char, 4> generator_state_magic{'F', 'R', 'T', 'N'};
+inline constexpr unsigned char generator_state_version = 1;
+inline constexpr std::size_t generator_state_header = 8;
+inline constexpr std::size_t generator_state_capacity =
+    generator_state_header + 8 * (mt_size + 1);
+
 class GeneratorCore {
 public:
-    explicit GeneratorCore(const std::uint64_t seed_value = 0, const bool synchronized = true)
-        : generator_{seed_value}, process_id_{current_process_id()}, synchronized_{synchronized} {}
+    explicit GeneratorCore(const std::uint64_t seed_value = 0, const bool synchronized = true,
+                           const EngineKind kind = EngineKind::mt19937_64)
+        : engine_{seed_value, kind},
+          process_id_{current_process_id()},
+          synchronized_{synchronized} {}
+
+    GeneratorCore(const std::uint64_t seed_value, const bool synchronized, const int engine)
+        : GeneratorCore{seed_value, synchronized, FortunaCore::engine_kind(engine)} {}
 
     void lock() {
         if (synchronized_) {
@@ -61,6 +86,8 @@ public:
         }
     }
 
+    auto try_lock() noexcept -> bool { return !synchronized_ || mutex_.try_lock(); }
+
     void unlock() noexcept {
         if (synchronized_) {
             mutex_.unlock();
@@ -70,36 +97,103 @@ public:
     void prepare() { static_cast<void>(engine()); }
 
     void seed(const std::uint64_t seed_value) {
-        generator_.seed(seed_value);
+        engine_.seed(seed_value);
         entropy_managed_ = false;
         process_id_ = current_process_id();
     }
 
     void reseed_from_entropy() {
-        seed_from_entropy(generator_);
+        seed_from_entropy(engine_);
         entropy_managed_ = true;
         process_id_ = current_process_id();
     }
 
-    auto engine() -> Storm::engine_type& {
+    auto engine() -> Engine& {
         if (entropy_managed_ && process_id_ != current_process_id()) {
             reseed_from_entropy();
         }
-        return generator_.engine();
+        return engine_;
     }
 
+    [[nodiscard]] auto engine_kind() const noexcept -> EngineKind { return engine_.kind(); }
+
     // The module-level owner already performs its fork check before exposing
     // this generator. Explicit generators must continue to use engine().
-    auto prepared_engine() noexcept -> Storm::engine_type& { return generator_.engine(); }
+    auto prepared_engine() noexcept -> Engine& { return engine_; }
+
+    // Writes the snapshot when it fits in `capacity` bytes and returns its
+    // size either way.
+    auto write_state(unsigned char* output, const std::size_t capacity) -> std::size_t {
+        const Engine& current = engine();
+        const std::size_t words = current.state_words();
+        const std::size_t size = generator_state_header + 8 * words;
+        if (size > capacity) {
+            return size;
+        }
+        std::array<std::uint64_t, mt_size + 1> saved{};
+        current.save(saved.data());
+        std::copy(generator_state_magic.begin(), generator_state_magic.end(), output);
+        output[4] = generator_state_version;
+        output[5] = static_cast<unsigned char>(current.kind());
+        output[6] = entropy_managed_ ? 1U : 0U;
+        output[7] = 0;
+        for (std::size_t word = 0; word < words; ++word) {
+            for (std::size_t byte = 0; byte < 8; ++byte) {
+                output[generator_state_header + 8 * word + byte] =
+                    static_cast<unsigned char>(saved[word] >> (8U * byte));
+            }
+        }
+        return size;
+    }
+
+    // A restored generator belongs to the current process, so only a later
+    // fork reseeds an entropy-managed snapshot.
+    void restore_state(const unsigned char* input, const std::size_t size) {
+        if (size < generator_state_header ||
+            !std::equal(generator_state_magic.begin(), generator_state_magic.end(), input)) {
+            throw std::invalid_argument{"state is not a Fortuna generator state"};
+        }
+        if (input[4] != generator_state_version) {
+            throw std::invalid_argument{"unsupported generator state version"};
+        }
+        if (input[5] >= engine_kind_count) {
+            throw std::invalid_argument{"state names an unknown engine"};
+        }
+        if (input[6] > 1 || input[7] != 0) {
+            throw std::invalid_argument{"state has unknown flags"};
+        }
+        const auto kind = static_cast<EngineKind>(input[5]);
+        Engine restored{0, kind};
+        const std::size_t words = restored.state_words();
+        if (size != generator_state_header + 8 * words) {
+            throw std::invalid_argument{"state length does not match its engine"};
+        }
+        std::array<std::uint64_t, mt_size + 1> loaded{};
+        for (std::size_t word = 0; word < words; ++word) {
+            for (std::size_t byte = 0; byte < 8; ++byte) {
+                loaded[word] |= static_cast<std::uint64_t>(
+                                    input[generator_state_header + 8 * word + byte])
+                                << (8U * byte);
+            }
+        }
+        restored.load(loaded.data());
+        engine_ = std::move(restored);
+        entropy_managed_ = input[6] == 1;
+        process_id_ = current_process_id();
+    }
 
 private:
-    Storm::Generator generator_;
+    Engine engine_;
     bool entropy_managed_{false};
     std::uint64_t process_id_;
     bool synchronized_;
     std::mutex mutex_;
 };
 
+inline auto generator_engine(GeneratorCore& generator) noexcept -> int {
+    return static_cast<int>(generator.engine_kind());
+}
+
 class GeneratorLockGuard {
 public:
     explicit GeneratorLockGuard(GeneratorCore& generator) : generator_{generator} {
@@ -113,6 +207,38 @@ private:
     GeneratorCore& generator_;
 };
 
+inline void generator_seek(GeneratorCore& generator, const EnginePosition position) {
+    const GeneratorLockGuard guard{generator};
+    generator.engine().seek(position);
+}
+
+inline void generator_advance(GeneratorCore& generator, const std::uint64_t steps) {
+    const GeneratorLockGuard guard{generator};
+    generator.engine().advance(steps);
+}
+
+inline void generator_jump(GeneratorCore& generator) {
+    const GeneratorLockGuard guard{generator};
+    generator.engine().jump();
+}
+
+inline auto generator_position(GeneratorCore& generator) -> EnginePosition {
+    const GeneratorLockGuard guard{generator};
+    return generator.engine().position();
+}
+
+inline auto generator_write_state(GeneratorCore& generator, unsigned char* output,
+                                  const std::size_t capacity) -> std::size_t {
+    const GeneratorLockGuard guard{generator};
+    return generator.write_state(output, capacity);
+}
+
+inline void generator_restore_state(GeneratorCore& generator, const unsigned char* input,
+                                    const std::size_t size) {
+    const GeneratorLockGuard guard{generator};
+    generator.restore_state(input, size);
+}
+
 struct ModuleState {
     GeneratorCore generator{0, false};
     bool needs_entropy{true};
@@ -128,7 +254,7 @@ inline auto module_generator() -> GeneratorCore* {
     return &module_state.generator;
 }
 
-inline auto module_engine() -> Storm::engine_type& {
+inline auto module_engine() -> Engine& {
     return module_generator()->prepared_engine();
 }
 
@@ -136,7 +262,7 @@ inline auto module_needs_prepare() noexcept -> bool { return module_state.needs_
 
 inline void module_prepare() { static_cast<void>(module_generator()); }
 
-inline auto module_prepared_engine() noexcept -> Storm::engine_type& {
+inline auto module_prepared_engine() noexcept -> Engine& {
     return module_state.generator.prepared_engine();
 }
 
@@ -204,23 +330,23 @@ inline auto finite_output(const double value) -> double {
 inline auto storm_version() noexcept -> const char* { return Storm::version; }
 
 inline auto canonical(GeneratorCore& generator) -> double {
-    return Storm::canonical(generator.engine());
+    return draws::canonical(generator.engine());
 }
 
 inline auto module_canonical_prepared() noexcept -> double {
-    return Storm::canonical(module_prepared_engine());
+    return draws::canonical(module_prepared_engine());
 }
 
 inline void module_canonical_fill(double* output, const std::size_t count) {
     auto& engine = module_engine();
     for (std::size_t index = 0; index < count; ++index) {
-        output[index] = Storm::canonical(engine);
+        output[index] = draws::canonical(engine);
     }
 }
 
 inline auto generator_canonical(GeneratorCore& generator) -> double {
     const GeneratorLockGuard guard{generator};
-    return Storm::canonical(generator.engine());
+    return draws::canonical(generator.engine());
 }
 
 inline void generator_canonical_fill(GeneratorCore& generator, double* output,
@@ -228,23 +354,176 @@ inline void generator_canonical_fill(GeneratorCore& generator, double* output,
     const GeneratorLockGuard guard{generator};
     auto& engine = generator.engine();
     for (std::size_t index = 0; index < count; ++index) {
-        output[index] = Storm::canonical(engine);
+        output[index] = draws::canonical(engine);
+    }
+}
+
+// Raw bytes serialize each 64-bit engine output least-significant byte first on
+// every host. A trailing partial word consumes one whole output and keeps its
+// low-order bytes, so equal sizes always reproduce equal byte strings.
+inline void store_little_endian(unsigned char* output, std::uint64_t word,
+                                const std::size_t size) noexcept {
+    if constexpr (std::endian::native == std::endian::little) {
+        std::memcpy(output, &word, size);
+    } else {
+        for (std::size_t offset = 0; offset < size; ++offset) {
+            output[offset] = static_cast<unsigned char>(word);
+            word >>= 8U;
+        }
+    }
+}
+
+inline void fill_bytes(Engine& engine, unsigned char* output,
+                       const std::size_t size) {
+    constexpr std::size_t word_size = sizeof(std::uint64_t);
+    std::size_t index = 0;
+    for (; index + word_size <= size; index += word_size) {
+        store_little_endian(output + index, engine(), word_size);
+    }
+    if (index < size) {
+        store_little_endian(output + index, engine(), size - index);
+    }
+}
+
+inline void module_fill_bytes(unsigned char* output, const std::size_t size) {
+    fill_bytes(module_engine(), output, size);
+}
+
+inline void generator_fill_bytes(GeneratorCore& generator, unsigned char* output,
+                                 const std::size_t size) {
+    const GeneratorLockGuard guard{generator};
+    fill_bytes(generator.engine(), output, size);
+}
+
+// Packed bits use the raw-byte layout: bit i is (output[i / 8] >> (i % 8)) & 1.
+// Bits past the requested size in the final byte are cleared.
+inline auto packed_bit_bytes(const std::size_t bits) noexcept -> std::size_t {
+    return bits / 8U + (bits % 8U != 0U ? 1U : 0U);
+}
+
+inline void clear_unused_bits(unsigned char* output, const std::size_t bits) noexcept {
+    if (bits % 8U != 0U) {
+        output[bits / 8U] &= static_cast<unsigned char>((1U << (bits % 8U)) - 1U);
+    }
+}
+
+inline void fill_bits(Engine& engine, unsigned char* output, const std::size_t bits) {
+    fill_bytes(engine, output, packed_bit_bytes(bits));
+    clear_unused_bits(output, bits);
+}
+
+// Each of the 64 lanes of a word compares an independent uniform real U with
+// the exact binary expansion of the probability, one engine word per digit.
+// A lane becomes 1 at the first digit where p has a 1 and U has a 0, becomes
+// 0 at the first digit where p has a 0 and U has a 1, and otherwise stays
+// undecided. P(U < p) is therefore exact for every double. Undecided lanes
+// halve with each digit, so a word needs about eight engine outputs
+// regardless of p. A lane still undecided after p's final 1 digit has U >= p.
+inline auto bernoulli_word(Engine& engine, const std::uint64_t mantissa,
+                           const int leading_zeros, std::uint64_t undecided) -> std::uint64_t {
+    std::uint64_t result = 0;
+    for (int digit = 0; digit < leading_zeros && undecided != 0U; ++digit) {
+        undecided &= ~engine();
+    }
+    for (std::uint64_t bit = std::uint64_t{1} << 52U; bit != 0U && undecided != 0U;
+         bit >>= 1U) {
+        const std::uint64_t word = engine();
+        if ((mantissa & bit) != 0U) {
+            result |= undecided & ~word;
+            undecided &= word;
+            if ((mantissa & (bit - 1U)) == 0U) {
+                break;
+            }
+        } else {
+            undecided &= ~word;
+        }
+    }
+    return result;
+}
+
+inline void fill_bernoulli_bits(Engine& engine, const double probability,
+                                unsigned char* output, const std::size_t bits) {
+    const std::size_t size = packed_bit_bytes(bits);
+    if (probability == 0.0 || probability == 1.0) {
+        std::memset(output, probability == 0.0 ? 0x00 : 0xFF, size);
+        clear_unused_bits(output, bits);
+        return;
+    }
+    int exponent = 0;
+    const double fraction = std::frexp(probability, &exponent);
+    const auto mantissa = static_cast<std::uint64_t>(std::ldexp(fraction, 53));
+    const int leading_zeros = -exponent;
+    constexpr std::size_t word_bits = 64;
+    std::size_t index = 0;
+    for (; index + word_bits <= bits; index += word_bits) {
+        store_little_endian(output + index / 8U,
+                            bernoulli_word(engine, mantissa, leading_zeros, ~std::uint64_t{0}),
+                            sizeof(std::uint64_t));
     }
+    if (index < bits) {
+        const std::size_t lanes = bits - index;
+        const std::uint64_t lane_mask = (std::uint64_t{1} << lanes) - 1U;
+        store_little_endian(output + index / 8U,
+                            bernoulli_word(engine, mantissa, leading_zeros, lane_mask),
+                            size - index / 8U);
+    }
+}
+
+inline void module_fill_bits(unsigned char* output, const std::size_t bits) {
+    fill_bits(module_engine(), output, bits);
+}
+
+inline void generator_fill_bits(GeneratorCore& generator, unsigned char* output,
+                                const std::size_t bits) {
+    const GeneratorLockGuard guard{generator};
+    fill_bits(generator.engine(), output, bits);
+}
+
+inline void module_fill_bernoulli_bits(const double probability, unsigned char* output,
+                                       const std::size_t bits) {
+    require_probability(probability);
+    fill_bernoulli_bits(module_engine(), probability, output, bits);
+}
+
+inline void generator_fill_bernoulli_bits(GeneratorCore& generator, const double probability,
+                                          unsigned char* output, const std::size_t bits) {
+    const GeneratorLockGuard guard{generator};
+    require_probability(probability);
+    fill_bernoulli_bits(generator.engine(), probability, output, bits);
 }
 
 inline auto random_int(GeneratorCore& generator, const std::int64_t low,
                        const std::int64_t high) -> std::int64_t {
-    return Storm::uniform_integer(generator.engine(), low, high);
+    return draws::uniform_integer(generator.engine(), low, high);
 }
 
 inline auto random_index(GeneratorCore& generator, const std::size_t size) -> std::size_t {
-    return Storm::uniform_index(generator.engine(), size);
+    return draws::uniform_index(generator.engine(), size);
 }
 
-inline void sample_offsets(Storm::engine_type& engine, const std::size_t population_size,
+inline void sample_offsets(Engine& engine, const std::size_t population_size,
                            const std::size_t count, std::size_t* output) {
     for (std::size_t position = 0; position < count; ++position) {
-        output[position] = position + Storm::uniform_index(engine, population_size - position);
+        output[position] = position + draws::uniform_index(engine, population_size - position);
+    }
+}
+
+// Replays the partial Fisher-Yates swaps named by `offsets` on the identity
+// permutation while storing only displaced positions. A sample of `count`
+// indices from a range of any size needs O(count) memory and matches the
+// materialized swap loop exactly.
+inline void sparse_sample_indices(const std::size_t* offsets, const std::size_t count,
+                                  std::uint64_t* output) {
+    std::unordered_map<std::size_t, std::size_t> displaced;
+    displaced.reserve(count * 2);
+    const auto at = [&displaced](const std::size_t position) {
+        const auto found = displaced.find(position);
+        return found == displaced.end() ? position : found->second;
+    };
+    for (std::size_t position = 0; position < count; ++position) {
+        const std::size_t other = offsets[position];
+        output[position] = at(other);
+        displaced[other] = at(position);
     }
 }
 
@@ -263,21 +542,21 @@ inline void generator_sample_offsets(GeneratorCore& generator, const std::size_t
 
 inline auto random_range(GeneratorCore& generator, const std::int64_t start,
                          const std::int64_t stop, const std::int64_t step) -> std::int64_t {
-    return Storm::random_range(generator.engine(), start, stop, step);
+    return draws::random_range(generator.engine(), start, stop, step);
 }
 
 inline auto roll_die(GeneratorCore& generator, const std::size_t sides) -> std::size_t {
-    return Storm::roll_die(generator.engine(), sides);
+    return draws::roll_die(generator.engine(), sides);
 }
 
 inline auto roll_dice(GeneratorCore& generator, const std::size_t rolls,
                       const std::size_t sides) -> std::uint64_t {
-    return Storm::roll_dice(generator.engine(), rolls, sides);
+    return draws::roll_dice(generator.engine(), rolls, sides);
 }
 
-inline auto ability_dice_engine(Storm::engine_type& engine, const std::size_t count)
+inline auto ability_dice_engine(Engine& engine, const std::size_t count)
     -> std::uint64_t {
-    return Storm::ability_dice(engine, count);
+    return draws::ability_dice(engine, count);
 }
 
 inline auto ability_dice(GeneratorCore& generator, const std::size_t count) -> std::uint64_t {
@@ -309,7 +588,7 @@ inline auto triangular(GeneratorCore& generator, const double low, const double
         return low;
     }
     const double span = high - low;
-    const double value = Storm::canonical(generator.engine());
+    const double value = draws::canonical(generator.engine());
     const double fraction = (mode - low) / span;
     if (value > fraction) {
         return high - span * std::sqrt((1.0 - value) * (1.0 - fraction));
@@ -317,12 +596,6 @@ inline auto triangular(GeneratorCore& generator, const double low, const double
     return low + span * std::sqrt(value * fraction);
 }
 
-inline auto binomial(GeneratorCore& generator, const std::uint64_t trials,
-                     const double probability) -> std::uint64_t {
-    std::binomial_distribution<std::uint64_t> distribution{trials, probability};
-    return distribution(generator.engine());
-}
-
 inline auto negative_binomial(GeneratorCore& generator, const std::uint64_t successes,
                               const double probability) -> std::uint64_t {
     std::negative_binomial_distribution<std::uint64_t> distribution{successes, probability};
@@ -337,12 +610,210 @@ inline auto geometric(GeneratorCore& generator, const double probability) -> std
     return distribution(generator.engine());
 }
 
-inline auto poisson(GeneratorCore& generator, const double mean) -> std::uint64_t {
-    if (mean == 0.0) {
-        return 0;
+// Fortuna-owned ziggurat samplers. The logarithm and exponential below use only
+// IEEE-754 arithmetic and exact scaling, and the build disables floating-point
+// contraction, so the tables and every draw are identical on every binary64
+// platform instead of following the toolchain's <random> and libm.
+inline constexpr double ziggurat_ln2_high = 6.93147180369123816490e-01;
+inline constexpr double ziggurat_ln2_low = 1.90821492927058770002e-10;
+
+inline auto stable_log(const double value) noexcept -> double {
+    int exponent = 0;
+    double mantissa = std::frexp(value, &exponent);
+    if (mantissa < std::numbers::sqrt2 / 2.0) {
+        mantissa *= 2.0;
+        --exponent;
     }
-    std::poisson_distribution<std::uint64_t> distribution{mean};
-    return distribution(generator.engine());
+    const double s = (mantissa - 1.0) / (mantissa + 1.0);
+    const double z = s * s;
+    double series = 1.0 / 23.0;
+    for (int denominator = 21; denominator > 0; denominator -= 2) {
+        series = series * z + 1.0 / denominator;
+    }
+    const double scaled = static_cast<double>(exponent);
+    return scaled * ziggurat_ln2_high + (scaled * ziggurat_ln2_low + 2.0 * s * series);
+}
+
+// log(1 + value) for value > -1, without the cancellation that rounding
+// 1 + value would cause near zero.
+inline auto stable_log1p(const double value) noexcept -> double {
+    const double sum = 1.0 + value;
+    if (!(sum > std::numbers::sqrt2 / 2.0 && sum < std::numbers::sqrt2)) {
+        return stable_log(sum);
+    }
+    const double s = value / (2.0 + value);
+    const double z = s * s;
+    double series = 1.0 / 23.0;
+    for (int denominator = 21; denominator > 0; denominator -= 2) {
+        series = series * z + 1.0 / denominator;
+    }
+    return 2.0 * s * series;
+}
+
+inline auto stable_exp(const double value) noexcept -> double {
+    if (value < -745.2) {
+        return 0.0;
+    }
+    if (value > 710.0) {
+        return std::numeric_limits<double>::infinity();
+    }
+    const double steps = std::floor(value * std::numbers::log2e + 0.5);
+    const double reduced = (value - steps * ziggurat_ln2_high) - steps * ziggurat_ln2_low;
+    constexpr std::array<double, 14> inverse_factorials = [] {
+        std::array<double, 14> result{};
+        double factorial = 1.0;
+        for (std::size_t index = 0; index < result.size(); ++index) {
+            factorial *= index == 0 ? 1.0 : static_cast<double>(index);
+            result[index] = 1.0 / factorial;
+        }
+        return result;
+    }();
+    double series = inverse_factorials[13];
+    for (std::size_t index = 13; index-- > 0;) {
+        series = series * reduced + inverse_factorials[index];
+    }
+    return std::ldexp(series, static_cast<int>(steps));
+}
+
+struct ZigguratTables {
+    std::array<std::uint64_t, 256> accept;
+    std::array<double, 256> width;
+    std::array<double, 256> height;
+};
+
+// Marsaglia and Tsang (2000) with 256 layers; layer 0 is the base strip and
+// tail. Normal draws use 52 magnitude bits and exponential draws use 53.
+inline constexpr double ziggurat_normal_edge = 3.6541528853610088;
+inline constexpr double ziggurat_exponential_edge = 7.69711747013104972;
+
+inline auto ziggurat_normal_tables() -> const ZigguratTables& {
+    static const ZigguratTables tables = [] {
+        constexpr double scale = 0x1.0p52;
+        constexpr double area = 4.92867323399e-3;
+        ZigguratTables result{};
+        double edge = ziggurat_normal_edge;
+        double previous = edge;
+        const double base = area / stable_exp(-0.5 * edge * edge);
+        result.accept[0] = static_cast<std::uint64_t>((edge / base) * scale);
+        result.accept[1] = 0;
+        result.width[0] = base / scale;
+        result.width[255] = edge / scale;
+        result.height[0] = 1.0;
+        result.height[255] = stable_exp(-0.5 * edge * edge);
+        for (std::size_t index = 254; index > 0; --index) {
+            edge = std::sqrt(-2.0 * stable_log(area / edge + stable_exp(-0.5 * edge * edge)));
+            result.accept[index + 1] = static_cast<std::uint64_t>((edge / previous) * scale);
+            previous = edge;
+            result.height[index] = stable_exp(-0.5 * edge * edge);
+            result.width[index] = edge / scale;
+        }
+        return result;
+    }();
+    return tables;
+}
+
+inline auto ziggurat_exponential_tables() -> const ZigguratTables& {
+    static const ZigguratTables tables = [] {
+        constexpr double scale = 0x1.0p53;
+        constexpr double area = 3.949659822581572e-3;
+        ZigguratTables result{};
+        double edge = ziggurat_exponential_edge;
+        double previous = edge;
+        const double base = area / stable_exp(-edge);
+        result.accept[0] = static_cast<std::uint64_t>((edge / base) * scale);
+        result.accept[1] = 0;
+        result.width[0] = base / scale;
+        result.width[255] = edge / scale;
+        result.height[0] = 1.0;
+        result.height[255] = stable_exp(-edge);
+        for (std::size_t index = 254; index > 0; --index) {
+            edge = -stable_log(area / edge + stable_exp(-edge));
+            result.accept[index + 1] = static_cast<std::uint64_t>((edge / previous) * scale);
+            previous = edge;
+            result.height[index] = stable_exp(-edge);
+            result.width[index] = edge / scale;
+        }
+        return result;
+    }();
+    return tables;
+}
+
+// A uniform draw in (0, 1], so its logarithm is always finite.
+inline auto ziggurat_open_unit(Engine& engine) noexcept -> double {
+    return 1.0 - draws::canonical(engine);
+}
+
+inline auto ziggurat_half_normal(Engine& engine, std::uint64_t& bits) -> double {
+    const auto& tables = ziggurat_normal_tables();
+    for (;;) {
+        bits = engine();
+        const auto layer = static_cast<std::size_t>(bits & 0xFF);
+        const std::uint64_t magnitude = bits >> 12;
+        const double value = static_cast<double>(magnitude) * tables.width[layer];
+        if (magnitude < tables.accept[layer]) {
+            return value;
+        }
+        if (layer == 0) {
+            for (;;) {
+                const double excess =
+                    -stable_log(ziggurat_open_unit(engine)) / ziggurat_normal_edge;
+                const double height = -stable_log(ziggurat_open_unit(engine));
+                if (height + height > excess * excess) {
+                    return ziggurat_normal_edge + excess;
+                }
+            }
+        }
+        const double lower = tables.height[layer];
+        const double upper = tables.height[layer - 1];
+        if (lower + draws::canonical(engine) * (upper - lower) <
+            stable_exp(-0.5 * value * value)) {
+            return value;
+        }
+    }
+}
+
+inline auto ziggurat_half_normal(Engine& engine) -> double {
+    std::uint64_t bits = 0;
+    return ziggurat_half_normal(engine, bits);
+}
+
+inline auto ziggurat_normal(Engine& engine) -> double {
+    std::uint64_t bits = 0;
+    const double magnitude = ziggurat_half_normal(engine, bits);
+    return (bits & 0x100) != 0 ? -magnitude : magnitude;
+}
+
+inline auto ziggurat_exponential(Engine& engine) -> double {
+    const auto& tables = ziggurat_exponential_tables();
+    for (;;) {
+        const std::uint64_t bits = engine();
+        const auto layer = static_cast<std::size_t>(bits & 0xFF);
+        const std::uint64_t magnitude = bits >> 11;
+        const double value = static_cast<double>(magnitude) * tables.width[layer];
+        if (magnitude < tables.accept[layer]) {
+            return value;
+        }
+        if (layer == 0) {
+            return ziggurat_exponential_edge - stable_log(ziggurat_open_unit(engine));
+        }
+        const double lower = tables.height[layer];
+        const double upper = tables.height[layer - 1];
+        if (lower + draws::canonical(engine) * (upper - lower) < stable_exp(-value)) {
+            return value;
+        }
+    }
+}
+
+inline auto normal_ziggurat(GeneratorCore& generator, const double mean,
+                            const double deviation) -> double {
+    if (deviation == 0.0) {
+        return mean;
+    }
+    return mean + deviation * ziggurat_normal(generator.engine());
+}
+
+inline auto exponential_ziggurat(GeneratorCore& generator, const double rate) -> double {
+    return ziggurat_exponential(generator.engine()) / rate;
 }
 
 inline auto exponential(GeneratorCore& generator, const double rate) -> double {
@@ -350,9 +821,367 @@ inline auto exponential(GeneratorCore& generator, const double rate) -> double {
     return distribution(generator.engine());
 }
 
+// Marsaglia and Tsang (2000) for shape >= 1, driven by the ziggurat normal and
+// the same stable logarithm, so every gamma-derived family below is
+// platform-stable too.
+inline auto marsaglia_tsang_gamma(Engine& engine, const double shape) -> double {
+    const double offset = shape - 1.0 / 3.0;
+    const double spread = 1.0 / std::sqrt(9.0 * offset);
+    for (;;) {
+        double normal_value = 0.0;
+        double cube = 0.0;
+        do {
+            normal_value = ziggurat_normal(engine);
+            cube = 1.0 + spread * normal_value;
+        } while (cube <= 0.0);
+        cube = cube * cube * cube;
+        const double uniform = ziggurat_open_unit(engine);
+        const double square = normal_value * normal_value;
+        if (uniform < 1.0 - 0.0331 * square * square ||
+            stable_log(uniform) < 0.5 * square + offset * (1.0 - cube + stable_log(cube))) {
+            return offset * cube;
+        }
+    }
+}
+
+// Logarithm of a unit-scale gamma draw. Shapes below one use the
+// G(shape + 1) * U^(1 / shape) boost in log space, so tiny shapes never
+// underflow to a zero that a ratio of gammas would turn into NaN.
+inline auto log_standard_gamma(Engine& engine, const double shape) -> double {
+    if (shape >= 1.0) {
+        return stable_log(marsaglia_tsang_gamma(engine, shape));
+    }
+    const double boosted = marsaglia_tsang_gamma(engine, shape + 1.0);
+    return stable_log(boosted) + stable_log(ziggurat_open_unit(engine)) / shape;
+}
+
+inline auto standard_gamma(Engine& engine, const double shape) -> double {
+    if (shape >= 1.0) {
+        return marsaglia_tsang_gamma(engine, shape);
+    }
+    const double boosted = marsaglia_tsang_gamma(engine, shape + 1.0);
+    return boosted * stable_exp(stable_log(ziggurat_open_unit(engine)) / shape);
+}
+
 inline auto gamma(GeneratorCore& generator, const double shape, const double scale) -> double {
-    std::gamma_distribution<double> distribution{shape, scale};
-    return distribution(generator.engine());
+    return standard_gamma(generator.engine(), shape) * scale;
+}
+
+// The remainder of Stirling's series for ln(Gamma(next)) after
+// (next - 0.5) * ln(next) - next + ln(2 * pi) / 2.
+inline auto stirling_series(const double next) noexcept -> double {
+    const double inverse = 1.0 / next;
+    const double square = inverse * inverse;
+    return inverse *
+           (1.0 / 12.0 - square * (1.0 / 360.0 - square * (1.0 / 1260.0 - square / 1680.0)));
+}
+
+inline constexpr double half_log_two_pi = 0.9189385332046727;
+
+// ln(k!) from a table below ten and Stirling's series above it.
+inline auto log_factorial(const double value) noexcept -> double {
+    constexpr std::array<double, 10> small = {
+        0.0,
+        0.0,
+        0.6931471805599453,
+        1.791759469228055,
+        3.1780538303479458,
+        4.787491742782046,
+        6.579251212010101,
+        8.525161361065415,
+        10.60460290274525,
+        12.801827480081469,
+    };
+    if (value < 10.0) {
+        return small[static_cast<std::size_t>(value)];
+    }
+    const double next = value + 1.0;
+    return (next - 0.5) * stable_log(next) - next + half_log_two_pi + stirling_series(next);
+}
+
+// Every per-parameter constant of a binomial draw. A bulk call or Sampler
+// prepares it once, so each draw does constant work however large the trials.
+struct BinomialSetup {
+    std::uint64_t trials = 0;
+    bool flipped = false;
+    bool btpe = false;
+    double r = 0.0;
+    double q = 0.0;
+    double start = 0.0;
+    double bound = 0.0;
+    double nrq = 0.0;
+    double fm = 0.0;
+    double m = 0.0;
+    double p1 = 0.0;
+    double xm = 0.0;
+    double xl = 0.0;
+    double xr = 0.0;
+    double c = 0.0;
+    double laml = 0.0;
+    double lamr = 0.0;
+    double p2 = 0.0;
+    double p3 = 0.0;
+    double p4 = 0.0;
+};
+
+inline auto prepare_binomial(const std::uint64_t trials, const double probability)
+    -> BinomialSetup {
+    BinomialSetup setup{};
+    setup.trials = trials;
+    setup.flipped = probability > 0.5;
+    setup.r = setup.flipped ? 1.0 - probability : probability;
+    setup.q = 1.0 - setup.r;
+    const double n = static_cast<double>(trials);
+    const double mean = n * setup.r;
+    setup.btpe = mean >= 30.0;
+    if (!setup.btpe) {
+        setup.start = stable_exp(n * stable_log(setup.q));
+        setup.bound = std::min(n, mean + 10.0 * std::sqrt(mean * setup.q + 1.0));
+        return setup;
+    }
+    setup.nrq = mean * setup.q;
+    setup.fm = mean + setup.r;
+    setup.m = std::floor(setup.fm);
+    setup.p1 = std::floor(2.195 * std::sqrt(setup.nrq) - 4.6 * setup.q) + 0.5;
+    setup.xm = setup.m + 0.5;
+    setup.xl = setup.xm - setup.p1;
+    setup.xr = setup.xm + setup.p1;
+    setup.c = 0.134 + 20.5 / (15.3 + setup.m);
+    double slope = (setup.fm - setup.xl) / (setup.fm - setup.xl * setup.r);
+    setup.laml = slope * (1.0 + slope / 2.0);
+    slope = (setup.xr - setup.fm) / (setup.xr * setup.q);
+    setup.lamr = slope * (1.0 + slope / 2.0);
+    setup.p2 = setup.p1 * (1.0 + 2.0 * setup.c);
+    setup.p3 = setup.p2 + setup.c / setup.laml;
+    setup.p4 = setup.p3 + setup.c / setup.lamr;
+    return setup;
+}
+
+// Inversion from zero for small means, restarting past a ten-sigma bound.
+inline auto binomial_inversion(Engine& engine, const BinomialSetup& setup)
+    -> double {
+    const double n = static_cast<double>(setup.trials);
+    double successes = 0.0;
+    double mass = setup.start;
+    double uniform = draws::canonical(engine);
+    while (uniform > mass) {
+        successes += 1.0;
+        if (successes > setup.bound) {
+            successes = 0.0;
+            mass = setup.start;
+            uniform = draws::canonical(engine);
+        } else {
+            uniform -= mass;
+            mass = ((n - successes + 1.0) * setup.r * mass) / (successes * setup.q);
+        }
+    }
+    return successes;
+}
+
+// The squeeze term of Stirling's series used by BTPE's final acceptance test.
+inline auto btpe_stirling(const double value) noexcept -> double {
+    const double square = value * value;
+    return (13680.0 - (462.0 - (132.0 - (99.0 - 140.0 / square) / square) / square) / square) /
+           value / 166320.0;
+}
+
+// Kachitvichyanukul and Schmeiser's BTPE: a triangle, two parallelograms, and
+// two exponential tails bound the mass function for means of at least 30.
+inline auto binomial_btpe(Engine& engine, const BinomialSetup& setup) -> double {
+    const double n = static_cast<double>(setup.trials);
+    for (;;) {
+        const double u = draws::canonical(engine) * setup.p4;
+        double v = draws::canonical(engine);
+        double y = 0.0;
+        if (u <= setup.p1) {
+            return std::floor(setup.xm - setup.p1 * v + u);
+        }
+        if (u <= setup.p2) {
+            const double x = setup.xl + (u - setup.p1) / setup.c;
+            v = v * setup.c + 1.0 - std::fabs(setup.m - x + 0.5) / setup.p1;
+            if (v > 1.0) {
+                continue;
+            }
+            y = std::floor(x);
+        } else if (u <= setup.p3) {
+            if (v == 0.0) {
+                continue;
+            }
+            y = std::floor(setup.xl + stable_log(v) / setup.laml);
+            if (y < 0.0) {
+                continue;
+            }
+            v = v * (u - setup.p2) * setup.laml;
+        } else {
+            if (v == 0.0) {
+                continue;
+            }
+            y = std::floor(setup.xr - stable_log(v) / setup.lamr);
+            if (y > n) {
+                continue;
+            }
+            v = v * (u - setup.p3) * setup.lamr;
+        }
+        const double k = std::fabs(y - setup.m);
+        if (k <= 20.0 || k >= setup.nrq / 2.0 - 1.0) {
+            // Evaluate f(y) / f(m) by the recurrence when y is close to the mode.
+            const double s = setup.r / setup.q;
+            const double a = s * (n + 1.0);
+            double ratio = 1.0;
+            for (double index = setup.m + 1.0; index <= y; index += 1.0) {
+                ratio *= a / index - s;
+            }
+            for (double index = y + 1.0; index <= setup.m; index += 1.0) {
+                ratio /= a / index - s;
+            }
+            if (v <= ratio) {
+                return y;
+            }
+            continue;
+        }
+        if (v <= 0.0) {
+            return y;
+        }
+        const double rho =
+            (k / setup.nrq) * ((k * (k / 3.0 + 0.625) + 0.16666666666666666) / setup.nrq + 0.5);
+        const double t = -k * k / (2.0 * setup.nrq);
+        const double log_v = stable_log(v);
+        if (log_v < t - rho) {
+            return y;
+        }
+        if (log_v > t + rho) {
+            continue;
+        }
+        const double x1 = y + 1.0;
+        const double f1 = setup.m + 1.0;
+        const double z = n + 1.0 - setup.m;
+        const double w = n - y + 1.0;
+        const double bound = setup.xm * stable_log(f1 / x1) +
+                             (n - setup.m + 0.5) * stable_log(z / w) +
+                             (y - setup.m) * stable_log(w * setup.r / (x1 * setup.q)) +
+                             btpe_stirling(f1) + btpe_stirling(z) + btpe_stirling(x1) +
+                             btpe_stirling(w);
+        if (log_v <= bound) {
+            return y;
+        }
+    }
+}
+
+inline auto binomial(GeneratorCore& generator, const BinomialSetup& setup) -> std::uint64_t {
+    if (setup.trials == 0 || setup.r == 0.0) {
+        return setup.flipped ? setup.trials : 0;
+    }
+    auto& engine = generator.engine();
+    const auto successes = static_cast<std::uint64_t>(
+        setup.btpe ? binomial_btpe(engine, setup) : binomial_inversion(engine, setup));
+    return setup.flipped ? setup.trials - successes : successes;
+}
+
+inline auto binomial(GeneratorCore& generator, const std::uint64_t trials,
+                     const double probability) -> std::uint64_t {
+    return binomial(generator, prepare_binomial(trials, probability));
+}
+
+// Per-mean constants for Poisson draws: inversion below a mean of ten and
+// Hormann's transformed rejection with squeeze (PTRS) above it.
+struct PoissonSetup {
+    double mean = 0.0;
+    bool ptrs = false;
+    double start = 0.0;
+    double log_mean = 0.0;
+    double b = 0.0;
+    double a = 0.0;
+    double log_inverse_alpha = 0.0;
+    double vr = 0.0;
+};
+
+inline auto prepare_poisson(const double mean) -> PoissonSetup {
+    PoissonSetup setup{};
+    setup.mean = mean;
+    setup.ptrs = mean >= 10.0;
+    if (!setup.ptrs) {
+        setup.start = stable_exp(-mean);
+        return setup;
+    }
+    setup.log_mean = stable_log(mean);
+    setup.b = 0.931 + 2.53 * std::sqrt(mean);
+    setup.a = -0.059 + 0.02483 * setup.b;
+    setup.log_inverse_alpha = stable_log(1.1239 + 1.1328 / (setup.b - 3.4));
+    setup.vr = 0.9277 - 3.6224 / (setup.b - 2.0);
+    return setup;
+}
+
+inline auto poisson_inversion(Engine& engine, const PoissonSetup& setup) -> double {
+    for (;;) {
+        double events = 0.0;
+        double mass = setup.start;
+        double uniform = draws::canonical(engine);
+        // Rounding can leave a sliver of uniform mass past the underflowing
+        // tail; redraw rather than walk forever.
+        while (uniform > mass && mass > 0.0) {
+            uniform -= mass;
+            events += 1.0;
+            mass *= setup.mean / events;
+        }
+        if (mass > 0.0) {
+            return events;
+        }
+    }
+}
+
+// ln(mean^k e^-mean / k!). Written out directly, -mean + k * ln(mean) and
+// ln(k!) nearly cancel and keep only a few integer digits at large means, so
+// above the table Stirling's series is expanded around the mean instead:
+// with d = k + 1 - mean, the log mass is d - k * ln(1 + d / mean) - ln(k + 1) / 2
+// less the series constants.
+inline auto poisson_log_mass(const PoissonSetup& setup, const double k) noexcept -> double {
+    if (k < 10.0) {
+        return -setup.mean + k * setup.log_mean - log_factorial(k);
+    }
+    const double next = k + 1.0;
+    const double offset = next - setup.mean;
+    return offset - k * stable_log1p(offset / setup.mean) - 0.5 * stable_log(next) -
+           half_log_two_pi - stirling_series(next);
+}
+
+inline auto poisson_ptrs(Engine& engine, const PoissonSetup& setup) -> double {
+    // Candidates at or past 2^64 carry no representable probability mass.
+    constexpr double limit = 0x1.0p64;
+    for (;;) {
+        const double u = draws::canonical(engine) - 0.5;
+        const double v = draws::canonical(engine);
+        const double us = 0.5 - std::fabs(u);
+        if (us == 0.0) {
+            continue;
+        }
+        const double k = std::floor((2.0 * setup.a / us + setup.b) * u + setup.mean + 0.43);
+        if (us >= 0.07 && v <= setup.vr) {
+            return k;
+        }
+        if (k < 0.0 || k >= limit || (us < 0.013 && v > us)) {
+            continue;
+        }
+        if (v == 0.0) {
+            return k;
+        }
+        if (stable_log(v) + setup.log_inverse_alpha - stable_log(setup.a / (us * us) + setup.b) <=
+            poisson_log_mass(setup, k)) {
+            return k;
+        }
+    }
+}
+
+inline auto poisson(GeneratorCore& generator, const PoissonSetup& setup) -> std::uint64_t {
+    if (setup.mean == 0.0) {
+        return 0;
+    }
+    auto& engine = generator.engine();
+    return static_cast<std::uint64_t>(setup.ptrs ? poisson_ptrs(engine, setup)
+                                                 : poisson_inversion(engine, setup));
+}
+
+inline auto poisson(GeneratorCore& generator, const double mean) -> std::uint64_t {
+    return poisson(generator, prepare_poisson(mean));
 }
 
 inline auto weibull(GeneratorCore& generator, const double shape, const double scale) -> double {
@@ -360,247 +1189,986 @@ inline auto weibull(GeneratorCore& generator, const double shape, const double s
     return distribution(generator.engine());
 }
 
-inline auto normal(GeneratorCore& generator, const double mean, const double deviation) -> double {
-    if (deviation == 0.0) {
-        return mean;
+inline auto normal(GeneratorCore& generator, const double mean, const double deviation) -> double {
+    if (deviation == 0.0) {
+        return mean;
+    }
+    std::normal_distribution<double> distribution{mean, deviation};
+    return distribution(generator.engine());
+}
+
+inline auto log_normal(GeneratorCore& generator, const double log_mean,
+                       const double log_deviation) -> double {
+    if (log_deviation == 0.0) {
+        return std::exp(log_mean);
+    }
+    std::lognormal_distribution<double> distribution{log_mean, log_deviation};
+    return distribution(generator.engine());
+}
+
+inline auto extreme_value(GeneratorCore& generator, const double location,
+                          const double scale) -> double {
+    std::extreme_value_distribution<double> distribution{location, scale};
+    return distribution(generator.engine());
+}
+
+inline auto chi_squared(GeneratorCore& generator, const double degrees) -> double {
+    return 2.0 * standard_gamma(generator.engine(), 0.5 * degrees);
+}
+
+inline auto cauchy(GeneratorCore& generator, const double location, const double scale) -> double {
+    std::cauchy_distribution<double> distribution{location, scale};
+    return distribution(generator.engine());
+}
+
+// F, t, and beta are ratios of gamma draws. Shapes of at least one use the
+// direct ratio; smaller shapes take the ratio in log space.
+inline auto fisher_f(GeneratorCore& generator, const double first, const double second) -> double {
+    auto& engine = generator.engine();
+    const double first_half = 0.5 * first;
+    const double second_half = 0.5 * second;
+    if (first_half >= 1.0 && second_half >= 1.0) {
+        const double numerator = marsaglia_tsang_gamma(engine, first_half) / first_half;
+        return numerator / (marsaglia_tsang_gamma(engine, second_half) / second_half);
+    }
+    const double numerator = log_standard_gamma(engine, first_half) - stable_log(first_half);
+    const double denominator = log_standard_gamma(engine, second_half) - stable_log(second_half);
+    return stable_exp(numerator - denominator);
+}
+
+inline auto student_t(GeneratorCore& generator, const double degrees) -> double {
+    auto& engine = generator.engine();
+    const double half = 0.5 * degrees;
+    const double normal_value = ziggurat_normal(engine);
+    if (half >= 1.0) {
+        return normal_value / std::sqrt(marsaglia_tsang_gamma(engine, half) / half);
+    }
+    const double log_gamma = log_standard_gamma(engine, half);
+    if (normal_value == 0.0) {
+        return normal_value;
+    }
+    return normal_value * stable_exp(0.5 * (stable_log(half) - log_gamma));
+}
+
+inline auto beta(GeneratorCore& generator, const double alpha, const double beta_value) -> double {
+    auto& engine = generator.engine();
+    if (alpha >= 1.0 && beta_value >= 1.0) {
+        const double left = marsaglia_tsang_gamma(engine, alpha);
+        return left / (left + marsaglia_tsang_gamma(engine, beta_value));
+    }
+    const double left = log_standard_gamma(engine, alpha);
+    const double right = log_standard_gamma(engine, beta_value);
+    const double pivot = std::max(left, right);
+    const double scaled_left = stable_exp(left - pivot);
+    return scaled_left / (scaled_left + stable_exp(right - pivot));
+}
+
+inline auto pareto(GeneratorCore& generator, const double alpha) -> double {
+    return 1.0 / std::pow(1.0 - draws::canonical(generator.engine()), 1.0 / alpha);
+}
+
+inline auto vonmises(GeneratorCore& generator, const double mu, const double kappa) -> double {
+    constexpr double tau = 2.0 * std::numbers::pi;
+    auto& engine = generator.engine();
+    if (kappa < 1.0e-6) {
+        return tau * draws::canonical(engine);
+    }
+    // Stable Best-Fisher formulation, including huge finite concentration.
+    const double scale = 0.5 / kappa;
+    const double r = scale + std::sqrt(1.0 + scale * scale);
+    for (;;) {
+        const double z = std::cos(std::numbers::pi * draws::canonical(engine));
+        const double delta = z / (r + z);
+        const double accept = draws::canonical(engine);
+        if (accept < 1.0 - delta * delta ||
+            accept <= (1.0 - delta) * std::exp(delta)) {
+            const double inverse = 1.0 / r;
+            const double f = (inverse + z) / (1.0 + inverse * z);
+            double theta = draws::canonical(engine) < 0.5 ? std::acos(f) : -std::acos(f);
+            theta = std::fmod(theta + mu, tau);
+            return theta < 0.0 ? theta + tau : theta;
+        }
+    }
+}
+
+inline auto plus_or_minus_engine(Engine& engine, const std::int64_t radius)
+    -> std::int64_t {
+    return draws::uniform_integer(engine, -radius, radius);
+}
+
+inline auto plus_or_minus_triangular_engine(Engine& engine,
+                                            const std::int64_t radius)
+    -> std::int64_t {
+    const auto limit = static_cast<std::uint64_t>(radius);
+    const auto left = draws::uniform_unsigned(engine, 0, limit);
+    const auto right = draws::uniform_unsigned(engine, 0, limit);
+    if (left >= right) {
+        return static_cast<std::int64_t>(left - right);
+    }
+    return -static_cast<std::int64_t>(right - left);
+}
+
+inline auto plus_or_minus_normal_engine(Engine& engine, const std::int64_t radius)
+    -> std::int64_t {
+    if (radius == 0) {
+        return 0;
+    }
+    std::normal_distribution<double> distribution{
+        0.0, static_cast<double>(radius) / std::numbers::pi};
+    for (;;) {
+        const double rounded = std::round(distribution(engine));
+        if (rounded < -0x1.0p63 || rounded >= 0x1.0p63) {
+            continue;
+        }
+        const auto result = static_cast<std::int64_t>(rounded);
+        if (result >= -radius && result <= radius) {
+            return result;
+        }
+    }
+}
+
+inline auto plus_or_minus(GeneratorCore& generator, const std::int64_t radius) -> std::int64_t {
+    return plus_or_minus_engine(generator.engine(), radius);
+}
+
+inline auto plus_or_minus_triangular(GeneratorCore& generator, const std::int64_t radius)
+    -> std::int64_t {
+    return plus_or_minus_triangular_engine(generator.engine(), radius);
+}
+
+inline auto plus_or_minus_normal(GeneratorCore& generator, const std::int64_t radius)
+    -> std::int64_t {
+    return plus_or_minus_normal_engine(generator.engine(), radius);
+}
+
+inline auto front_triangular_engine(Engine& engine, const std::size_t size)
+    -> std::size_t {
+    return std::min(draws::uniform_index(engine, size), draws::uniform_index(engine, size));
+}
+
+inline auto back_triangular_engine(Engine& engine, const std::size_t size)
+    -> std::size_t {
+    return std::max(draws::uniform_index(engine, size), draws::uniform_index(engine, size));
+}
+
+inline auto center_triangular_engine(Engine& engine, const std::size_t size)
+    -> std::size_t {
+    const auto left = draws::uniform_index(engine, size);
+    const auto right = draws::uniform_index(engine, size);
+    return (left & right) + ((left ^ right) >> 1U);
+}
+
+inline auto front_poisson_engine(Engine& engine, const std::size_t size)
+    -> std::size_t {
+    std::poisson_distribution<std::uint64_t> distribution{
+        static_cast<double>(size) / 4.0};
+    for (;;) {
+        const auto sample = distribution(engine);
+        if (sample < static_cast<std::uint64_t>(size)) {
+            return static_cast<std::size_t>(sample);
+        }
+    }
+}
+
+inline auto front_triangular(GeneratorCore& generator, const std::size_t size) -> std::size_t {
+    return front_triangular_engine(generator.engine(), size);
+}
+
+inline auto center_triangular(GeneratorCore& generator, const std::size_t size) -> std::size_t {
+    return center_triangular_engine(generator.engine(), size);
+}
+
+inline auto back_triangular(GeneratorCore& generator, const std::size_t size) -> std::size_t {
+    return back_triangular_engine(generator.engine(), size);
+}
+
+inline auto checked_size(const std::uint64_t value) -> std::size_t {
+    if constexpr (std::numeric_limits<std::size_t>::digits < 64) {
+        if (value > static_cast<std::uint64_t>(std::numeric_limits<std::size_t>::max())) {
+            throw std::overflow_error{"value exceeds the platform size domain"};
+        }
+    }
+    return static_cast<std::size_t>(value);
+}
+
+class WideIndexCore {
+public:
+    explicit WideIndexCore(const std::uint64_t size) : selector_{make_module(size)} {}
+
+    WideIndexCore(GeneratorCore& generator, const std::uint64_t size)
+        : selector_{make(generator, size)} {}
+
+    auto draw_module() -> std::uint64_t {
+        module_prepare();
+        return static_cast<std::uint64_t>(selector_(module_prepared_engine()));
+    }
+
+    auto draw(GeneratorCore& generator) -> std::uint64_t {
+        GeneratorLockGuard guard{generator};
+        return static_cast<std::uint64_t>(selector_(generator.engine()));
+    }
+
+private:
+    static auto make_module(const std::uint64_t size) -> draws::wide_index_selector {
+        module_prepare();
+        return draws::wide_index_selector{module_prepared_engine(), checked_size(size)};
+    }
+
+    static auto make(GeneratorCore& generator, const std::uint64_t size)
+        -> draws::wide_index_selector {
+        GeneratorLockGuard guard{generator};
+        return draws::wide_index_selector{generator.engine(), checked_size(size)};
+    }
+
+    draws::wide_index_selector selector_;
+};
+
+class PreparedCumulativeWeightedIndexCore {
+public:
+    explicit PreparedCumulativeWeightedIndexCore(const std::vector<double>& boundaries)
+        : selector_{boundaries} {}
+
+    auto draw_module() const -> std::uint64_t {
+        module_prepare();
+        return static_cast<std::uint64_t>(selector_(module_prepared_engine()));
+    }
+
+    auto draw(GeneratorCore& generator) const -> std::uint64_t {
+        GeneratorLockGuard guard{generator};
+        return static_cast<std::uint64_t>(selector_(generator.engine()));
+    }
+
+    void fill_module(std::uint64_t* output, const std::size_t count) const {
+        module_prepare();
+        auto& engine = module_prepared_engine();
+        for (std::size_t index = 0; index < count; ++index) {
+            output[index] = static_cast<std::uint64_t>(selector_(engine));
+        }
+    }
+
+    void fill(GeneratorCore& generator, std::uint64_t* output, const std::size_t count) const {
+        GeneratorLockGuard guard{generator};
+        auto& engine = generator.engine();
+        for (std::size_t index = 0; index < count; ++index) {
+            output[index] = static_cast<std::uint64_t>(selector_(engine));
+        }
+    }
+
+private:
+    draws::PreparedCumulativeWeightedIndex selector_;
+};
+
+// Walker's alias table, built with Vose's O(n) pairing from the same
+// validated cumulative boundaries. Each draw takes one bounded column and one
+// raw engine output compared with that column's 64-bit acceptance threshold.
+class PreparedAliasWeightedIndexCore {
+public:
+    explicit PreparedAliasWeightedIndexCore(const std::vector<double>& boundaries) {
+        if (boundaries.empty()) {
+            throw std::invalid_argument{"alias table requires at least one boundary"};
+        }
+        const std::size_t size = boundaries.size();
+        const double total = boundaries.back();
+        if (!std::isfinite(total) || !(total > 0.0)) {
+            throw std::invalid_argument{"alias table requires a positive final boundary"};
+        }
+        std::vector<double> scaled(size);
+        std::vector<std::size_t> small;
+        std::vector<std::size_t> large;
+        double previous = 0.0;
+        std::size_t heaviest = 0;
+        for (std::size_t index = 0; index < size; ++index) {
+            const double weight = boundaries[index] - previous;
+            if (!(weight >= 0.0)) {
+                throw std::invalid_argument{
+                    "alias table requires finite, nonnegative, nondecreasing boundaries"};
+            }
+            previous = boundaries[index];
+            scaled[index] = weight / total * static_cast<double>(size);
+            if (scaled[index] > scaled[heaviest]) {
+                heaviest = index;
+            }
+            (scaled[index] < 1.0 ? small : large).push_back(index);
+        }
+        threshold_.assign(size, 0);
+        alias_.resize(size);
+        while (!small.empty() && !large.empty()) {
+            const std::size_t column = small.back();
+            small.pop_back();
+            const std::size_t donor = large.back();
+            threshold_[column] = acceptance_threshold(scaled[column]);
+            alias_[column] = donor;
+            scaled[donor] = (scaled[donor] + scaled[column]) - 1.0;
+            if (scaled[donor] < 1.0) {
+                large.pop_back();
+                small.push_back(donor);
+            }
+        }
+        // Whatever rounding leaves unpaired keeps its whole column, except
+        // zero-weight entries, which must never be selected.
+        for (const std::size_t column : large) {
+            alias_[column] = column;
+        }
+        for (const std::size_t column : small) {
+            const bool empty = boundaries[column] == (column == 0 ? 0.0 : boundaries[column - 1]);
+            alias_[column] = empty ? heaviest : column;
+        }
+    }
+
+    auto draw_module() const -> std::uint64_t {
+        module_prepare();
+        return select(module_prepared_engine());
+    }
+
+    auto draw(GeneratorCore& generator) const -> std::uint64_t {
+        GeneratorLockGuard guard{generator};
+        return select(generator.engine());
+    }
+
+    void fill_module(std::uint64_t* output, const std::size_t count) const {
+        module_prepare();
+        auto& engine = module_prepared_engine();
+        for (std::size_t index = 0; index < count; ++index) {
+            output[index] = select(engine);
+        }
+    }
+
+    void fill(GeneratorCore& generator, std::uint64_t* output, const std::size_t count) const {
+        GeneratorLockGuard guard{generator};
+        auto& engine = generator.engine();
+        for (std::size_t index = 0; index < count; ++index) {
+            output[index] = select(engine);
+        }
+    }
+
+private:
+    static auto acceptance_threshold(const double probability) noexcept -> std::uint64_t {
+        return probability > 0.0 ? static_cast<std::uint64_t>(std::ldexp(probability, 64)) : 0;
+    }
+
+    auto select(Engine& engine) const -> std::uint64_t {
+        const std::size_t column = draws::uniform_index(engine, alias_.size());
+        const std::uint64_t draw = engine();
+        return draw < threshold_[column] ? column : alias_[column];
+    }
+
+    std::vector<std::uint64_t> threshold_;
+    std::vector<std::size_t> alias_;
+};
+
+// A Fenwick (binary indexed) tree over mutable relative weights. Updates,
+// appends, swap-removals, and draws each take O(log n). Incremental updates
+// let partial sums drift, so the tree is rebuilt from the stored weights after
+// every `size` updates or once the churn dwarfs the total, and a descent that
+// drift lands on a zero-weight or missing entry steps to the nearest positive
+// entry instead.
+class FenwickWeightedIndexCore {
+public:
+    auto size() const noexcept -> std::size_t { return weights_.size(); }
+
+    auto positive() const noexcept -> std::size_t { return positive_; }
+
+    auto weight(const std::size_t index) const -> double { return weights_.at(index); }
+
+    auto total() const noexcept -> double {
+        double sum = 0.0;
+        for (std::size_t node = weights_.size(); node > 0; node -= lowbit(node)) {
+            sum += tree_[node];
+        }
+        return sum;
+    }
+
+    void set(const std::size_t index, const double weight) {
+        checked_weight(weight);
+        const double previous = weights_.at(index);
+        positive_ += static_cast<std::size_t>(weight > 0.0);
+        positive_ -= static_cast<std::size_t>(previous > 0.0);
+        weights_[index] = weight;
+        if (!retire(std::fabs(weight - previous))) {
+            for (std::size_t node = index + 1; node < tree_.size(); node += lowbit(node)) {
+                tree_[node] += weight - previous;
+            }
+        }
+    }
+
+    void push_back(const double weight) {
+        checked_weight(weight);
+        weights_.push_back(weight);
+        positive_ += static_cast<std::size_t>(weight > 0.0);
+        const std::size_t node = weights_.size();
+        double sum = weight;
+        for (std::size_t child = node - 1; child > node - lowbit(node); child -= lowbit(child)) {
+            sum += tree_[child];
+        }
+        tree_.push_back(sum);
+        retire(weight);
+    }
+
+    // Moves the last entry into `index`, so no other position changes.
+    void swap_remove(const std::size_t index) {
+        if (index >= weights_.size()) {
+            throw std::out_of_range{"Fenwick index out of range"};
+        }
+        const std::size_t last = weights_.size() - 1;
+        if (index != last) {
+            set(index, weights_[last]);
+        }
+        positive_ -= static_cast<std::size_t>(weights_[last] > 0.0);
+        churn_ += weights_[last];
+        weights_.pop_back();
+        tree_.pop_back();
+    }
+
+    auto locate(const double draw) const -> std::uint64_t {
+        require_positive();
+        const std::size_t size = weights_.size();
+        std::size_t position = 0;
+        double remaining = draw;
+        for (std::size_t step = std::bit_floor(size); step > 0; step >>= 1) {
+            const std::size_t next = position + step;
+            if (next <= size && tree_[next] <= remaining) {
+                position = next;
+                remaining -= tree_[next];
+            }
+        }
+        if (position < size && weights_[position] > 0.0) {
+            return position;
+        }
+        for (std::size_t index = std::min(position, size); index > 0; --index) {
+            if (weights_[index - 1] > 0.0) {
+                return index - 1;
+            }
+        }
+        for (std::size_t index = position + 1; index < size; ++index) {
+            if (weights_[index] > 0.0) {
+                return index;
+            }
+        }
+        throw std::logic_error{"Fenwick tree lost its positive weights"};
+    }
+
+    auto draw_module() const -> std::uint64_t {
+        require_positive();
+        module_prepare();
+        return select(module_prepared_engine());
+    }
+
+    auto draw(GeneratorCore& generator) const -> std::uint64_t {
+        require_positive();
+        GeneratorLockGuard guard{generator};
+        return select(generator.engine());
+    }
+
+    void fill_module(std::uint64_t* output, const std::size_t count) const {
+        require_positive();
+        module_prepare();
+        auto& engine = module_prepared_engine();
+        const double sum = total();
+        for (std::size_t index = 0; index < count; ++index) {
+            output[index] = locate(draws::canonical(engine) * sum);
+        }
+    }
+
+    void fill(GeneratorCore& generator, std::uint64_t* output, const std::size_t count) const {
+        require_positive();
+        GeneratorLockGuard guard{generator};
+        auto& engine = generator.engine();
+        const double sum = total();
+        for (std::size_t index = 0; index < count; ++index) {
+            output[index] = locate(draws::canonical(engine) * sum);
+        }
+    }
+
+private:
+    static constexpr double churn_limit = 0x1p20;
+
+    static auto lowbit(const std::size_t node) noexcept -> std::size_t {
+        return node & (~node + 1);
+    }
+
+    static void checked_weight(const double weight) {
+        if (!std::isfinite(weight) || !(weight >= 0.0)) {
+            throw std::invalid_argument{"weights must be finite and nonnegative"};
+        }
+    }
+
+    // Counts one update and rebuilds when drift could matter. Returns whether
+    // the tree was rebuilt, which already accounts for the pending update.
+    auto retire(const double magnitude) -> bool {
+        ++updates_;
+        churn_ += magnitude;
+        if (updates_ < weights_.size() && !(churn_ > churn_limit * total())) {
+            return false;
+        }
+        tree_.assign(weights_.size() + 1, 0.0);
+        for (std::size_t node = 1; node < tree_.size(); ++node) {
+            tree_[node] += weights_[node - 1];
+            const std::size_t parent = node + lowbit(node);
+            if (parent < tree_.size()) {
+                tree_[parent] += tree_[node];
+            }
+        }
+        updates_ = 0;
+        churn_ = 0.0;
+        return true;
+    }
+
+    void require_positive() const {
+        if (positive_ == 0) {
+            throw std::domain_error{"at least one weight must be positive"};
+        }
     }
-    std::normal_distribution<double> distribution{mean, deviation};
-    return distribution(generator.engine());
-}
 
-inline auto log_normal(GeneratorCore& generator, const double log_mean,
-                       const double log_deviation) -> double {
-    if (log_deviation == 0.0) {
-        return std::exp(log_mean);
+    auto select(Engine& engine) const -> std::uint64_t {
+        return locate(draws::canonical(engine) * total());
     }
-    std::lognormal_distribution<double> distribution{log_mean, log_deviation};
-    return distribution(generator.engine());
-}
 
-inline auto extreme_value(GeneratorCore& generator, const double location,
-                          const double scale) -> double {
-    std::extreme_value_distribution<double> distribution{location, scale};
-    return distribution(generator.engine());
-}
+    std::vector<double> weights_;
+    std::vector<double> tree_ = std::vector<double>(1, 0.0);
+    std::size_t positive_ = 0;
+    std::size_t updates_ = 0;
+    double churn_ = 0.0;
+};
 
-inline auto chi_squared(GeneratorCore& generator, const double degrees) -> double {
-    std::chi_squared_distribution<double> distribution{degrees};
-    return distribution(generator.engine());
+// Efraimidis-Spirakis sampling without replacement. Each positive-weight
+// entry gets the key E / w for a ziggurat exponential E, so the smallest key
+// is a weighted draw and the keys in increasing order repeat that draw
+// without replacement. Partial selection keeps the cost at O(n + k log k);
+// ties break by index so the order never depends on the standard library.
+inline void weighted_sample_indices(Engine& engine, const double* boundaries,
+                                    const std::size_t size, const std::size_t count,
+                                    std::uint64_t* output) {
+    std::size_t positive = 0;
+    double previous = 0.0;
+    for (std::size_t index = 0; index < size; ++index) {
+        positive += static_cast<std::size_t>(boundaries[index] > previous);
+        previous = boundaries[index];
+    }
+    if (count > positive) {
+        throw std::invalid_argument{"k must not exceed the number of positive weights"};
+    }
+    if (count == 0) {
+        return;
+    }
+    std::vector<std::pair<double, std::size_t>> keys;
+    keys.reserve(positive);
+    previous = 0.0;
+    for (std::size_t index = 0; index < size; ++index) {
+        const double weight = boundaries[index] - previous;
+        previous = boundaries[index];
+        if (weight > 0.0) {
+            keys.emplace_back(ziggurat_exponential(engine) / weight, index);
+        }
+    }
+    const auto middle = keys.begin() + static_cast<std::ptrdiff_t>(count);
+    if (count < keys.size()) {
+        std::nth_element(keys.begin(), middle, keys.end());
+    }
+    std::sort(keys.begin(), middle);
+    for (std::size_t position = 0; position < count; ++position) {
+        output[position] = keys[position].second;
+    }
 }
 
-inline auto cauchy(GeneratorCore& generator, const double location, const double scale) -> double {
-    std::cauchy_distribution<double> distribution{location, scale};
-    return distribution(generator.engine());
+inline void module_weighted_sample(const double* boundaries, const std::size_t size,
+                                   const std::size_t count, std::uint64_t* output) {
+    module_prepare();
+    weighted_sample_indices(module_prepared_engine(), boundaries, size, count, output);
 }
 
-inline auto fisher_f(GeneratorCore& generator, const double first, const double second) -> double {
-    std::fisher_f_distribution<double> distribution{first, second};
-    return distribution(generator.engine());
+inline void generator_weighted_sample(GeneratorCore& generator, const double* boundaries,
+                                      const std::size_t size, const std::size_t count,
+                                      std::uint64_t* output) {
+    const GeneratorLockGuard guard{generator};
+    weighted_sample_indices(generator.engine(), boundaries, size, count, output);
+}
+
+// Knuth-B shuffle of `count` items of `item_size` bytes in place. The draws
+// match the index schedule of Fortuna's sequence shuffle: each position from
+// the second to last down to the first swaps with a uniform position in
+// [position, count - 1]. Items are copied with memcpy, so the buffer needs no
+// alignment, and common widths swap as single words.
+template <typename Word>
+void shuffle_words(Engine& engine, unsigned char* data, const std::uint64_t last) {
+    for (std::uint64_t position = last; position-- > 0;) {
+        const std::uint64_t other = draws::uniform_unsigned(engine, position, last);
+        Word first;
+        Word second;
+        std::memcpy(&first, data + position * sizeof(Word), sizeof(Word));
+        std::memcpy(&second, data + other * sizeof(Word), sizeof(Word));
+        std::memcpy(data + position * sizeof(Word), &second, sizeof(Word));
+        std::memcpy(data + other * sizeof(Word), &first, sizeof(Word));
+    }
 }
 
-inline auto student_t(GeneratorCore& generator, const double degrees) -> double {
-    std::student_t_distribution<double> distribution{degrees};
-    return distribution(generator.engine());
+inline void knuth_b_items(Engine& engine, unsigned char* data, const std::size_t count,
+                          const std::size_t item_size) {
+    if (count < 2) {
+        return;
+    }
+    const std::uint64_t last = count - 1;
+    switch (item_size) {
+        case 1:
+            shuffle_words<std::uint8_t>(engine, data, last);
+            return;
+        case 2:
+            shuffle_words<std::uint16_t>(engine, data, last);
+            return;
+        case 4:
+            shuffle_words<std::uint32_t>(engine, data, last);
+            return;
+        case 8:
+            shuffle_words<std::uint64_t>(engine, data, last);
+            return;
+        default:
+            break;
+    }
+    for (std::uint64_t position = last; position-- > 0;) {
+        const std::uint64_t other = draws::uniform_unsigned(engine, position, last);
+        if (other != position) {
+            std::swap_ranges(data + position * item_size, data + (position + 1) * item_size,
+                             data + other * item_size);
+        }
+    }
 }
 
-inline auto beta(GeneratorCore& generator, const double alpha, const double beta_value) -> double {
-    std::gamma_distribution<double> first{alpha, 1.0};
-    std::gamma_distribution<double> second{beta_value, 1.0};
-    for (std::size_t attempt = 0; attempt < 1024; ++attempt) {
-        const double left = first(generator.engine());
-        const double right = second(generator.engine());
-        if (left == 0.0 && right == 0.0) {
-            continue;
-        }
-        if (std::isinf(left)) {
-            return std::isinf(right) ? 0.5 : 1.0;
-        }
-        if (std::isinf(right)) {
-            return 0.0;
+inline void shuffle_items(GeneratorCore& generator, unsigned char* data, const std::size_t count,
+                          const std::size_t item_size) {
+    if (count < 2) {
+        return;
+    }
+    const GeneratorLockGuard guard{generator};
+    knuth_b_items(generator.engine(), data, count, item_size);
+}
+
+// Rao-Sandelius blocked shuffle. Each item draws one of 256 buckets from eight
+// bits of an engine word, the items are scattered to the buckets in input
+// order, and each bucket is shuffled the same way until it fits in
+// `blocked_leaf_bytes`, where Knuth-B finishes it in cache. Every pass reads
+// sequentially and writes 256 sequential streams, so large buffers avoid the
+// cache and TLB miss that Knuth-B takes on each swap.
+//
+// After the first scatter every top-level bucket is shuffled by its own
+// engine, seeded from one word of the generator, so buckets may run on
+// separate threads. The seeds are drawn whatever the thread count, which
+// therefore never changes the result.
+inline constexpr std::size_t blocked_bucket_bits = 8;
+inline constexpr std::size_t blocked_buckets = std::size_t{1} << blocked_bucket_bits;
+inline constexpr std::size_t blocked_leaf_bytes = std::size_t{1} << 18;
+
+struct BlockedBuckets {
+    std::array<std::size_t, blocked_buckets + 1> offsets{};
+};
+
+// Labels `count` items, scatters `source` into `target` by label, and returns
+// each bucket's offset.
+inline auto blocked_scatter(Engine& engine, const unsigned char* source,
+                            unsigned char* target, std::uint8_t* labels, const std::size_t count,
+                            const std::size_t item_size) -> BlockedBuckets {
+    constexpr std::size_t labels_per_word = 64 / blocked_bucket_bits;
+    BlockedBuckets buckets;
+    for (std::size_t index = 0; index < count; index += labels_per_word) {
+        std::uint64_t word = engine();
+        const std::size_t stop = std::min(count, index + labels_per_word);
+        for (std::size_t position = index; position < stop; ++position) {
+            labels[position] = static_cast<std::uint8_t>(word);
+            word >>= blocked_bucket_bits;
+            ++buckets.offsets[labels[position] + 1];
         }
-        const double pivot = std::max(left, right);
-        return (left / pivot) / ((left / pivot) + (right / pivot));
     }
-    throw std::overflow_error{"beta sampling did not produce a representable result"};
+    for (std::size_t bucket = 0; bucket < blocked_buckets; ++bucket) {
+        buckets.offsets[bucket + 1] += buckets.offsets[bucket];
+    }
+    std::array<std::size_t, blocked_buckets> next{};
+    std::copy_n(buckets.offsets.begin(), blocked_buckets, next.begin());
+    for (std::size_t position = 0; position < count; ++position) {
+        std::memcpy(target + next[labels[position]]++ * item_size, source + position * item_size,
+                    item_size);
+    }
+    return buckets;
 }
 
-inline auto pareto(GeneratorCore& generator, const double alpha) -> double {
-    return 1.0 / std::pow(1.0 - Storm::canonical(generator.engine()), 1.0 / alpha);
+// Shuffles `data` in place, using `scratch` and `labels` of the same length.
+// A bucket of fewer than two items is finished even when one item exceeds
+// `blocked_leaf_bytes`, since scattering it again cannot make it smaller.
+inline void blocked_items(Engine& engine, unsigned char* data, unsigned char* scratch,
+                          std::uint8_t* labels, const std::size_t count,
+                          const std::size_t item_size) {
+    if (count < 2 || count * item_size <= blocked_leaf_bytes) {
+        knuth_b_items(engine, data, count, item_size);
+        return;
+    }
+    const BlockedBuckets buckets = blocked_scatter(engine, data, scratch, labels, count, item_size);
+    for (std::size_t bucket = 0; bucket < blocked_buckets; ++bucket) {
+        const std::size_t offset = buckets.offsets[bucket];
+        blocked_items(engine, scratch + offset * item_size, data + offset * item_size,
+                      labels + offset, buckets.offsets[bucket + 1] - offset, item_size);
+    }
+    std::memcpy(data, scratch, count * item_size);
 }
 
-inline auto vonmises(GeneratorCore& generator, const double mu, const double kappa) -> double {
-    constexpr double tau = 2.0 * std::numbers::pi;
+inline void blocked_shuffle_items(GeneratorCore& generator, unsigned char* data,
+                                  const std::size_t count, const std::size_t item_size,
+                                  const std::size_t threads) {
+    if (count < 2) {
+        return;
+    }
+    const GeneratorLockGuard guard{generator};
     auto& engine = generator.engine();
-    if (kappa < 1.0e-6) {
-        return tau * Storm::canonical(engine);
+    if (count * item_size <= blocked_leaf_bytes) {
+        knuth_b_items(engine, data, count, item_size);
+        return;
     }
-    // Stable Best-Fisher formulation, including huge finite concentration.
-    const double scale = 0.5 / kappa;
-    const double r = scale + std::sqrt(1.0 + scale * scale);
-    for (;;) {
-        const double z = std::cos(std::numbers::pi * Storm::canonical(engine));
-        const double delta = z / (r + z);
-        const double accept = Storm::canonical(engine);
-        if (accept < 1.0 - delta * delta ||
-            accept <= (1.0 - delta) * std::exp(delta)) {
-            const double inverse = 1.0 / r;
-            const double f = (inverse + z) / (1.0 + inverse * z);
-            double theta = Storm::canonical(engine) < 0.5 ? std::acos(f) : -std::acos(f);
-            theta = std::fmod(theta + mu, tau);
-            return theta < 0.0 ? theta + tau : theta;
+    std::vector<unsigned char> scratch(count * item_size);
+    std::vector<std::uint8_t> labels(count);
+    const BlockedBuckets buckets =
+        blocked_scatter(engine, data, scratch.data(), labels.data(), count, item_size);
+    std::array<std::uint64_t, blocked_buckets> seeds{};
+    for (auto& seed : seeds) {
+        seed = engine();
+    }
+    // Workers claim buckets from a shared counter. If a thread cannot start,
+    // the calling thread still drains every bucket.
+    std::atomic<std::size_t> next_bucket{0};
+    const auto shuffle_buckets = [&] {
+        for (std::size_t bucket = next_bucket++; bucket < blocked_buckets;
+             bucket = next_bucket++) {
+            const std::size_t offset = buckets.offsets[bucket];
+            const std::size_t size = buckets.offsets[bucket + 1] - offset;
+            Engine bucket_engine{seeds[bucket], engine.kind()};
+            blocked_items(bucket_engine, scratch.data() + offset * item_size,
+                          data + offset * item_size, labels.data() + offset, size, item_size);
+            std::memcpy(data + offset * item_size, scratch.data() + offset * item_size,
+                        size * item_size);
+        }
+    };
+    std::vector<std::thread> pool;
+    try {
+        const std::size_t workers = std::min(threads, blocked_buckets);
+        pool.reserve(workers > 0 ? workers - 1 : 0);
+        for (std::size_t worker = 1; worker < workers; ++worker) {
+            pool.emplace_back(shuffle_buckets);
         }
+    } catch (const std::system_error&) {
+    }
+    shuffle_buckets();
+    for (auto& thread : pool) {
+        thread.join();
     }
 }
 
-inline auto plus_or_minus_engine(Storm::engine_type& engine, const std::int64_t radius)
-    -> std::int64_t {
-    return Storm::uniform_integer(engine, -radius, radius);
-}
+// Draws for streaming reservoirs. `skip` and `replace` implement Li's
+// Algorithm L: the threshold W shrinks by U^(1/k) after each replacement, and
+// the number of items passed over before the next one is geometric with
+// success probability W. `key`, `jump`, and `bounded_key` implement
+// Efraimidis and Spirakis's exponential jumps over log keys log(U) / w.
+// Each draw locks the generator on its own, so Python may consume the stream
+// between draws.
+class ReservoirDrawsCore {
+public:
+    explicit ReservoirDrawsCore(const std::uint64_t size) : size_{size} {
+        if (size == 0) {
+            throw std::invalid_argument{"reservoir size must be greater than zero"};
+        }
+    }
 
-inline auto plus_or_minus_triangular_engine(Storm::engine_type& engine,
-                                            const std::int64_t radius)
-    -> std::int64_t {
-    const auto limit = static_cast<std::uint64_t>(radius);
-    const auto left = Storm::uniform_unsigned(engine, 0, limit);
-    const auto right = Storm::uniform_unsigned(engine, 0, limit);
-    if (left >= right) {
-        return static_cast<std::int64_t>(left - right);
+    void start(GeneratorCore& generator) {
+        GeneratorLockGuard guard{generator};
+        start_engine(generator.engine());
     }
-    return -static_cast<std::int64_t>(right - left);
-}
 
-inline auto plus_or_minus_normal_engine(Storm::engine_type& engine, const std::int64_t radius)
-    -> std::int64_t {
-    if (radius == 0) {
-        return 0;
+    auto skip(GeneratorCore& generator) -> std::uint64_t {
+        GeneratorLockGuard guard{generator};
+        return skip_engine(generator.engine());
     }
-    std::normal_distribution<double> distribution{
-        0.0, static_cast<double>(radius) / std::numbers::pi};
-    for (;;) {
-        const double rounded = std::round(distribution(engine));
-        if (rounded < -0x1.0p63 || rounded >= 0x1.0p63) {
-            continue;
+
+    auto replace(GeneratorCore& generator) -> std::uint64_t {
+        GeneratorLockGuard guard{generator};
+        return replace_engine(generator.engine());
+    }
+
+    // Fills `output` with the positions Algorithm L keeps from a sequence of
+    // `population` items, drawing exactly as the streaming calls would.
+    void fill(GeneratorCore& generator, const std::uint64_t population, std::uint64_t* output) {
+        GeneratorLockGuard guard{generator};
+        auto& engine = generator.engine();
+        for (std::uint64_t slot = 0; slot < size_; ++slot) {
+            output[slot] = slot;
         }
-        const auto result = static_cast<std::int64_t>(rounded);
-        if (result >= -radius && result <= radius) {
-            return result;
+        start_engine(engine);
+        for (std::uint64_t last = size_ - 1;;) {
+            const std::uint64_t passed = skip_engine(engine);
+            if (passed >= population - 1 - last) {
+                return;
+            }
+            last += passed + 1;
+            output[replace_engine(engine)] = last;
         }
     }
-}
-
-inline auto plus_or_minus(GeneratorCore& generator, const std::int64_t radius) -> std::int64_t {
-    return plus_or_minus_engine(generator.engine(), radius);
-}
 
-inline auto plus_or_minus_triangular(GeneratorCore& generator, const std::int64_t radius)
-    -> std::int64_t {
-    return plus_or_minus_triangular_engine(generator.engine(), radius);
-}
+    static auto key(GeneratorCore& generator, const double weight) -> double {
+        GeneratorLockGuard guard{generator};
+        return stable_log(ziggurat_open_unit(generator.engine())) / weight;
+    }
 
-inline auto plus_or_minus_normal(GeneratorCore& generator, const std::int64_t radius)
-    -> std::int64_t {
-    return plus_or_minus_normal_engine(generator.engine(), radius);
-}
+    static auto jump(GeneratorCore& generator, const double threshold) -> double {
+        GeneratorLockGuard guard{generator};
+        const double numerator = stable_log(ziggurat_open_unit(generator.engine()));
+        return threshold < 0.0 ? numerator / threshold
+                               : std::numeric_limits<double>::infinity();
+    }
 
-inline auto front_triangular_engine(Storm::engine_type& engine, const std::size_t size)
-    -> std::size_t {
-    return std::min(Storm::uniform_index(engine, size), Storm::uniform_index(engine, size));
-}
+    static auto bounded_key(GeneratorCore& generator, const double weight,
+                            const double threshold) -> double {
+        GeneratorLockGuard guard{generator};
+        const double lower = stable_exp(weight * threshold);
+        const double draw = lower + (1.0 - lower) * ziggurat_open_unit(generator.engine());
+        return draw < 1.0 ? stable_log(draw) / weight : 0.0;
+    }
 
-inline auto back_triangular_engine(Storm::engine_type& engine, const std::size_t size)
-    -> std::size_t {
-    return std::max(Storm::uniform_index(engine, size), Storm::uniform_index(engine, size));
-}
+private:
+    auto shrink(Engine& engine) const -> double {
+        return stable_exp(stable_log(ziggurat_open_unit(engine)) / static_cast<double>(size_));
+    }
 
-inline auto center_triangular_engine(Storm::engine_type& engine, const std::size_t size)
-    -> std::size_t {
-    const auto left = Storm::uniform_index(engine, size);
-    const auto right = Storm::uniform_index(engine, size);
-    return (left & right) + ((left ^ right) >> 1U);
-}
+    void start_engine(Engine& engine) { threshold_ = shrink(engine); }
 
-inline auto front_poisson_engine(Storm::engine_type& engine, const std::size_t size)
-    -> std::size_t {
-    std::poisson_distribution<std::uint64_t> distribution{
-        static_cast<double>(size) / 4.0};
-    for (;;) {
-        const auto sample = distribution(engine);
-        if (sample < static_cast<std::uint64_t>(size)) {
-            return static_cast<std::size_t>(sample);
+    auto skip_engine(Engine& engine) const -> std::uint64_t {
+        const double numerator = stable_log(ziggurat_open_unit(engine));
+        if (!(threshold_ < 1.0)) {
+            return 0;
+        }
+        const double count = std::floor(numerator / stable_log1p(-threshold_));
+        if (!(count < 0x1p63)) {
+            return static_cast<std::uint64_t>(std::numeric_limits<std::int64_t>::max());
         }
+        return static_cast<std::uint64_t>(count);
     }
-}
 
-inline auto front_triangular(GeneratorCore& generator, const std::size_t size) -> std::size_t {
-    return front_triangular_engine(generator.engine(), size);
-}
+    auto replace_engine(Engine& engine) -> std::uint64_t {
+        const auto slot = static_cast<std::uint64_t>(draws::uniform_index(engine, size_));
+        threshold_ *= shrink(engine);
+        return slot;
+    }
 
-inline auto center_triangular(GeneratorCore& generator, const std::size_t size) -> std::size_t {
-    return center_triangular_engine(generator.engine(), size);
-}
+    std::uint64_t size_;
+    double threshold_ = 1.0;
+};
 
-inline auto back_triangular(GeneratorCore& generator, const std::size_t size) -> std::size_t {
-    return back_triangular_engine(generator.engine(), size);
-}
+// A keyed bijection on [0, size) that needs no per-item state. An unbalanced
+// Feistel network permutes the smallest power-of-two domain of at least six
+// bits that covers `size`; each round replaces one half with itself xor a
+// mixed function of the other half and its round key, then swaps the halves.
+// Cycle walking reapplies the network until the value lands back in range.
+// Above 64 values the domain is less than twice `size`, so the expected walk
+// is under two steps. The six-bit floor keeps tiny orders close to uniform,
+// which halves of one or two bits cannot do.
+class FeistelPermutationCore {
+public:
+    static constexpr std::size_t rounds = 8;
 
-inline auto checked_size(const std::uint64_t value) -> std::size_t {
-    if constexpr (std::numeric_limits<std::size_t>::digits < 64) {
-        if (value > static_cast<std::uint64_t>(std::numeric_limits<std::size_t>::max())) {
-            throw std::overflow_error{"value exceeds the platform size domain"};
+    FeistelPermutationCore(const std::uint64_t size, const std::vector<std::uint64_t>& keys)
+        : size_{size} {
+        if (size > static_cast<std::uint64_t>(std::numeric_limits<std::int64_t>::max())) {
+            throw std::overflow_error{"permutation size must fit in a signed 64-bit integer"};
+        }
+        if (keys.size() != rounds) {
+            throw std::invalid_argument{"permutation requires one key per Feistel round"};
         }
+        if (std::ranges::any_of(keys, [](const std::uint64_t key) { return key >> 32 != 0; })) {
+            throw std::invalid_argument{"permutation round keys must fit in 32 bits"};
+        }
+        std::copy(keys.begin(), keys.end(), keys_.begin());
+        const int width = std::max(6, static_cast<int>(std::bit_width(size > 0 ? size - 1 : 0)));
+        low_bits_ = width / 2;
+        high_bits_ = width - low_bits_;
     }
-    return static_cast<std::size_t>(value);
-}
 
-class WideIndexCore {
-public:
-    explicit WideIndexCore(const std::uint64_t size) : selector_{make_module(size)} {}
+    [[nodiscard]] auto size() const noexcept -> std::uint64_t { return size_; }
 
-    WideIndexCore(GeneratorCore& generator, const std::uint64_t size)
-        : selector_{make(generator, size)} {}
+    [[nodiscard]] auto forward(const std::uint64_t index) const -> std::uint64_t {
+        require_member(index, "permutation index out of range");
+        std::uint64_t value = encrypt(index);
+        while (value >= size_) {
+            value = encrypt(value);
+        }
+        return value;
+    }
 
-    auto draw_module() -> std::uint64_t {
-        module_prepare();
-        return static_cast<std::uint64_t>(selector_(module_prepared_engine()));
+    [[nodiscard]] auto inverse(const std::uint64_t value) const -> std::uint64_t {
+        require_member(value, "value is not in the permutation");
+        std::uint64_t index = decrypt(value);
+        while (index >= size_) {
+            index = decrypt(index);
+        }
+        return index;
     }
 
-    auto draw(GeneratorCore& generator) -> std::uint64_t {
-        GeneratorLockGuard guard{generator};
-        return static_cast<std::uint64_t>(selector_(generator.engine()));
+    void fill(const std::uint64_t start, std::uint64_t* output, const std::size_t count) const {
+        if (start > size_ || count > size_ - start) {
+            throw std::out_of_range{"permutation slice out of range"};
+        }
+        for (std::size_t offset = 0; offset < count; ++offset) {
+            std::uint64_t value = encrypt(start + offset);
+            while (value >= size_) {
+                value = encrypt(value);
+            }
+            output[offset] = value;
+        }
     }
 
 private:
-    static auto make_module(const std::uint64_t size) -> Storm::wide_index_selector {
-        module_prepare();
-        return Storm::wide_index_selector{module_prepared_engine(), checked_size(size)};
+    void require_member(const std::uint64_t value, const char* message) const {
+        if (value >= size_) {
+            throw std::out_of_range{message};
+        }
     }
 
-    static auto make(GeneratorCore& generator, const std::uint64_t size)
-        -> Storm::wide_index_selector {
-        GeneratorLockGuard guard{generator};
-        return Storm::wide_index_selector{generator.engine(), checked_size(size)};
+    static constexpr auto mask(const int bits) noexcept -> std::uint64_t {
+        return (std::uint64_t{1} << bits) - 1;
     }
 
-    Storm::wide_index_selector selector_;
-};
-
-class PreparedCumulativeWeightedIndexCore {
-public:
-    explicit PreparedCumulativeWeightedIndexCore(const std::vector<double>& boundaries)
-        : selector_{boundaries} {}
+    // Both halves hold at most 32 bits, so packing a half with its 32-bit key
+    // is injective before the SplitMix64 finalizer mixes it.
+    [[nodiscard]] static constexpr auto round_function(const std::uint64_t half,
+                                                       const std::uint64_t key) noexcept
+        -> std::uint64_t {
+        std::uint64_t mixed = (half << 32) | key;
+        mixed = (mixed ^ (mixed >> 30)) * 0xBF58476D1CE4E5B9ULL;
+        mixed = (mixed ^ (mixed >> 27)) * 0x94D049BB133111EBULL;
+        return mixed ^ (mixed >> 31);
+    }
 
-    auto draw_module() const -> std::uint64_t {
-        module_prepare();
-        return static_cast<std::uint64_t>(selector_(module_prepared_engine()));
+    // The low half carries the round input. After each round the mixed half
+    // becomes the low half, so the two widths alternate.
+    [[nodiscard]] auto encrypt(std::uint64_t value) const noexcept -> std::uint64_t {
+        int low_bits = low_bits_;
+        int high_bits = high_bits_;
+        for (const std::uint64_t key : keys_) {
+            const std::uint64_t low = value & mask(low_bits);
+            const std::uint64_t high = value >> low_bits;
+            value = (low << high_bits) | ((high ^ round_function(low, key)) & mask(high_bits));
+            std::swap(low_bits, high_bits);
+        }
+        return value;
     }
 
-    auto draw(GeneratorCore& generator) const -> std::uint64_t {
-        GeneratorLockGuard guard{generator};
-        return static_cast<std::uint64_t>(selector_(generator.engine()));
+    [[nodiscard]] auto decrypt(std::uint64_t value) const noexcept -> std::uint64_t {
+        int low_bits = rounds % 2 == 0 ? low_bits_ : high_bits_;
+        int high_bits = rounds % 2 == 0 ? high_bits_ : low_bits_;
+        for (auto key = keys_.rbegin(); key != keys_.rend(); ++key) {
+            std::swap(low_bits, high_bits);
+            const std::uint64_t low = value >> high_bits;
+            const std::uint64_t high = (value ^ round_function(low, *key)) & mask(high_bits);
+            value = (high << low_bits) | low;
+        }
+        return value;
     }
 
-private:
-    Storm::PreparedCumulativeWeightedIndex selector_;
+    std::uint64_t size_;
+    std::array<std::uint64_t, rounds> keys_{};
+    int low_bits_ = 1;
+    int high_bits_ = 1;
 };
 
 // The small numeric dispatch surface keeps Cython declarations narrow. These
@@ -629,7 +2197,7 @@ inline auto sample_unsigned_unchecked(GeneratorCore& generator, const int operat
                                       const double parameter) -> std::uint64_t {
     switch (operation) {
         case 0:
-            return Storm::uniform_unsigned(generator.engine(), a, b);
+            return draws::uniform_unsigned(generator.engine(), a, b);
         case 1:
             return static_cast<std::uint64_t>(random_index(generator, checked_size(a)));
         case 2:
@@ -638,13 +2206,8 @@ inline auto sample_unsigned_unchecked(GeneratorCore& generator, const int operat
             return roll_dice(generator, checked_size(a), checked_size(b));
         case 4:
             return ability_dice(generator, checked_size(a));
-        case 5: {
-            const auto result = binomial(generator, a, parameter);
-            if (result == std::numeric_limits<std::uint64_t>::max()) {
-                throw std::overflow_error{"binomial result is not representable"};
-            }
-            return result;
-        }
+        case 5:
+            return binomial(generator, a, parameter);
         case 6: {
             const auto result = negative_binomial(generator, a, parameter);
             if (result == std::numeric_limits<std::uint64_t>::max()) {
@@ -659,13 +2222,8 @@ inline auto sample_unsigned_unchecked(GeneratorCore& generator, const int operat
             }
             return result;
         }
-        case 8: {
-            const auto result = poisson(generator, parameter);
-            if (result == std::numeric_limits<std::uint64_t>::max()) {
-                throw std::overflow_error{"Poisson result is not representable"};
-            }
-            return result;
-        }
+        case 8:
+            return poisson(generator, parameter);
         case 9:
             return static_cast<std::uint64_t>(front_triangular(generator, checked_size(a)));
         case 10:
@@ -677,6 +2235,41 @@ inline auto sample_unsigned_unchecked(GeneratorCore& generator, const int operat
     }
 }
 
+// A validated unsigned operation with its binomial or Poisson constants
+// computed once, for bulk loops and prepared samplers.
+struct UnsignedSetup {
+    int operation = 0;
+    std::uint64_t a = 0;
+    std::uint64_t b = 0;
+    double parameter = 0.0;
+    BinomialSetup binomial{};
+    PoissonSetup poisson{};
+};
+
+inline auto prepare_unsigned(const int operation, const std::uint64_t a, const std::uint64_t b,
+                             const double parameter) -> UnsignedSetup {
+    UnsignedSetup setup{operation, a, b, parameter};
+    if (operation == 5) {
+        setup.binomial = prepare_binomial(a, parameter);
+    } else if (operation == 8) {
+        setup.poisson = prepare_poisson(parameter);
+    }
+    return setup;
+}
+
+inline auto sample_unsigned_prepared(GeneratorCore& generator, const UnsignedSetup& setup)
+    -> std::uint64_t {
+    switch (setup.operation) {
+        case 5:
+            return binomial(generator, setup.binomial);
+        case 8:
+            return poisson(generator, setup.poisson);
+        default:
+            return sample_unsigned_unchecked(generator, setup.operation, setup.a, setup.b,
+                                             setup.parameter);
+    }
+}
+
 inline auto sample_float_unchecked(GeneratorCore& generator, const int operation, const double a,
                                    const double b, const double c) -> double {
     double result = 0.0;
@@ -729,6 +2322,12 @@ inline auto sample_float_unchecked(GeneratorCore& generator, const int operation
         case 15:
             result = student_t(generator, a);
             break;
+        case 16:
+            result = normal_ziggurat(generator, a, b);
+            break;
+        case 17:
+            result = exponential_ziggurat(generator, a);
+            break;
         default:
             throw std::invalid_argument{"unknown floating sampling operation"};
     }
@@ -895,6 +2494,7 @@ inline void validate_float(const int operation, const double a, const double b,
             }
             return;
         case 6:
+        case 17:
             require_positive(a, "exponential rate must be finite and greater than zero");
             if (1.0 / a > max_floating_mean) {
                 throw std::overflow_error{"exponential mean is not safely representable"};
@@ -916,6 +2516,7 @@ inline void validate_float(const int operation, const double a, const double b,
             return;
         case 9:
         case 10:
+        case 16:
             require_finite(a, "distribution mean must be finite");
             require_finite(b, "distribution deviation must be finite");
             if (b < 0.0) {
@@ -927,7 +2528,7 @@ inline void validate_float(const int operation, const double a, const double b,
                 }
                 return;
             }
-            if (operation == 9 &&
+            if (operation != 10 &&
                 std::fabs(static_cast<long double>(a)) + 12.0L * b >
                     std::numeric_limits<double>::max()) {
                 throw std::overflow_error{"normal parameters exceed the representable safety margin"};
@@ -983,19 +2584,19 @@ inline void validate_bool(const int operation, const double parameter) {
 // thread-local owner before entering these functions, while explicit-generator
 // calls hold the generator lock across fork preparation, validation, and draw.
 inline auto module_random_below_prepared(const std::uint64_t high) -> std::uint64_t {
-    return Storm::uniform_unsigned(module_prepared_engine(), 0, high);
+    return draws::uniform_unsigned(module_prepared_engine(), 0, high);
 }
 
 inline auto generator_random_below(GeneratorCore& generator, const std::uint64_t high)
     -> std::uint64_t {
     const GeneratorLockGuard guard{generator};
-    return Storm::uniform_unsigned(generator.engine(), 0, high);
+    return draws::uniform_unsigned(generator.engine(), 0, high);
 }
 
 inline auto module_random_index_prepared(const std::uint64_t size) -> std::uint64_t {
     validate_unsigned(1, size, 0, 0.0);
     return static_cast<std::uint64_t>(
-        Storm::uniform_index(module_prepared_engine(), checked_size(size)));
+        draws::uniform_index(module_prepared_engine(), checked_size(size)));
 }
 
 inline auto generator_random_index(GeneratorCore& generator, const std::uint64_t size)
@@ -1008,7 +2609,7 @@ inline auto generator_random_index(GeneratorCore& generator, const std::uint64_t
 inline auto module_random_int_prepared(const std::int64_t low, const std::int64_t high)
     -> std::int64_t {
     validate_signed(0, low, high, 0);
-    return Storm::uniform_integer(module_prepared_engine(), low, high);
+    return draws::uniform_integer(module_prepared_engine(), low, high);
 }
 
 inline auto generator_random_int(GeneratorCore& generator, const std::int64_t low,
@@ -1021,7 +2622,7 @@ inline auto generator_random_int(GeneratorCore& generator, const std::int64_t lo
 inline auto module_random_range_prepared(const std::int64_t start, const std::int64_t stop,
                                          const std::int64_t step) -> std::int64_t {
     validate_signed(1, start, stop, step);
-    return Storm::random_range(module_prepared_engine(), start, stop, step);
+    return draws::random_range(module_prepared_engine(), start, stop, step);
 }
 
 inline auto generator_random_range(GeneratorCore& generator, const std::int64_t start,
@@ -1035,7 +2636,7 @@ inline auto generator_random_range(GeneratorCore& generator, const std::int64_t
 inline auto module_roll_die_prepared(const std::uint64_t sides) -> std::uint64_t {
     validate_unsigned(2, sides, 0, 0.0);
     return static_cast<std::uint64_t>(
-        Storm::roll_die(module_prepared_engine(), checked_size(sides)));
+        draws::roll_die(module_prepared_engine(), checked_size(sides)));
 }
 
 inline auto generator_roll_die(GeneratorCore& generator, const std::uint64_t sides)
@@ -1048,7 +2649,7 @@ inline auto generator_roll_die(GeneratorCore& generator, const std::uint64_t sid
 inline auto module_roll_dice_prepared(const std::uint64_t rolls, const std::uint64_t sides)
     -> std::uint64_t {
     validate_unsigned(3, rolls, sides, 0.0);
-    return Storm::roll_dice(module_prepared_engine(), checked_size(rolls), checked_size(sides));
+    return draws::roll_dice(module_prepared_engine(), checked_size(rolls), checked_size(sides));
 }
 
 inline auto generator_roll_dice(GeneratorCore& generator, const std::uint64_t rolls,
@@ -1157,7 +2758,7 @@ inline auto module_triangular_prepared(const double low, const double high, cons
         return low;
     }
     const double span = high - low;
-    const double value = Storm::canonical(module_prepared_engine());
+    const double value = draws::canonical(module_prepared_engine());
     const double fraction = (mode - low) / span;
     const double result = value > fraction
                               ? high - span * std::sqrt((1.0 - value) * (1.0 - fraction))
@@ -1276,4 +2877,95 @@ inline auto sample_bool(GeneratorCore& generator, const int operation, const dou
     return sample_bool_unchecked(generator, operation, parameter);
 }
 
+// Fills `count` values in chunks of `chunk`. Chunk i is drawn from its own
+// generator of the same engine kind, seeded with seeds[i], exactly as a
+// sequential bulk call on that generator would fill it, so the output depends
+// on the seeds and the chunk size but never on `threads`. Workers claim chunks from a shared counter;
+// the first exception stops them and is rethrown after every worker joins.
+template <typename Value, typename Draw>
+inline void parallel_chunks(const std::uint64_t* seeds, Value* output, const std::size_t count,
+                            const std::size_t chunk, const std::size_t threads,
+                            const EngineKind kind, const Draw& draw) {
+    const std::size_t chunks = count == 0 ? 0 : (count - 1) / chunk + 1;
+    std::atomic<std::size_t> next_chunk{0};
+    std::atomic<bool> failed{false};
+    std::exception_ptr failure;
+    std::mutex failure_mutex;
+    const auto fill_chunks = [&] {
+        for (std::size_t index = next_chunk++; index < chunks && !failed; index = next_chunk++) {
+            try {
+                GeneratorCore generator{seeds[index], false, kind};
+                const std::size_t stop = std::min(count, (index + 1) * chunk);
+                for (std::size_t position = index * chunk; position < stop; ++position) {
+                    output[position] = draw(generator);
+                }
+            } catch (...) {
+                const std::lock_guard lock{failure_mutex};
+                if (!failure) {
+                    failure = std::current_exception();
+                }
+                failed = true;
+            }
+        }
+    };
+    std::vector<std::thread> pool;
+    try {
+        const std::size_t workers = std::min(threads, chunks);
+        pool.reserve(workers > 0 ? workers - 1 : 0);
+        for (std::size_t worker = 1; worker < workers; ++worker) {
+            pool.emplace_back(fill_chunks);
+        }
+    } catch (const std::system_error&) {
+    }
+    fill_chunks();
+    for (auto& thread : pool) {
+        thread.join();
+    }
+    if (failure) {
+        std::rethrow_exception(failure);
+    }
+}
+
+inline void parallel_fill_signed(const std::uint64_t* seeds, std::int64_t* output,
+                                 const std::size_t count, const std::size_t chunk,
+                                 const std::size_t threads, const int engine, const int operation,
+                                 const std::int64_t a, const std::int64_t b,
+                                 const std::int64_t c) {
+    parallel_chunks(seeds, output, count, chunk, threads, engine_kind(engine),
+                    [&](GeneratorCore& generator) {
+                        return sample_signed_unchecked(generator, operation, a, b, c);
+                    });
+}
+
+inline void parallel_fill_unsigned(const std::uint64_t* seeds, std::uint64_t* output,
+                                   const std::size_t count, const std::size_t chunk,
+                                   const std::size_t threads, const int engine,
+                                   const UnsignedSetup& setup) {
+    parallel_chunks(seeds, output, count, chunk, threads, engine_kind(engine),
+                    [&](GeneratorCore& generator) {
+                        return sample_unsigned_prepared(generator, setup);
+                    });
+}
+
+inline void parallel_fill_float(const std::uint64_t* seeds, double* output,
+                                const std::size_t count, const std::size_t chunk,
+                                const std::size_t threads, const int engine, const int operation,
+                                const double a, const double b, const double c) {
+    parallel_chunks(seeds, output, count, chunk, threads, engine_kind(engine),
+                    [&](GeneratorCore& generator) {
+                        return sample_float_unchecked(generator, operation, a, b, c);
+                    });
+}
+
+inline void parallel_fill_bool(const std::uint64_t* seeds, std::uint8_t* output,
+                               const std::size_t count, const std::size_t chunk,
+                               const std::size_t threads, const int engine, const int operation,
+                               const double parameter) {
+    parallel_chunks(seeds, output, count, chunk, threads, engine_kind(engine),
+                    [&](GeneratorCore& generator) {
+                        return static_cast<std::uint8_t>(
+                            sample_bool_unchecked(generator, operation, parameter));
+                    });
+}
+
 }  // namespace FortunaCore
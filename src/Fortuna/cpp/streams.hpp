@@ -0,0 +1,158 @@
+// SPDX-License-Identifier: MIT
+#pragma once
+
+#include <algorithm>
+#include <array>
+#include <bit>
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+
+namespace FortunaCore {
+
+// SHA-256 (FIPS 180-4), enough of it to hash stream payloads without building
+// Python bytes objects.
+class Sha256 {
+public:
+    void update(const unsigned char* data, std::size_t size) noexcept {
+        length_ += size;
+        while (size != 0) {
+            const std::size_t taken = std::min(size, block_.size() - filled_);
+            std::memcpy(block_.data() + filled_, data, taken);
+            filled_ += taken;
+            data += taken;
+            size -= taken;
+            if (filled_ == block_.size()) {
+                compress();
+                filled_ = 0;
+            }
+        }
+    }
+
+    void update_byte(const unsigned char byte) noexcept { update(&byte, 1); }
+
+    void update_big_endian(const std::uint64_t value) noexcept {
+        std::array<unsigned char, 8> bytes{};
+        for (std::size_t index = 0; index < bytes.size(); ++index) {
+            bytes[index] = static_cast<unsigned char>(value >> (56U - 8U * index));
+        }
+        update(bytes.data(), bytes.size());
+    }
+
+    // The first eight digest bytes as a big-endian integer.
+    [[nodiscard]] auto leading_word() noexcept -> std::uint64_t {
+        const std::uint64_t bits = length_ * 8U;
+        block_[filled_++] = 0x80;
+        if (filled_ > block_.size() - 8) {
+            std::fill(block_.begin() + static_cast<std::ptrdiff_t>(filled_), block_.end(), 0);
+            compress();
+            filled_ = 0;
+        }
+        std::fill(block_.begin() + static_cast<std::ptrdiff_t>(filled_), block_.end() - 8, 0);
+        for (std::size_t index = 0; index < 8; ++index) {
+            block_[block_.size() - 8 + index] =
+                static_cast<unsigned char>(bits >> (56U - 8U * index));
+        }
+        compress();
+        return (static_cast<std::uint64_t>(state_[0]) << 32U) | state_[1];
+    }
+
+private:
+    void compress() noexcept {
+        static constexpr std::array<std::uint32_t, 64> rounds{
+            0x428A2F98, 0x71374491, 0xB5C0FBCF, 0xE9B5DBA5, 0x3956C25B, 0x59F111F1, 0x923F82A4,
+            0xAB1C5ED5, 0xD807AA98, 0x12835B01, 0x243185BE, 0x550C7DC3, 0x72BE5D74, 0x80DEB1FE,
+            0x9BDC06A7, 0xC19BF174, 0xE49B69C1, 0xEFBE4786, 0x0FC19DC6, 0x240CA1CC, 0x2DE92C6F,
+            0x4A7484AA, 0x5CB0A9DC, 0x76F988DA, 0x983E5152, 0xA831C66D, 0xB00327C8, 0xBF597FC7,
+            0xC6E00BF3, 0xD5A79147, 0x06CA6351, 0x14292967, 0x27B70A85, 0x2E1B2138, 0x4D2C6DFC,
+            0x53380D13, 0x650A7354, 0x766A0ABB, 0x81C2C92E, 0x92722C85, 0xA2BFE8A1, 0xA81A664B,
+            0xC24B8B70, 0xC76C51A3, 0xD192E819, 0xD6990624, 0xF40E3585, 0x106AA070, 0x19A4C116,
+            0x1E376C08, 0x2748774C, 0x34B0BCB5, 0x391C0CB3, 0x4ED8AA4A, 0x5B9CCA4F, 0x682E6FF3,
+            0x748F82EE, 0x78A5636F, 0x84C87814, 0x8CC70208, 0x90BEFFFA, 0xA4506CEB, 0xBEF9A3F7,
+            0xC67178F2};
+        std::array<std::uint32_t, 64> schedule{};
+        for (std::size_t index = 0; index < 16; ++index) {
+            schedule[index] = (static_cast<std::uint32_t>(block_[4 * index]) << 24U) |
+                              (static_cast<std::uint32_t>(block_[4 * index + 1]) << 16U) |
+                              (static_cast<std::uint32_t>(block_[4 * index + 2]) << 8U) |
+                              block_[4 * index + 3];
+        }
+        for (std::size_t index = 16; index < 64; ++index) {
+            const std::uint32_t early = schedule[index - 15];
+            const std::uint32_t late = schedule[index - 2];
+            schedule[index] = schedule[index - 16] + schedule[index - 7] +
+                              (std::rotr(early, 7) ^ std::rotr(early, 18) ^ (early >> 3U)) +
+                              (std::rotr(late, 17) ^ std::rotr(late, 19) ^ (late >> 10U));
+        }
+        auto [a, b, c, d, e, f, g, h] = state_;
+        for (std::size_t index = 0; index < 64; ++index) {
+            const std::uint32_t first = h +
+                                        (std::rotr(e, 6) ^ std::rotr(e, 11) ^ std::rotr(e, 25)) +
+                                        ((e & f) ^ (~e & g)) + rounds[index] + schedule[index];
+            const std::uint32_t second =
+                (std::rotr(a, 2) ^ std::rotr(a, 13) ^ std::rotr(a, 22)) +
+                ((a & b) ^ (a & c) ^ (b & c));
+            h = g;
+            g = f;
+            f = e;
+            e = d + first;
+            d = c;
+            c = b;
+            b = a;
+            a = first + second;
+        }
+        state_[0] += a;
+        state_[1] += b;
+        state_[2] += c;
+        state_[3] += d;
+        state_[4] += e;
+        state_[5] += f;
+        state_[6] += g;
+        state_[7] += h;
+    }
+
+    std::array<std::uint32_t, 8> state_{0x6A09E667, 0xBB67AE85, 0x3C6EF372, 0xA54FF53A,
+                                        0x510E527F, 0x9B05688C, 0x1F83D9AB, 0x5BE0CD19};
+    std::array<unsigned char, 64> block_{};
+    std::size_t filled_{0};
+    std::uint64_t length_{0};
+};
+
+// The for_stream seed: the leading word of SHA-256 over the versioned domain
+// prefix, the big-endian root, and the typed identifier. An identifier is its
+// tag ('i', 's', or 'b'), an integer's sign ('+' or '-'), the big-endian length
+// of `data`, and `data`: an integer's minimal big-endian magnitude (one byte
+// for zero), a string's UTF-8, or the bytes themselves. A zero `sign` is
+// omitted.
+inline auto stream_seed(const std::uint64_t root, const unsigned char tag, const unsigned char sign,
+                        const unsigned char* data, const std::size_t size) noexcept
+    -> std::uint64_t {
+    static constexpr char prefix[] = "Fortuna\0" "6.0\0" "for_stream";
+    Sha256 hash;
+    hash.update(reinterpret_cast<const unsigned char*>(prefix), sizeof(prefix));
+    hash.update_big_endian(root);
+    hash.update_byte(tag);
+    if (sign != 0) {
+        hash.update_byte(sign);
+    }
+    hash.update_big_endian(size);
+    hash.update(data, size);
+    return hash.leading_word();
+}
+
+// The seed for a signed 64-bit integer identifier.
+inline auto stream_seed_integer(const std::uint64_t root, const std::int64_t stream_id) noexcept
+    -> std::uint64_t {
+    const std::uint64_t magnitude =
+        stream_id < 0 ? ~static_cast<std::uint64_t>(stream_id) + 1U
+                      : static_cast<std::uint64_t>(stream_id);
+    const std::size_t size =
+        magnitude == 0 ? 1U : static_cast<std::size_t>((std::bit_width(magnitude) + 7) / 8);
+    std::array<unsigned char, 8> bytes{};
+    for (std::size_t index = 0; index < size; ++index) {
+        bytes[index] = static_cast<unsigned char>(magnitude >> (8U * (size - 1 - index)));
+    }
+    return stream_seed(root, 'i', stream_id < 0 ? '-' : '+', bytes.data(), size);
+}
+
+}  // namespace FortunaCore
@@ -1,5 +1,10 @@
+import array
+import copy
+import hashlib
 import inspect
+import itertools
 import math
+import pickle
 import subprocess
 import sys
 import threading
@@ -19,8 +24,8 @@ def test_version_and_seed_zero_are_deterministic():
 
 
 def test_generator_constructor_exposes_its_runtime_signature():
-    assert Fortuna.Generator.__text_signature__ == "(seed=0)"
-    assert str(inspect.signature(Fortuna.Generator)) == "(seed=0)"
+    assert Fortuna.Generator.__text_signature__ == "(seed=0, *, engine='mt19937_64')"
+    assert str(inspect.signature(Fortuna.Generator)) == "(seed=0, *, engine='mt19937_64')"
     assert (
         Fortuna.Generator.__doc__
         == "Owned random engine with deterministic and entropy construction modes."
@@ -330,6 +335,103 @@ def test_stream_derivation_is_stable_and_type_domain_separated():
         Fortuna.for_stream(42, True)
 
 
+def _reference_stream_seed(root_seed, stream_id):
+    if isinstance(stream_id, int):
+        magnitude = abs(stream_id).to_bytes(max(1, (abs(stream_id).bit_length() + 7) // 8), "big")
+        sign = b"-" if stream_id < 0 else b"+"
+        identifier = b"i" + sign + len(magnitude).to_bytes(8, "big") + magnitude
+    elif isinstance(stream_id, str):
+        encoded = stream_id.encode("utf-8")
+        identifier = b"s" + len(encoded).to_bytes(8, "big") + encoded
+    else:
+        identifier = b"b" + len(stream_id).to_bytes(8, "big") + stream_id
+    payload = b"Fortuna\x006.0\x00for_stream\x00" + root_seed.to_bytes(8, "big") + identifier
+    return int.from_bytes(hashlib.sha256(payload).digest()[:8], "big")
+
+
+STREAM_IDS = (
+    0,
+    255,
+    -256,
+    2**63 - 1,
+    -(2**63),
+    2**63,
+    -(2**200),
+    "",
+    "worker-3",
+    "\u00e9\u2014" * 40,
+    b"",
+    b"\x00" * 100,
+)
+
+
+@pytest.mark.parametrize("engine", ["mt19937_64", "philox4x64"])
+def test_batch_stream_derivation_matches_scalar_streams(engine):
+    root = 2**64 - 1
+    streams = Fortuna.for_streams(root, iter(STREAM_IDS), engine=engine)
+
+    for stream, stream_id in zip(streams, STREAM_IDS, strict=True):
+        expected = Fortuna.Generator(_reference_stream_seed(root, stream_id), engine=engine)
+        scalar = Fortuna.for_stream(root, stream_id, engine=engine)
+        assert stream.engine == engine
+        assert stream.random_below(2**64, count=4) == expected.random_below(2**64, count=4)
+        assert scalar.random_below(2**64, count=4) == Fortuna.Generator(
+            _reference_stream_seed(root, stream_id), engine=engine
+        ).random_below(2**64, count=4)
+    assert Fortuna.for_streams(1, []) == []
+
+
+def test_batch_stream_derivation_builds_subclasses_and_rejects_invalid_ids():
+    class Streamed(Fortuna.Generator):
+        pass
+
+    streams = Streamed.for_streams(42, range(3))
+    assert [type(stream) for stream in streams] == [Streamed] * 3
+    with pytest.raises(TypeError, match="not bool"):
+        Fortuna.for_streams(42, [1, True])
+    with pytest.raises(TypeError, match="int, str, or bytes"):
+        Fortuna.for_streams(42, ["a", 1.0])
+    with pytest.raises(ValueError, match="engine must be"):
+        Fortuna.for_streams(42, [1], engine="mt")
+    with pytest.raises(OverflowError, match="root_seed"):
+        Fortuna.for_streams(2**64, [1])
+
+
+@pytest.mark.parametrize("engine", ["mt19937_64", "sfc64"])
+def test_spawned_children_are_streams_of_one_root_draw(engine):
+    parent = Fortuna.Generator(74, engine=engine)
+    control = Fortuna.Generator(74, engine=engine)
+
+    children = parent.spawn(5)
+    root = control.random_below(2**64)
+    assert [child.engine for child in children] == [engine] * 5
+    assert [child.random_below(2**64) for child in children] == [
+        Fortuna.for_stream(root, index, engine=engine).random_below(2**64) for index in range(5)
+    ]
+    assert parent.random_below(2**64) == control.random_below(2**64)
+    grandchildren = children[0].spawn(2)
+    assert len({child.random_below(2**64) for child in grandchildren}) == 2
+
+
+def test_spawn_matches_parallel_chunks_and_validates_first():
+    class Spawned(Fortuna.Generator):
+        pass
+
+    children = Fortuna.Generator(75).spawn(4)
+    drawn = Fortuna.Generator(75).parallel("d", 20, count=400, chunk=100)
+    assert drawn == [value for child in children for value in child.d(20, count=100)]
+    assert all(type(child) is Spawned for child in Spawned(75).spawn(2))
+
+    generator = Fortuna.Generator(76)
+    control = Fortuna.Generator(76)
+    assert generator.spawn(0) == []
+    with pytest.raises(ValueError, match="n must be nonnegative"):
+        generator.spawn(-1)
+    with pytest.raises(TypeError, match="n must be an integer"):
+        generator.spawn(2.0)
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
 def test_degenerate_distributions_have_deliberate_behavior():
     generator = Fortuna.Generator(3)
     maximum = float.fromhex("0x1.fffffffffffffp+1023")
@@ -572,6 +674,155 @@ def test_module_random_value_materialized_rejects_nonexact_containers():
         Fortuna._core._random_value_materialized(TupleSubclass((1,)))
 
 
+def _knuth_b_order(seed, size):
+    expected = list(range(size))
+    control = Fortuna.Generator(seed)
+    for position in range(size - 2, -1, -1):
+        other = position + control.random_index(size - position)
+        expected[position], expected[other] = expected[other], expected[position]
+    return expected, control.random_below(2**64)
+
+
+@pytest.mark.parametrize("typecode", ["b", "h", "i", "q", "d"])
+@pytest.mark.parametrize("size", [0, 1, 2, 10, 257, 1_000])
+def test_buffer_shuffle_uses_the_sequence_schedule(typecode, size):
+    seed = 0xF07A_6018 + size
+    expected, expected_next = _knuth_b_order(seed, size)
+    values = [value % 100 for value in range(size)]
+
+    buffer = array.array(typecode, values)
+    generator = Fortuna.Generator(seed)
+    generator.shuffle(buffer)
+    assert list(buffer) == [values[index] for index in expected]
+    assert generator.random_below(2**64) == expected_next
+
+    data = bytearray(value % 256 for value in range(size))
+    Fortuna.seed(seed)
+    Fortuna.shuffle(data)
+    assert list(data) == [index % 256 for index in expected]
+    assert Fortuna.random_below(2**64) == expected_next
+
+
+def test_buffer_shuffle_moves_whole_rows():
+    expected, _ = _knuth_b_order(0xF07A_6019, 10)
+    rows = [[3 * row, 3 * row + 1, 3 * row + 2] for row in range(10)]
+
+    matrix = memoryview(array.array("q", range(30))).cast("B").cast("q", (10, 3))
+    Fortuna.Generator(0xF07A_6019).shuffle(matrix)
+    assert matrix.tolist() == [rows[index] for index in expected]
+
+    flat = array.array("q", range(30))
+    Fortuna.Generator(0xF07A_6019).shuffle(flat, item_size=24)
+    assert flat.tolist() == [value for index in expected for value in rows[index]]
+
+    records = bytearray(range(30))
+    Fortuna.seed(0xF07A_6019)
+    Fortuna.shuffle(records, item_size=3)
+    assert list(records) == [value for index in expected for value in rows[index]]
+
+
+@pytest.mark.parametrize("strategy", ["knuth_b", "blocked"])
+def test_buffer_shuffle_of_zero_width_rows_does_nothing(strategy):
+    numpy = pytest.importorskip("numpy")
+    generator = Fortuna.Generator(0xF07A_6018)
+    control = Fortuna.Generator(0xF07A_6018)
+    rows = numpy.zeros((3, 0))
+
+    generator.shuffle(rows, strategy=strategy)
+    generator.shuffle(bytearray(), strategy=strategy)
+    Fortuna.shuffle(numpy.zeros((4, 0), dtype=numpy.int64))
+
+    assert rows.shape == (3, 0)
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+@pytest.mark.parametrize("item_size", [1, 8, 24])
+def test_blocked_shuffle_is_a_permutation_independent_of_thread_count(item_size):
+    # 300_000 bytes exceeds the 256 KiB Knuth-B leaf, so buckets are used.
+    template = bytes(value % 251 for value in range(300_000))
+    rows = [template[start : start + item_size] for start in range(0, len(template), item_size)]
+    results = []
+    for threads in (1, 3, 300):
+        data = bytearray(template)
+        generator = Fortuna.Generator(0xF07A_6019)
+        generator.shuffle(data, item_size=item_size, strategy="blocked", threads=threads)
+        results.append((bytes(data), generator.random_below(2**64)))
+    assert results[0] == results[1] == results[2]
+
+    shuffled = results[0][0]
+    assert shuffled != template
+    assert sorted(
+        shuffled[start : start + item_size] for start in range(0, len(shuffled), item_size)
+    ) == sorted(rows)
+
+    data = bytearray(template)
+    Fortuna.seed(0xF07A_6019)
+    Fortuna.shuffle(data, item_size=item_size, strategy="blocked", threads=2)
+    assert (bytes(data), Fortuna.random_below(2**64)) == results[0]
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_blocked_shuffle_finishes_items_larger_than_the_leaf(threads):
+    # Each 300_000-byte item alone exceeds the 256 KiB leaf, so single-item
+    # buckets must stop splitting.
+    item_size = 300_000
+    rows = [bytes([row]) * item_size for row in range(4)]
+    data = bytearray(b"".join(rows))
+    Fortuna.Generator(5).shuffle(data, item_size=item_size, strategy="blocked", threads=threads)
+    assert sorted(data[start : start + item_size] for start in range(0, len(data), 300_000)) == rows
+
+    data = bytearray(b"".join(rows[:2]))
+    Fortuna.shuffle(data, item_size=item_size, strategy="blocked")
+    assert sorted(data[start : start + item_size] for start in (0, item_size)) == rows[:2]
+
+
+def test_blocked_shuffle_of_a_cache_sized_buffer_is_knuth_b():
+    expected, expected_next = _knuth_b_order(0xF07A_6020, 1_000)
+    values = array.array("q", range(1_000))
+    generator = Fortuna.Generator(0xF07A_6020)
+    generator.shuffle(values, strategy="blocked", threads=4)
+    assert values.tolist() == expected
+    assert generator.random_below(2**64) == expected_next
+
+
+def test_invalid_shuffle_strategy_does_not_advance_generator():
+    generator = Fortuna.Generator(55)
+    control = Fortuna.Generator(55)
+    with pytest.raises(ValueError, match="strategy must be 'knuth_b' or 'blocked'"):
+        generator.shuffle(bytearray(10), strategy="merge")
+    with pytest.raises(TypeError, match="strategy must be a str"):
+        generator.shuffle(bytearray(10), strategy=None)
+    with pytest.raises(ValueError, match="threads must be positive"):
+        generator.shuffle(bytearray(10), strategy="blocked", threads=0)
+    with pytest.raises(ValueError, match="threads requires strategy='blocked'"):
+        generator.shuffle(bytearray(10), threads=2)
+    with pytest.raises(TypeError, match="writable buffer"):
+        generator.shuffle([1, 2, 3], strategy="blocked")
+    with pytest.raises(TypeError, match="writable buffer"):
+        Fortuna.shuffle([1, 2, 3], strategy="blocked")
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+def test_invalid_buffer_shuffle_does_not_advance_generator():
+    generator = Fortuna.Generator(55)
+    control = Fortuna.Generator(55)
+    with pytest.raises(TypeError, match="writable buffer"):
+        generator.shuffle(b"abc")
+    with pytest.raises(TypeError, match="writable buffer"):
+        generator.shuffle([1, 2, 3], item_size=8)
+    with pytest.raises(ValueError, match="C-contiguous"):
+        generator.shuffle(memoryview(bytearray(10))[::2])
+    with pytest.raises(ValueError, match="item_size must be positive"):
+        generator.shuffle(bytearray(10), item_size=0)
+    with pytest.raises(ValueError, match="item_size must be nonnegative"):
+        generator.shuffle(bytearray(10), item_size=-1)
+    with pytest.raises(TypeError, match="item_size must be an integer"):
+        generator.shuffle(bytearray(10), item_size=1.0)
+    with pytest.raises(ValueError, match="divide the buffer length"):
+        generator.shuffle(bytearray(10), item_size=3)
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
 def test_invalid_shuffle_does_not_advance_generator():
     generator = Fortuna.Generator(55)
     control = Fortuna.Generator(55)
@@ -594,6 +845,674 @@ def test_random_below_supports_the_full_uint64_domain():
         generator.random_index(2**64)
 
 
+@pytest.mark.parametrize("size", [0, 1, 7, 8, 9, 64, 1_001])
+def test_raw_bytes_serialize_engine_words_least_significant_byte_first(size):
+    words = Fortuna.Generator(12).random_below(2**64, count=(size + 7) // 8)
+    expected = b"".join(word.to_bytes(8, "little") for word in words)[:size]
+    storage = bytearray(size)
+
+    assert Fortuna.Generator(12).random_bytes(size) == expected
+    Fortuna.Generator(12).fill_bytes(storage)
+    assert storage == expected
+    Fortuna.seed(12)
+    assert Fortuna.random_bytes(size) == expected
+
+
+def test_fill_bytes_accepts_any_contiguous_writable_buffer():
+    storage = array.array("d", [0.0] * 3)
+    Fortuna.Generator(12).fill_bytes(storage)
+    assert storage.tobytes() == Fortuna.Generator(12).random_bytes(24)
+
+    view = memoryview(bytearray(32))[8:16]
+    Fortuna.Generator(12).fill_bytes(view)
+    assert view.tobytes() == Fortuna.Generator(12).random_bytes(8)
+
+
+@pytest.mark.parametrize("size", [0, 1, 7, 8, 9, 64, 1_001])
+def test_packed_bits_share_the_raw_byte_layout(size):
+    expected = bytearray(Fortuna.Generator(12).random_bytes((size + 7) // 8))
+    if size % 8:
+        expected[-1] &= (1 << (size % 8)) - 1
+
+    assert Fortuna.Generator(12).random_bits(size) == expected
+    Fortuna.seed(12)
+    assert Fortuna.random_bits(size) == expected
+
+
+def test_fair_bernoulli_bits_use_one_word_per_sixty_four_bits():
+    size = 130
+    words = Fortuna.Generator(12).random_below(2**64, count=3)
+    inverted = sum((~word & (2**64 - 1)) << (64 * index) for index, word in enumerate(words))
+    generator = Fortuna.Generator(12)
+    control = Fortuna.Generator(12)
+
+    packed = generator.bernoulli_bits(0.5, size)
+    control.random_bits(3 * 64)
+    assert int.from_bytes(packed, "little") == inverted & ((1 << size) - 1)
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+@pytest.mark.parametrize(("probability", "expected"), [(0.0, 0), (1.0, 2**75 - 1)])
+def test_certain_bernoulli_bits_consume_no_entropy(probability, expected):
+    generator = Fortuna.Generator(12)
+    control = Fortuna.Generator(12)
+
+    assert int.from_bytes(generator.bernoulli_bits(probability, 75), "little") == expected
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+@pytest.mark.parametrize(
+    ("call", "error", "message"),
+    [
+        (lambda generator: generator.random_bits(-1), ValueError, "size must be nonnegative"),
+        (
+            lambda generator: generator.bernoulli_bits(1.5, 8),
+            ValueError,
+            r"probability must be in \[0, 1\]",
+        ),
+        (
+            lambda generator: generator.bernoulli_bits(math.nan, 8),
+            ValueError,
+            "probability must be finite",
+        ),
+        (lambda generator: generator.bernoulli_bits(0.5, -1), ValueError, "size must be"),
+        (lambda generator: generator.random_bytes(-1), ValueError, "size must be nonnegative"),
+        (lambda generator: generator.random_bytes(True), TypeError, "size must be an integer"),
+        (lambda generator: generator.random_bytes(1.5), TypeError, "size must be an integer"),
+        (lambda generator: generator.fill_bytes(b"abc"), TypeError, "writable buffer"),
+        (lambda generator: generator.fill_bytes([0]), TypeError, "writable buffer"),
+        (
+            lambda generator: generator.fill_bytes(memoryview(bytearray(8))[::2]),
+            ValueError,
+            "C-contiguous",
+        ),
+    ],
+)
+def test_invalid_raw_byte_requests_do_not_advance(call, error, message):
+    generator = Fortuna.Generator(55)
+    control = Fortuna.Generator(55)
+    with pytest.raises(error, match=message):
+        call(generator)
+    assert generator.random_bytes(0) == b""
+    generator.fill_bytes(bytearray())
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+@pytest.mark.parametrize(
+    ("method", "arguments", "result_type"),
+    [
+        ("d", (20,), int),
+        ("random_below", (-10,), int),
+        ("random_int", (-5, 5), int),
+        ("normal_variate", (0.0, 1.0), float),
+        ("canonical", (), float),
+        ("percent_true", (30.0,), bool),
+    ],
+)
+def test_stream_matches_repeated_scalar_calls_across_chunks(method, arguments, result_type):
+    stream = Fortuna.Generator(31).stream(method, *arguments, chunk=7)
+    control = Fortuna.Generator(31)
+
+    streamed = list(itertools.islice(stream, 20))
+    assert streamed == [getattr(control, method)(*arguments) for _ in range(20)]
+    assert all(type(value) is result_type for value in streamed)
+    assert iter(stream) is stream
+
+
+def test_stream_draws_one_chunk_at_a_time():
+    generator = Fortuna.Generator(32)
+    control = Fortuna.Generator(32)
+    stream = generator.stream("d", 6, chunk=4)
+
+    assert generator.random_below(2**64) == control.random_below(2**64)
+    next(stream)
+    control.d(6, count=4)
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+def test_stream_calls_subclass_overrides_for_every_draw():
+    class Loaded(Fortuna.Generator):
+        def d(self, sides=20, *, count=None, as_buffer=False, out=None):
+            return sides
+
+    assert list(itertools.islice(Loaded(1).stream("d", 6), 3)) == [6, 6, 6]
+
+
+@pytest.mark.parametrize(
+    ("call", "error", "message"),
+    [
+        (lambda generator: generator.stream(3), TypeError, "method must be a str"),
+        (lambda generator: generator.stream("seed"), ValueError, "not a count-aware"),
+        (lambda generator: generator.stream("d", chunk=0), ValueError, "chunk must be positive"),
+        (lambda generator: generator.stream("d", chunk=True), TypeError, "chunk must be an"),
+        (lambda generator: generator.stream("d", 0), ValueError, "greater than zero"),
+        (lambda generator: generator.stream("normal_variate", 0.0, -1.0), ValueError, "deviation"),
+    ],
+)
+def test_invalid_stream_requests_do_not_advance(call, error, message):
+    generator = Fortuna.Generator(56)
+    control = Fortuna.Generator(56)
+    with pytest.raises(error, match=message):
+        call(generator)
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+@pytest.mark.parametrize(
+    ("method", "arguments", "keywords"),
+    [
+        ("random_below", (-10,), {}),
+        ("random_index", (-10,), {}),
+        ("random_range", (10,), {}),
+        ("random_range", (-10, 10), {"step": 3}),
+        ("normal_variate", (), {"mean": 5.0, "std_dev": 2.0}),
+        ("random_float", (), {}),
+    ],
+)
+def test_prepared_sampler_binds_arguments_like_the_method(method, arguments, keywords):
+    sampler = Fortuna.Generator(41).prepare(method, *arguments, **keywords)
+    control = getattr(Fortuna.Generator(41), method)
+
+    assert [sampler() for _ in range(6)] == [control(*arguments, **keywords) for _ in range(6)]
+
+
+def test_prepared_sampler_shares_the_generator_engine():
+    generator = Fortuna.Generator(42)
+    control = Fortuna.Generator(42)
+    sampler = generator.prepare("d", 6)
+
+    assert [sampler(), generator.d(6), sampler()] == control.d(6, count=3)
+
+
+def test_prepared_sampler_serializes_concurrent_draws():
+    sampler = Fortuna.Generator(43).prepare("random_below", 2**64)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        batches = list(executor.map(lambda _: [sampler() for _ in range(2_000)], range(4)))
+
+    drawn = sorted(value for batch in batches for value in batch)
+    assert drawn == sorted(Fortuna.Generator(43).random_below(2**64, count=8_000))
+
+
+def test_prepared_sampler_calls_subclass_overrides():
+    class Loaded(Fortuna.Generator):
+        def d(self, sides=20, *, count=None, as_buffer=False, out=None):
+            return sides if count is None else [sides] * count
+
+    sampler = Loaded(1).prepare("d", 6)
+    assert [sampler(), *sampler.take(2)] == [6, 6, 6]
+
+
+@pytest.mark.parametrize(
+    ("call", "error", "message"),
+    [
+        (lambda generator: generator.prepare(3), TypeError, "method must be a str"),
+        (lambda generator: generator.prepare("shuffle"), ValueError, "not a count-aware"),
+        (lambda generator: generator.prepare("gamma_variate", 2.0), TypeError, "scale"),
+        (lambda generator: generator.prepare("d", 6, count=2), TypeError, "cannot include"),
+        (lambda generator: generator.prepare("d", "6"), TypeError, "sides must be an integer"),
+        (lambda generator: generator.prepare("random_below", 0), ValueError, "nonzero"),
+        (lambda generator: generator.prepare("gamma_variate", -1.0, 1.0), ValueError, "shape"),
+        (lambda generator: generator.prepare("d", 6).take(-1), ValueError, "nonnegative"),
+        (
+            lambda generator: generator.prepare("d", 6).fill(array.array("d", [0.0])),
+            TypeError,
+            "out must hold uint64 values",
+        ),
+    ],
+)
+def test_invalid_prepared_sampler_requests_do_not_advance(call, error, message):
+    generator = Fortuna.Generator(57)
+    control = Fortuna.Generator(57)
+    with pytest.raises(error, match=message):
+        call(generator)
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+def _parallel_chunks(generator, method, arguments, count, chunk):
+    root = generator.random_below(2**64)
+    values = []
+    for index, start in enumerate(range(0, count, chunk)):
+        stream = type(generator).for_stream(root, index)
+        values += getattr(stream, method)(*arguments, count=min(chunk, count - start))
+    return values
+
+
+@pytest.mark.parametrize(
+    ("method", "arguments"),
+    [
+        ("d", (20,)),
+        ("random_below", (-10,)),
+        ("random_below", (-(2**64),)),
+        ("random_index", (-10,)),
+        ("random_int", (-5, 5)),
+        ("normal_variate", (0.0, 1.0)),
+        ("canonical", ()),
+        ("percent_true", (30.0,)),
+        ("poisson_variate", (3.5,)),
+    ],
+)
+def test_parallel_draws_concatenate_for_stream_chunks(method, arguments):
+    generator = Fortuna.Generator(58)
+    control = Fortuna.Generator(58)
+
+    drawn = generator.parallel(method, *arguments, count=1_000, chunk=97, threads=3)
+    assert drawn == _parallel_chunks(control, method, arguments, 1_000, 97)
+    assert generator.random_below(2**64) == control.random_below(2**64)
+    assert type(drawn[0]) is type(getattr(control, method)(*arguments))
+
+
+@pytest.mark.parametrize("threads", [1, 2, 5, 64])
+def test_parallel_draws_do_not_depend_on_thread_count(threads):
+    expected = Fortuna.Generator(59).parallel(
+        "normal_variate", 0.0, 1.0, count=10_000, chunk=512, threads=1
+    )
+
+    drawn = Fortuna.Generator(59).parallel(
+        "normal_variate", 0.0, 1.0, count=10_000, chunk=512, threads=threads
+    )
+    assert drawn == expected
+    assert (
+        Fortuna.Generator(59).parallel("normal_variate", 0.0, 1.0, count=10_000, chunk=500)
+        != expected
+    )
+
+
+def test_parallel_draws_fill_buffers():
+    expected = Fortuna.Generator(60).parallel("random_index", -10, count=300, chunk=64)
+    storage = array.array("q", [0] * 300)
+
+    assert Fortuna.Generator(60).parallel("random_index", -10, out=storage, chunk=64) is storage
+    assert storage.tolist() == expected
+    buffered = Fortuna.Generator(60).parallel(
+        "random_index", -10, count=300, as_buffer=True, chunk=64
+    )
+    assert buffered.typecode == "q"
+    assert buffered.tolist() == expected
+    assert Fortuna.Generator(60).parallel("canonical", count=0) == []
+
+
+def test_parallel_draws_call_subclass_overrides_per_chunk():
+    class Counted(Fortuna.Generator):
+        calls = 0
+
+        def d(self, sides=20, *, count=None, as_buffer=False, out=None):
+            Counted.calls += 1
+            return super().d(sides, count=count, as_buffer=as_buffer, out=out)
+
+    expected = Fortuna.Generator(61).parallel("d", 6, count=300, chunk=64)
+    storage = array.array("Q", [0] * 300)
+
+    assert Counted(61).parallel("d", 6, count=300, chunk=64, threads=2) == expected
+    assert Counted.calls == 6
+    assert Counted(61).parallel("d", 6, out=storage, chunk=64) is storage
+    assert storage.tolist() == expected
+    assert Counted(61).parallel("d", 6, count=300, as_buffer=True, chunk=64).tolist() == expected
+
+
+@pytest.mark.parametrize(
+    ("call", "error", "message"),
+    [
+        (lambda generator: generator.parallel("seed", count=4), ValueError, "not a count-aware"),
+        (lambda generator: generator.parallel("d", 6), TypeError, "requires count or out"),
+        (lambda generator: generator.parallel("d", 0, count=4), ValueError, "greater than zero"),
+        (lambda generator: generator.parallel("d", count=-1), ValueError, "nonnegative"),
+        (lambda generator: generator.parallel("d", count=4, chunk=0), ValueError, "chunk must be"),
+        (lambda generator: generator.parallel("d", count=4, threads=0), ValueError, "threads must"),
+        (
+            lambda generator: generator.parallel("d", count=4, threads=1.0),
+            TypeError,
+            "threads must",
+        ),
+        (
+            lambda generator: generator.parallel("d", count=4, out=array.array("Q", [0] * 2)),
+            ValueError,
+            "count must equal the length of out",
+        ),
+        (
+            lambda generator: generator.parallel("random_below", -(2**64), count=4, as_buffer=True),
+            OverflowError,
+            "signed 64-bit range",
+        ),
+    ],
+)
+def test_invalid_parallel_requests_do_not_advance(call, error, message):
+    generator = Fortuna.Generator(62)
+    control = Fortuna.Generator(62)
+    with pytest.raises(error, match=message):
+        call(generator)
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+def test_parallel_distribution_errors_propagate_from_workers():
+    with pytest.raises(OverflowError, match="not finite"):
+        Fortuna.Generator(63).parallel("pareto_variate", 1e-12, count=100_000, chunk=97, threads=4)
+
+
+ENGINES = ("mt19937_64", "pcg64_dxsm", "xoshiro256++", "sfc64", "philox4x64")
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engines_are_deterministic_and_reseed_in_place(engine):
+    generator = Fortuna.Generator(64, engine=engine)
+    expected = Fortuna.Generator(64, engine=engine).random_below(2**64, count=16)
+
+    assert generator.engine == engine
+    assert generator.random_below(2**64, count=16) == expected
+    generator.seed(64)
+    assert generator.engine == engine
+    assert generator.random_below(2**64, count=16) == expected
+    assert Fortuna.Generator.from_entropy(engine=engine).engine == engine
+
+
+def test_engines_produce_distinct_streams_and_default_to_mersenne_twister():
+    assert Fortuna.Generator(65).engine == "mt19937_64"
+    assert Fortuna.Generator.from_entropy().engine == "mt19937_64"
+    assert Fortuna.for_stream(65, 1).engine == "mt19937_64"
+    assert Fortuna.Generator(65).random_below(2**64, count=8) == Fortuna.Generator(
+        65, engine="mt19937_64"
+    ).random_below(2**64, count=8)
+    streams = {
+        tuple(Fortuna.Generator(65, engine=engine).random_below(2**64, count=8))
+        for engine in ENGINES
+    }
+    assert len(streams) == len(ENGINES)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engine_streams_share_stream_seed_derivation(engine):
+    stream = Fortuna.for_stream(42, "worker-3", engine=engine)
+    same = Fortuna.Generator.for_stream(42, "worker-3", engine=engine)
+
+    assert stream.engine == engine
+    assert stream.random_below(2**64, count=8) == same.random_below(2**64, count=8)
+    assert Fortuna.for_stream(42, "worker-3").random_below(2**64) == 29_152_502_809_120_148
+
+
+@pytest.mark.parametrize(
+    ("call", "error", "message"),
+    [
+        (lambda: Fortuna.Generator(1, engine="pcg64"), ValueError, "engine must be"),
+        (lambda: Fortuna.Generator(1, engine=None), TypeError, "engine must be a str"),
+        (lambda: Fortuna.Generator.from_entropy(engine="xoshiro"), ValueError, "engine must be"),
+        (lambda: Fortuna.for_stream(1, 2, engine=b"sfc64"), TypeError, "engine must be a str"),
+    ],
+)
+def test_invalid_engines_are_rejected(call, error, message):
+    with pytest.raises(error, match=message):
+        call()
+
+
+@pytest.mark.parametrize("engine", ENGINES[1:])
+def test_engines_drive_distributions_selectors_and_parallel_draws(engine):
+    generator = Fortuna.Generator(66, engine=engine)
+    control = Fortuna.Generator(66, engine=engine)
+
+    assert generator.normal_variate(0.0, 1.0, count=4) == control.normal_variate(0.0, 1.0, count=4)
+    assert generator.sample(range(100), 5) == control.sample(range(100), 5)
+    table = [(1, "a"), (2, "b"), (3, "c")]
+    choice = Fortuna.WeightedChoice(table, generator=generator, method="alias")
+    control_choice = Fortuna.WeightedChoice(table, generator=control, method="alias")
+    assert [choice() for _ in range(8)] == [control_choice() for _ in range(8)]
+    values = array.array("q", range(10_000))
+    shuffled = array.array("q", range(10_000))
+    generator.shuffle(values, strategy="blocked", threads=2)
+    control.shuffle(shuffled, strategy="blocked", threads=1)
+    assert values == shuffled
+    assert sorted(values) == list(range(10_000))
+
+    drawn = generator.parallel("d", 20, count=1_000, chunk=97, threads=3)
+    root = control.random_below(2**64)
+    expected = []
+    for index, start in enumerate(range(0, 1_000, 97)):
+        stream = Fortuna.Generator.for_stream(root, index, engine=engine)
+        expected += stream.d(20, count=min(97, 1_000 - start))
+    assert drawn == expected
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+def test_counter_engine_reaches_any_position_directly():
+    words = Fortuna.Generator(68, engine="philox4x64").random_below(2**64, count=64)
+    generator = Fortuna.Generator(68, engine="philox4x64")
+
+    assert generator.position == 0
+    assert generator.at(37) is generator
+    assert generator.position == 37
+    assert generator.random_below(2**64, count=27) == words[37:]
+    assert generator.at(5).advance(6).advance(3) is generator
+    assert generator.position == 14
+    assert generator.random_below(2**64) == words[14]
+
+    partitioned = []
+    for start, stop in ((0, 7), (7, 8), (8, 40), (40, 64)):
+        partitioned += generator.at(start).random_below(2**64, count=stop - start)
+    assert partitioned == words
+
+
+def test_counter_engine_positions_resume_variable_length_draws():
+    generator = Fortuna.Generator(69, engine="philox4x64")
+    generator.normal_variate(0.0, 1.0, count=100)
+    generator.random_index(3**30, count=100)
+    checkpoint = generator.position
+    expected = generator.d(20, count=32)
+
+    assert generator.at(checkpoint).d(20, count=32) == expected
+    assert generator.at(2**64 - 4).advance(2**64 - 1).position == 2**65 - 5
+
+
+@pytest.mark.parametrize("steps", [0, 1, 311, 312, 2**20 - 1, 2**20 + 12_345])
+@pytest.mark.parametrize("drawn", [0, 5, 311])
+def test_mersenne_twister_advance_matches_discarded_words(steps, drawn):
+    generator = Fortuna.Generator(71)
+    control = Fortuna.Generator(71)
+    generator.random_below(2**64, count=drawn)
+    control.random_below(2**64, count=drawn)
+    control.random_bytes(8 * steps)
+
+    assert generator.advance(steps) is generator
+    assert generator.random_below(2**64, count=8) == control.random_below(2**64, count=8)
+
+
+def test_mersenne_twister_jumps_compose():
+    first = Fortuna.Generator(72).advance(2**40).advance(2**40 + 3)
+    assert first.random_below(2**64, count=8) == Fortuna.Generator(72).advance(
+        2**41 + 3
+    ).random_below(2**64, count=8)
+
+    jumped = Fortuna.Generator(72).jump()
+    assert jumped.random_below(2**64, count=8) != Fortuna.Generator(72).random_below(2**64, count=8)
+    entropy = Fortuna.Generator.from_entropy()
+    assert entropy.jump().advance(2**63) is entropy
+
+
+def test_counter_engine_jump_moves_past_every_offset():
+    generator = Fortuna.Generator(73, engine="philox4x64").advance(6)
+    assert generator.jump().position == 2**128 + 6
+    assert generator.random_below(2**64) != Fortuna.Generator(73, engine="philox4x64").at(
+        6
+    ).random_below(2**64)
+
+
+def test_counter_engine_positions_round_trip_past_64_bits():
+    generator = Fortuna.Generator(74, engine="philox4x64").advance(6).jump().jump()
+    checkpoint = generator.position
+    expected = generator.random_below(2**64, count=9)
+
+    assert checkpoint == 2**129 + 6
+    assert generator.at(checkpoint).random_below(2**64, count=9) == expected
+    assert generator.at(0).position == 0
+    assert generator.at(2**130 - 1).position == 2**130 - 1
+    generator.random_below(2**64)
+    assert generator.position == 0
+    assert (
+        generator.at(2**64 + 5).position
+        == Fortuna.Generator(74, engine="philox4x64")
+        .advance(2**63)
+        .advance(2**63)
+        .advance(5)
+        .position
+    )
+
+
+@pytest.mark.parametrize(
+    ("call", "error", "message"),
+    [
+        (lambda generator: generator.at(0), ValueError, "requires a counter-based engine"),
+        (lambda generator: generator.advance(1), ValueError, "requires the mt19937_64 or philox"),
+        (lambda generator: generator.jump(), ValueError, "requires the mt19937_64 or philox"),
+        (lambda generator: generator.position, ValueError, "requires a counter-based engine"),
+        (
+            lambda generator: Fortuna.Generator(1, engine="philox4x64").at(1.0),
+            TypeError,
+            "offset must be an integer",
+        ),
+        (
+            lambda generator: Fortuna.Generator(1, engine="philox4x64").advance(-1),
+            ValueError,
+            "steps must be nonnegative",
+        ),
+        (
+            lambda generator: Fortuna.Generator(1, engine="philox4x64").at(2**130),
+            OverflowError,
+            "offset must be below 2\\*\\*130",
+        ),
+    ],
+)
+def test_invalid_random_access_does_not_advance(call, error, message):
+    generator = Fortuna.Generator(70, engine="sfc64")
+    control = Fortuna.Generator(70, engine="sfc64")
+    with pytest.raises(error, match=message):
+        call(generator)
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+def test_subclass_parallel_streams_keep_the_owner_engine():
+    class Streamed(Fortuna.Generator):
+        pass
+
+    expected = Fortuna.Generator(67, engine="sfc64").parallel("d", 6, count=300, chunk=64)
+    subclassed = Streamed(67, engine="sfc64")
+
+    assert type(Streamed.for_stream(1, 2, engine="sfc64")) is Streamed
+    assert subclassed.parallel("d", 6, count=300, chunk=64) == expected
+    assert _parallel_chunks(Streamed(67), "d", (6,), 300, 64) == Streamed(67).parallel(
+        "d", 6, count=300, chunk=64
+    )
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_state_snapshots_resume_every_engine(engine):
+    generator = Fortuna.Generator(71, engine=engine)
+    generator.random_below(2**64, count=5)
+    state = generator.getstate()
+    expected = generator.random_below(2**64, count=700)
+
+    generator.setstate(state)
+    restored = Fortuna.Generator()
+    restored.setstate(bytearray(state))
+
+    assert state[:8] == b"FRTN\x01" + bytes([ENGINES.index(engine), 0, 0])
+    assert generator.random_below(2**64, count=700) == expected
+    assert restored.engine == engine
+    assert restored.random_below(2**64, count=700) == expected
+
+
+def test_state_snapshot_layout_is_little_endian_words():
+    mersenne = Fortuna.Generator(72)
+    mersenne.random_below(2**64)
+    counter = Fortuna.Generator(72, engine="philox4x64").advance(6)
+
+    assert len(mersenne.getstate()) == 8 + 313 * 8
+    assert mersenne.getstate()[-8:] == (1).to_bytes(8, "little")
+    assert len(Fortuna.Generator(72, engine="sfc64").getstate()) == 40
+    assert counter.getstate()[8:16] == (1).to_bytes(8, "little")
+    assert counter.getstate()[-8:] == (2).to_bytes(8, "little")
+    assert len(counter.getstate()) == 64
+
+
+class _TrackedGenerator(Fortuna.Generator):
+    pass
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_pickle_and_copy_continue_the_same_stream(engine):
+    generator = _TrackedGenerator(73, engine=engine)
+    generator.label = "hero"
+    generator.d(20, count=9)
+    clones = [pickle.loads(pickle.dumps(generator)), copy.copy(generator), copy.deepcopy(generator)]
+    expected = generator.random_below(2**64, count=400)
+
+    for clone in clones:
+        assert type(clone) is _TrackedGenerator
+        assert clone.label == "hero"
+        assert clone.engine == engine
+        assert clone.random_below(2**64, count=400) == expected
+
+
+def test_state_snapshots_write_into_reused_buffers_and_keep_the_entropy_flag():
+    generator = Fortuna.Generator(74, engine="xoshiro256++")
+    buffer = bytearray(len(generator.getstate()))
+    entropy = Fortuna.Generator.from_entropy(engine="sfc64")
+    twin = Fortuna.Generator()
+
+    assert generator.getstate(out=buffer) is buffer
+    assert bytes(buffer) == generator.getstate()
+    expected = generator.random_below(2**64, count=8)
+    generator.setstate(memoryview(buffer))
+    twin.setstate(entropy.getstate())
+
+    assert generator.random_below(2**64, count=8) == expected
+    assert entropy.getstate()[6] == 1
+    assert twin.getstate() == entropy.getstate()
+    assert twin.random_below(2**64, count=8) == entropy.random_below(2**64, count=8)
+
+
+def _edited_state(offset, value):
+    state = bytearray(Fortuna.Generator(75).getstate())
+    state[offset] = value
+    return bytes(state)
+
+
+@pytest.mark.parametrize(
+    ("state", "error", "message"),
+    [
+        (7, TypeError, "state must be a bytes-like object"),
+        ("FRTN", TypeError, "state must be a bytes-like object"),
+        (memoryview(bytes(80))[::2], ValueError, "state must be C-contiguous"),
+        (b"", ValueError, "not a Fortuna generator state"),
+        (_edited_state(0, 0), ValueError, "not a Fortuna generator state"),
+        (_edited_state(4, 2), ValueError, "unsupported generator state version"),
+        (_edited_state(5, 5), ValueError, "unknown engine"),
+        (_edited_state(6, 2), ValueError, "unknown flags"),
+        (_edited_state(5, 3), ValueError, "length does not match its engine"),
+        (Fortuna.Generator(75).getstate()[:-1], ValueError, "length does not match"),
+        (b"FRTN\x01\x00\x00\x00" + bytes(313 * 8), ValueError, "valid mt19937_64 state"),
+        (b"FRTN\x01\x01\x00\x00" + bytes(32), ValueError, "valid pcg64_dxsm state"),
+        (b"FRTN\x01\x02\x00\x00" + bytes(32), ValueError, "valid xoshiro256\\+\\+ state"),
+        (b"FRTN\x01\x04\x00\x00" + bytes(48) + b"\x04" + bytes(7), ValueError, "philox4x64"),
+    ],
+)
+def test_invalid_states_leave_the_generator_unchanged(state, error, message):
+    generator = Fortuna.Generator(76, engine="sfc64")
+    control = Fortuna.Generator(76, engine="sfc64")
+    with pytest.raises(error, match=message):
+        generator.setstate(state)
+    assert generator.engine == "sfc64"
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+def test_invalid_state_buffers_are_rejected_before_drawing():
+    generator = Fortuna.Generator(77, engine="pcg64_dxsm")
+    control = Fortuna.Generator(77, engine="pcg64_dxsm")
+    rejected = [bytearray(39), bytearray(b"\xaa" * 4000)]
+    for out in rejected:
+        with pytest.raises(ValueError, match="out must hold exactly 40 bytes"):
+            generator.getstate(out=out)
+    assert rejected == [bytearray(39), bytearray(b"\xaa" * 4000)]
+    with pytest.raises(TypeError, match="out must be a writable buffer"):
+        generator.getstate(out=bytes(40))
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
 @pytest.mark.parametrize("method", ["random_below", "random_index"])
 @pytest.mark.parametrize("count", [None, 32])
 @pytest.mark.parametrize("owner_kind", ["module", "generator"])
@@ -9,6 +9,7 @@ EXPECTED_ALL = (
     "seed",
     "from_entropy",
     "for_stream",
+    "for_streams",
     "percent_true",
     "bernoulli_variate",
     "random_below",
@@ -44,12 +45,21 @@ EXPECTED_ALL = (
     "front_triangular",
     "center_triangular",
     "back_triangular",
+    "random_bytes",
+    "fill_bytes",
+    "random_bits",
+    "bernoulli_bits",
     "random_value",
     "shuffle",
     "sample",
+    "weighted_sample",
+    "reservoir_sample",
+    "weighted_reservoir_sample",
     "RandomValue",
     "TruffleShuffle",
     "WeightedChoice",
+    "MutableWeightedChoice",
+    "RandomPermutation",
 )
 
 
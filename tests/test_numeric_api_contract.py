@@ -1,6 +1,7 @@
 """Release contract matrix for every count-aware numeric API."""
 
 import inspect
+from array import array
 
 import pytest
 
@@ -44,6 +45,39 @@ API_CASES = (
     ("back_triangular", (100,)),
 )
 
+SIGNED_APIS = {
+    "random_int",
+    "random_range",
+    "plus_or_minus",
+    "plus_or_minus_triangular",
+    "plus_or_minus_normal",
+}
+UNSIGNED_APIS = {
+    "random_below",
+    "random_index",
+    "d",
+    "dice",
+    "ability_dice",
+    "binomial_variate",
+    "negative_binomial_variate",
+    "geometric_variate",
+    "poisson_variate",
+    "front_triangular",
+    "center_triangular",
+    "back_triangular",
+}
+BOOL_APIS = {"percent_true", "bernoulli_variate"}
+
+
+def _buffer_typecode(method):
+    if method in SIGNED_APIS:
+        return "q"
+    if method in UNSIGNED_APIS:
+        return "Q"
+    if method in BOOL_APIS:
+        return "B"
+    return "d"
+
 
 def test_contract_matrix_covers_every_public_count_api():
     expected = {method for method, _ in API_CASES}
@@ -58,6 +92,7 @@ def test_contract_matrix_covers_every_public_count_api():
         name
         for name in dir(Fortuna.Generator)
         if not name.startswith("_")
+        and name != "parallel"
         and callable(method := getattr(Fortuna.Generator, name))
         and "count" in inspect.signature(method).parameters
     }
@@ -140,3 +175,369 @@ def test_module_invalid_count_is_consistent_and_side_effect_free(
     with pytest.raises(error, match=message):
         getattr(Fortuna, method)(*arguments, count=count)
     assert Fortuna.random_below(2**64) == control.random_below(2**64)
+
+
+@pytest.mark.parametrize(("method", "arguments"), API_CASES, ids=[case[0] for case in API_CASES])
+def test_generator_buffer_output_matches_list_output_for_every_count_api(method, arguments):
+    buffer = getattr(Fortuna.Generator(8128), method)(*arguments, count=8, as_buffer=True)
+    listed = getattr(Fortuna.Generator(8128), method)(*arguments, count=8)
+
+    assert type(buffer) is array
+    assert buffer.typecode == _buffer_typecode(method)
+    assert buffer.itemsize == (1 if method in BOOL_APIS else 8)
+    assert buffer.tolist() == [int(value) if method in BOOL_APIS else value for value in listed]
+
+
+@pytest.mark.parametrize(("method", "arguments"), API_CASES, ids=[case[0] for case in API_CASES])
+def test_module_buffer_output_matches_list_output_for_every_count_api(method, arguments):
+    function = getattr(Fortuna, method)
+    Fortuna.seed(8128)
+    buffer = function(*arguments, count=8, as_buffer=True)
+    Fortuna.seed(8128)
+    listed = function(*arguments, count=8)
+
+    assert buffer.typecode == _buffer_typecode(method)
+    assert buffer.tolist() == [int(value) if method in BOOL_APIS else value for value in listed]
+
+
+@pytest.mark.parametrize(("method", "arguments"), API_CASES, ids=[case[0] for case in API_CASES])
+@pytest.mark.parametrize(
+    ("options", "error", "message"),
+    [
+        ({"as_buffer": True}, TypeError, "as_buffer requires count"),
+        ({"count": 4, "as_buffer": 1}, TypeError, "as_buffer must be a bool"),
+        ({"count": -1, "as_buffer": True}, ValueError, "count must be nonnegative"),
+    ],
+)
+def test_invalid_buffer_request_is_side_effect_free(method, arguments, options, error, message):
+    tested = Fortuna.Generator(99)
+    control = Fortuna.Generator(99)
+
+    with pytest.raises(error, match=message):
+        getattr(tested, method)(*arguments, **options)
+    assert tested.random_below(2**64) == control.random_below(2**64)
+
+
+def test_zero_count_buffer_is_empty_and_side_effect_free():
+    tested = Fortuna.Generator(99)
+    control = Fortuna.Generator(99)
+
+    assert tested.normal_variate(0.0, 1.0, count=0, as_buffer=True) == array("d")
+    assert tested.random_below(2**64) == control.random_below(2**64)
+
+
+@pytest.mark.parametrize("method", ["random_below", "random_index"])
+@pytest.mark.parametrize("magnitude", [10, 2**63])
+def test_negative_direction_buffers_match_list_output(method, magnitude):
+    buffer = getattr(Fortuna.Generator(5), method)(-magnitude, count=16, as_buffer=True)
+    listed = getattr(Fortuna.Generator(5), method)(-magnitude, count=16)
+
+    assert buffer.typecode == "q"
+    assert buffer.tolist() == listed
+
+
+def test_negative_direction_buffer_extremes_fit_signed_storage():
+    assert Fortuna.Generator(5).random_below(-(2**63 + 1), count=4, as_buffer=True).typecode == "q"
+
+    tested = Fortuna.Generator(99)
+    control = Fortuna.Generator(99)
+    with pytest.raises(OverflowError, match="signed 64-bit range"):
+        tested.random_below(-(2**63 + 2), count=4, as_buffer=True)
+    with pytest.raises(OverflowError, match="signed 64-bit range"):
+        tested.random_index(-(2**63 + 1), count=4, as_buffer=True)
+    assert tested.random_below(2**64) == control.random_below(2**64)
+
+
+@pytest.mark.parametrize(("method", "arguments"), API_CASES, ids=[case[0] for case in API_CASES])
+def test_generator_out_fills_caller_storage_for_every_count_api(method, arguments):
+    storage = array(_buffer_typecode(method), [0] * 8)
+    listed = getattr(Fortuna.Generator(8128), method)(*arguments, count=8)
+
+    assert getattr(Fortuna.Generator(8128), method)(*arguments, out=storage) is storage
+    assert storage.tolist() == [int(value) if method in BOOL_APIS else value for value in listed]
+
+
+@pytest.mark.parametrize(("method", "arguments"), API_CASES, ids=[case[0] for case in API_CASES])
+def test_module_out_fills_caller_storage_for_every_count_api(method, arguments):
+    function = getattr(Fortuna, method)
+    storage = array(_buffer_typecode(method), [0] * 8)
+    Fortuna.seed(8128)
+    assert function(*arguments, count=8, out=storage) is storage
+    Fortuna.seed(8128)
+    listed = function(*arguments, count=8)
+
+    assert storage.tolist() == [int(value) if method in BOOL_APIS else value for value in listed]
+
+
+@pytest.mark.parametrize(("method", "arguments"), API_CASES, ids=[case[0] for case in API_CASES])
+def test_zero_count_accepts_empty_out_storage(method, arguments):
+    tested = Fortuna.Generator(8128)
+    control = Fortuna.Generator(8128)
+    storage = array(_buffer_typecode(method))
+
+    assert getattr(tested, method)(*arguments, count=0, out=storage) is storage
+    assert getattr(tested, method)(*arguments, out=bytearray()) is not None
+    assert len(storage) == 0
+    assert tested.random_below(2**64) == control.random_below(2**64)
+
+
+def test_out_accepts_raw_byte_storage_in_native_order():
+    storage = bytearray(8 * 4)
+
+    Fortuna.Generator(3).random_float(-1.0, 1.0, out=storage)
+
+    assert array("d", storage).tolist() == Fortuna.Generator(3).random_float(-1.0, 1.0, count=4)
+
+
+@pytest.mark.parametrize(
+    ("out", "options", "error", "message"),
+    [
+        (array("q", [0] * 4), {}, TypeError, "out must hold float64 values, not format 'q'"),
+        (array("f", [0] * 4), {}, TypeError, "out must hold float64 values, not format 'f'"),
+        (bytes(32), {}, TypeError, "out must be a writable buffer"),
+        ([0.0] * 4, {}, TypeError, "out must be a writable buffer"),
+        (memoryview(array("d", [0] * 8))[::2], {}, ValueError, "out must be C-contiguous"),
+        (bytearray(31), {}, ValueError, "out byte length must be a multiple of 8"),
+        (memoryview(bytearray(40))[1:33], {}, ValueError, "out must be aligned to 8 bytes"),
+        (array("d", [0] * 4), {"count": 3}, ValueError, "count must equal the length of out"),
+        (array("d", [0] * 4), {"count": -1}, ValueError, "count must be nonnegative"),
+        (array("d", [0] * 4), {"as_buffer": True}, TypeError, "out cannot be combined"),
+    ],
+)
+def test_invalid_out_is_rejected_before_the_engine_advances(out, options, error, message):
+    tested = Fortuna.Generator(99)
+    control = Fortuna.Generator(99)
+
+    with pytest.raises(error, match=message):
+        tested.normal_variate(0.0, 1.0, out=out, **options)
+    assert tested.random_below(2**64) == control.random_below(2**64)
+
+
+def test_out_domain_errors_leave_storage_and_engine_untouched():
+    tested = Fortuna.Generator(99)
+    control = Fortuna.Generator(99)
+    storage = array("d", [7.0] * 4)
+
+    with pytest.raises(ValueError, match="deviation"):
+        tested.normal_variate(0.0, -1.0, out=storage)
+    assert storage.tolist() == [7.0] * 4
+    assert tested.random_below(2**64) == control.random_below(2**64)
+
+
+@pytest.mark.parametrize("method", ["random_below", "random_index"])
+def test_negative_direction_out_requires_signed_storage(method):
+    storage = array("q", [0] * 16)
+    getattr(Fortuna.Generator(5), method)(-10, out=storage)
+
+    assert storage.tolist() == getattr(Fortuna.Generator(5), method)(-10, count=16)
+    with pytest.raises(TypeError, match="out must hold int64 values, not format 'Q'"):
+        getattr(Fortuna.Generator(5), method)(-10, out=array("Q", [0] * 4))
+
+
+@pytest.mark.parametrize(("method", "arguments"), API_CASES, ids=[case[0] for case in API_CASES])
+def test_prepared_sampler_matches_scalar_calls_for_every_count_api(method, arguments):
+    sampler = Fortuna.Generator(8128).prepare(method, *arguments)
+    control = Fortuna.Generator(8128)
+
+    drawn = [sampler() for _ in range(4)] + sampler.take(4)
+    assert drawn == [getattr(control, method)(*arguments) for _ in range(8)]
+    buffered = sampler.take(4, as_buffer=True)
+    storage = array(_buffer_typecode(method), [0] * 4)
+    assert sampler.fill(storage) is storage
+    expected = [getattr(control, method)(*arguments) for _ in range(8)]
+    assert buffered.tolist() + storage.tolist() == [
+        int(value) if method in BOOL_APIS else value for value in expected
+    ]
+
+
+VECTOR_CASES = (
+    ("percent_true", ([0.0, 25.0, 50.0, 100.0],)),
+    ("bernoulli_variate", ([0.0, 0.25, 0.5, 1.0],)),
+    ("random_float", ([-1.0, 0.0, 5.0, 10.0], 20.0)),
+    ("triangular", ([0.0, 1.0, 2.0, 3.0], [1.0, 2.0, 4.0, 8.0], [0.5, 1.5, 3.0, 3.0])),
+    ("beta_variate", ([2.0, 0.5, 1.0, 8.0], 5.0)),
+    ("pareto_variate", ([1.0, 2.0, 3.0, 4.0],)),
+    ("vonmises_variate", (0.0, [0.0, 1.0, 4.0, 16.0])),
+    ("binomial_variate", ([1, 10, 100, 1_000], [0.1, 0.5, 0.9, 0.5])),
+    ("negative_binomial_variate", ([1, 5, 10, 20], 0.5)),
+    ("geometric_variate", ([0.1, 0.5, 0.9, 1.0],)),
+    ("poisson_variate", ([0.5, 4.0, 20.0, 200.0],)),
+    ("exponential_variate", ([0.5, 1.0, 2.0, 4.0],)),
+    ("gamma_variate", ([0.5, 1.0, 2.0, 9.0], [1.0, 3.0, 0.5, 2.0])),
+    ("weibull_variate", ([1.0, 2.0, 3.0, 4.0], 3.0)),
+    ("normal_variate", ([0.0, 10.0, 100.0, -50.0], [1.0, 0.0, 5.0, 2.0])),
+    ("log_normal_variate", ([0.0, 1.0, 2.0, 3.0], 1.0)),
+    ("extreme_value_variate", (0.0, [1.0, 2.0, 3.0, 4.0])),
+    ("chi_squared_variate", ([1.0, 2.0, 4.0, 8.0],)),
+    ("cauchy_variate", ([0.0, 1.0, 2.0, 3.0], 1.0)),
+    ("fisher_f_variate", ([1.0, 2.0, 4.0, 8.0], [5.0, 6.0, 7.0, 8.0])),
+    ("student_t_variate", ([1.0, 2.0, 4.0, 30.0],)),
+)
+
+
+def _vector_rows(arguments):
+    rows = []
+    for index in range(4):
+        rows.append(
+            tuple(value[index] if isinstance(value, list) else value for value in arguments)
+        )
+    return rows
+
+
+@pytest.mark.parametrize(
+    ("method", "arguments"), VECTOR_CASES, ids=[case[0] for case in VECTOR_CASES]
+)
+def test_parameter_vectors_match_repeated_scalar_calls(method, arguments):
+    vectorized = getattr(Fortuna.Generator(8128), method)(*arguments)
+    scalar_generator = Fortuna.Generator(8128)
+    scalar = [getattr(scalar_generator, method)(*row) for row in _vector_rows(arguments)]
+
+    assert vectorized == scalar
+    Fortuna.seed(8128)
+    assert getattr(Fortuna, method)(*arguments) == scalar
+
+
+@pytest.mark.parametrize(
+    ("method", "arguments"), VECTOR_CASES, ids=[case[0] for case in VECTOR_CASES]
+)
+def test_parameter_vectors_fill_buffers_and_out(method, arguments):
+    listed = getattr(Fortuna.Generator(8128), method)(*arguments)
+    typecode = _buffer_typecode(method)
+    tuples = tuple(tuple(value) if isinstance(value, list) else value for value in arguments)
+    storage = array(typecode, [0] * 4)
+    expected = [int(value) if method in BOOL_APIS else value for value in listed]
+
+    buffered = getattr(Fortuna.Generator(8128), method)(*tuples, count=4, as_buffer=True)
+    assert buffered.typecode == typecode
+    assert buffered.tolist() == expected
+    assert getattr(Fortuna.Generator(8128), method)(*arguments, out=storage) is storage
+    assert storage.tolist() == expected
+
+
+def test_parameter_vectors_accept_one_dimensional_buffers():
+    means = array("d", [0.0, 10.0, 100.0])
+    trials = array("Q", [1, 10, 100])
+
+    assert Fortuna.Generator(3).normal_variate(means, 1.0) == Fortuna.Generator(3).normal_variate(
+        list(means), 1.0
+    )
+    assert Fortuna.Generator(3).binomial_variate(trials, 0.5) == Fortuna.Generator(
+        3
+    ).binomial_variate(list(trials), 0.5)
+    assert Fortuna.Generator(3).normal_variate(memoryview(means)[::2], 1.0) == Fortuna.Generator(
+        3
+    ).normal_variate([0.0, 100.0], 1.0)
+    assert Fortuna.Generator(3).normal_variate([], 1.0) == []
+
+
+@pytest.mark.parametrize(
+    ("call", "error", "message"),
+    [
+        (lambda g: g.normal_variate([0.0, 1.0], [1.0, 2.0, 3.0]), ValueError, "equal lengths"),
+        (
+            lambda g: g.normal_variate([0.0, 1.0], 1.0, count=3),
+            ValueError,
+            "count must equal the parameter vector length",
+        ),
+        (lambda g: g.normal_variate([0.0, 1.0], [1.0, -1.0]), ValueError, "deviation"),
+        (lambda g: g.normal_variate([0.0, "1"], 1.0), TypeError, "mean must be a real number"),
+        (lambda g: g.binomial_variate([1, -1], 0.5), ValueError, "trials"),
+        (lambda g: g.poisson_variate([1.0, float("nan")]), ValueError, "finite"),
+        (lambda g: g.percent_true([50.0, 101.0]), ValueError, "percent"),
+        (
+            lambda g: g.normal_variate(memoryview(bytearray(16)).cast("d", (2, 1)), 1.0),
+            ValueError,
+            "mean must be one-dimensional",
+        ),
+        (
+            lambda g: g.normal_variate([0.0, 1.0], 1.0, out=array("d", [0.0] * 3)),
+            ValueError,
+            "count must equal the length of out",
+        ),
+    ],
+)
+def test_invalid_parameter_vectors_are_rejected_before_the_engine_advances(call, error, message):
+    tested = Fortuna.Generator(99)
+    control = Fortuna.Generator(99)
+
+    with pytest.raises(error, match=message):
+        call(tested)
+    assert tested.random_below(2**64) == control.random_below(2**64)
+
+
+ZIGGURAT_CASES = (("normal_variate", (1.0, 2.0)), ("exponential_variate", (0.5,)))
+
+
+@pytest.mark.parametrize(
+    ("method", "arguments"), ZIGGURAT_CASES, ids=[case[0] for case in ZIGGURAT_CASES]
+)
+def test_ziggurat_forms_match_repeated_scalar_calls(method, arguments):
+    options = {"algorithm": "ziggurat"}
+    scalar_generator = Fortuna.Generator(8128)
+    scalar = [getattr(scalar_generator, method)(*arguments, **options) for _ in range(8)]
+
+    assert getattr(Fortuna.Generator(8128), method)(*arguments, count=8, **options) == scalar
+    assert getattr(Fortuna.Generator(8128), method)(*arguments, count=8) != scalar
+    vectorized = [[value] * 8 for value in arguments]
+    assert getattr(Fortuna.Generator(8128), method)(*vectorized, **options) == scalar
+    sampler = Fortuna.Generator(8128).prepare(method, *arguments, **options)
+    assert [sampler() for _ in range(4)] + sampler.take(4) == scalar
+    stream = Fortuna.Generator(8128).stream(method, *arguments, chunk=3, **options)
+    assert [next(stream) for _ in range(8)] == scalar
+    Fortuna.seed(8128)
+    assert [getattr(Fortuna, method)(*arguments, **options) for _ in range(8)] == scalar
+
+
+@pytest.mark.parametrize(
+    ("method", "arguments"), ZIGGURAT_CASES, ids=[case[0] for case in ZIGGURAT_CASES]
+)
+@pytest.mark.parametrize(
+    ("algorithm", "error", "message"),
+    [
+        (None, TypeError, "algorithm must be a str"),
+        ("polar", ValueError, "algorithm must be 'standard' or 'ziggurat'"),
+    ],
+)
+def test_invalid_algorithm_is_rejected_before_the_engine_advances(
+    method, arguments, algorithm, error, message
+):
+    tested = Fortuna.Generator(99)
+    control = Fortuna.Generator(99)
+
+    with pytest.raises(error, match=message):
+        getattr(tested, method)(*arguments, algorithm=algorithm, count=4)
+    with pytest.raises(error, match=message):
+        tested.prepare(method, *arguments, algorithm=algorithm)
+    assert tested.random_below(2**64) == control.random_below(2**64)
+
+
+def test_ziggurat_keeps_the_standard_domain_checks():
+    with pytest.raises(ValueError, match="deviation"):
+        Fortuna.Generator(1).normal_variate(0.0, -1.0, algorithm="ziggurat")
+    with pytest.raises(ValueError, match="rate"):
+        Fortuna.Generator(1).exponential_variate(0.0, algorithm="ziggurat")
+    assert Fortuna.Generator(1).normal_variate(3.0, 0.0, algorithm="ziggurat") == 3.0
+
+
+DISCRETE_SETUP_CASES = (
+    ("binomial_variate", (20, 0.3)),
+    ("binomial_variate", (1_000_000, 0.3)),
+    ("binomial_variate", (1_000_000, 0.8)),
+    ("poisson_variate", (3.0,)),
+    ("poisson_variate", (50.0,)),
+    ("poisson_variate", (1e12,)),
+)
+
+
+@pytest.mark.parametrize(("method", "arguments"), DISCRETE_SETUP_CASES)
+def test_prepared_discrete_setups_match_repeated_scalar_calls(method, arguments):
+    scalar_generator = Fortuna.Generator(8128)
+    scalar = [getattr(scalar_generator, method)(*arguments) for _ in range(8)]
+
+    assert getattr(Fortuna.Generator(8128), method)(*arguments, count=8) == scalar
+    vectorized = [[value] * 8 for value in arguments]
+    assert getattr(Fortuna.Generator(8128), method)(*vectorized) == scalar
+    sampler = Fortuna.Generator(8128).prepare(method, *arguments)
+    assert [sampler() for _ in range(4)] + sampler.take(4) == scalar
+    stream = Fortuna.Generator(8128).stream(method, *arguments, chunk=3)
+    assert [next(stream) for _ in range(8)] == scalar
@@ -1,9 +1,10 @@
+from array import array
 from collections import deque
 
 import pytest
 
 import Fortuna
-from Fortuna import RandomValue, TruffleShuffle, WeightedChoice, _core
+from Fortuna import MutableWeightedChoice, RandomValue, TruffleShuffle, WeightedChoice, _core
 
 SEED = 0xF07A_6005
 SIZE = 100
@@ -212,6 +213,189 @@ def test_weighted_choice_feeds_normalized_boundaries_to_the_native_selector(monk
     assert observed == [((1.0, 3.0, 4.0), None), ((1.0, 3.0, 4.0), None)]
 
 
+def test_alias_weighted_choice_feeds_normalized_boundaries_to_the_alias_table(monkeypatch):
+    observed = []
+
+    def prepare(boundaries, generator):
+        observed.append((tuple(boundaries), generator))
+        return lambda: 1
+
+    monkeypatch.setattr(_core, "_prepared_alias_weighted_index", prepare)
+    generator = Fortuna.Generator(SEED)
+    choice = WeightedChoice(
+        relative=((1.0, "a"), (2.0, "b"), (1.0, "c")), method="alias", generator=generator
+    )
+
+    assert observed == [((1.0, 3.0, 4.0), generator)]
+    assert choice() == "b"
+
+
+@pytest.mark.parametrize("size", [4, 100, 1000])
+def test_alias_weighted_choice_is_shared_by_module_and_generator_sources(size):
+    table = tuple((0.0 if index % 7 == 0 else float(index % 5 + 1), index) for index in range(size))
+    Fortuna.seed(SEED)
+    module_selector = WeightedChoice(table, resolve_callables=False, method="alias")
+    generator = Fortuna.Generator(SEED)
+    generator_selector = WeightedChoice(
+        table, resolve_callables=False, method="alias", generator=generator
+    )
+
+    assert module_selector.take(COUNT) == generator_selector.take(COUNT)
+    assert Fortuna.random_below(2**64) == generator.random_below(2**64)
+
+
+@pytest.mark.parametrize("method", ["cumulative", "alias"])
+def test_weighted_choice_native_take_matches_repeated_calls(method):
+    table = tuple((float(index % 3), index) for index in range(50))
+    bulk_generator = Fortuna.Generator(SEED)
+    scalar_generator = Fortuna.Generator(SEED)
+    bulk = WeightedChoice(table, resolve_callables=False, method=method, generator=bulk_generator)
+    scalar = WeightedChoice(
+        table, resolve_callables=False, method=method, generator=scalar_generator
+    )
+
+    assert bulk.take(COUNT) == [scalar() for _ in range(COUNT)]
+    assert bulk.take(0) == []
+    assert bulk_generator.random_below(2**64) == scalar_generator.random_below(2**64)
+    with pytest.raises(ValueError, match="count"):
+        bulk.take(-1)
+    with pytest.raises(TypeError, match="count"):
+        bulk.take(True)
+
+
+def test_weighted_choice_native_take_resolves_only_selected_callables():
+    calls = []
+
+    def never():
+        calls.append("never")
+        return "never"
+
+    def scaled(value):
+        calls.append(value)
+        return value * 2
+
+    table = ((0, never), (1, "plain"), (1, scaled))
+    choice = WeightedChoice(table, generator=Fortuna.Generator(SEED))
+    control = WeightedChoice(table, resolve_callables=False, generator=Fortuna.Generator(SEED))
+    selected = control.take(COUNT)
+
+    assert choice.take(COUNT, 21) == [42 if value is scaled else value for value in selected]
+    assert calls == [21] * selected.count(scaled)
+
+
+def test_weighted_choice_native_calls_return_plain_values_and_resolve_callables():
+    def scaled(value):
+        return value * 2
+
+    plain_table = ((1, "a"), (2, "b"), (3, "c"))
+    plain = WeightedChoice(plain_table, generator=Fortuna.Generator(SEED))
+    control = WeightedChoice(plain_table, generator=Fortuna.Generator(SEED))
+    mixed = WeightedChoice(((1, "plain"), (1, scaled)), generator=Fortuna.Generator(SEED))
+    raw = WeightedChoice(
+        ((1, "plain"), (1, scaled)), resolve_callables=False, generator=Fortuna.Generator(SEED)
+    )
+
+    assert [plain() for _ in range(COUNT)] == control.take(COUNT)
+    assert [mixed(21) for _ in range(COUNT)] == [
+        42 if value is scaled else value for value in (raw() for _ in range(COUNT))
+    ]
+
+
+def test_weighted_choice_take_observes_module_monkeypatch(monkeypatch):
+    choice = WeightedChoice(((1.0, "a"), (3.0, "b")), resolve_callables=False)
+    monkeypatch.setattr(_core, "random_float", lambda low, high: 2.0)
+
+    assert choice.take(3) == ["b", "b", "b"]
+
+
+def test_prepared_weighted_index_take_requires_matching_values():
+    selector = _core._prepared_alias_weighted_index((1.0, 2.0), Fortuna.Generator(SEED))
+    with pytest.raises(ValueError, match="prepared boundaries"):
+        selector.take(("only",), 4)
+
+
+def test_mutable_weighted_choice_native_take_matches_repeated_calls():
+    table = tuple((float(index % 3), index) for index in range(50))
+    bulk_generator = Fortuna.Generator(SEED)
+    scalar_generator = Fortuna.Generator(SEED)
+    bulk = MutableWeightedChoice(table, resolve_callables=False, generator=bulk_generator)
+    scalar = MutableWeightedChoice(table, resolve_callables=False, generator=scalar_generator)
+
+    assert bulk.take(COUNT) == [scalar() for _ in range(COUNT)]
+    assert bulk_generator.random_below(2**64) == scalar_generator.random_below(2**64)
+
+    Fortuna.seed(SEED)
+    module_choice = MutableWeightedChoice(table, resolve_callables=False)
+    assert module_choice.take(COUNT) == MutableWeightedChoice(
+        table, resolve_callables=False, generator=Fortuna.Generator(SEED)
+    ).take(COUNT)
+
+
+def test_mutable_weighted_choice_survives_churn_without_selecting_zero_weights():
+    generator = Fortuna.Generator(SEED)
+    choice = MutableWeightedChoice(
+        tuple((float(index), index) for index in range(SIZE)),
+        resolve_callables=False,
+        generator=generator,
+    )
+    for step in range(20 * SIZE):
+        choice.set_weight(step % SIZE, generator.random_float(0.0, 1e6) * (step % 3 != 0))
+    weights = [choice[index][0] for index in range(SIZE)]
+    zero = {value for weight, value in (choice[index] for index in range(SIZE)) if weight == 0.0}
+
+    assert choice.total == pytest.approx(sum(weights), rel=1e-12)
+    assert zero and zero.isdisjoint(choice.take(10_000))
+
+
+def test_mutable_weighted_choice_observes_module_monkeypatch(monkeypatch):
+    choice = MutableWeightedChoice(((1.0, "a"), (3.0, "b")), resolve_callables=False)
+    monkeypatch.setattr(_core, "random_float", lambda low, high: 0.5)
+
+    assert choice.take(2) == ["a", "a"]
+    monkeypatch.setattr(_core, "random_float", lambda low, high: high)
+    with pytest.raises(ValueError, match="generated weighted draw"):
+        choice()
+
+
+def test_weighted_sample_module_and_generator_sources_agree(monkeypatch):
+    table = tuple((float(index % 3), index) for index in range(SIZE))
+    Fortuna.seed(SEED)
+    module_result = Fortuna.weighted_sample(table, 20)
+
+    assert module_result == Fortuna.weighted_sample(table, 20, generator=Fortuna.Generator(SEED))
+    assert len(set(module_result)) == 20
+    assert all(value % 3 for value in module_result)
+
+    monkeypatch.setattr(_core, "random_float", lambda low, high: 0.0)
+    assert Fortuna.weighted_sample(table, 2) == [1, 2]
+
+
+def test_reservoir_sample_native_fill_matches_the_streaming_loop():
+    class Subclass(Fortuna.Generator):
+        pass
+
+    sources = (
+        lambda: range(SIZE),
+        lambda: list(range(SIZE)),
+        lambda: tuple(range(SIZE)),
+        lambda: array("q", range(SIZE)),
+        lambda: iter(range(SIZE)),
+        lambda: (value for value in range(SIZE)),
+    )
+    Fortuna.seed(SEED)
+    expected = Fortuna.reservoir_sample(iter(range(SIZE)), 20)
+    assert len(set(expected)) == 20
+    for source in sources:
+        Fortuna.seed(SEED)
+        assert Fortuna.reservoir_sample(source(), 20) == expected
+        for make in (Fortuna.Generator, Subclass):
+            generator = make(SEED)
+            assert Fortuna.reservoir_sample(source(), 20, generator=generator) == expected
+            control = Fortuna.Generator(SEED)
+            Fortuna.reservoir_sample(iter(range(SIZE)), 20, generator=control)
+            assert generator.random_below(2**64) == control.random_below(2**64)
+
+
 def test_module_random_value_fast_path_observes_monkeypatches(monkeypatch):
     monkeypatch.setattr(_core, "random_index", lambda size: size - 1)
     assert Fortuna.random_value(("first", "last")) == "last"
@@ -231,6 +415,43 @@ def test_native_sample_and_shuffle_preserve_generator_state():
     assert first.random_below(2**64) == second.random_below(2**64)
 
 
+@pytest.mark.parametrize(
+    "population", [range(SIZE), range(-7, 5 * SIZE - 7, 5), range(SIZE, 0, -3)]
+)
+def test_range_sample_matches_the_materialized_order_for_every_source(population):
+    class Subclass(Fortuna.Generator):
+        pass
+
+    class Custom:
+        def __init__(self):
+            self.generator = Fortuna.Generator(SEED)
+
+        def random_index(self, size):
+            return self.generator.random_index(size)
+
+    count = min(20, len(population))
+    Fortuna.seed(SEED)
+    module_result = Fortuna.sample(population, count)
+    Fortuna.seed(SEED)
+    assert module_result == Fortuna.sample(list(population), count)
+    for make in (lambda: Fortuna.Generator(SEED), lambda: Subclass(SEED), Custom):
+        assert Fortuna.sample(population, count, generator=make()) == module_result
+    assert Fortuna.Generator(SEED).sample(population, count) == module_result
+    assert Subclass(SEED).sample(population, count) == module_result
+
+
+def test_range_sample_does_not_materialize_huge_populations():
+    population = range(10, 10 + 3 * 10**15, 3)
+    result = Fortuna.Generator(SEED).sample(population, 50)
+
+    assert len(set(result)) == 50
+    assert all(value in population for value in result)
+    with pytest.raises(ValueError, match="exceed"):
+        Fortuna.sample(range(3), 4)
+    with pytest.raises(ValueError, match="exceeds"):
+        Fortuna.Generator(SEED).sample(range(3), 4)
+
+
 def test_custom_generator_sample_consumes_one_validated_offset_per_value():
     class Generator:
         def __init__(self):
@@ -1,9 +1,22 @@
+from array import array
 from collections import deque
 
 import pytest
 
 import Fortuna
-from Fortuna import RandomValue, TruffleShuffle, WeightedChoice, random_value, sample, shuffle
+from Fortuna import (
+    MutableWeightedChoice,
+    RandomPermutation,
+    RandomValue,
+    TruffleShuffle,
+    WeightedChoice,
+    random_value,
+    reservoir_sample,
+    sample,
+    shuffle,
+    weighted_reservoir_sample,
+    weighted_sample,
+)
 
 
 class FixedGenerator:
@@ -55,6 +68,51 @@ def test_custom_shuffle_and_sample_validate_injected_indexes():
         sample(range(2), 3)
 
 
+def test_shuffle_accepts_buffers_for_every_generator_source():
+    class IndexSource:
+        def __init__(self, seed):
+            self.generator = Fortuna.Generator(seed)
+
+        def random_index(self, size):
+            return self.generator.random_index(size)
+
+    rows = array("q", range(30))
+    shuffle(rows, item_size=24, generator=IndexSource(17))
+    order = list(range(10))
+    shuffle(order, generator=IndexSource(17))
+    assert rows.tolist() == [3 * row + column for row in order for column in range(3)]
+
+    values = bytearray(range(10))
+    shuffle(values, generator=Fortuna.Generator(17))
+    expected = list(range(10))
+    Fortuna.Generator(17).shuffle(expected)
+    assert list(values) == expected
+
+    with pytest.raises(TypeError, match="mutable sequence or writable buffer"):
+        shuffle((1, 2))
+    with pytest.raises(TypeError, match="item_size requires a buffer"):
+        shuffle([1, 2], item_size=1)
+    with pytest.raises(TypeError, match="writable buffer"):
+        shuffle(b"ab", generator=IndexSource(17))
+    with pytest.raises(ValueError, match="divide the buffer length"):
+        shuffle(bytearray(5), item_size=2, generator=IndexSource(17))
+    with pytest.raises(ValueError, match="outside"):
+        shuffle(bytearray(2), generator=FixedGenerator(indices=(2,)))
+
+
+def test_blocked_shuffle_requires_a_native_shuffle_method():
+    blocked = bytearray(range(10))
+    shuffle(blocked, strategy="blocked", threads=2, generator=Fortuna.Generator(17))
+    expected = bytearray(range(10))
+    Fortuna.Generator(17).shuffle(expected, strategy="blocked")
+    assert blocked == expected
+
+    with pytest.raises(TypeError, match="require a generator with a shuffle method"):
+        shuffle(bytearray(10), strategy="blocked", generator=FixedGenerator())
+    with pytest.raises(TypeError, match="require a generator with a shuffle method"):
+        shuffle(bytearray(10), threads=2, generator=FixedGenerator())
+
+
 def test_random_value_is_uniform_by_default_and_exposes_slim_strategies():
     selector = RandomValue(
         ("front", "center", "back"),
@@ -214,6 +272,224 @@ def test_weighted_choice_validates_custom_draws(draw):
         choice()
 
 
+def test_weighted_choice_validates_its_method():
+    with pytest.raises(TypeError, match="method must be a str"):
+        WeightedChoice(((1, "value"),), method=None)
+    with pytest.raises(ValueError, match="'cumulative' or 'alias'"):
+        WeightedChoice(((1, "value"),), method="binary")
+
+
+def test_alias_weighted_choice_never_selects_zero_weights():
+    table = ((0, "never"), (1, "first"), (0, "also never"), (3, "last"), (0, "tail"))
+    for form in ({"relative": table}, {"cumulative": ((0, "a"), (1, "b"), (1, "c"), (4, "d"))}):
+        choice = WeightedChoice(**form, method="alias", generator=Fortuna.Generator(17))
+        assert set(choice.take(5_000)) <= {"first", "last", "b", "d"}
+
+
+def test_alias_weighted_choice_uses_the_scan_for_custom_draws():
+    table = ((1, "first"), (2, "second"), (1, "third"))
+    choice = WeightedChoice(table, method="alias", generator=FixedGenerator(floats=(0.0, 1.0, 3.5)))
+    assert [choice(), choice(), choice()] == ["first", "second", "third"]
+
+
+def test_mutable_weighted_choice_updates_adds_and_swap_removes():
+    choice = MutableWeightedChoice(
+        ((1, "a"), (2, "b")),
+        generator=FixedGenerator(floats=(0.5, 1.5, 3.5, 0.5)),
+    )
+    assert [choice(), choice()] == ["a", "b"]
+
+    choice.set_weight(0, 0)
+    assert choice.add("c", 4.0) == 2
+    assert (len(choice), choice.total, choice[2]) == (3, 6.0, (4.0, "c"))
+    assert choice() == "c"
+    assert choice.remove(0) == "a"
+    assert [choice[index] for index in range(len(choice))] == [(4.0, "c"), (2.0, "b")]
+    assert choice() == "c"
+
+
+def test_mutable_weighted_choice_validates_weights_and_indices():
+    choice = MutableWeightedChoice(((1, "a"),))
+    with pytest.raises(TypeError, match="weight must be a real number"):
+        choice.add("b", True)
+    with pytest.raises(ValueError, match="nonnegative"):
+        choice.set_weight(0, -1.0)
+    with pytest.raises(ValueError, match="finite"):
+        choice.add("b", float("inf"))
+    with pytest.raises(ValueError, match="total must be finite"):
+        MutableWeightedChoice(((1e308, "a"),)).add("b", 1e308)
+    with pytest.raises(IndexError):
+        choice.set_weight(1, 1.0)
+    with pytest.raises(IndexError):
+        choice.remove(-1)
+    with pytest.raises(TypeError, match="index must be an integer"):
+        choice[0.0]
+    assert (len(choice), choice.total) == (1, 1.0)
+
+
+def test_mutable_weighted_choice_requires_a_positive_weight_before_drawing():
+    generator = Fortuna.Generator(17)
+    control = Fortuna.Generator(17)
+    choice = MutableWeightedChoice(((0, "never"),), generator=generator)
+    with pytest.raises(ValueError, match="at least one weight must be positive"):
+        choice()
+    with pytest.raises(ValueError, match="at least one weight must be positive"):
+        choice.take(3)
+    assert choice.take(0) == []
+    assert MutableWeightedChoice().take(0) == []
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+def test_weighted_sample_accepts_every_weighted_table_form():
+    relative = ((1, "a"), (0, "never"), (3, "b"))
+    cumulative = ((1, "a"), (1, "never"), (4, "b"))
+    for form in ({"weighted_table": relative}, {"relative": relative}, {"cumulative": cumulative}):
+        result = weighted_sample(**form, k=2, generator=Fortuna.Generator(17))
+        assert sorted(result) == ["a", "b"]
+
+
+def test_weighted_sample_validates_before_drawing():
+    generator = Fortuna.Generator(17)
+    control = Fortuna.Generator(17)
+    table = ((1, "a"), (0, "never"), (3, "b"))
+    with pytest.raises(TypeError, match="exactly one"):
+        weighted_sample(table, 1, relative=table)
+    with pytest.raises(TypeError, match="requires k"):
+        weighted_sample(table)
+    with pytest.raises(ValueError, match="k must be >= 0"):
+        weighted_sample(table, -1, generator=generator)
+    with pytest.raises(ValueError, match="number of positive weights"):
+        weighted_sample(table, 3, generator=generator)
+    with pytest.raises(ValueError, match="weights must be nonnegative"):
+        weighted_sample(((-1, "a"),), 1, generator=generator)
+    assert weighted_sample(table, 0, generator=generator) == []
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+def test_weighted_sample_removes_each_custom_selection():
+    table = ((1, "a"), (0, "never"), (2, "b"), (1, "c"))
+    generator = FixedGenerator(floats=(1.5, 1.5, 0.0))
+    assert weighted_sample(table, 3, generator=generator) == ["b", "c", "a"]
+    with pytest.raises(ValueError, match="generated weighted draw"):
+        weighted_sample(table, 1, generator=FixedGenerator(floats=(4.0,)))
+
+
+def test_reservoir_sample_validates_before_drawing():
+    generator = Fortuna.Generator(17)
+    control = Fortuna.Generator(17)
+    stream = iter(range(10))
+    assert reservoir_sample(stream, 0, generator=generator) == []
+    assert next(stream) == 0
+    with pytest.raises(ValueError, match="k must be >= 0"):
+        reservoir_sample(range(3), -1, generator=generator)
+    with pytest.raises(ValueError, match="exceed the population size"):
+        reservoir_sample(range(3), 4, generator=generator)
+    with pytest.raises(ValueError, match="exceed the population size"):
+        reservoir_sample(iter(range(3)), 4, generator=generator)
+    assert sorted(reservoir_sample(iter("abc"), 3, generator=generator)) == ["a", "b", "c"]
+    assert generator.random_below(2**64) != control.random_below(2**64)
+
+
+def test_reservoir_sample_uses_custom_generator_draws():
+    # The threshold starts at 0.5**(1/2), so "c" replaces slot 1 with no skip; the
+    # last draw then skips past the end of the stream.
+    generator = FixedGenerator(indices=(1,), floats=(0.5, 0.5, 0.5, 0.9999))
+    assert reservoir_sample(iter("abcdef"), 2, generator=generator) == ["a", "c"]
+    with pytest.raises(ValueError, match="generated weighted draw"):
+        reservoir_sample("abc", 1, generator=FixedGenerator(floats=(1.0,)))
+
+
+def test_weighted_reservoir_sample_validates_pairs_and_weights():
+    generator = Fortuna.Generator(17)
+    assert weighted_reservoir_sample(((1, "a"),), 0, generator=generator) == []
+    with pytest.raises(TypeError, match="iterable of"):
+        weighted_reservoir_sample(1, 1)
+    with pytest.raises(TypeError, match="item 1 must be a"):
+        weighted_reservoir_sample(((1, "a"), "b"), 1, generator=generator)
+    with pytest.raises(ValueError, match="nonnegative"):
+        weighted_reservoir_sample(((1, "a"), (-1, "b")), 1, generator=generator)
+    with pytest.raises(ValueError, match="number of positive weights"):
+        weighted_reservoir_sample(((1, "a"), (0, "b")), 2, generator=generator)
+    table = ((0, "never"), (1, "a"), (0, "also never"), (3, "b"))
+    assert sorted(weighted_reservoir_sample(iter(table), 2, generator=generator)) == ["a", "b"]
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 63, 64, 65, 1000, 4097])
+def test_random_permutation_is_a_bijection_with_an_inverse(size):
+    permutation = RandomPermutation(size, generator=Fortuna.Generator(size))
+    values = list(permutation)
+
+    assert len(permutation) == size
+    assert sorted(values) == list(range(size))
+    assert [permutation[index] for index in range(size)] == values
+    assert [permutation.index_of(value) for value in values] == list(range(size))
+    assert permutation[:] == values
+    assert permutation[size // 3 :: 2] == values[size // 3 :: 2]
+    if size > 1:
+        assert permutation[-1] == values[-1]
+        assert permutation.fill(array("q", bytes(8 * (size - 1))), 1).tolist() == values[1:]
+
+
+def test_random_permutation_validates_before_drawing_keys():
+    generator = Fortuna.Generator(17)
+    control = Fortuna.Generator(17)
+    with pytest.raises(ValueError, match="size must be >= 0"):
+        RandomPermutation(-1, generator=generator)
+    with pytest.raises(TypeError, match="size must be an integer"):
+        RandomPermutation(True, generator=generator)
+    with pytest.raises(OverflowError, match="size must be <="):
+        RandomPermutation(2**63, generator=generator)
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+def test_random_permutation_lookups_do_not_advance_the_generator():
+    generator = Fortuna.Generator(17)
+    control = Fortuna.Generator(17)
+    permutation = RandomPermutation(10**12, generator=generator)
+    for _ in range(8):
+        control.random_index(2**32)
+    assert permutation.index_of(permutation[-1]) == 10**12 - 1
+    assert permutation.index_of(permutation[123_456_789]) == 123_456_789
+    assert generator.random_below(2**64) == control.random_below(2**64)
+
+
+def test_random_permutation_rejects_bad_lookups():
+    permutation = RandomPermutation(10, generator=Fortuna.Generator(17))
+    with pytest.raises(IndexError, match="out of range"):
+        permutation[10]
+    with pytest.raises(IndexError, match="out of range"):
+        permutation[-11]
+    with pytest.raises(TypeError, match="index must be an integer"):
+        permutation[1.0]
+    with pytest.raises(ValueError, match="10 is not in the permutation"):
+        permutation.index_of(10)
+    with pytest.raises(ValueError, match="-1 is not in the permutation"):
+        permutation.index_of(-1)
+    assert 9 in permutation
+    assert 10 not in permutation
+    assert "1" not in permutation
+    assert True not in permutation
+    with pytest.raises(IndexError, match="out of range"):
+        permutation.fill(array("q", bytes(8 * 4)), 7)
+    with pytest.raises(IndexError, match="out of range"):
+        permutation.fill(array("q"), 11)
+    with pytest.raises(ValueError, match="start must be >= 0"):
+        permutation.fill(array("q"), -1)
+    with pytest.raises(TypeError, match="int64"):
+        permutation.fill(array("d", [0.0]))
+    with pytest.raises(TypeError, match="writable buffer"):
+        permutation.fill(bytes(8))
+
+
+def test_random_permutation_keys_come_from_validated_custom_indices():
+    keys = (1, 2, 3, 4, 5, 6, 7, 8)
+    first = RandomPermutation(100, generator=FixedGenerator(indices=keys))
+    second = RandomPermutation(100, generator=FixedGenerator(indices=keys))
+    assert list(first) == list(second)
+    with pytest.raises(ValueError, match="generated index 4294967296 is outside"):
+        RandomPermutation(100, generator=FixedGenerator(indices=(2**32,)))
+
+
 def test_weighted_choice_resolves_selected_callables_and_supports_take():
     choice = WeightedChoice(
         ((1, lambda value=3: value),), generator=FixedGenerator(floats=(0.0, 0.0))
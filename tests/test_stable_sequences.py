@@ -7,6 +7,9 @@ not part of Fortuna's cross-platform stability promise.
 
 from __future__ import annotations
 
+import hashlib
+import struct
+from array import array
 from collections.abc import Callable
 from typing import Any
 
@@ -139,3 +142,376 @@ def test_partial_fisher_yates_sample_owned_schedule_golden_vector() -> None:
     Fortuna.seed(SEED)
     assert Fortuna.sample(POPULATION, len(expected)) == expected
     assert Fortuna.random_below(2**64) == expected_next
+
+    # Sparse range sampling replays the same swaps without a working list.
+    _assert_collection_schedule(
+        lambda generator: generator.sample(range(len(POPULATION)), len(expected)),
+        expected,
+        expected_next,
+    )
+    Fortuna.seed(SEED)
+    assert Fortuna.sample(range(len(POPULATION)), len(expected)) == expected
+    assert Fortuna.random_below(2**64) == expected_next
+
+
+def test_alias_weighted_choice_owned_schedule_golden_vector() -> None:
+    # Zero weights at every fourth value must be aliased away, never drawn.
+    table = tuple((float(value % 4), value) for value in POPULATION)
+    expected = [2, 17, 19, 11, 18, 5, 5, 7, 11, 14, 3, 11]
+    expected_next = 5_752_389_478_553_983_903
+
+    _assert_collection_schedule(
+        lambda generator: Fortuna.WeightedChoice(
+            table, resolve_callables=False, method="alias", generator=generator
+        ).take(len(expected)),
+        expected,
+        expected_next,
+    )
+
+
+def test_mutable_weighted_choice_owned_schedule_golden_vector() -> None:
+    table = tuple((float(value % 4), value) for value in POPULATION)
+    expected = [3, 11, 3, 7, 19, 2, 14, 19, 19, 7, 7, 6]
+    expected_next = 11_690_925_506_155_829_445
+
+    def operation(generator: Fortuna.Generator) -> list[int]:
+        choice = Fortuna.MutableWeightedChoice(table, resolve_callables=False, generator=generator)
+        choice.set_weight(0, 2.5)
+        choice.remove(5)
+        choice.add(20, 1.0)
+        return choice.take(len(expected))
+
+    _assert_collection_schedule(operation, expected, expected_next)
+
+
+def test_weighted_sample_owned_schedule_golden_vector() -> None:
+    table = tuple((float(value % 4), value) for value in POPULATION)
+    expected = [19, 3, 11, 7, 1, 10]
+    expected_next = 10_084_470_491_917_665_767
+
+    _assert_collection_schedule(
+        lambda generator: Fortuna.weighted_sample(table, len(expected), generator=generator),
+        expected,
+        expected_next,
+    )
+
+
+def test_blocked_shuffle_owned_schedule_golden_vector() -> None:
+    def blocked(generator: Any) -> tuple[list[int], str]:
+        values = array("q", range(100_000))
+        generator.shuffle(values, strategy="blocked", threads=3)
+        digest = hashlib.sha256(struct.pack(f"<{len(values)}q", *values)).hexdigest()
+        return values[:6].tolist(), digest
+
+    _assert_collection_schedule(
+        blocked,
+        (
+            [74979, 23656, 80720, 81044, 80674, 42384],
+            "f9df59de5751ba37e80fbb0d26049ea3efe8e157118293c87cff4e3cf8b2b1ef",
+        ),
+        134_654_801_497_239_883,
+    )
+
+
+def test_parallel_chunk_owned_schedule_golden_vector() -> None:
+    def parallel(generator: Any) -> tuple[list[int], list[int], str]:
+        values = generator.parallel("d", 20, count=100_000, chunk=4096, threads=3)
+        digest = hashlib.sha256(struct.pack(f"<{len(values)}Q", *values)).hexdigest()
+        return values[:6], values[4096:4100], digest
+
+    _assert_collection_schedule(
+        parallel,
+        (
+            [2, 19, 18, 19, 18, 6],
+            [10, 2, 3, 13],
+            "b9d1f1dd02ff61f474e3a9168afedc6a23c48c8d6cf46f56094e99bb579dd761",
+        ),
+        11_767_622_565_797_284_508,
+    )
+
+
+@pytest.mark.parametrize(
+    ("engine", "expected_words", "expected_dice", "expected_next"),
+    [
+        (
+            "pcg64_dxsm",
+            [14_055_152_001_077_618_145, 3_566_157_573_689_168_022, 17_779_202_622_629_814_240],
+            [12, 18, 14, 2, 7, 20],
+            234_734_257_037_348_562,
+        ),
+        (
+            "xoshiro256++",
+            [6_613_536_358_118_234_009, 13_466_557_033_666_390_657, 12_887_886_461_757_822_170],
+            [16, 2, 17, 19, 10, 16],
+            16_358_355_459_644_813_614,
+        ),
+        (
+            "sfc64",
+            [6_157_925_279_951_323_686, 18_259_562_178_530_035_208, 17_241_262_210_670_670_172],
+            [19, 2, 15, 7, 19, 3],
+            6_794_195_196_430_337_515,
+        ),
+        (
+            "philox4x64",
+            [15_541_329_127_942_859_819, 179_491_472_427_368_692, 9_955_881_859_906_187_165],
+            [1, 4, 2, 16, 3, 5],
+            8_355_579_394_717_709_002,
+        ),
+    ],
+)
+def test_alternative_engine_golden_vectors(
+    engine: str,
+    expected_words: list[int],
+    expected_dice: list[int],
+    expected_next: int,
+) -> None:
+    generator = Fortuna.Generator(SEED, engine=engine)
+
+    assert generator.random_below(UINT64_MAX + 1, count=3) == expected_words
+    assert generator.d(20, count=6) == expected_dice
+    generator.canonical()
+    assert generator.random_below(UINT64_MAX + 1) == expected_next
+
+
+def test_mersenne_twister_jump_ahead_golden_vectors() -> None:
+    jumped = Fortuna.Generator(SEED).jump()
+    advanced = Fortuna.Generator(SEED).advance(10**15)
+
+    assert jumped.random_below(UINT64_MAX + 1, count=3) == [
+        1_415_342_216_291_319_672,
+        17_490_037_298_738_896_639,
+        10_483_147_877_767_218_526,
+    ]
+    assert advanced.random_below(UINT64_MAX + 1, count=3) == [
+        17_543_547_877_625_625_450,
+        10_180_187_594_181_158_260,
+        10_864_659_672_511_850_704,
+    ]
+
+
+def test_random_permutation_owned_schedule_golden_vectors() -> None:
+    expected_next = 5_762_370_405_561_471_798
+    _assert_collection_schedule(
+        lambda generator: list(Fortuna.RandomPermutation(12, generator=generator)),
+        [8, 1, 5, 4, 3, 11, 10, 0, 9, 6, 7, 2],
+        expected_next,
+    )
+
+    def large(generator: Any) -> tuple[list[int], int, int]:
+        permutation = Fortuna.RandomPermutation(10**10, generator=generator)
+        return permutation[:6], permutation[-1], permutation.index_of(12345)
+
+    _assert_collection_schedule(
+        large,
+        (
+            [60_013_773, 5_747_513_402, 9_226_270_448, 2_023_780_712, 4_755_267_513, 3_625_010_671],
+            6_656_886_553,
+            3_370_946_989,
+        ),
+        expected_next,
+    )
+
+
+def test_reservoir_sample_owned_schedule_golden_vectors() -> None:
+    expected = [136, 23, 44, 116, 35, 190]
+    expected_next = 5_426_093_304_734_522_741
+    # The native sequence loop and the streaming loop share one schedule.
+    for population in (range(200), list(range(200)), iter(range(200))):
+        _assert_collection_schedule(
+            lambda generator, population=population: Fortuna.reservoir_sample(
+                population, len(expected), generator=generator
+            ),
+            expected,
+            expected_next,
+        )
+
+    weighted = [190, 37, 71, 125, 81, 59]
+    _assert_collection_schedule(
+        lambda generator: Fortuna.weighted_reservoir_sample(
+            ((float(value % 4), value) for value in range(200)), len(weighted), generator=generator
+        ),
+        weighted,
+        7_447_567_213_860_685_291,
+    )
+
+
+def test_raw_byte_owned_schedule_golden_vector() -> None:
+    expected = bytes.fromhex("6afb54c43259392c9cca374560")
+    expected_next = 3_827_615_796_449_682_217
+
+    _assert_collection_schedule(
+        lambda generator: generator.random_bytes(13), expected, expected_next
+    )
+
+    storage = bytearray(13)
+    Fortuna.seed(SEED)
+    Fortuna.fill_bytes(storage)
+    assert storage == expected
+    assert Fortuna.random_below(2**64) == expected_next
+
+
+def test_packed_bit_owned_schedule_golden_vectors() -> None:
+    _assert_collection_schedule(
+        lambda generator: generator.random_bits(70),
+        bytes.fromhex("6afb54c43259392c1c"),
+        3_827_615_796_449_682_217,
+    )
+    _assert_collection_schedule(
+        lambda generator: generator.bernoulli_bits(0.3, 70),
+        bytes.fromhex("0104893a8d8080d00b"),
+        9_388_431_527_544_222_304,
+    )
+
+
+@pytest.mark.parametrize(
+    ("method", "arguments", "expected", "digest", "expected_next"),
+    [
+        (
+            "normal_variate",
+            (0.0, 1.0),
+            [
+                "-0x1.eaf73d952a15dp-3",
+                "0x1.1ad107c0f1a42p+0",
+                "-0x1.82b3357b3c5d5p-3",
+                "-0x1.99fed500cf78fp+0",
+            ],
+            "ff7cd0a8f1761ed784af4e9342d0b3dbf85b2b5cabf7d009b6d38ee7b3c61fc9",
+            8_309_934_224_104_784_705,
+        ),
+        (
+            "exponential_variate",
+            (1.0,),
+            [
+                "0x1.f225ec552bf79p-3",
+                "0x1.4efa9b2abb610p+0",
+                "0x1.2931d094dddedp-3",
+                "0x1.9c851a79fd9c9p+1",
+            ],
+            "4f53e31599af935208a9467a085757b55fc1b86abee21ba7c63d7444fe3e21be",
+            5_433_105_895_292_437_292,
+        ),
+    ],
+)
+def test_ziggurat_owned_schedule_golden_vectors(
+    method: str,
+    arguments: tuple[float, ...],
+    expected: list[str],
+    digest: str,
+    expected_next: int,
+) -> None:
+    # At this seed, 20,000 draws reach layer wedges and the tail beyond the base strip.
+    generator = Fortuna.Generator(SEED)
+    values = getattr(generator, method)(*arguments, algorithm="ziggurat", count=20_000)
+    assert [value.hex() for value in values[:4]] == expected
+    assert hashlib.sha256(struct.pack(f"<{len(values)}d", *values)).hexdigest() == digest
+    assert generator.random_below(2**64) == expected_next
+
+
+@pytest.mark.parametrize(
+    ("method", "arguments", "expected", "digest", "expected_next"),
+    [
+        (
+            "gamma_variate",
+            (0.5, 2.0),
+            ["0x1.29e7c9ec8bd1ap+0", "0x1.b022b118dfa11p-3"],
+            "47df8f91ff5bbfa4cdad5caf676604bab0e345b9fe0747622f363f7e9a38b86b",
+            11_442_177_310_283_787_470,
+        ),
+        (
+            "gamma_variate",
+            (3.0, 1.0),
+            ["0x1.25a2ebe5d2752p+1", "0x1.2f5e17d80a48dp+1"],
+            "dc0ab7675a23d364efcc673d91117c24bb7962ce6fd6e6ad0b75a01a721fcb99",
+            5_224_686_497_670_109_418,
+        ),
+        (
+            "beta_variate",
+            (0.4, 2.5),
+            ["0x1.d1fef067b9233p-2", "0x1.e36ae3471a7bfp-3"],
+            "43eaa3680bbc910d55d7a612262f51ec6bef9dd15f40f0d4112f831dd6fb4670",
+            3_924_353_901_732_079_793,
+        ),
+        (
+            "chi_squared_variate",
+            (5.0,),
+            ["0x1.d52593ba1e55cp+1", "0x1.e683c75cdba3ap+1"],
+            "2fa4df74c57f51e71d039eb2e3621b9190f8d9acf18749a875112c7f39425dce",
+            16_520_300_051_263_606_671,
+        ),
+        (
+            "student_t_variate",
+            (3.0,),
+            ["-0x1.6684e9fedaec2p-3", "-0x1.43517c86e3747p+1"],
+            "6c8f85a1868b60c17cf6f8c5d432a56522684a765d599e7a4903b03e435ace10",
+            15_958_893_616_888_643_687,
+        ),
+        (
+            "fisher_f_variate",
+            (0.8, 7.0),
+            ["0x1.e2fa982983c77p+1", "0x1.c6f7c0aa13854p+0"],
+            "30a1156eb76b0a5e484a52e1a20c2f3cd66fa6d3151680c408872531f8acdc7f",
+            8_056_760_835_081_958_357,
+        ),
+    ],
+)
+def test_gamma_family_owned_schedule_golden_vectors(
+    method: str,
+    arguments: tuple[float, ...],
+    expected: list[str],
+    digest: str,
+    expected_next: int,
+) -> None:
+    # Shapes on both sides of one exercise the direct and log-space gamma paths.
+    generator = Fortuna.Generator(SEED)
+    values = getattr(generator, method)(*arguments, count=20_000)
+    assert [value.hex() for value in values[:2]] == expected
+    assert hashlib.sha256(struct.pack(f"<{len(values)}d", *values)).hexdigest() == digest
+    assert generator.random_below(2**64) == expected_next
+
+
+@pytest.mark.parametrize(
+    ("method", "arguments", "expected", "digest", "expected_next"),
+    [
+        (
+            "binomial_variate",
+            (25, 0.3),
+            [5, 8, 6, 7],
+            "1982a8db36325870ea582e82eab4bb3d41ac494d76530e63151a098642fdcbaf",
+            7_797_467_596_486_601_876,
+        ),
+        (
+            "binomial_variate",
+            (1_000_000, 0.65),
+            [650_427, 650_198, 649_727, 650_940],
+            "b6b306de8a62d7686d74d1724745d0f818de67d3173002401de41d4706dcf1f2",
+            11_060_859_424_877_940_720,
+        ),
+        (
+            "poisson_variate",
+            (4.5,),
+            [2, 5, 3, 4],
+            "2e5076eb74e127a68f536e44356e2673c2ce21cb2750603863c133a1923fb96f",
+            7_797_467_596_486_601_876,
+        ),
+        (
+            "poisson_variate",
+            (1e9,),
+            [999_966_292, 999_970_997, 999_983_532, 1_000_025_714],
+            "72703147595182b4d6f409169b70827629432dc744a10ef1fd10b8105a705b5e",
+            17_261_008_462_961_820_890,
+        ),
+    ],
+)
+def test_btpe_and_ptrs_owned_schedule_golden_vectors(
+    method: str,
+    arguments: tuple[float, ...],
+    expected: list[int],
+    digest: str,
+    expected_next: int,
+) -> None:
+    # Small parameters use inversion with one canonical draw; large ones use rejection.
+    generator = Fortuna.Generator(SEED)
+    values = getattr(generator, method)(*arguments, count=20_000)
+    assert values[:4] == expected
+    assert hashlib.sha256(struct.pack(f"<{len(values)}Q", *values)).hexdigest() == digest
+    assert generator.random_below(2**64) == expected_next
@@ -145,6 +145,22 @@ def test_uniform_integer_generators_have_flat_category_frequencies(
     _assert_discrete_uniform(samples, support)
 
 
+@pytest.mark.parametrize("engine", ["pcg64_dxsm", "xoshiro256++", "sfc64", "philox4x64"])
+def test_alternative_engines_have_flat_frequencies_and_fair_bits(engine: str) -> None:
+    generator = Fortuna.Generator(0xF07A_1002, engine=engine)
+    _assert_discrete_uniform(generator.random_index(17, count=34_000), range(17))
+
+    sample_size = 1_000_003
+    packed = generator.random_bits(sample_size)
+    _assert_probability(int.from_bytes(packed, "little").bit_count(), sample_size, 0.5)
+    _assert_mean_and_variance(
+        generator.canonical(count=50_000),
+        expected_mean=0.5,
+        expected_variance=1.0 / 12.0,
+        fourth_central_moment=1.0 / 80.0,
+    )
+
+
 def test_percent_true_and_bernoulli_match_declared_probabilities() -> None:
     sample_size = 30_000
 
@@ -157,6 +173,20 @@ def test_percent_true_and_bernoulli_match_declared_probabilities() -> None:
     _assert_probability(sum(bernoulli_samples), sample_size, 0.73)
 
 
+@pytest.mark.parametrize("probability", [0.5, 0.73, 1.0 / 3.0, 0.001, 2.0**-40])
+def test_packed_bernoulli_bits_match_declared_probabilities(probability: float) -> None:
+    sample_size = 1_000_003
+    packed = Fortuna.Generator(0xF07A_2003).bernoulli_bits(probability, sample_size)
+    observed_true = int.from_bytes(packed, "little").bit_count()
+    _assert_probability(observed_true, sample_size, probability)
+
+
+def test_packed_random_bits_are_fair() -> None:
+    sample_size = 1_000_003
+    packed = Fortuna.Generator(0xF07A_2004).random_bits(sample_size)
+    _assert_probability(int.from_bytes(packed, "little").bit_count(), sample_size, 0.5)
+
+
 def test_die_is_uniform_and_dice_have_theoretical_first_two_moments() -> None:
     die_samples = Fortuna.Generator(0xF07A_3001).d(12, count=36_000)
     _assert_discrete_uniform(die_samples, range(1, 13))
@@ -176,6 +206,184 @@ def test_die_is_uniform_and_dice_have_theoretical_first_two_moments() -> None:
     )
 
 
+def _beta_fourth_central_moment(alpha: float, beta: float) -> float:
+    total = alpha + beta
+    variance = alpha * beta / (total**2 * (total + 1))
+    excess = (
+        6
+        * ((alpha - beta) ** 2 * (total + 1) - alpha * beta * (total + 2))
+        / (alpha * beta * (total + 2) * (total + 3))
+    )
+    return variance**2 * (3 + excess)
+
+
+def _fisher_f_fourth_central_moment(first: float, second: float) -> float:
+    variance = 2 * second**2 * (first + second - 2) / (first * (second - 2) ** 2 * (second - 4))
+    excess = (
+        12
+        * (first * (5 * second - 22) * (first + second - 2) + (second - 4) * (second - 2) ** 2)
+        / (first * (second - 6) * (second - 8) * (first + second - 2))
+    )
+    return variance**2 * (3 + excess)
+
+
+@pytest.mark.parametrize(
+    ("method_name", "arguments", "expected_mean", "expected_variance", "fourth_moment"),
+    [
+        ("gamma_variate", (0.3, 2.0), 0.6, 1.2, 3 * 0.3 * 2.3 * 2.0**4),
+        ("gamma_variate", (40.0, 0.5), 20.0, 10.0, 3 * 40.0 * 42.0 * 0.5**4),
+        ("beta_variate", (2.0, 5.0), 2 / 7, 10 / (49 * 8), _beta_fourth_central_moment(2.0, 5.0)),
+        ("beta_variate", (0.5, 0.5), 0.5, 1 / 8, _beta_fourth_central_moment(0.5, 0.5)),
+        ("chi_squared_variate", (4.0,), 4.0, 8.0, 12 * 4.0 * 8.0),
+        ("chi_squared_variate", (0.6,), 0.6, 1.2, 12 * 0.6 * 4.6),
+        ("student_t_variate", (10.0,), 0.0, 1.25, 1.25**2 * 4),
+        (
+            "fisher_f_variate",
+            (6.0, 40.0),
+            40 / 38,
+            2 * 40**2 * 44 / (6 * 38**2 * 36),
+            _fisher_f_fourth_central_moment(6.0, 40.0),
+        ),
+    ],
+)
+def test_gamma_family_matches_theoretical_first_two_moments(
+    method_name: str,
+    arguments: tuple[float, ...],
+    expected_mean: float,
+    expected_variance: float,
+    fourth_moment: float,
+) -> None:
+    """Cover both Marsaglia-Tsang branches and each gamma ratio."""
+
+    generator = Fortuna.Generator(0xF07A_4010)
+    samples = getattr(generator, method_name)(*arguments, count=30_000)
+    _assert_mean_and_variance(
+        samples,
+        expected_mean=expected_mean,
+        expected_variance=expected_variance,
+        fourth_central_moment=fourth_moment,
+    )
+
+
+@pytest.mark.parametrize(
+    ("method_name", "arguments", "cdf", "points"),
+    [
+        (
+            "gamma_variate",
+            (1.0, 1.0),
+            lambda x: -math.expm1(-x),
+            (0.01, 0.2, 0.7, 1.0, 2.0, 4.0, 8.0),
+        ),
+        (
+            "beta_variate",
+            (0.5, 0.5),
+            lambda x: 2 / math.pi * math.asin(math.sqrt(x)),
+            (1e-4, 0.01, 0.2, 0.5, 0.8, 0.99, 1 - 1e-4),
+        ),
+        (
+            "student_t_variate",
+            (1.0,),
+            lambda x: 0.5 + math.atan(x) / math.pi,
+            (-50.0, -3.0, -1.0, 0.0, 0.4, 1.0, 3.0, 50.0),
+        ),
+    ],
+)
+def test_gamma_family_empirical_cdf(
+    method_name: str,
+    arguments: tuple[float, ...],
+    cdf,
+    points: tuple[float, ...],
+) -> None:
+    generator = Fortuna.Generator(0xF07A_4011)
+    samples = getattr(generator, method_name)(*arguments, count=100_000)
+    epsilon = math.sqrt(math.log(2 / 1e-10) / (2 * len(samples)))
+    for point in points:
+        below = sum(1 for value in samples if value <= point) / len(samples)
+        assert abs(below - cdf(point)) <= epsilon
+
+
+def _binomial_moments(trials: int, probability: float) -> tuple[float, float, float]:
+    variance = trials * probability * (1 - probability)
+    return (
+        trials * probability,
+        variance,
+        variance * (1 + 3 * probability * (1 - probability) * (trials - 2)),
+    )
+
+
+@pytest.mark.parametrize(
+    ("method_name", "arguments", "moments"),
+    [
+        ("binomial_variate", (12, 0.3), _binomial_moments(12, 0.3)),
+        ("binomial_variate", (300, 0.1), _binomial_moments(300, 0.1)),
+        ("binomial_variate", (1_000_000, 0.4), _binomial_moments(1_000_000, 0.4)),
+        ("binomial_variate", (200, 0.85), _binomial_moments(200, 0.85)),
+        ("poisson_variate", (2.5,), (2.5, 2.5, 2.5 + 3 * 2.5**2)),
+        ("poisson_variate", (10.0,), (10.0, 10.0, 10.0 + 3 * 10.0**2)),
+        ("poisson_variate", (1e6,), (1e6, 1e6, 1e6 + 3 * 1e12)),
+        ("poisson_variate", (1e15,), (1e15, 1e15, 1e15 + 3 * 1e30)),
+        ("poisson_variate", (1e16,), (1e16, 1e16, 1e16 + 3 * 1e32)),
+        ("poisson_variate", (2.0**62,), (2.0**62, 2.0**62, 2.0**62 + 3 * 2.0**124)),
+    ],
+)
+def test_btpe_and_ptrs_regimes_match_theoretical_first_two_moments(
+    method_name: str,
+    arguments: tuple[float | int, ...],
+    moments: tuple[float, float, float],
+) -> None:
+    """Cover inversion and rejection regimes on both sides of each threshold."""
+
+    generator = Fortuna.Generator(0xF07A_4013)
+    samples = getattr(generator, method_name)(*arguments, count=50_000)
+    _assert_mean_and_variance(
+        samples,
+        expected_mean=moments[0],
+        expected_variance=moments[1],
+        fourth_central_moment=moments[2],
+    )
+
+
+@pytest.mark.parametrize(("trials", "probability"), [(40, 0.5), (1_000, 0.5), (5_000, 0.02)])
+def test_btpe_binomial_matches_its_probability_mass(trials: int, probability: float) -> None:
+    def mass(successes: int) -> float:
+        return (
+            math.comb(trials, successes)
+            * probability**successes
+            * (1 - probability) ** (trials - successes)
+        )
+
+    generator = Fortuna.Generator(0xF07A_4014)
+    samples = generator.binomial_variate(trials, probability, count=100_000)
+    counts = Counter(samples)
+    mean = trials * probability
+    deviation = math.sqrt(mean * (1 - probability))
+    for successes in range(int(mean - 3 * deviation), int(mean + 3 * deviation) + 1):
+        expected = mass(successes)
+        observed = counts[successes] / len(samples)
+        assert abs(observed - expected) <= 6 * math.sqrt(expected * (1 - expected) / len(samples))
+
+
+def test_ptrs_poisson_matches_its_probability_mass() -> None:
+    mean = 250.0
+    generator = Fortuna.Generator(0xF07A_4015)
+    samples = generator.poisson_variate(mean, count=100_000)
+    counts = Counter(samples)
+    for events in range(200, 301, 5):
+        expected = math.exp(-mean + events * math.log(mean) - math.lgamma(events + 1))
+        observed = counts[events] / len(samples)
+        assert abs(observed - expected) <= 6 * math.sqrt(expected * (1 - expected) / len(samples))
+
+
+def test_gamma_ratios_stay_finite_at_the_smallest_shapes() -> None:
+    generator = Fortuna.Generator(0xF07A_4012)
+    betas = generator.beta_variate(1e-12, 1e-12, count=2_000)
+    assert all(value in (0.0, 1.0) for value in betas)
+    assert 700 < sum(betas) < 1_300
+    assert all(0.0 <= value <= 1.0 for value in generator.beta_variate(1e-12, 3.0, count=200))
+    assert all(value >= 0.0 for value in generator.gamma_variate(1e-12, 1.0, count=200))
+    assert all(value >= 0.0 for value in generator.chi_squared_variate(1e-12, count=200))
+
+
 @pytest.mark.parametrize(
     ("method_name", "arguments", "expected_mean", "expected_variance", "fourth_moment"),
     [
@@ -227,6 +435,185 @@ def test_standard_distributions_match_theoretical_first_two_moments(
     )
 
 
+@pytest.mark.parametrize(
+    ("method_name", "arguments", "expected_mean", "expected_variance", "fourth_moment"),
+    [
+        ("normal_variate", (4.0, 2.5), 4.0, 2.5**2, 3 * 2.5**4),
+        ("exponential_variate", (0.4,), 1 / 0.4, 1 / 0.4**2, 9 / 0.4**4),
+    ],
+)
+def test_ziggurat_distributions_match_theoretical_first_two_moments(
+    method_name: str,
+    arguments: tuple[float, ...],
+    expected_mean: float,
+    expected_variance: float,
+    fourth_moment: float,
+) -> None:
+    generator = Fortuna.Generator(0xF07A_4008)
+    samples = getattr(generator, method_name)(*arguments, algorithm="ziggurat", count=30_000)
+    _assert_mean_and_variance(
+        samples,
+        expected_mean=expected_mean,
+        expected_variance=expected_variance,
+        fourth_central_moment=fourth_moment,
+    )
+
+
+@pytest.mark.parametrize(
+    ("method_name", "arguments", "cdf", "points"),
+    [
+        (
+            "normal_variate",
+            (0.0, 1.0),
+            lambda x: 0.5 * math.erfc(-x / math.sqrt(2.0)),
+            (-3.7, -3.0, -2.0, -1.0, -0.3, 0.0, 0.01, 0.5, 1.5, 2.5, 3.65, 4.0),
+        ),
+        (
+            "exponential_variate",
+            (1.0,),
+            lambda x: -math.expm1(-x),
+            (0.001, 0.05, 0.3, 1.0, 2.0, 4.0, 7.0, 7.7, 9.0),
+        ),
+    ],
+)
+def test_ziggurat_empirical_cdf_matches_every_layer_and_tail(
+    method_name: str,
+    arguments: tuple[float, ...],
+    cdf,
+    points: tuple[float, ...],
+) -> None:
+    """Bound the empirical CDF with DKW at points inside, between, and past the layers."""
+
+    generator = Fortuna.Generator(0xF07A_4009)
+    samples = sorted(
+        getattr(generator, method_name)(*arguments, algorithm="ziggurat", count=200_000)
+    )
+    epsilon = math.sqrt(math.log(2 / 1e-10) / (2 * len(samples)))
+    for point in points:
+        below = sum(1 for value in samples if value <= point) / len(samples)
+        assert abs(below - cdf(point)) <= epsilon
+
+
+@pytest.mark.parametrize("method", ["cumulative", "alias"])
+def test_weighted_choice_frequencies_match_declared_weights(method: str) -> None:
+    weights = (0.0, 5.0, 0.5, 0.0, 12.0, 1.0, 3.25, 0.0, 8.0, 0.25)
+    choice = Fortuna.WeightedChoice(
+        tuple(zip(weights, range(len(weights)), strict=True)),
+        resolve_callables=False,
+        method=method,
+        generator=Fortuna.Generator(0xF07A_4016),
+    )
+    counts = Counter(choice.take(100_000))
+    total = sum(weights)
+    for index, weight in enumerate(weights):
+        if weight == 0.0:
+            assert counts[index] == 0
+        else:
+            _assert_probability(counts[index], 100_000, weight / total)
+
+
+def test_mutable_weighted_choice_frequencies_follow_updates() -> None:
+    weights = [0.0, 5.0, 0.5, 0.0, 12.0, 1.0, 3.25, 0.0, 8.0, 0.25]
+    choice = Fortuna.MutableWeightedChoice(
+        tuple(zip(weights, range(len(weights)), strict=True)),
+        resolve_callables=False,
+        generator=Fortuna.Generator(0xF07A_4017),
+    )
+    for index, weight in ((4, 0.0), (0, 6.0), (9, 2.75)):
+        choice.set_weight(index, weight)
+        weights[index] = weight
+    choice.remove(3)
+    weights[3] = weights.pop()
+    counts = Counter(choice.take(100_000))
+    total = sum(weights)
+    for index, weight in enumerate(weights):
+        value = choice[index][1]
+        if weight == 0.0:
+            assert counts[value] == 0
+        else:
+            _assert_probability(counts[value], 100_000, weight / total)
+
+
+def test_weighted_sample_orders_match_sequential_draws_without_replacement() -> None:
+    weights = {"a": 1.0, "b": 2.0, "c": 3.0, "never": 0.0}
+    table = tuple((weight, value) for value, weight in weights.items())
+    generator = Fortuna.Generator(0xF07A_4018)
+    sample_size = 60_000
+    counts = Counter(
+        tuple(Fortuna.weighted_sample(table, 2, generator=generator)) for _ in range(sample_size)
+    )
+    total = sum(weights.values())
+    assert sum(counts.values()) == sample_size
+    for first in "abc":
+        for second in "abc":
+            if first != second:
+                expected = weights[first] / total * weights[second] / (total - weights[first])
+                _assert_probability(counts[(first, second)], sample_size, expected)
+
+
+@pytest.mark.parametrize("size", [5, 100])
+def test_random_permutation_places_every_value_equally(size: int) -> None:
+    generator = Fortuna.Generator(0xF07A_4017 + size)
+    sample_size = 30_000
+    counts = Counter()
+    for _ in range(sample_size):
+        permutation = Fortuna.RandomPermutation(size, generator=generator)
+        counts[(permutation[0], permutation.index_of(0))] += 1
+    first = Counter()
+    positions = Counter()
+    for (value, position), count in counts.items():
+        first[value] += count
+        positions[position] += count
+    for value in range(size):
+        _assert_probability(first[value], sample_size, 1 / size)
+        _assert_probability(positions[value], sample_size, 1 / size)
+
+
+def test_blocked_shuffle_places_each_row_uniformly() -> None:
+    # 33 rows of 8 KiB exceed the Knuth-B leaf, so every draw uses buckets.
+    rows = 33
+    width = 8192
+    data = bytearray(row for row in range(rows) for _ in range(width))
+    generator = Fortuna.Generator(0xF07A_4019)
+    sample_size = 6_000
+    positions = Counter()
+    for _ in range(sample_size):
+        generator.shuffle(data, item_size=width, strategy="blocked")
+        positions[bytes(data[::width]).index(0)] += 1
+    for position in range(rows):
+        _assert_probability(positions[position], sample_size, 1 / rows)
+
+
+def test_reservoir_sample_includes_every_item_equally() -> None:
+    generator = Fortuna.Generator(0xF07A_4019)
+    sample_size = 20_000
+    counts = Counter()
+    for _ in range(sample_size):
+        counts.update(Fortuna.reservoir_sample(iter(range(40)), 5, generator=generator))
+    for value in range(40):
+        _assert_probability(counts[value], sample_size, 5 / 40)
+
+
+def test_weighted_reservoir_sample_orders_match_sequential_draws() -> None:
+    weights = {"a": 1.0, "never": 0.0, "b": 2.0, "c": 3.0}
+    generator = Fortuna.Generator(0xF07A_4020)
+    sample_size = 60_000
+    counts = Counter(
+        tuple(
+            Fortuna.weighted_reservoir_sample(
+                ((weight, value) for value, weight in weights.items()), 2, generator=generator
+            )
+        )
+        for _ in range(sample_size)
+    )
+    total = sum(weights.values())
+    for first in "abc":
+        for second in "abc":
+            if first != second:
+                expected = weights[first] / total * weights[second] / (total - weights[first])
+                _assert_probability(counts[(first, second)], sample_size, expected)
+
+
 def test_cauchy_distribution_matches_declared_quartiles() -> None:
     """Validate a heavy-tailed distribution without pretending its moments exist."""
 
@@ -8,6 +8,29 @@ from pathlib import Path
 import Fortuna
 
 STUB = Path(__file__).parents[1] / "src" / "Fortuna" / "_core.pyi"
+VECTOR_APIS = {
+    "percent_true",
+    "bernoulli_variate",
+    "random_float",
+    "triangular",
+    "beta_variate",
+    "pareto_variate",
+    "vonmises_variate",
+    "binomial_variate",
+    "negative_binomial_variate",
+    "geometric_variate",
+    "poisson_variate",
+    "exponential_variate",
+    "gamma_variate",
+    "weibull_variate",
+    "normal_variate",
+    "log_normal_variate",
+    "extreme_value_variate",
+    "chi_squared_variate",
+    "cauchy_variate",
+    "fisher_f_variate",
+    "student_t_variate",
+}
 
 
 def _functions(nodes):
@@ -28,38 +51,87 @@ def _runtime_count_apis():
     }
 
 
+def _keyword(definition, name):
+    position = [argument.arg for argument in definition.args.kwonlyargs].index(name)
+    default = definition.args.kw_defaults[position]
+    return (
+        ast.unparse(definition.args.kwonlyargs[position].annotation),
+        None if default is None else ast.unparse(default),
+    )
+
+
+def _assert_vector_overloads(name, definitions):
+    parameters = [argument for argument in definitions[1].args.args if argument.arg != "self"]
+    assert len(definitions) == 5 + len(parameters), name
+    scalar = ast.unparse(definitions[0].returns)
+    for position, definition in enumerate(definitions[5:]):
+        annotations = [
+            ast.unparse(argument.annotation)
+            for argument in definition.args.args
+            if argument.arg != "self"
+        ]
+        assert annotations[position] in {"_FloatVector", "_IntVector"}
+        assert all("Vector" not in annotation for annotation in annotations[:position])
+        assert _keyword(definition, "count") == ("None", "None")
+        assert _keyword(definition, "as_buffer") == ("Literal[False]", "False")
+        assert _keyword(definition, "out") == ("None", "None")
+        assert ast.unparse(definition.returns) == f"list[{scalar}]"
+
+
 def _assert_count_overloads(functions, expected):
-    assert {name for name, definitions in functions.items() if len(definitions) == 3} == expected
+    # Generator.parallel dispatches to the count APIs by name; it is not one.
+    assert {
+        name
+        for name, definitions in functions.items()
+        if len(definitions) >= 5 and name != "parallel"
+    } == expected
     for name in expected:
         definitions = functions[name]
+        if name in VECTOR_APIS:
+            _assert_vector_overloads(name, definitions)
+            definitions = definitions[:5]
+        else:
+            assert len(definitions) == 5, name
         assert all(
             [ast.unparse(decorator) for decorator in definition.decorator_list] == ["overload"]
             for definition in definitions
         )
 
-        count_parameters = []
-        for definition in definitions:
-            position = [argument.arg for argument in definition.args.kwonlyargs].index("count")
-            count_parameters.append(
-                (
-                    ast.unparse(definition.args.kwonlyargs[position].annotation),
-                    definition.args.kw_defaults[position],
-                )
-            )
-        assert count_parameters[0][0] == "None"
-        assert isinstance(count_parameters[0][1], ast.Constant)
-        assert count_parameters[0][1].value is None
-        assert count_parameters[1:] == [("int", None), ("int | None", None)]
+        assert [_keyword(definition, "count") for definition in definitions] == [
+            ("None", "None"),
+            ("int", None),
+            ("int", None),
+            ("int | None", None),
+            ("int | None", "None"),
+        ]
+        assert [_keyword(definition, "as_buffer") for definition in definitions] == [
+            ("Literal[False]", "False"),
+            ("Literal[False]", "False"),
+            ("Literal[True]", None),
+            ("Literal[False]", "False"),
+            ("Literal[False]", "False"),
+        ]
+        assert [_keyword(definition, "out") for definition in definitions] == [
+            ("None", "None"),
+            ("None", "None"),
+            ("None", "None"),
+            ("None", "None"),
+            ("_OutT", None),
+        ]
 
         scalar = ast.unparse(definitions[0].returns)
+        buffer = "array[float]" if scalar == "float" else "array[int]"
         assert ast.unparse(definitions[1].returns) == f"list[{scalar}]"
-        assert ast.unparse(definitions[2].returns) == f"{scalar} | list[{scalar}]"
+        assert ast.unparse(definitions[2].returns) == buffer
+        assert ast.unparse(definitions[3].returns) == f"{scalar} | list[{scalar}]"
+        assert ast.unparse(definitions[4].returns) == "_OutT"
 
 
 def test_every_count_api_has_precise_module_and_generator_overloads():
     module = ast.parse(STUB.read_text())
     expected = _runtime_count_apis()
     assert len(expected) == 35
+    assert expected >= VECTOR_APIS
 
     generator = next(
         node for node in module.body if isinstance(node, ast.ClassDef) and node.name == "Generator"
@@ -71,5 +143,6 @@ def test_every_count_api_has_precise_module_and_generator_overloads():
 def test_native_stub_does_not_advertise_stub_only_runtime_bases():
     module = ast.parse(STUB.read_text())
     classes = {node.name for node in module.body if isinstance(node, ast.ClassDef)}
-    assert classes == {"Generator"}
+    assert classes == {"Generator", "Sampler"}
+    assert isinstance(Fortuna._core.Sampler, type)
     assert not hasattr(Fortuna._core, "_CountAPI")
@@ -1,6 +1,7 @@
 """Static consumer contract checked by Pyright; this module is not run by pytest."""
 
-from collections.abc import Callable, MutableSequence
+from array import array
+from collections.abc import Callable, Iterator, MutableSequence
 from typing import Literal, assert_type, overload
 
 import Fortuna
@@ -40,6 +41,20 @@ class SimpleIndexGenerator:
 generator = Fortuna.Generator(0)
 assert_type(CustomGenerator.from_entropy(), CustomGenerator)
 assert_type(CustomGenerator.for_stream(0, "worker-1"), CustomGenerator)
+assert_type(
+    Fortuna.Generator(0, engine="pcg64_dxsm").engine,
+    Literal["mt19937_64", "pcg64_dxsm", "xoshiro256++", "sfc64", "philox4x64"],
+)
+assert_type(Fortuna.for_stream(0, "worker-2", engine="sfc64"), Fortuna.Generator)
+assert_type(CustomGenerator(0, engine="philox4x64").at(1_000).advance(4), CustomGenerator)
+assert_type(Fortuna.Generator(0, engine="philox4x64").position, int)
+assert_type(Fortuna.Generator(0).jump().advance(2**40), Fortuna.Generator)
+assert_type(Fortuna.for_streams(0, ["a", b"b", 3]), list[Fortuna.Generator])
+assert_type(CustomGenerator.for_streams(0, range(4)), list[CustomGenerator])
+assert_type(CustomGenerator(0).spawn(4), list[CustomGenerator])
+assert_type(Fortuna.Generator(0).getstate(), bytes)
+assert_type(Fortuna.Generator(0).getstate(out=bytearray(2512)), bytearray)
+assert_type(Fortuna.Generator(0).setstate(b"FRTN"), None)
 
 assert_type(Fortuna.percent_true(), bool)
 assert_type(Fortuna.percent_true(count=None), bool)
@@ -58,6 +73,35 @@ assert_type(Fortuna.canonical(count=4), list[float])
 assert_type(generator.normal_variate(0.0, 1.0), float)
 assert_type(generator.normal_variate(0.0, 1.0, count=4), list[float])
 
+assert_type(Fortuna.random_int(-4, 4, count=4, as_buffer=True), array[int])
+assert_type(Fortuna.percent_true(count=4, as_buffer=True), array[int])
+assert_type(generator.canonical(count=4, as_buffer=True), array[float])
+assert_type(generator.d(6, count=4, as_buffer=False), list[int])
+
+float_storage = array("d", bytes(32))
+assert_type(generator.normal_variate(0.0, 1.0, out=float_storage), array[float])
+assert_type(Fortuna.random_int(-4, 4, out=bytearray(32)), bytearray)
+assert_type(generator.normal_variate([0.0, 10.0], 1.0), list[float])
+assert_type(Fortuna.binomial_variate((10, 20), float_storage), list[int])
+assert_type(generator.percent_true([25.0, 75.0], count=2, as_buffer=True), array[int])
+assert_type(Fortuna.gamma_variate(float_storage, 2.0, out=float_storage), array[float])
+assert_type(generator.stream("d", 20), Iterator[int])
+assert_type(generator.stream("normal_variate", 0.0, 1.0, chunk=256), Iterator[float])
+assert_type(next(generator.stream("percent_true", 25.0)), bool)
+gamma = generator.prepare("gamma_variate", 2.0, 3.0)
+assert_type(gamma(), float)
+assert_type(gamma.take(8), list[float])
+assert_type(gamma.take(8, as_buffer=True), array[float])
+assert_type(gamma.fill(float_storage), array[float])
+assert_type(generator.prepare("d", sides=20)(), int)
+assert_type(generator.prepare("percent_true").take(4, as_buffer=True), array[int])
+assert_type(generator.parallel("d", 20, count=8, threads=2), list[int])
+assert_type(generator.parallel("normal_variate", 0.0, 1.0, count=8, as_buffer=True), array[float])
+assert_type(generator.parallel("gamma_variate", 2.0, 3.0, out=float_storage), array[float])
+assert_type(generator.normal_variate(0.0, 1.0, algorithm="ziggurat"), float)
+assert_type(Fortuna.exponential_variate(2.0, algorithm="ziggurat", count=4), list[float])
+assert_type(generator.stream("normal_variate", 0.0, 1.0, algorithm="ziggurat"), Iterator[float])
+
 Direction = Literal["north", "south"]
 words: tuple[Direction, Direction] = ("north", "south")
 assert_type(Fortuna.random_value(words), Direction)
@@ -74,6 +118,9 @@ assert_type(Fortuna.shuffle(mutable_words), None)
 assert_type(Fortuna.shuffle(mutable_words, generator=ShuffleGenerator()), None)
 assert_type(Fortuna.shuffle(mutable_words, generator=SimpleIndexGenerator()), None)
 assert_type(generator.shuffle(mutable_words), None)
+assert_type(Fortuna.shuffle(bytearray(b"abcd"), item_size=2), None)
+assert_type(generator.shuffle(array("q", [1, 2]), item_size=8), None)
+assert_type(Fortuna.shuffle(array("q", [1, 2]), strategy="blocked", threads=2), None)
 
 value_generator = Fortuna.RandomValue(words)
 assert_type(value_generator(), Direction)
@@ -93,6 +140,18 @@ assert_type(Fortuna.WeightedChoice(relative_weights)(), Direction)
 assert_type(Fortuna.WeightedChoice(relative=relative_weights)(), Direction)
 cumulative_weights: tuple[tuple[int, Direction], ...] = ((1, "north"), (2, "south"))
 assert_type(Fortuna.WeightedChoice(cumulative=cumulative_weights)(), Direction)
+assert_type(Fortuna.WeightedChoice(relative_weights, method="alias")(), Direction)
+assert_type(Fortuna.weighted_sample(relative_weights, 1), list[Direction])
+assert_type(Fortuna.weighted_sample(cumulative=cumulative_weights, k=1), list[Direction])
+assert_type(Fortuna.reservoir_sample(iter(words), 1), list[Direction])
+assert_type(Fortuna.weighted_reservoir_sample(iter(relative_weights), 1), list[Direction])
+permutation = Fortuna.RandomPermutation(10)
+assert_type(permutation[0], int)
+assert_type(permutation[1:], list[int])
+assert_type(permutation.index_of(3), int)
+assert_type(permutation.fill(array("q", bytes(80))), array[int])
+mutable_weights = Fortuna.MutableWeightedChoice(relative_weights)
+assert_type(mutable_weights(), Direction)
 
 
 def selected_direction() -> Direction:
@@ -128,3 +187,10 @@ def check_dynamic_count(dynamic_count: int | None) -> None:
     assert_type(generator.front_triangular(10, count=dynamic_count), int | list[int])
     assert_type(Fortuna.canonical(count=dynamic_count), float | list[float])
     assert_type(generator.normal_variate(0.0, 1.0, count=dynamic_count), float | list[float])
+
+
+def check_dynamic_buffer(dynamic_buffer: bool) -> None:
+    assert_type(
+        Fortuna.random_int(-4, 4, count=4, as_buffer=dynamic_buffer), list[int] | array[int]
+    )
+    assert_type(generator.canonical(count=4, as_buffer=dynamic_buffer), list[float] | array[float])